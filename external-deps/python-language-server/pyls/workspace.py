@@ -16,6 +16,15 @@
 RE_START_WORD = re.compile('[A-Za-z_0-9]*$')
 RE_END_WORD = re.compile('^[A-Za-z_0-9]*')
 
+# Lines end with \n, \r\n or \r in the Language Server Protocol. Unlike
+# str.splitlines, other line boundaries (e.g. form feeds) are not line ends.
+RE_LINE = re.compile(r'[^\r\n]*(?:\r\n|\r|\n)|[^\r\n]+\Z')
+
+
+def split_lines(text):
+    """Split text in lines, keeping their line endings."""
+    return RE_LINE.findall(text)
+
 
 def lock(method):
     """Define an atomic region over a method."""
@@ -140,6 +149,8 @@ def __init__(self, uri, workspace, source=None, version=None, local=True, extra_
         self._workspace = workspace
         self._local = local
         self._source = source
+        self._lines = None
+        self._line_offsets = [0]
         self._extra_sys_path = extra_sys_path or []
         self._rope_project_builder = rope_project_builder
         self._lock = RLock()
@@ -154,12 +165,21 @@ def _rope_resource(self, rope_config):
     @property
     @lock
     def lines(self):
-        return self.source.splitlines(True)
+        # The list is cached until the next change and replaced (not
+        # modified) by changes, so callers can keep it around.
+        if self._lines is None:
+            if self._source is None:
+                return split_lines(self.source)
+            self._lines = split_lines(self._source)
+        return self._lines
 
     @property
     @lock
     def source(self):
         if self._source is None:
+            if self._lines is not None:
+                self._source = ''.join(self._lines)
+                return self._source
             with io.open(self.path, 'r', encoding='utf-8') as f:
                 return f.read()
         return self._source
@@ -176,44 +196,56 @@ def apply_change(self, change):
         if not change_range:
             # The whole file has changed
             self._source = text
+            self._lines = None
+            self._line_offsets = [0]
             return
 
-        start_line = change_range['start']['line']
+        lines = self.lines
+        start_line = min(change_range['start']['line'], len(lines))
         start_col = change_range['start']['character']
-        end_line = change_range['end']['line']
+        end_line = min(change_range['end']['line'], len(lines))
         end_col = change_range['end']['character']
 
-        # Check for an edit occuring at the very end of the file
-        if start_line == len(self.lines):
-            self._source = self.source + text
-            return
+        # Only the lines touched by the edit are split again. Edits can
+        # start or end on the line after the last one, which is empty.
+        before = lines[start_line][:start_col] if start_line < len(lines) else ''
+        after = lines[end_line][end_col:] if end_line < len(lines) else ''
 
-        new = io.StringIO()
+        # A '\n' inserted after a line ending in a bare '\r' joins it
+        if start_line > 0 and lines[start_line - 1].endswith('\r'):
+            start_line -= 1
+            before = lines[start_line] + before
 
-        # Iterate over the existing document until we hit the edit range,
-        # at which point we write the new text, then loop until we hit
-        # the end of the range and continue writing.
-        for i, line in enumerate(self.lines):
-            if i < start_line:
-                new.write(line)
-                continue
+        new_lines = split_lines(before + text + after)
 
-            if i > end_line:
-                new.write(line)
-                continue
+        # Join the following line if the edit removed the line ending
+        end_line += 1
+        if (new_lines and end_line < len(lines)
+                and not new_lines[-1].endswith(('\n', '\r'))):
+            new_lines[-1] += lines[end_line]
+            end_line += 1
 
-            if i == start_line:
-                new.write(line[:start_col])
-                new.write(text)
-
-            if i == end_line:
-                new.write(line[end_col:])
-
-        self._source = new.getvalue()
+        self._lines = lines[:start_line] + new_lines + lines[end_line:]
+        self._source = None
+        del self._line_offsets[start_line + 1:]
 
+    @lock
     def offset_at_position(self, position):
         """Return the byte-offset pointed at by the given position."""
-        return position['character'] + len(''.join(self.lines[:position['line']]))
+        line = position['line']
+        lines = self.lines
+        if lines is not self._lines:
+            # Documents read from disk are not cached
+            return position['character'] + len(''.join(lines[:line]))
+
+        offsets = self._line_offsets
+        if line >= len(offsets):
+            for i in range(len(offsets) - 1, min(line, len(lines))):
+                offsets.append(offsets[i] + len(lines[i]))
+            if line >= len(offsets):
+                # Past the end of the document
+                return position['character'] + offsets[-1]
+        return position['character'] + offsets[line]
 
     def word_at_position(self, position):
         """Get the word under the cursor returning the start and end positions."""
@@ -97,3 +97,50 @@ def test_document_end_of_file_edit(workspace):
         "print 'b'\n",
         "o",
     ]
+
+
+def test_document_lines_line_endings(workspace):
+    doc = Document('file:///uri', workspace, u'a = 1\r\nb = 2\x0cc = 3\rd')
+    assert doc.lines == [u'a = 1\r\n', u'b = 2\x0cc = 3\r', u'd']
+
+
+def test_document_incremental_edits(workspace):
+    doc = Document('file:///uri', workspace, u'import os\n\ndef main():\n    pass\n')
+    assert doc.offset_at_position({'line': 3, 'character': 4}) == 27
+
+    # Join the second and third lines
+    doc.apply_change({'text': u'', 'range': {
+        'start': {'line': 1, 'character': 0},
+        'end': {'line': 2, 'character': 0}
+    }})
+    doc.apply_change({'text': u'\n    return 1\n', 'range': {
+        'start': {'line': 2, 'character': 8},
+        'end': {'line': 3, 'character': 0}
+    }})
+    assert doc.source == u'import os\ndef main():\n    pass\n    return 1\n'
+    assert doc.lines[3] == u'    return 1\n'
+    assert doc.offset_at_position({'line': 3, 'character': 4}) == 35
+    assert doc.word_at_position({'line': 3, 'character': 6}) == 'return'
+
+
+def test_document_incremental_edits_carriage_return(workspace):
+    doc = Document('file:///uri', workspace, u'a\r\r')
+    doc.apply_change({'text': u'\n', 'range': {
+        'start': {'line': 1, 'character': 0},
+        'end': {'line': 2, 'character': 0}
+    }})
+    assert doc.lines == [u'a\r\n']
+
+    doc.apply_change({'text': u'\rb', 'range': {
+        'start': {'line': 0, 'character': 1},
+        'end': {'line': 1, 'character': 0}
+    }})
+    assert doc.lines == [u'a\r', u'b']
+
+    doc.apply_change({'text': u'\nc', 'range': {
+        'start': {'line': 1, 'character': 0},
+        'end': {'line': 1, 'character': 0}
+    }})
+    assert doc.lines == [u'a\r\n', u'cb']
+    assert doc.source == u'a\r\ncb'
+    assert doc.offset_at_position({'line': 1, 'character': 1}) == 4
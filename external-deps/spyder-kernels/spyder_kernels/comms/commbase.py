@@ -8,7 +8,8 @@
 Class that handles communications between Spyder kernel and frontend.
 
 Comms transmit data in a list of buffers, and in a json-able dictionnary.
-Here, we only support a buffer list with a single element.
+The first buffer is always a pickle stream. Any other buffers contain
+out-of-band data of that stream (see `dumps`).
 
 The messages exchanged have the following msg_dict:
 
@@ -19,7 +20,11 @@
     }
     ```
 
-The buffer is generated by cloudpickle using `PICKLE_PROTOCOL = 2`.
+The buffer is generated by cloudpickle using `PICKLE_PROTOCOL = 2`, or the
+highest protocol supported by both sides once they know it. With protocol 5,
+large contiguous buffers (e.g. the data of NumPy arrays or DataFrame
+columns) are sent as separate buffers instead of being copied into the
+pickle stream, if the other side supports it.
 
 To simplify the usage of messaging, we use a higher level function calling
 mechanism:
@@ -70,6 +75,78 @@
 # Max timeout (in secs) for blocking calls
 TIMEOUT = 3
 
+# Minimum size (in bytes) of the buffers sent out of the pickle stream
+MIN_OUT_OF_BAND_SIZE = 64 * 1024
+
+
+def dumps(data, protocol, out_of_band=False):
+    """
+    Serialize data into a list of buffers.
+
+    Parameters
+    ----------
+    data: any
+        Object to serialize with cloudpickle.
+    protocol: int
+        Pickle protocol.
+    out_of_band: bool
+        If True and protocol is at least 5, contiguous buffers bigger than
+        `MIN_OUT_OF_BAND_SIZE` are not copied into the pickle stream but
+        returned after it, so they can be sent as separate frames.
+
+    Returns
+    -------
+    list
+        The pickle stream followed by its out-of-band buffers.
+    """
+    if not out_of_band or protocol < 5:
+        return [cloudpickle.dumps(data, protocol=protocol)]
+
+    buffers = []
+
+    def buffer_callback(pickle_buffer):
+        # Returning True keeps the buffer in the pickle stream
+        raw = pickle_buffer.raw()
+        if raw.nbytes < MIN_OUT_OF_BAND_SIZE:
+            return True
+        buffers.append(raw)
+        return False
+
+    stream = cloudpickle.dumps(data, protocol=protocol,
+                               buffer_callback=buffer_callback)
+    return [stream] + buffers
+
+
+def loads(buffers, writable=True):
+    """
+    Deserialize data from a list of buffers generated by `dumps`.
+
+    Parameters
+    ----------
+    buffers: list
+        The pickle stream followed by its out-of-band buffers.
+    writable: bool
+        Objects are rebuilt on top of the received buffers, so arrays
+        built on read-only buffers can't be modified. If True, those
+        buffers are copied first. Otherwise they are used as they are.
+    """
+    if len(buffers) > 1:
+        out_of_band = []
+        for buf in buffers[1:]:
+            if writable and memoryview(buf).readonly:
+                buf = bytearray(buf)
+            out_of_band.append(buf)
+        return cloudpickle.loads(buffers[0], buffers=out_of_band)
+
+    if PY3:
+        # https://docs.python.org/3/library/pickle.html#pickle.loads
+        # Using encoding='latin1' is required for unpickling
+        # NumPy arrays and instances of datetime, date and time
+        # pickled by Python 2.
+        return cloudpickle.loads(buffers[0], encoding='latin-1')
+    else:
+        return cloudpickle.loads(buffers[0])
+
 
 class CommError(RuntimeError):
     pass
@@ -139,6 +216,10 @@ class CommBase(object):
     Subclasses must open a comm and register it with `self._register_comm`.
     """
 
+    # Whether objects received in read-only out-of-band buffers must be
+    # copied to be modifiable (see `loads`).
+    _writable_buffers = True
+
     def __init__(self):
         super(CommBase, self).__init__()
         self.calling_comm_id = None
@@ -227,7 +308,8 @@ def _send_message(self, spyder_msg_type, content=None, data=None,
             The (JSONable) content of the message
         data: any
             Any object that is serializable by cloudpickle (should be most
-            things). Will arrive as cloudpickled bytes in `.buffers[0]`.
+            things). Will arrive as cloudpickled bytes in `.buffers[0]`,
+            followed by its out-of-band buffers, if any.
         comm_id: int
             the comm to send to. If None sends to all comms.
         """
@@ -241,8 +323,8 @@ def _send_message(self, spyder_msg_type, content=None, data=None,
                 'pickle_protocol': self._comms[comm_id]['pickle_protocol'],
                 'python_version': sys.version,
                 }
-            buffers = [cloudpickle.dumps(
-                data, protocol=self._comms[comm_id]['pickle_protocol'])]
+            buffers = dumps(data, self._comms[comm_id]['pickle_protocol'],
+                            self._comms[comm_id]['out_of_band'])
             self._comms[comm_id]['comm'].send(msg_dict, buffers=buffers)
 
     def _set_pickle_protocol(self, protocol):
@@ -287,6 +369,7 @@ def _register_comm(self, comm):
         self._comms[comm.comm_id] = {
             'comm': comm,
             'pickle_protocol': DEFAULT_PICKLE_PROTOCOL,
+            'out_of_band': False,
             'status': 'opening',
             }
 
@@ -304,17 +387,10 @@ def _comm_message(self, msg):
         # Get message dict
         msg_dict = msg['content']['data']
 
-        # Load the buffer. Only one is supported.
+        # Load the buffers
         try:
-            if PY3:
-                # https://docs.python.org/3/library/pickle.html#pickle.loads
-                # Using encoding='latin1' is required for unpickling
-                # NumPy arrays and instances of datetime, date and time
-                # pickled by Python 2.
-                buffer = cloudpickle.loads(msg['buffers'][0],
-                                           encoding='latin-1')
-            else:
-                buffer = cloudpickle.loads(msg['buffers'][0])
+            buffer = loads(msg['buffers'],
+                           writable=self._writable_buffers)
         except Exception as e:
             logger.debug(
                 "Exception in cloudpickle.loads : %s" % str(e))
@@ -394,12 +470,16 @@ def _register_call(self, call_dict, callback=None):
     def on_outgoing_call(self, call_dict):
         """A message is about to be sent"""
         call_dict["pickle_highest_protocol"] = pickle.HIGHEST_PROTOCOL
+        call_dict["pickle_out_of_band"] = True
         return call_dict
 
     def on_incoming_call(self, call_dict):
         """A call was received"""
         if "pickle_highest_protocol" in call_dict:
             self._set_pickle_protocol(call_dict["pickle_highest_protocol"])
+        if "pickle_out_of_band" in call_dict:
+            self._comms[self.calling_comm_id]['out_of_band'] = (
+                call_dict["pickle_out_of_band"])
 
     def _get_call_return_value(self, call_dict, call_data, comm_id):
         """
@@ -72,6 +72,12 @@ def __init__(self, *args, **kwargs):
             'set_pdb_execute_events': self.set_pdb_execute_events,
             'set_pdb_use_exclamation_mark': self.set_pdb_use_exclamation_mark,
             'get_value': self.get_value,
+            'open_data_view': self.open_data_view,
+            'get_data_view_window': self.get_data_view_window,
+            'get_data_view_header': self.get_data_view_header,
+            'get_data_view_minmax': self.get_data_view_minmax,
+            'sort_data_view': self.sort_data_view,
+            'close_data_view': self.close_data_view,
             'load_data': self.load_data,
             'save_namespace': self.save_namespace,
             'is_defined': self.is_defined,
@@ -87,6 +93,7 @@ def __init__(self, *args, **kwargs):
             'close_all_mpl_figures': self.close_all_mpl_figures,
             'show_mpl_backend_errors': self.show_mpl_backend_errors,
             'get_namespace_view': self.get_namespace_view,
+            'get_namespace_view_changes': self.get_namespace_view_changes,
             'set_namespace_view_settings': self.set_namespace_view_settings,
             'get_var_properties': self.get_var_properties,
             'set_sympy_forecolor': self.set_sympy_forecolor,
@@ -101,6 +108,11 @@ def __init__(self, *args, **kwargs):
                 call_id, handlers[call_id])
 
         self.namespace_view_settings = {}
+        self._namespace_view_cache = {}
+        self._namespace_view_id = 0
+        self._minmax_displays = None
+        self._data_views = {}
+        self._data_view_id = 0
         self._pdb_obj = None
         self._pdb_step = None
         self._do_publish_pdb_state = True
@@ -128,6 +140,9 @@ def frontend_call(self, blocking=False, broadcast=True,
     def set_namespace_view_settings(self, settings):
         """Set namespace_view_settings."""
         self.namespace_view_settings = settings
+        # Views made with other settings can't be updated with changes
+        self._namespace_view_cache = {}
+        self._namespace_view_id += 1
 
     def get_namespace_view(self):
         """
@@ -148,11 +163,48 @@ def get_namespace_view(self):
         settings = self.namespace_view_settings
         if settings:
             ns = self._get_current_namespace()
-            view = make_remote_view(ns, settings, EXCLUDED_NAMES)
+            view = make_remote_view(ns, settings, EXCLUDED_NAMES,
+                                    self._get_minmax_displays())
             return view
         else:
             return None
 
+    def get_namespace_view_changes(self, view_id=None):
+        """
+        Return the changes of the namespace view since the one with id
+        view_id.
+
+        This is a dictionary with the following structure
+
+        {'view_id': 2, 'full': False, 'changed': {'a': {...}}, 'removed': []}
+
+        Here:
+        * 'view_id' is the id of the new view, to ask for the next changes
+        * 'full' is True if 'changed' contains the whole view. That's the
+          case when view_id is None or is not the id of the last view
+        * 'changed' contains the entries of the added or changed variables,
+          as in get_namespace_view
+        * and 'removed' is the list of names of removed variables
+        """
+        from spyder_kernels.utils.nsview import make_remote_view_changes
+
+        settings = self.namespace_view_settings
+        if not settings:
+            return None
+
+        full = view_id is None or view_id != self._namespace_view_id
+        if full:
+            self._namespace_view_cache = {}
+        ns = self._get_current_namespace()
+        changed, removed = make_remote_view_changes(
+            ns, settings, self._namespace_view_cache, EXCLUDED_NAMES,
+            self._get_minmax_displays())
+        self._namespace_view_id += 1
+        return {'view_id': self._namespace_view_id,
+                'full': full,
+                'changed': changed,
+                'removed': removed}
+
     def get_var_properties(self):
         """
         Get some properties of the variables in the current
@@ -191,6 +243,45 @@ def get_value(self, name):
         self._do_publish_pdb_state = False
         return ns[name]
 
+    def open_data_view(self, name):
+        """
+        Open a view of a variable to browse it without copying it.
+
+        Return the id and the info of the view, or None if the variable
+        is not supported.
+        """
+        from spyder_kernels.utils.dataview import DataView, is_viewable
+
+        value = self.get_value(name)
+        if not is_viewable(value):
+            return None
+        self._data_view_id += 1
+        view = DataView(value)
+        self._data_views[self._data_view_id] = view
+        return self._data_view_id, view.get_info()
+
+    def get_data_view_window(self, view_id, start_row, stop_row,
+                             start_col, stop_col):
+        """Get a window of cells of a view"""
+        return self._data_views[view_id].get_window(
+            start_row, stop_row, start_col, stop_col)
+
+    def get_data_view_header(self, view_id, axis, start, stop):
+        """Get labels of the columns or rows of a view"""
+        return self._data_views[view_id].get_header(axis, start, stop)
+
+    def get_data_view_minmax(self, view_id):
+        """Get the maximum and minimum of each column of a view"""
+        return self._data_views[view_id].get_minmax()
+
+    def sort_data_view(self, view_id, column, ascending=True):
+        """Sort the rows of a view"""
+        self._data_views[view_id].sort(column, ascending)
+
+    def close_data_view(self, view_id):
+        """Close a view"""
+        self._data_views.pop(view_id, None)
+
     def set_value(self, name, value):
         """Set the value of a variable"""
         ns = self._get_reference_namespace(name)
@@ -576,6 +667,29 @@ def _get_current_namespace(self, with_magics=False):
 
         return ns
 
+    def _get_minmax_displays(self):
+        """Return the cache of min/max displays of arrays."""
+        if self._minmax_displays is None:
+            from spyder_kernels.utils.nsview import MinMaxDisplays
+            self._minmax_displays = MinMaxDisplays(
+                callback=self._minmax_displays_ready)
+            # Running code may modify arrays in place
+            self.shell.events.register('post_execute',
+                                       self._minmax_displays.clear)
+        return self._minmax_displays
+
+    def _minmax_displays_ready(self):
+        """
+        Ask the frontend to refresh the Variable Explorer to show the
+        min/max of big arrays.
+
+        This is called from the thread that computes them, so the call is
+        made from the event loop of the kernel.
+        """
+        self.io_loop.add_callback(
+            lambda: self.frontend_call(
+                blocking=False).refresh_namespacebrowser(interrupt=False))
+
     def _get_reference_namespace(self, name):
         """
         Return namespace where reference name is defined
@@ -193,6 +193,26 @@ def test_get_namespace_view(kernel):
     assert "'view': '1'" in nsview
 
 
+def test_get_namespace_view_changes(kernel):
+    """
+    Test the changes of the namespace view of the kernel.
+    """
+    execute = kernel.do_execute('a = 1', True)
+    changes = kernel.get_namespace_view_changes()
+    assert changes['full']
+    assert 'a' in changes['changed']
+
+    execute = kernel.do_execute('b = 2; del a', True)
+    changes = kernel.get_namespace_view_changes(changes['view_id'])
+    assert not changes['full']
+    assert list(changes['changed']) == ['b']
+    assert changes['removed'] == ['a']
+
+    # Views made with other settings can't be updated
+    kernel.set_namespace_view_settings(kernel.namespace_view_settings)
+    assert kernel.get_namespace_view_changes(changes['view_id'])['full']
+
+
 def test_get_var_properties(kernel):
     """
     Test the properties fo the variables in the namespace.
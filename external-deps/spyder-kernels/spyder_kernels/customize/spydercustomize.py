@@ -481,12 +481,45 @@ def exec_code(code, filename, ns_globals, ns_locals=None, post_mortem=False):
     __tracebackhide__ = "__pdb_exit__"
 
 
+# Code of the files run from the editor, with the version given to it by
+# the frontend, so it's only sent again after it changes.
+FILE_CODE_CACHE = {}
+
+
+def get_frontend_file_code(filename, save_all=True):
+    """
+    Get the content of a file from the frontend.
+
+    The version of the cached content is sent with the request and the
+    frontend only replies with the content if it changed.
+    """
+    version, file_code = FILE_CODE_CACHE.get(filename, (None, None))
+    try:
+        new_version, new_file_code = (
+            frontend_request().get_file_code_version(
+                filename, version, save_all=save_all))
+    except CommError:
+        # Frontends that don't support versions
+        return frontend_request().get_file_code(
+            filename, save_all=save_all)
+
+    if new_version is None:
+        # Not open in the editor
+        FILE_CODE_CACHE.pop(filename, None)
+        return new_file_code
+
+    if new_file_code is None and new_version == version:
+        return file_code
+
+    FILE_CODE_CACHE[filename] = (new_version, new_file_code)
+    return new_file_code
+
+
 def get_file_code(filename, save_all=True):
     """Retrive the content of a file."""
     # Get code from spyder
     try:
-        file_code = frontend_request().get_file_code(
-            filename, save_all=save_all)
+        file_code = get_frontend_file_code(filename, save_all=save_all)
     except (CommError, TimeoutError):
         file_code = None
     if file_code is None:
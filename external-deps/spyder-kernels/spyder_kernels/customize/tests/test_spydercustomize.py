@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# Copyright (c) 2009- Spyder Kernels Contributors
+#
+# Licensed under the terms of the MIT License
+# (see spyder_kernels/__init__.py for details)
+# -----------------------------------------------------------------------------
+
+"""Tests for the code of files run from the frontend."""
+
+# Third party imports
+import pytest
+
+# Local imports
+from spyder_kernels.comms.frontendcomm import CommError
+from spyder_kernels.customize import spydercustomize
+
+
+class FakeFrontend(object):
+    """Frontend that replies to the requests for the code of files."""
+
+    def __init__(self, code, in_editor=True, versions=True):
+        self.code = code
+        self.in_editor = in_editor
+        self.versions = versions
+        self.requests = []
+
+    def get_file_code(self, filename, save_all=True):
+        self.requests.append(('get_file_code', filename))
+        return self.code
+
+    def get_file_code_version(self, filename, version, save_all=True):
+        if not self.versions:
+            raise CommError("No such spyder call type: get_file_code_version")
+        self.requests.append(('get_file_code_version', filename, version))
+        if not self.in_editor:
+            return None, self.code
+        new_version = 'v' + self.code
+        if new_version == version:
+            return new_version, None
+        return new_version, self.code
+
+
+@pytest.fixture
+def frontend(monkeypatch):
+    frontend = FakeFrontend('x = 1')
+    monkeypatch.setattr(spydercustomize, 'frontend_request',
+                        lambda: frontend)
+    monkeypatch.setattr(spydercustomize, 'FILE_CODE_CACHE', {})
+    return frontend
+
+
+def test_frontend_file_code_cache(frontend):
+    """Test that the code is cached until it changes."""
+    get_frontend_file_code = spydercustomize.get_frontend_file_code
+    assert get_frontend_file_code('test.py') == 'x = 1'
+    assert get_frontend_file_code('test.py') == 'x = 1'
+    assert frontend.requests == [
+        ('get_file_code_version', 'test.py', None),
+        ('get_file_code_version', 'test.py', 'vx = 1')]
+
+    # Changed file
+    frontend.code = 'x = 2'
+    assert get_frontend_file_code('test.py') == 'x = 2'
+    assert spydercustomize.FILE_CODE_CACHE['test.py'] == ('vx = 2', 'x = 2')
+
+
+def test_frontend_file_code_not_in_editor(frontend):
+    """Test that files not open in the editor are not cached."""
+    spydercustomize.get_frontend_file_code('test.py')
+    frontend.in_editor = False
+    frontend.code = 'x = 2'
+    assert spydercustomize.get_frontend_file_code('test.py') == 'x = 2'
+    assert 'test.py' not in spydercustomize.FILE_CODE_CACHE
+
+
+def test_frontend_file_code_no_versions(frontend):
+    """Test frontends that can't send the version of the code."""
+    frontend.versions = False
+    assert spydercustomize.get_frontend_file_code('test.py') == 'x = 1'
+    assert frontend.requests == [('get_file_code', 'test.py')]
+    assert spydercustomize.FILE_CODE_CACHE == {}
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -11,6 +11,8 @@
 # Stdlib imports
 import os
 import sys
+import time
+import types
 
 # Third party imports
 import pytest
@@ -119,3 +121,66 @@ def test_umr_reload_modules(user_module):
     # Reload user modules
     import foo3
     assert umr.is_module_reloadable(foo3, 'foo3')
+
+
+def test_umr_reload_changed_modules(tmpdir):
+    """
+    Test that the UMR only reloads changed modules and the ones that
+    import them.
+    """
+    if to_text_string(tmpdir) not in sys.path:
+        sys.path.append(to_text_string(tmpdir))
+    package = tmpdir.mkdir('foo5')
+    package.join('__init__.py').write('#')
+    package.join('bar.py').write('x = 1')
+    package.join('baz.py').write('from .bar import x')
+    package.join('spam.py').write('y = 2')
+
+    # Files modified before modules were imported
+    past = time.time() - 60
+    for filename in ('__init__.py', 'bar.py', 'baz.py', 'spam.py'):
+        os.utime(to_text_string(package.join(filename)), (past, past))
+
+    umr = UserModuleReloader()
+    import foo5.baz
+    import foo5.spam
+    umr.run()
+    assert umr.modnames_to_reload == []
+
+    # Saving a file without changes doesn't reload it
+    package.join('spam.py').write('y = 2')
+    umr.run()
+    assert umr.modnames_to_reload == []
+
+    # Modules that import changed modules are reloaded too
+    package.join('bar.py').write('x = 2')
+    umr.run()
+    assert umr.modnames_to_reload == ['foo5.bar', 'foo5.baz']
+    import foo5.baz
+    assert foo5.baz.x == 2
+
+    # Reloading a package reloads its submodules
+    package.join('__init__.py').write('# Changed')
+    umr.run()
+    assert umr.modnames_to_reload == ['foo5', 'foo5.bar', 'foo5.baz',
+                                      'foo5.spam']
+
+
+def test_umr_reload_pyximport_modules(tmpdir):
+    """Test that the UMR always reloads modules compiled by pyximport."""
+    umr = UserModuleReloader()
+    build_dir = tmpdir.mkdir('.pyxbld').mkdir('lib')
+    module = types.ModuleType('foo6')
+    module.__file__ = to_text_string(build_dir.join('foo6.so'))
+    build_dir.join('foo6.so').write('')
+    assert umr.is_module_changed('foo6', module)
+    assert umr.is_module_changed('foo6', module)
+
+    # Modules compiled in place, next to their source
+    tmpdir.join('foo7.cpython-38-x86_64-linux-gnu.so').write('')
+    module = types.ModuleType('foo7')
+    module.__file__ = to_text_string(
+        tmpdir.join('foo7.cpython-38-x86_64-linux-gnu.so'))
+    assert not umr.is_pyximport_module(module)
+    tmpdir.join('foo7.pyx').write('')
+    assert umr.is_pyximport_module(module)
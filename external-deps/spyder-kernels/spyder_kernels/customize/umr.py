@@ -5,13 +5,22 @@
 
 """User module reloader."""
 
+import ast
+import hashlib
 import os
 import sys
+import time
 
 from spyder_kernels.customize.utils import path_is_library
 from spyder_kernels.py3compat import PY2, _print
 
 
+# Files modified less than this number of seconds before a module was first
+# seen are assumed to have been modified after it was imported. This leaves
+# room for the precision of modification times.
+MTIME_MARGIN = 2
+
+
 class UserModuleReloader(object):
     """
     User Module Reloader (UMR) aims at deleting user modules
@@ -56,6 +65,11 @@ def __init__(self, namelist=None, pathlist=None):
         # List of module names to reload
         self.modnames_to_reload = []
 
+        # Source stamps and imports of the user modules seen by run, and the
+        # time of its last call
+        self.module_records = {}
+        self.last_run_time = time.time()
+
         # Activate Cython support
         self.has_cython = False
         self.activate_cython()
@@ -118,23 +132,188 @@ def activate_cython(self):
                 pyximport.install(setup_args=pyx_setup_args,
                                   reload_support=True)
 
+    def is_pyximport_module(self, module):
+        """
+        Decide if a module was compiled from a .pyx file by pyximport.
+
+        Their __file__ is the compiled extension module, which pyximport
+        only builds again when they're imported after their .pyx changed.
+        """
+        loader = getattr(module, '__loader__', None)
+        if type(loader).__module__.split('.')[0] == 'pyximport':
+            return True
+        filename = getattr(module, '__file__', None)
+        if not filename or filename.endswith(('.py', '.pyc')):
+            return False
+        if os.sep + '.pyxbld' + os.sep in filename:
+            # Built in the default directory of pyximport
+            return True
+        # Built in place, next to its source
+        dirname, basename = os.path.split(filename)
+        pyx_file = os.path.join(dirname, basename.split('.')[0] + '.pyx')
+        return os.path.isfile(pyx_file)
+
+    def get_source_stamp(self, filename):
+        """Return the modification time and size of filename, or None."""
+        try:
+            stat = os.stat(filename)
+        except (OSError, TypeError, ValueError):
+            return None
+        return (stat.st_mtime, stat.st_size)
+
+    def get_source_hash(self, filename):
+        """Return a hash of the contents of filename, or None."""
+        try:
+            with open(filename, 'rb') as f:
+                return hashlib.sha1(f.read()).hexdigest()
+        except (IOError, OSError, TypeError, ValueError):
+            return None
+
+    def get_module_imports(self, modname, module, filename):
+        """
+        Return the names of the modules imported by the source of module,
+        including their parent packages.
+
+        Imports in functions are included too, so they may be more than
+        the modules actually imported.
+        """
+        if not filename or not filename.endswith('.py'):
+            return set()
+        try:
+            with open(filename, 'rb') as f:
+                tree = ast.parse(f.read(), filename)
+        except (IOError, OSError, SyntaxError, TypeError, ValueError):
+            return set()
+
+        package = getattr(module, '__package__', None)
+        if package is None:
+            if hasattr(module, '__path__'):
+                package = modname
+            else:
+                package = modname.rpartition('.')[0]
+
+        names = []
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                names += [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom):
+                base = node.module
+                if node.level:
+                    # Relative import
+                    parts = package.split('.')
+                    parts = parts[:len(parts) - node.level + 1]
+                    if node.module:
+                        parts.append(node.module)
+                    base = '.'.join(parts)
+                if not base:
+                    continue
+                names.append(base)
+                names += [base + '.' + alias.name for alias in node.names]
+
+        imports = set()
+        for name in names:
+            parts = name.split('.')
+            for i in range(1, len(parts) + 1):
+                imports.add('.'.join(parts[:i]))
+        return imports
+
+    def is_module_changed(self, modname, module):
+        """
+        Decide if the source of a module changed since it was imported,
+        and update its record.
+
+        Modules seen for the first time are considered changed if their
+        file was modified after the previous run, i.e. maybe after they were
+        imported. Modules compiled by pyximport are always considered
+        changed, because their source is not known.
+        """
+        if self.is_pyximport_module(module):
+            self.module_records[modname] = {
+                'module': module, 'stamp': None, 'hash': None,
+                'imports': set()}
+            return True
+
+        filename = getattr(module, '__file__', None)
+        stamp = self.get_source_stamp(filename)
+        record = self.module_records.get(modname)
+        if record is None or record['module'] is not module:
+            changed = (stamp is not None and
+                       stamp[0] >= self.last_run_time - MTIME_MARGIN)
+            self.module_records[modname] = {
+                'module': module,
+                'stamp': stamp,
+                'hash': self.get_source_hash(filename),
+                'imports': self.get_module_imports(modname, module,
+                                                   filename)}
+            return changed
+
+        # Files modified around the last run are checked anyway, in case
+        # their modification time has a coarse precision
+        if stamp == record['stamp'] and (
+                stamp is None or
+                stamp[0] < self.last_run_time - MTIME_MARGIN):
+            return False
+        record['stamp'] = stamp
+        source_hash = self.get_source_hash(filename)
+        if source_hash is not None and source_hash == record['hash']:
+            # The file was saved without changes
+            return False
+        return True
+
+    def get_modnames_to_reload(self, modules):
+        """
+        Return the names of the modules that need to be reloaded out of
+        modules, a dict of reloadable modules.
+
+        These are the changed modules, the ones that import them (directly
+        or not) and the submodules of all of them.
+        """
+        to_reload = set(modname for modname, module in modules.items()
+                        if self.is_module_changed(modname, module))
+
+        pending = list(to_reload)
+        while pending:
+            reloaded = pending.pop()
+            for modname in modules:
+                if modname in to_reload:
+                    continue
+                record = self.module_records[modname]
+                if (reloaded in record['imports'] or
+                        modname.startswith(reloaded + '.')):
+                    to_reload.add(modname)
+                    pending.append(modname)
+
+        return sorted(to_reload)
+
     def run(self):
         """
-        Delete user modules to force Python to deeply reload them
+        Delete changed user modules to force Python to deeply reload them
 
         Do not del modules which are considered as system modules, i.e.
         modules installed in subdirectories of Python interpreter's binary
         Do not del C modules
+
+        Only modules whose source changed since they were imported, or that
+        import (directly or not) such modules, are deleted.
         """
-        self.modnames_to_reload = []
+        run_time = time.time()
+        modules = {}
         for modname, module in list(sys.modules.items()):
             if modname not in self.previous_modules:
                 # Decide if a module can be reloaded or not
                 if self.is_module_reloadable(module, modname):
-                    self.modnames_to_reload.append(modname)
-                    del sys.modules[modname]
-                else:
-                    continue
+                    modules[modname] = module
+
+        # Forget modules deleted by other means
+        for modname in list(self.module_records):
+            if modname not in modules:
+                del self.module_records[modname]
+
+        self.modnames_to_reload = self.get_modnames_to_reload(modules)
+        for modname in self.modnames_to_reload:
+            del sys.modules[modname]
+            del self.module_records[modname]
+        self.last_run_time = run_time
 
         # Report reloaded modules
         if self.verbose and self.modnames_to_reload:
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# Copyright (c) 2009- Spyder Kernels Contributors
+#
+# Licensed under the terms of the MIT License
+# (see spyder_kernels/__init__.py for details)
+# -----------------------------------------------------------------------------
+
+"""
+Views of data frames kept in the kernel.
+
+They let the Variable Explorer browse big DataFrames, Series and Indexes
+without sending them to the frontend: only the windows of cells, labels
+and statistics that are displayed are requested.
+"""
+
+# Third party imports
+import numpy as np
+
+
+# Supported numbers and complex numbers, as in the DataFrame editor
+REAL_NUMBER_TYPES = (float, int, np.int64, np.int32)
+COMPLEX_NUMBER_TYPES = (complex, np.complex64, np.complex128)
+
+
+def is_viewable(value):
+    """Return True if a DataView can be created for value."""
+    try:
+        from pandas import DataFrame, Index, Series
+    except ImportError:
+        return False
+    return isinstance(value, (DataFrame, Index, Series))
+
+
+class DataView(object):
+    """
+    View of a DataFrame, Series or Index.
+
+    Series and Indexes are seen as DataFrames with a single column. Sorting
+    the view only changes the order of its rows, never the viewed object.
+    """
+
+    def __init__(self, value):
+        from pandas import DataFrame, Series
+
+        self.type_name = value.__class__.__name__
+        self.is_series = isinstance(value, Series)
+        if self.is_series:
+            value = value.to_frame()
+        elif not isinstance(value, DataFrame):
+            value = DataFrame(value)
+        self.df = value
+
+        # Positions of the rows in the view, or None if they are unsorted
+        self._order = None
+
+    def get_info(self):
+        """Return what's needed to display the view."""
+        df = self.df
+        return {
+            'type_name': self.type_name,
+            'is_series': self.is_series,
+            'shape': df.shape,
+            'header_shape': (df.columns.nlevels, df.index.nlevels),
+            'names': (list(df.columns.names), list(df.index.names)),
+        }
+
+    def get_window(self, start_row, stop_row, start_col, stop_col):
+        """Return the DataFrame of the given rows and columns of the view."""
+        return self.df.iloc[self._rows(start_row, stop_row),
+                            start_col:stop_col]
+
+    def get_header(self, axis, start, stop):
+        """
+        Return a list with the labels of columns (axis 0) or rows (axis 1)
+        from start to stop.
+
+        Labels of multi-level axes are tuples.
+        """
+        if axis == 0:
+            labels = self.df.columns[start:stop]
+        else:
+            labels = self.df.index[self._rows(start, stop)]
+        return labels.tolist()
+
+    def get_minmax(self):
+        """
+        Return a list whose k-th entry is [vmax, vmin] for the k-th column.
+
+        See DataFrameModel.max_min_col_update in Spyder for details.
+        """
+        df = self.df
+        if df.shape[0] == 0:
+            return None
+        max_min_col = [None] * df.shape[1]
+
+        # The columns of each kind are reduced all at once
+        dtypes = df.dtypes
+        real = [i for i in range(df.shape[1])
+                if dtypes.iat[i] in REAL_NUMBER_TYPES]
+        complex_ = [i for i in range(df.shape[1])
+                    if dtypes.iat[i] in COMPLEX_NUMBER_TYPES]
+        for positions in (real, complex_):
+            if not positions:
+                continue
+            if len(positions) == df.shape[1]:
+                values = df
+            else:
+                values = df.iloc[:, positions]
+            if positions is complex_:
+                values = values.abs()
+            vmaxs = values.max(skipna=True).tolist()
+            vmins = values.min(skipna=True).tolist()
+            for i, vmax, vmin in zip(positions, vmaxs, vmins):
+                if vmax != vmin:
+                    max_min_col[i] = [vmax, vmin]
+                else:
+                    max_min_col[i] = [vmax, vmin - 1]
+        return max_min_col
+
+    def sort(self, column, ascending=True):
+        """
+        Sort the rows of the view by a column, or by the index if column
+        is negative.
+
+        The sort is stable and missing values are put last, as done by
+        pandas.
+        """
+        from pandas import Series
+
+        if column >= 0:
+            col = self.df.iloc[:, column].reset_index(drop=True)
+            order = col.sort_values(ascending=ascending,
+                                    kind='mergesort').index
+        else:
+            positions = Series(np.arange(self.df.shape[0]),
+                               index=self.df.index)
+            order = positions.sort_index(ascending=ascending,
+                                         kind='mergesort')
+        self._order = np.asarray(order)
+
+    def _rows(self, start, stop):
+        """Return the positions of the rows from start to stop."""
+        if self._order is None:
+            return slice(start, stop)
+        return self._order[start:stop]
@@ -27,8 +27,10 @@
 import json
 import inspect
 import dis
-import copy
 import glob
+import hashlib
+import io
+import time
 
 # Third party imports
 # - If pandas fails to import here (for any reason), Spyder
@@ -208,11 +210,6 @@ def load_array(filename):
         except Exception as error:
             return None, str(error)
 
-    def __save_array(data, basename, index):
-        """Save numpy array"""
-        fname = basename + '_%04d.npy' % index
-        np.save(fname, data)
-        return fname
 except:
     load_array = None
 
@@ -286,100 +283,189 @@ def load_json(filename):
         return None, str(err)
 
 
-def save_dictionary(data, filename):
-    """Save dictionary in a single file .spydata file"""
+# Version of the .spydata format written by save_dictionary. Files without
+# SPYDATA_INFO are in the first format: a tar file with a pickle of all
+# variables and .npy files for some of their arrays.
+SPYDATA_FORMAT = 2
+SPYDATA_INFO = 'spydata.json'
+
+# Arrays with at least this number of bytes are saved as separate blobs
+MIN_BLOB_SIZE = 64 * 1024
+
+# Arrays are hashed and written in chunks of (about) this number of bytes
+CHUNK_SIZE = 16 * 1024 ** 2
+
+
+class _ChunksReader(object):
+    """File-like object to read the bytes of a sequence of chunks."""
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._chunk = memoryview(b'')
+
+    def read(self, size=-1):
+        data = []
+        while size != 0:
+            if not len(self._chunk):
+                try:
+                    self._chunk = memoryview(next(self._chunks))
+                except StopIteration:
+                    break
+            end = len(self._chunk) if size < 0 else min(size,
+                                                        len(self._chunk))
+            data.append(self._chunk[:end].tobytes())
+            self._chunk = self._chunk[end:]
+            if size > 0:
+                size -= end
+        return b''.join(data)
+
+
+def _get_npy_header(array):
+    """Return the header of the .npy file of *array*."""
+    header = io.BytesIO()
+    np.lib.format.write_array_header_1_0(
+        header, np.lib.format.header_data_from_array_1_0(array))
+    return header.getvalue()
+
+
+def _iter_npy_chunks(array):
+    """Yield the contents of the .npy file of *array* in chunks."""
+    yield _get_npy_header(array)
+
+    # Data is written in the order of the header
+    if not array.flags.c_contiguous and array.flags.f_contiguous:
+        array = array.T
+    if array.ndim == 0:
+        array = array.reshape(1)
+    rows = max(1, CHUNK_SIZE // max(1, array[0].nbytes))
+    for start in range(0, len(array), rows):
+        chunk = np.ascontiguousarray(array[start:start + rows])
+        yield chunk.reshape(-1).view(np.uint8)
+
+
+def _get_blob_name(array):
+    """Return the name of the blob of *array*, made from its contents."""
+    sha1 = hashlib.sha1()
+    for chunk in _iter_npy_chunks(array):
+        sha1.update(chunk)
+    return 'arrays/%s.npy' % sha1.hexdigest()
+
+
+def _add_to_tar(tar, name, size, fileobj):
+    """Add a member to *tar*, reading *size* bytes from *fileobj*."""
+    info = tarfile.TarInfo(name)
+    info.size = size
+    info.mtime = time.time()
+    tar.addfile(info, fileobj)
+
+
+def _replace_file(src, dst):
+    """
+    Replace *dst* with *src* in a single step.
+
+    Windows doesn't allow to replace a file that is memory-mapped, which
+    is the case of a .spydata file while arrays loaded from it are alive.
+    """
+    try:
+        if PY2:
+            if osp.isfile(dst):
+                os.remove(dst)
+            os.rename(src, dst)
+        else:
+            os.replace(src, dst)
+    except OSError:
+        if os.name == 'nt' and osp.isfile(dst):
+            raise IOError("%s is in use by arrays that were loaded from it. "
+                          "Please save the data to another file." % dst)
+        raise
+
+
+def save_dictionary(data, filename, compress=False):
+    """
+    Save dictionary in a single file .spydata file
+
+    Variables are pickled one by one, without copying them. Big arrays
+    (including the ones in other objects) are saved apart as .npy blobs,
+    which are written in chunks, named after their contents to save equal
+    arrays once and memory-mapped by load_dictionary. The file can be
+    compressed, but then arrays are read whole when loading.
+
+    The data is written to a temporary file that replaces *filename* at
+    the end. On Windows, this fails if arrays memory-mapped from
+    *filename* are still alive.
+    """
     filename = osp.abspath(filename)
-    old_cwd = getcwd()
-    os.chdir(osp.dirname(filename))
+    tmp_filename = filename + '.tmp'
     error_message = None
     skipped_keys = []
-    data_copy = {}
+    variables = {}
 
     try:
-        # Copy dictionary before modifying it to fix #6689
-        for obj_name, obj_value in data.items():
-            # Skip modules, since they can't be pickled, users virtually never
-            # would want them to be and so they don't show up in the skip list.
-            # Skip callables, since they are only pickled by reference and thus
-            # must already be present in the user's environment anyway.
-            if not (callable(obj_value) or isinstance(obj_value,
-                                                      types.ModuleType)):
-                # If an object cannot be deepcopied, then it cannot be pickled.
-                # Ergo, we skip it and list it later.
+        # Use PAX (POSIX.1-2001) format instead of default GNU.
+        # This improves interoperability and UTF-8/long variable name support.
+        mode = 'w:gz' if compress else 'w'
+        with tarfile.open(tmp_filename, mode,
+                          format=tarfile.PAX_FORMAT) as tar:
+            saved_blobs = set()
+            blob_names = {}
+
+            def persistent_id(obj, new_blobs):
+                """Return the blob of obj, if it's saved apart."""
+                if not (type(obj) in (np.ndarray, np.memmap) and
+                        not obj.dtype.hasobject and
+                        obj.nbytes >= MIN_BLOB_SIZE):
+                    return None
+                if id(obj) not in blob_names:
+                    # Keep obj to not reuse its id
+                    blob_names[id(obj)] = (_get_blob_name(obj), obj)
+                name = blob_names[id(obj)][0]
+                new_blobs[name] = obj
+                return ('array', name)
+
+            for obj_name, obj_value in data.items():
+                # Skip modules, since they can't be pickled, users virtually
+                # never would want them to be and so they don't show up in
+                # the skip list.
+                # Skip callables, since they are only pickled by reference
+                # and thus must already be present in the user's environment
+                # anyway.
+                if (callable(obj_value) or
+                        isinstance(obj_value, types.ModuleType)):
+                    continue
+
+                new_blobs = {}
+                pickled = io.BytesIO()
+                pickler = pickle.Pickler(pickled, protocol=2)
+                if load_array is not None:
+                    pickler.persistent_id = (
+                        lambda obj: persistent_id(obj, new_blobs))
                 try:
-                    data_copy[obj_name] = copy.deepcopy(obj_value)
+                    pickler.dump(obj_value)
                 except Exception:
                     skipped_keys.append(obj_name)
-        data = data_copy
-        if not data:
-            raise RuntimeError('No supported objects to save')
-
-        saved_arrays = {}
-        if load_array is not None:
-            # Saving numpy arrays with np.save
-            arr_fname = osp.splitext(filename)[0]
-            for name in list(data.keys()):
-                try:
-                    if isinstance(data[name],
-                                  np.ndarray) and data[name].size > 0:
-                        # Save arrays at data root
-                        fname = __save_array(data[name], arr_fname,
-                                             len(saved_arrays))
-                        saved_arrays[(name, None)] = osp.basename(fname)
-                        data.pop(name)
-                    elif isinstance(data[name], (list, dict)):
-                        # Save arrays nested in lists or dictionaries
-                        if isinstance(data[name], list):
-                            iterator = enumerate(data[name])
-                        else:
-                            iterator = iter(list(data[name].items()))
-                        to_remove = []
-                        for index, value in iterator:
-                            if isinstance(value,
-                                          np.ndarray) and value.size > 0:
-                                fname = __save_array(value, arr_fname,
-                                                     len(saved_arrays))
-                                saved_arrays[(name, index)] = (
-                                    osp.basename(fname))
-                                to_remove.append(index)
-                        for index in sorted(to_remove, reverse=True):
-                            data[name].pop(index)
-                except (RuntimeError, pickle.PicklingError, TypeError,
-                        AttributeError, IndexError):
-                    # If an array can't be saved with numpy for some reason,
-                    # leave the object intact and try to save it normally.
-                    pass
-            if saved_arrays:
-                data['__saved_arrays__'] = saved_arrays
-
-        pickle_filename = osp.splitext(filename)[0] + '.pickle'
-        # Attempt to pickle everything.
-        # If pickling fails, iterate through to eliminate problem objs & retry.
-        with open(pickle_filename, 'w+b') as fdesc:
-            try:
-                pickle.dump(data, fdesc, protocol=2)
-            except (pickle.PicklingError, AttributeError, TypeError,
-                    ImportError, IndexError, RuntimeError):
-                data_filtered = {}
-                for obj_name, obj_value in data.items():
-                    try:
-                        pickle.dumps(obj_value, protocol=2)
-                    except Exception:
-                        skipped_keys.append(obj_name)
-                    else:
-                        data_filtered[obj_name] = obj_value
-                if not data_filtered:
-                    raise RuntimeError('No supported objects to save')
-                pickle.dump(data_filtered, fdesc, protocol=2)
-
-        # Use PAX (POSIX.1-2001) format instead of default GNU.
-        # This improves interoperability and UTF-8/long variable name support.
-        with tarfile.open(filename, "w", format=tarfile.PAX_FORMAT) as tar:
-            for fname in ([pickle_filename]
-                          + [fn for fn in list(saved_arrays.values())]):
-                tar.add(osp.basename(fname))
-                os.remove(fname)
-    except (RuntimeError, pickle.PicklingError, TypeError) as error:
+                    continue
+
+                for name, array in new_blobs.items():
+                    if name not in saved_blobs:
+                        size = len(_get_npy_header(array)) + array.nbytes
+                        _add_to_tar(tar, name, size,
+                                    _ChunksReader(_iter_npy_chunks(array)))
+                        saved_blobs.add(name)
+                member = 'variables/%d.pickle' % len(variables)
+                _add_to_tar(tar, member, pickled.tell(),
+                            io.BytesIO(pickled.getvalue()))
+                variables[obj_name] = member
+
+            if not variables:
+                raise RuntimeError('No supported objects to save')
+            info = json.dumps({'format': SPYDATA_FORMAT,
+                               'compressed': compress,
+                               'variables': variables}).encode('utf-8')
+            _add_to_tar(tar, SPYDATA_INFO, len(info), io.BytesIO(info))
+
+        _replace_file(tmp_filename, filename)
+    except (RuntimeError, pickle.PicklingError, TypeError, IOError,
+            OSError) as error:
         error_message = to_text_string(error)
     else:
         if skipped_keys:
@@ -387,10 +473,64 @@ def save_dictionary(data, filename):
             error_message = ('Some objects could not be saved: '
                              + ', '.join(skipped_keys))
     finally:
-        os.chdir(old_cwd)
+        if osp.isfile(tmp_filename):
+            os.remove(tmp_filename)
     return error_message
 
 
+def _load_blob(tar, filename, name, compressed):
+    """
+    Load the array saved in blob *name* of *tar*.
+
+    Arrays of uncompressed files are memory-mapped in copy-on-write mode,
+    so their data is only read when accessed and changing them doesn't
+    change the file.
+    """
+    member = tar.getmember(name)
+    fileobj = tar.extractfile(member)
+    version = np.lib.format.read_magic(fileobj)
+    if version == (1, 0):
+        shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(
+            fileobj)
+    else:
+        shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(
+            fileobj)
+    order = 'F' if fortran_order else 'C'
+
+    if compressed or member.issparse():
+        # np.lib.format.read_array can't read tar members
+        buffer = bytearray(member.size - fileobj.tell())
+        fileobj.readinto(buffer)
+        return np.frombuffer(buffer, dtype=dtype).reshape(shape, order=order)
+
+    array = np.memmap(filename, dtype=dtype, mode='c', shape=shape,
+                      order=order, offset=member.offset_data + fileobj.tell())
+    return array.view(np.ndarray)
+
+
+def _load_variables(tar, filename):
+    """Load the variables of a .spydata file saved by save_dictionary."""
+    info = json.loads(tar.extractfile(SPYDATA_INFO).read().decode('utf-8'))
+    if info['format'] > SPYDATA_FORMAT:
+        raise ValueError('This file was saved by a newer version of Spyder')
+
+    arrays = {}
+
+    def persistent_load(pid):
+        kind, name = pid
+        if name not in arrays:
+            arrays[name] = _load_blob(tar, filename, name,
+                                      info['compressed'])
+        return arrays[name]
+
+    data = {}
+    for obj_name, member in info['variables'].items():
+        unpickler = pickle.Unpickler(tar.extractfile(member))
+        unpickler.persistent_load = persistent_load
+        data[obj_name] = unpickler.load()
+    return data
+
+
 def load_dictionary(filename):
     """Load dictionary from .spydata file"""
     filename = osp.abspath(filename)
@@ -401,26 +541,11 @@ def load_dictionary(filename):
     error_message = None
     try:
         with tarfile.open(filename, "r") as tar:
-            tar.extractall()
-        pickle_filename = glob.glob('*.pickle')[0]
-        # 'New' format (Spyder >=2.2 for Python 2 and Python 3)
-        with open(pickle_filename, 'rb') as fdesc:
-            data = pickle.loads(fdesc.read())
-        saved_arrays = {}
-        if load_array is not None:
-            # Loading numpy arrays saved with np.save
-            try:
-                saved_arrays = data.pop('__saved_arrays__')
-                for (name, index), fname in list(saved_arrays.items()):
-                    arr = np.load( osp.join(tmp_folder, fname) )
-                    if index is None:
-                        data[name] = arr
-                    elif isinstance(data[name], dict):
-                        data[name][index] = arr
-                    else:
-                        data[name].insert(index, arr)
-            except KeyError:
-                pass
+            if SPYDATA_INFO in tar.getnames():
+                data = _load_variables(tar, filename)
+            else:
+                tar.extractall()
+                data = _load_first_format(tmp_folder)
     # Except AttributeError from e.g. trying to load function no longer present
     except (AttributeError, EOFError, ValueError) as error:
         error_message = to_text_string(error)
@@ -434,6 +559,33 @@ def load_dictionary(filename):
     return data, error_message
 
 
+def _load_first_format(tmp_folder):
+    """
+    Load the variables of a .spydata file in the first format, extracted
+    to the current directory *tmp_folder*.
+    """
+    pickle_filename = glob.glob('*.pickle')[0]
+    # 'New' format (Spyder >=2.2 for Python 2 and Python 3)
+    with open(pickle_filename, 'rb') as fdesc:
+        data = pickle.loads(fdesc.read())
+    saved_arrays = {}
+    if load_array is not None:
+        # Loading numpy arrays saved with np.save
+        try:
+            saved_arrays = data.pop('__saved_arrays__')
+            for (name, index), fname in list(saved_arrays.items()):
+                arr = np.load( osp.join(tmp_folder, fname) )
+                if index is None:
+                    data[name] = arr
+                elif isinstance(data[name], dict):
+                    data[name][index] = arr
+                else:
+                    data[name].insert(index, arr)
+        except KeyError:
+            pass
+    return data
+
+
 class IOFunctions(object):
     def __init__(self):
         self.load_extensions = None
@@ -15,13 +15,16 @@
 from itertools import islice
 import inspect
 import re
+import threading
+import time
+import weakref
 
 # Local imports
 from spyder_kernels.py3compat import (NUMERIC_TYPES, INT_TYPES, TEXT_TYPES,
                                       to_text_string, is_text_string,
                                       is_type_text_string,
                                       is_binary_string, PY2,
-                                      to_binary_string, iteritems)
+                                      to_binary_string, iteritems, Queue)
 
 
 #==============================================================================
@@ -287,6 +290,14 @@ def unsorted_unique(lista):
 #==============================================================================
 # Display <--> Value
 #==============================================================================
+# Longer displays are truncated
+MAX_DISPLAY_LENGTH = 70
+
+# Time to display the elements of a collection, in seconds. The rest of
+# them are replaced by an ellipsis.
+DISPLAY_TIME_BUDGET = 0.1
+
+
 def default_display(value, with_module=True):
     """Default display for unknown objects."""
     object_type = type(value)
@@ -310,8 +321,15 @@ def default_display(value, with_module=True):
         return type_str[1:-1]
 
 
-def collections_display(value, level):
-    """Display for collections (i.e. list, set, tuple and dict)."""
+def collections_display(value, level, deadline=None):
+    """
+    Display for collections (i.e. list, set, tuple and dict).
+
+    Elements are not displayed after *deadline*, as given by time.time(),
+    which is DISPLAY_TIME_BUDGET seconds from now by default.
+    """
+    if deadline is None:
+        deadline = time.time() + DISPLAY_TIME_BUDGET
     is_dict = isinstance(value, dict)
     is_set = isinstance(value, set)
 
@@ -332,13 +350,20 @@ def collections_display(value, level):
 
     # Get display of each element
     if level <= 2:
-        if is_dict:
-            displays = [value_to_display(k, level=level) + ':' +
-                        value_to_display(v, level=level)
-                        for (k, v) in list(elements)]
-        else:
-            displays = [value_to_display(e, level=level)
-                        for e in elements]
+        displays = []
+        for element in elements:
+            if time.time() > deadline:
+                truncate = True
+                break
+            if is_dict:
+                k, v = element
+                displays.append(
+                    value_to_display(k, level=level, deadline=deadline) +
+                    ':' +
+                    value_to_display(v, level=level, deadline=deadline))
+            else:
+                displays.append(
+                    value_to_display(element, level=level, deadline=deadline))
         if truncate:
             displays.append('...')
         display = ', '.join(displays)
@@ -358,8 +383,23 @@ def collections_display(value, level):
     return display
 
 
-def value_to_display(value, minmax=False, level=0):
-    """Convert value for display purpose"""
+def get_minmax_display(value):
+    """
+    Return the display of the min and max of array *value*, or None if
+    they can't be computed
+    """
+    try:
+        return 'Min: %r\nMax: %r' % (value.min(), value.max())
+    except (TypeError, ValueError):
+        return None
+
+
+def value_to_display(value, minmax=False, level=0, deadline=None):
+    """
+    Convert value for display purpose
+
+    *deadline* is passed to collections_display.
+    """
     # To save current Numpy printoptions
     np_printoptions = FakeObject
 
@@ -380,22 +420,16 @@ def value_to_display(value, minmax=False, level=0):
             display = 'Masked array'
         elif isinstance(value, ndarray):
             if level == 0:
-                if minmax:
-                    try:
-                        display = 'Min: %r\nMax: %r' % (value.min(), value.max())
-                    except (TypeError, ValueError):
-                        if value.dtype.type in NUMERIC_NUMPY_TYPES:
-                            display = str(value)
-                        else:
-                            display = default_display(value)
-                elif value.dtype.type in NUMERIC_NUMPY_TYPES:
-                    display = str(value)
-                else:
-                    display = default_display(value)
+                display = get_minmax_display(value) if minmax else None
+                if display is None:
+                    if value.dtype.type in NUMERIC_NUMPY_TYPES:
+                        display = str(value)
+                    else:
+                        display = default_display(value)
             else:
                 display = 'Numpy array'
         elif any([type(value) == t for t in [list, set, tuple, dict]]):
-            display = collections_display(value, level+1)
+            display = collections_display(value, level+1, deadline)
         elif isinstance(value, Image):
             if level == 0:
                 display = '%s  Mode: %s' % (address(value), value.mode)
@@ -403,7 +437,8 @@ def value_to_display(value, minmax=False, level=0):
                 display = 'Image'
         elif isinstance(value, DataFrame):
             if level == 0:
-                cols = value.columns
+                # More columns than these don't fit in the display
+                cols = value.columns[:MAX_DISPLAY_LENGTH // 2]
                 if PY2 and len(cols) > 0:
                     # Get rid of possible BOM utf-8 data present at the
                     # beginning of a file, which gets attached to the first
@@ -451,7 +486,8 @@ def value_to_display(value, minmax=False, level=0):
             # We don't apply this to classes that extend string types
             # See issue 5636
             if is_type_text_string(value):
-                display = value
+                # Avoid copying long strings, which are truncated below
+                display = value[:MAX_DISPLAY_LENGTH + 10]
                 if level > 0:
                     display = u"'" + display + u"'"
             else:
@@ -473,12 +509,12 @@ def value_to_display(value, minmax=False, level=0):
 
     # Truncate display at 70 chars to avoid freezing Spyder
     # because of large displays
-    if len(display) > 70:
+    if len(display) > MAX_DISPLAY_LENGTH:
         if is_binary_string(display):
             ellipses = b' ...'
         else:
             ellipses = u' ...'
-        display = display[:70].rstrip() + ellipses
+        display = display[:MAX_DISPLAY_LENGTH].rstrip() + ellipses
 
     # Restore Numpy printoptions
     if np_printoptions is not FakeObject:
@@ -709,7 +745,160 @@ def get_remote_data(data, settings, mode, more_excluded_names=None):
         excluded_names=excluded_names)
 
 
-def make_remote_view(data, settings, more_excluded_names=None):
+# Arrays with more elements than this have their min/max computed in a
+# background thread by MinMaxDisplays
+MINMAX_SIZE_BUDGET = 1000000
+
+# View of arrays whose min/max are being computed
+PENDING_MINMAX_DISPLAY = 'Computing min/max...'
+
+
+def get_array_fingerprint(value):
+    """
+    Return a fingerprint of array *value*, or None if *value* is not a
+    plain array.
+
+    The fingerprint changes when the array is reshaped or its data is
+    reallocated, but not when its elements are modified in place, because
+    that would need going through all of them.
+    """
+    if (not isinstance(value, ndarray) or
+            isinstance(value, (MaskedArray, recarray))):
+        return None
+    return (value.dtype.str, value.shape, value.strides,
+            value.__array_interface__['data'][0])
+
+
+class MinMaxDisplays(object):
+    """
+    Cache of the min/max displays of big arrays.
+
+    Arrays bigger than MINMAX_SIZE_BUDGET are reduced in a background
+    thread, so that they don't block the kernel, and PENDING_MINMAX_DISPLAY
+    is shown until then. Their displays are kept while they're alive and
+    their fingerprint doesn't change (see get_array_fingerprint), until
+    clear is called, e.g. after running code that may have modified them
+    in place. The min/max of smaller arrays are not cached.
+
+    Parameters
+    ----------
+    callback: callable, optional
+        Called without arguments from the background thread when the
+        pending displays are ready.
+    """
+
+    def __init__(self, callback=None):
+        self.callback = callback
+        # Maps array ids to (weak reference, fingerprint, display) tuples
+        self._displays = {}
+        self._lock = threading.RLock()
+        self._queue = Queue.Queue()
+        self._thread = None
+
+    def get_display(self, value):
+        """
+        Return the min/max display of array *value*.
+
+        Return None if *value* is not a plain array bigger than
+        MINMAX_SIZE_BUDGET, so value_to_display should be used instead.
+        """
+        fingerprint = get_array_fingerprint(value)
+        if fingerprint is None or value.size <= MINMAX_SIZE_BUDGET:
+            return None
+
+        key = id(value)
+        with self._lock:
+            cached = self._displays.get(key)
+            if (cached is not None and cached[0]() is value and
+                    cached[1] == fingerprint):
+                display = cached[2]
+            else:
+                try:
+                    ref = weakref.ref(value, lambda ref: self._forget(key))
+                except TypeError:
+                    return None
+                display = PENDING_MINMAX_DISPLAY
+                self._displays[key] = (ref, fingerprint, display)
+                self._queue.put(key)
+                self._start_thread()
+
+        if display is None:
+            # The min/max can't be computed
+            return value_to_display(value)
+        return display
+
+    def clear(self):
+        """Forget all the displays."""
+        with self._lock:
+            self._displays.clear()
+
+    def _forget(self, key):
+        """Remove the display of an array that was deleted."""
+        with self._lock:
+            self._displays.pop(key, None)
+
+    def _start_thread(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._compute_displays)
+            self._thread.daemon = True
+            self._thread.start()
+
+    def _compute_displays(self):
+        """Compute the pending displays, in the background thread."""
+        while True:
+            key = self._queue.get()
+            with self._lock:
+                cached = self._displays.get(key)
+            value = cached[0]() if cached is not None else None
+            if value is not None and cached[2] == PENDING_MINMAX_DISPLAY:
+                display = get_minmax_display(value)
+                with self._lock:
+                    if self._displays.get(key) is cached:
+                        self._displays[key] = cached[:2] + (display,)
+                del value
+            if self._queue.empty() and self.callback is not None:
+                self.callback()
+
+
+def get_view_fingerprint(value):
+    """
+    Return a cheap fingerprint of the entry of *value* in a remote view,
+    or None if its entry has to be computed every time.
+
+    Collections return None because any object nested in them can be
+    modified in place, which changes their display.
+    """
+    value_type = type(value)
+    if value_type in TEXT_TYPES or value_type is bytes:
+        return (len(value), hash(value))
+    elif (value is None or value_type in NUMERIC_TYPES or
+            value_type in NUMERIC_NUMPY_TYPES or
+            value_type in (bool, datetime.date, datetime.timedelta)):
+        return (value,)
+    elif isinstance(value, DataFrame):
+        return (value.shape, id(value.columns))
+    return None
+
+
+def make_remote_view_entry(value, settings, minmax_displays=None):
+    """
+    Make the entry of *value* in a remote view
+
+    *minmax_displays* is a MinMaxDisplays used for arrays, if given.
+    """
+    view = None
+    if settings['minmax'] and minmax_displays is not None:
+        view = minmax_displays.get_display(value)
+    if view is None:
+        view = value_to_display(value, minmax=settings['minmax'])
+    return {'type':  get_human_readable_type(value),
+            'size':  get_size(value),
+            'color': get_color_name(value),
+            'view':  view}
+
+
+def make_remote_view(data, settings, more_excluded_names=None,
+                     minmax_displays=None):
     """
     Make a remote view of dictionary *data*
     -> globals explorer
@@ -718,9 +907,42 @@ def make_remote_view(data, settings, more_excluded_names=None):
                            more_excluded_names=more_excluded_names)
     remote = {}
     for key, value in list(data.items()):
-        view = value_to_display(value, minmax=settings['minmax'])
-        remote[key] = {'type':  get_human_readable_type(value),
-                       'size':  get_size(value),
-                       'color': get_color_name(value),
-                       'view':  view}
-    return remote
\ No newline at end of file
+        remote[key] = make_remote_view_entry(value, settings,
+                                             minmax_displays)
+    return remote
+
+
+def make_remote_view_changes(data, settings, cache,
+                             more_excluded_names=None, minmax_displays=None):
+    """
+    Make the changes of the remote view of dictionary *data* since the
+    last call with the same *cache*.
+
+    *cache* is a dictionary (empty on the first call) that is updated with
+    the entries of the new view, to only return the ones that changed.
+    Entries are not computed again for variables that are still bound to
+    the same object, if its fingerprint didn't change (see
+    get_view_fingerprint). The min/max of big arrays are taken from
+    *minmax_displays* if given, so they're computed in the background.
+
+    Return a tuple (changed, removed) with the entries of the variables
+    that were added or changed and the names of the removed ones.
+    """
+    data = get_remote_data(data, settings, mode='editable',
+                           more_excluded_names=more_excluded_names)
+    changed = {}
+    for key, value in list(data.items()):
+        fingerprint = get_view_fingerprint(value)
+        cached = cache.get(key)
+        if (fingerprint is not None and cached is not None and
+                cached[0] == id(value) and cached[1] == fingerprint):
+            continue
+        entry = make_remote_view_entry(value, settings, minmax_displays)
+        if cached is None or cached[2] != entry:
+            changed[key] = entry
+        cache[key] = (id(value), fingerprint, entry)
+
+    removed = [key for key in cache if key not in data]
+    for key in removed:
+        del cache[key]
+    return changed, removed
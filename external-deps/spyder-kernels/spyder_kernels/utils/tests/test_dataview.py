@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# Copyright (c) 2009- Spyder Kernels Contributors
+#
+# Licensed under the terms of the MIT License
+# (see spyder_kernels/__init__.py for details)
+# -----------------------------------------------------------------------------
+
+"""
+Tests for dataview.py
+"""
+
+# Third party imports
+import numpy as np
+import pandas as pd
+import pytest
+
+# Local imports
+from spyder_kernels.utils.dataview import DataView, is_viewable
+
+
+@pytest.fixture
+def df():
+    index = pd.MultiIndex.from_tuples(
+        [('a', 1), ('a', 2), ('b', 1), ('b', 2)], names=['letter', 'number'])
+    return pd.DataFrame({'x': [3.0, np.nan, 1.0, 2.0],
+                         'y': ['d', 'c', 'b', 'a'],
+                         'z': [1j, 2j, 3j, 4j]},
+                        index=index)
+
+
+def test_is_viewable(df):
+    """Test the values that can be viewed."""
+    assert is_viewable(df)
+    assert is_viewable(df['x'])
+    assert is_viewable(df.columns)
+    assert not is_viewable(np.arange(3))
+    assert not is_viewable([1, 2])
+
+
+def test_dataview_window(df):
+    """Test getting windows of cells and labels."""
+    view = DataView(df)
+    info = view.get_info()
+    assert info['type_name'] == 'DataFrame'
+    assert info['shape'] == (4, 3)
+    assert info['header_shape'] == (1, 2)
+    assert info['names'] == ([None], ['letter', 'number'])
+
+    window = view.get_window(1, 3, 1, 3)
+    assert window.values.tolist() == [['c', 2j], ['b', 3j]]
+    assert view.get_header(0, 1, 5) == ['y', 'z']
+    assert view.get_header(1, 0, 2) == [('a', 1), ('a', 2)]
+
+    # Series are seen as frames of one column
+    view = DataView(df['y'])
+    assert view.is_series
+    assert view.get_info()['shape'] == (4, 1)
+
+
+def test_dataview_sort(df):
+    """Test that sorting a view doesn't change the viewed frame."""
+    original = df.copy()
+    view = DataView(df)
+
+    view.sort(0)
+    assert view.get_window(0, 4, 0, 1)['x'].tolist()[:3] == [1.0, 2.0, 3.0]
+    assert view.get_header(1, 0, 1) == [('b', 1)]
+
+    view.sort(1, ascending=False)
+    assert view.get_window(0, 4, 1, 2)['y'].tolist() == ['d', 'c', 'b', 'a']
+
+    view.sort(-1, ascending=False)
+    assert view.get_header(1, 0, 4) == [('b', 2), ('b', 1), ('a', 2),
+                                        ('a', 1)]
+    assert view.get_window(0, 1, 0, 2).values.tolist() == [[2.0, 'a']]
+    pd.testing.assert_frame_equal(df, original)
+
+
+def test_dataview_minmax(df):
+    """Test the statistics used to color the cells."""
+    view = DataView(df)
+    assert view.get_minmax() == [[3.0, 1.0], None, [4.0, 1.0]]
+    assert DataView(df.iloc[:0]).get_minmax() is None
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -14,6 +14,7 @@
 import io
 import os
 import copy
+import tarfile
 
 # Third party imports
 import pytest
@@ -339,5 +340,66 @@ def test_spydata_export(input_namespace, expected_namespace,
                 pass
 
 
+@pytest.mark.parametrize('compress', [False, True])
+def test_spydata_blobs(tmpdir, compress):
+    """
+    Test that big arrays are saved once and memory-mapped when loaded.
+    """
+    path = str(tmpdir.join('blobs.spydata'))
+    big = np.arange(iofuncs.MIN_BLOB_SIZE, dtype=np.float64).reshape(2, -1)
+    namespace = {'big': big,
+                 'same': big,
+                 'fortran': np.asfortranarray(big),
+                 'nested': {'equal': big.copy(), 'small': np.eye(2)}}
+
+    assert iofuncs.save_dictionary(namespace, path,
+                                   compress=compress) is None
+    with tarfile.open(path) as tar:
+        blobs = [name for name in tar.getnames()
+                 if name.startswith('arrays/')]
+    assert len(blobs) == 2
+
+    data, error = iofuncs.load_dictionary(path)
+    assert error is None
+    assert data['same'] is data['big']
+    for array in (data['big'], data['fortran'], data['nested']['equal']):
+        assert np.array_equal(array, big)
+    assert np.isfortran(data['fortran'])
+    assert np.array_equal(data['nested']['small'], np.eye(2))
+    assert isinstance(data['big'].base, np.memmap) != compress
+
+    # Changing loaded arrays doesn't change the file
+    data['big'][0, 0] = -1
+    del data
+    data, error = iofuncs.load_dictionary(path)
+    assert data['big'][0, 0] == 0
+
+
+@pytest.mark.skipif(os.name == 'nt',
+                    reason="Mapped files can't be replaced on Windows")
+def test_spydata_save_loaded(tmpdir):
+    """
+    Test that data loaded from a .spydata file can be saved back to it.
+    """
+    path = str(tmpdir.join('session.spydata'))
+    big = np.arange(iofuncs.MIN_BLOB_SIZE, dtype=np.float64)
+    assert iofuncs.save_dictionary({'big': big}, path) is None
+
+    data, error = iofuncs.load_dictionary(path)
+    assert isinstance(data['big'].base, np.memmap)
+    data['big'][0] = -1
+    data['other'] = 1
+    assert iofuncs.save_dictionary(data, path) is None
+    assert not os.path.isfile(path + '.tmp')
+
+    # Arrays loaded before are still valid
+    assert data['big'][1] == 1
+
+    data, error = iofuncs.load_dictionary(path)
+    assert error is None
+    assert data['big'][0] == -1
+    assert data['other'] == 1
+
+
 if __name__ == "__main__":
     pytest.main()
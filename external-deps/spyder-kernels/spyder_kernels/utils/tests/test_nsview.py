@@ -12,6 +12,8 @@
 
 from collections import defaultdict
 import datetime
+import threading
+import time
 
 # Third party imports
 import numpy as np
@@ -24,7 +26,12 @@
 from spyder_kernels.py3compat import PY2
 from spyder_kernels.utils.nsview import (sort_against, is_supported,
                                          value_to_display, get_size,
-                                         get_supported_types, Image)
+                                         get_supported_types, Image,
+                                         make_remote_view,
+                                         make_remote_view_changes,
+                                         MinMaxDisplays,
+                                         PENDING_MINMAX_DISPLAY)
+from spyder_kernels.utils import nsview
 
 def generate_complex_object():
     """Taken from issue #4221."""
@@ -299,5 +306,120 @@ def test_ellipses(tmpdir):
     assert b' ...' in value_to_display(buffer)
 
 
+def test_remote_view_changes(monkeypatch):
+    """Test that only the changes of a remote view are computed."""
+    settings = {'check_all': False, 'exclude_private': True,
+                'exclude_uppercase': False, 'exclude_capitalized': False,
+                'exclude_unsupported': False, 'excluded_names': [],
+                'minmax': False, 'show_callable_attributes': False,
+                'show_special_attributes': False,
+                'exclude_callables_and_modules': True}
+    ns = {'a': 1, 'b': [1, 2], 'c': np.arange(10), '_d': 2, 'f': [[1]],
+          'g': 'ham'}
+    cache = {}
+    changed, removed = make_remote_view_changes(ns, settings, cache)
+    assert changed == make_remote_view(ns, settings)
+    assert removed == []
+
+    # Values modified in place are noticed too
+    ns['b'].append(3)
+    ns['c'][0] = 10
+    ns['f'][0].append(2)
+    del ns['a']
+    ns['e'] = 'spam'
+    changed, removed = make_remote_view_changes(ns, settings, cache)
+    assert sorted(changed) == ['b', 'c', 'e', 'f']
+    assert changed['b']['view'] == '[1, 2, 3]'
+    assert changed['f']['view'] == '[[1, 2]]'
+    assert removed == ['a']
+    assert make_remote_view_changes(ns, settings, cache) == ({}, [])
+
+    # Entries of unchanged immutable objects are not computed again, but
+    # the ones of collections and arrays always are
+    displayed = []
+    monkeypatch.setattr(
+        nsview, 'value_to_display',
+        lambda value, **kwargs: displayed.append(value) or repr(value))
+    ns['e'] = 'eggs'
+    changed, __ = make_remote_view_changes(ns, settings, cache)
+    assert sorted(changed) == ['c', 'e']
+    assert displayed == [ns['b'], ns['c'], ns['f'], ns['e']]
+    monkeypatch.undo()
+
+    # The min/max of small arrays are computed again every time
+    settings['minmax'] = True
+    cache = {}
+    minmax_displays = MinMaxDisplays()
+    make_remote_view_changes(ns, settings, cache,
+                             minmax_displays=minmax_displays)
+    ns['c'][0] = 20
+    changed, __ = make_remote_view_changes(ns, settings, cache,
+                                           minmax_displays=minmax_displays)
+    assert changed['c'] == make_remote_view(ns, settings)['c']
+    assert changed['c']['view'] == value_to_display(ns['c'], minmax=True)
+    assert minmax_displays._displays == {}
+
+
+def test_minmax_displays_in_background(monkeypatch):
+    """Test that the min/max of big arrays are computed in a thread."""
+    monkeypatch.setattr(nsview, 'MINMAX_SIZE_BUDGET', 5)
+    ready = threading.Event()
+    minmax_displays = MinMaxDisplays(callback=ready.set)
+
+    # Small arrays are left to value_to_display
+    small = np.arange(5)
+    assert minmax_displays.get_display(small) is None
+    assert not ready.is_set()
+
+    big = np.arange(10)
+    assert minmax_displays.get_display(big) == PENDING_MINMAX_DISPLAY
+    assert ready.wait(5)
+    assert minmax_displays.get_display(big) == value_to_display(
+        big, minmax=True)
+
+    # Arrays modified in place keep their display until it's cleared
+    big[0] = 20
+    assert minmax_displays.get_display(big) != value_to_display(
+        big, minmax=True)
+    ready.clear()
+    minmax_displays.clear()
+    assert minmax_displays.get_display(big) == PENDING_MINMAX_DISPLAY
+    assert ready.wait(5)
+    assert minmax_displays.get_display(big) == value_to_display(
+        big, minmax=True)
+
+    # Values that are not plain arrays
+    assert minmax_displays.get_display([1, 2]) is None
+
+    # Displays are forgotten with their arrays
+    del big
+    assert minmax_displays._displays == {}
+
+
+def test_long_values_display():
+    """Test that long values are displayed without going through them."""
+    df = pd.DataFrame(np.zeros((1, 1000)),
+                      columns=['c%d' % i for i in range(1000)])
+    display = value_to_display(df)
+    assert display.startswith('Column names: c0, c1, c2')
+    assert display.endswith(' ...')
+    assert len(display) == 74
+
+    text = 'x' * 100
+    assert value_to_display(text) == 'x' * 70 + ' ...'
+    assert value_to_display([text]) == value_to_display([text * 1000])
+
+
+def test_collections_display_time_budget(monkeypatch):
+    """Test that collections stop being displayed after their time budget."""
+    monkeypatch.setattr(nsview, 'DISPLAY_TIME_BUDGET', -1)
+    assert value_to_display([1, 2]) == '[...]'
+    assert value_to_display({'a': [1, 2]}) == '{...}'
+
+    # The budget is shared with the collections nested in them
+    deadline = time.time() + 60
+    assert nsview.collections_display([[1], {2}], 1, deadline) == '[[1], {2}]'
+
+
 if __name__ == "__main__":
     pytest.main()
\ No newline at end of file
@@ -135,6 +135,14 @@ def get_options(argv=None):
         default=False,
         help="Start Spyder with a clean configuration directory"
     )
+    parser.add_argument(
+        '--trace-startup',
+        default=None,
+        dest="trace_startup",
+        metavar="FILE",
+        help="Save the wall time, CPU time and number of imports of each "
+             "startup phase to FILE, as a Chrome trace (JSON)"
+    )
     parser.add_argument(
         '--report-segfault',
         dest="report_segfault",
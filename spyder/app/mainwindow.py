@@ -108,6 +108,7 @@
 from spyder.otherplugins import get_spyderplugins_mods
 from spyder.app import tour
 from spyder.app.solver import find_external_plugins, solve_plugin_dependencies
+from spyder.app.tracer import STARTUP_TRACER
 
 # Spyder API Imports
 from spyder.api.exceptions import SpyderAPIError
@@ -236,6 +237,11 @@ def register_plugin(self, plugin, external=False):
         """
         Register a plugin in Spyder Main Window.
         """
+        with STARTUP_TRACER.phase('Register {}'.format(plugin.NAME)):
+            self._register_plugin(plugin, external=external)
+
+    def _register_plugin(self, plugin, external=False):
+        """Register a plugin, without tracing it."""
         self.set_splash(_("Loading {}...".format(plugin.get_name())))
         logger.info("Loading {}...".format(plugin.NAME))
 
@@ -1606,7 +1612,8 @@ def add_ipm_action(text, path):
 
         # Window set-up
         logger.info("Setting up window...")
-        self.setup_layout(default=False)
+        with STARTUP_TRACER.phase('Restore layout'):
+            self.setup_layout(default=False)
 
         # Menu about to show
         for child in self.menuBar().children():
@@ -2846,6 +2853,7 @@ def createPopupMenu(self):
 
     def set_splash(self, message):
         """Set splash message"""
+        STARTUP_TRACER.set_splash_phase(message)
         if self.splash is None:
             return
         if message:
@@ -2972,6 +2980,9 @@ def closing(self, cancelable=False):
 
         self.completions.shutdown()
 
+        # Write configuration changes that are waiting to be saved
+        CONF.flush()
+
         self.already_closed = True
         return True
 
@@ -3927,7 +3938,8 @@ def create_window(app, splash, options, args):
     # Main window
     main = MainWindow(splash, options)
     try:
-        main.setup()
+        with STARTUP_TRACER.phase('Set up main window'):
+            main.setup()
     except BaseException:
         if main.console is not None:
             try:
@@ -3936,8 +3948,10 @@ def create_window(app, splash, options, args):
                 pass
         raise
 
-    main.show()
-    main.post_visible_setup()
+    with STARTUP_TRACER.phase('Show main window'):
+        main.show()
+    with STARTUP_TRACER.phase('Post visible setup'):
+        main.post_visible_setup()
 
     if main.console:
         namespace = CONF.get('internal_console', 'namespace', {})
@@ -3968,6 +3982,8 @@ def create_window(app, splash, options, args):
     # the window
     app.focusChanged.connect(main.change_last_focused_widget)
 
+    STARTUP_TRACER.finish()
+
     if not running_under_pytest():
         app.exec_()
     return main
@@ -4022,7 +4038,8 @@ def main(options, args):
     setup_logging(options)
 
     # **** Create the application ****
-    app = create_application()
+    with STARTUP_TRACER.phase('Create application'):
+        app = create_application()
 
     # **** Create splash screen ****
     splash = create_splash_screen()
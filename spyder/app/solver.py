@@ -9,20 +9,194 @@
 
 import ast
 import importlib
+import json
 import logging
 import os
+import sys
 import traceback
 
 import pkg_resources
 
+from spyder import __version__
 from spyder.api.exceptions import SpyderAPIError
-from spyder.config.base import DEV, STDERR, running_under_pytest
+from spyder.config.base import (DEV, STDERR, get_conf_path,
+                                running_under_pytest)
 from spyder.utils.external.toposort import (CircularDependencyError,
                                             toposort_flatten)
 
 
 logger = logging.getLogger(__name__)
 
+# Version of the format of the plugin registry file
+PLUGIN_REGISTRY_VERSION = 1
+
+# Plugin registry file name
+PLUGIN_REGISTRY_FILE = 'plugin_registry.json'
+
+# Plugins that are not migrated to the new API yet
+# TODO: Remove after migration is finished
+OLD_API_PLUGINS = [
+    "editor",
+    "explorer",
+    "project_explorer",
+    "code_completion",
+    "kite",
+    "fallback",
+    "ipython_console",
+    "lsp",
+    "pylint",
+    "variable_explorer",
+    "outline_explorer",
+]
+
+# Internal plugins declared as entry points in setup.py
+NEW_API_PLUGINS = [
+    "appearance",
+    "code_completion",
+    "console",
+    "core",
+    "fallback_completion",
+    "kite_completion",
+    "lsp_completion",
+    "python",
+]
+
+
+# --- Plugin registry
+# ----------------------------------------------------------------------------
+def get_plugin_registry_key():
+    """
+    Return the key that identifies the installed plugins.
+
+    It changes when Spyder is updated or when distributions are installed
+    or removed, because that modifies the directories in `sys.path`.
+    """
+    paths = []
+    for path in sys.path:
+        # The current directory changes often and has no distributions
+        if not path:
+            continue
+
+        try:
+            paths.append([path, os.stat(path).st_mtime])
+        except OSError:
+            pass
+
+    return {
+        'version': PLUGIN_REGISTRY_VERSION,
+        'spyder': __version__,
+        'executable': sys.executable,
+        'paths': paths,
+    }
+
+
+def load_plugin_registry(path):
+    """
+    Load the plugin registry saved in `path`.
+
+    Return None if it doesn't exist or is outdated.
+    """
+    try:
+        with open(path, 'r') as fh:
+            registry = json.load(fh)
+    except (OSError, ValueError):
+        return None
+
+    if registry.get('key') != get_plugin_registry_key():
+        return None
+
+    return registry
+
+
+def save_plugin_registry(registry, path):
+    """Save the plugin `registry` in `path`."""
+    try:
+        with open(path, 'w') as fh:
+            json.dump(registry, fh)
+    except OSError as error:
+        logger.debug("Failed to save plugin registry: {}".format(error))
+
+
+def scan_internal_plugins():
+    """
+    Find the plugin classes declared in the internal plugin packages.
+
+    Return a dictionary of plugin names to `[module, class name]` lists.
+    """
+    import spyder.plugins as plugin_mod
+
+    internal_plugins = {}
+    plugins_path = os.path.dirname(plugin_mod.__file__)
+    for folder in os.listdir(plugins_path):
+        plugin_path = os.path.join(plugins_path, folder)
+        init_path = os.path.join(plugin_path, "__init__.py")
+        if (os.path.isdir(plugin_path) and os.path.isfile(init_path)
+                and not folder.startswith("io_")):
+            spec = importlib.util.spec_from_file_location(folder, init_path)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            for plugin_class in getattr(module, "PLUGIN_CLASSES", []):
+                internal_plugins[plugin_class.NAME] = [
+                    plugin_class.__module__, plugin_class.__name__]
+
+    return internal_plugins
+
+
+def scan_external_plugins(internal_plugins):
+    """
+    Find external plugins based on setuptools entry points.
+
+    Return a dictionary of plugin names to `[module, class name, package
+    name, package version]` lists.
+    """
+    external_plugins = {}
+    for entry_point in pkg_resources.iter_entry_points("spyder.plugins"):
+        name = entry_point.name
+        if (name not in internal_plugins and name not in OLD_API_PLUGINS
+                and name not in NEW_API_PLUGINS):
+            external_plugins[name] = [
+                entry_point.module_name,
+                entry_point.attrs[0],
+                entry_point.dist.project_name,
+                entry_point.dist.version,
+            ]
+
+    return external_plugins
+
+
+def get_plugin_registry():
+    """
+    Return the registry of internal and external plugins.
+
+    The registry is saved in the configuration directory and reused until
+    the installed distributions change, so plugin packages don't need to
+    be imported and entry points scanned on every start.
+    """
+    use_saved_registry = DEV is None and not running_under_pytest()
+    path = get_conf_path(PLUGIN_REGISTRY_FILE)
+    if use_saved_registry:
+        registry = load_plugin_registry(path)
+        if registry is not None:
+            return registry
+
+    # Compute the key before scanning, so the registry is updated on the
+    # next start if distributions are modified in the meantime
+    key = get_plugin_registry_key()
+    internal_plugins = scan_internal_plugins()
+    registry = {
+        'key': key,
+        'internal': internal_plugins,
+        'external': scan_external_plugins(internal_plugins),
+    }
+
+    if use_saved_registry:
+        save_plugin_registry(registry, path)
+
+    return registry
+
+
+# --- Plugin discovery
+# ----------------------------------------------------------------------------
 
 def find_internal_plugins():
     """
@@ -78,81 +252,47 @@ def find_internal_plugins():
             except (ModuleNotFoundError, ImportError):
                 pass
     else:
-        import spyder.plugins as plugin_mod
-
-        plugins_path = os.path.dirname(plugin_mod.__file__)
-        for folder in os.listdir(plugins_path):
-            plugin_path = os.path.join(plugins_path, folder)
-            init_path = os.path.join(plugin_path, "__init__.py")
-            if (os.path.isdir(plugin_path) and os.path.isfile(init_path)
-                    and not folder.startswith("io_")):
-                spec = importlib.util.spec_from_file_location(folder,
-                                                              init_path)
-                module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(module)
-                for plugin_class in getattr(module, "PLUGIN_CLASSES", []):
-                    internal_plugins[plugin_class.NAME] = plugin_class
+        registry = get_plugin_registry()
+        for name, (module, class_name) in registry['internal'].items():
+            try:
+                mod = importlib.import_module(module)
+                internal_plugins[name] = getattr(mod, class_name, None)
+            except (ModuleNotFoundError, ImportError):
+                pass
 
         # TODO: Remove after migration is finished
-        internal_plugins["editor"] = None
-        internal_plugins["explorer"] = None
-        internal_plugins["project_explorer"] = None
-        internal_plugins["code_completion"] = None
-        internal_plugins["kite"] = None
-        internal_plugins["fallback"] = None
-        internal_plugins["ipython_console"] = None
-        internal_plugins["lsp"] = None
-        internal_plugins["pylint"] = None
-        internal_plugins["variable_explorer"] = None
-        internal_plugins["outline_explorer"] = None
+        for name in OLD_API_PLUGINS:
+            internal_plugins[name] = None
 
     return internal_plugins
 
 
 def find_external_plugins():
     """
-    Find available internal plugins based on setuptools entry points.
-    """
-    internal_plugins = find_internal_plugins()
-    new_plugins = [
-        "appearance",
-        "code_completion",
-        "console",
-        "core",
-        "fallback_completion",
-        "kite_completion",
-        "lsp_completion",
-        "python",
-    ]
-    plugins = [
-        entry_point for entry_point
-        in pkg_resources.iter_entry_points("spyder.plugins")
-    ]
-
+    Find available external plugins based on setuptools entry points.
+    """
+    registry = get_plugin_registry()
     external_plugins = {}
-    for entry_point in plugins:
-        name = entry_point.name
-        if name not in internal_plugins and name not in new_plugins:
-            try:
-                class_name = entry_point.attrs[0]
-                mod = importlib.import_module(entry_point.module_name)
-                plugin_class = getattr(mod, class_name, None)
-
-                # To display in dependencies dialog
-                plugin_class._spyder_module_name = entry_point.module_name
-                plugin_class._spyder_package_name = (
-                    entry_point.dist.project_name)
-                plugin_class._spyder_version = entry_point.dist.version
-
-                external_plugins[name] = plugin_class
-                if name != plugin_class.NAME:
-                    raise SpyderAPIError(
-                        "Entry point name '{0}' and plugin.NAME '{1}' "
-                        "do not match!".format(name, plugin_class.NAME)
-                    )
-            except (ModuleNotFoundError, ImportError) as error:
-                print("%s: %s" % (name, str(error)), file=STDERR)
-                traceback.print_exc(file=STDERR)
+    for name, plugin_info in registry['external'].items():
+        module_name, class_name, package_name, version = plugin_info
+        try:
+            mod = importlib.import_module(module_name)
+            plugin_class = getattr(mod, class_name, None)
+
+            # To display in dependencies dialog
+            plugin_class._spyder_module_name = module_name
+            plugin_class._spyder_package_name = package_name
+            plugin_class._spyder_version = version
+
+            external_plugins[name] = plugin_class
+            if name != plugin_class.NAME:
+                raise SpyderAPIError(
+                    "Entry point name '{0}' and plugin.NAME '{1}' "
+                    "do not match!".format(name, plugin_class.NAME)
+                )
+        except (ModuleNotFoundError, ImportError) as error:
+            print("%s: %s" % (name, str(error)), file=STDERR)
+            traceback.print_exc(file=STDERR)
 
     return external_plugins
 
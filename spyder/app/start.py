@@ -29,6 +29,7 @@
 
 # Local imports
 from spyder.app.cli_options import get_options
+from spyder.app.tracer import STARTUP_TRACER
 from spyder.config.base import (get_conf_path, running_in_mac_app,
                                 reset_config_files, running_under_pytest)
 from spyder.utils.external import lockfile
@@ -93,7 +94,11 @@ def main():
         reset_config_files()
         return
 
-    from spyder.config.manager import CONF
+    if options.trace_startup:
+        STARTUP_TRACER.start(osp.abspath(options.trace_startup))
+
+    with STARTUP_TRACER.phase('Load configuration'):
+        from spyder.config.manager import CONF
 
     # Store variable to be used in self.restart (restart spyder instance)
     os.environ['SPYDER_ARGS'] = str(sys.argv[1:])
@@ -197,7 +202,8 @@ def main():
             # Then start Spyder as usual and *don't* continue
             # executing this script because it doesn't make
             # sense
-            from spyder.app import mainwindow
+            with STARTUP_TRACER.phase('Import main window'):
+                from spyder.app import mainwindow
             if running_under_pytest():
                 return mainwindow.main(options, args)
             else:
@@ -206,7 +212,8 @@ def main():
 
         if lock_created:
             # Start a new instance
-            from spyder.app import mainwindow
+            with STARTUP_TRACER.phase('Import main window'):
+                from spyder.app import mainwindow
             if running_under_pytest():
                 return mainwindow.main(options, args)
             else:
@@ -220,7 +227,8 @@ def main():
                 print("Spyder is already running. If you want to open a new \n"
                       "instance, please pass to it the --new-instance option")
     else:
-        from spyder.app import mainwindow
+        with STARTUP_TRACER.phase('Import main window'):
+            from spyder.app import mainwindow
         if running_under_pytest():
             return mainwindow.main(options, args)
         else:
@@ -29,6 +29,7 @@ def test_get_options():
     assert options.window_title is None
     assert options.project is None
     assert options.opengl_implementation is None
+    assert options.trace_startup is None
     assert options.files == []
     assert args == []
 
@@ -43,6 +44,9 @@ def test_get_options():
     assert options.optimize
     assert options.working_directory == 'test dir'
 
+    options, args = getopt(['--trace-startup', 'trace.json'])
+    assert options.trace_startup == 'trace.json'
+
     options, args = getopt('--window-title MyWindow'.split())
     assert options.window_title == 'MyWindow'
 
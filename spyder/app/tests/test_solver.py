@@ -8,13 +8,19 @@
 Tests for solver.py
 """
 
+# Standard library imports
+import os.path as osp
+
 # Third party imports
 import pytest
 
 # Local imports
 from spyder.api.exceptions import SpyderAPIError
 from spyder.api.plugins import SpyderPluginV2
-from spyder.app.solver import find_internal_plugins, solve_plugin_dependencies
+from spyder.app import solver
+from spyder.app.solver import (find_internal_plugins, load_plugin_registry,
+                               save_plugin_registry,
+                               solve_plugin_dependencies)
 from spyder.utils.external.toposort import CircularDependencyError
 
 
@@ -120,3 +126,22 @@ def test_solve_plugin_dependencies_3():
 def test_find_internal_plugins():
     internal = find_internal_plugins()
     assert len(internal) == 20
+
+
+def test_plugin_registry(tmpdir, monkeypatch):
+    path = osp.join(str(tmpdir), 'plugin_registry.json')
+    registry = {
+        'key': solver.get_plugin_registry_key(),
+        'internal': {'A': ['spyder.app.tests.test_solver', 'A']},
+        'external': {},
+    }
+
+    # Registries are loaded back only if they exist
+    assert load_plugin_registry(path) is None
+    save_plugin_registry(registry, path)
+    assert load_plugin_registry(path) == registry
+
+    # Registries are outdated if the installed distributions change
+    monkeypatch.setattr(solver, 'get_plugin_registry_key',
+                        lambda: {'version': -1})
+    assert load_plugin_registry(path) is None
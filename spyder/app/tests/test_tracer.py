@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+#
+
+"""
+Tests for tracer.py
+"""
+
+# Standard library imports
+import json
+import os.path as osp
+import sys
+import types
+
+# Local imports
+from spyder.app.tracer import SPLASH_TID, StartupTracer
+
+
+def test_startup_tracer_disabled():
+    tracer = StartupTracer()
+    with tracer.phase('Phase'):
+        pass
+    tracer.set_splash_phase('Loading...')
+    tracer.mark('Mark')
+    tracer.finish()
+    assert tracer.events == []
+
+
+def test_startup_tracer(tmpdir, monkeypatch):
+    path = osp.join(str(tmpdir), 'trace.json')
+    tracer = StartupTracer()
+    tracer.start(path)
+
+    tracer.set_splash_phase('Loading plugins...')
+    with tracer.phase('Register plugin'):
+        monkeypatch.setitem(sys.modules, 'traced_module',
+                            types.ModuleType('traced_module'))
+    tracer.set_splash_phase('Setting up main window...')
+    tracer.finish()
+
+    with open(path) as fh:
+        events = json.load(fh)['traceEvents']
+    phases = {event['name']: event for event in events
+              if event['ph'] == 'X'}
+
+    # Phases shown in the splash screen are in their own pseudo thread
+    assert phases['Loading plugins...']['tid'] == SPLASH_TID
+    assert phases['Setting up main window...']['tid'] == SPLASH_TID
+
+    # Imports done in a phase are counted
+    register = phases['Register plugin']
+    assert register['args']['imports'] == 1
+    assert register['dur'] >= 0
+    assert register['args']['cpu_ms'] >= 0
+
+    # Events after startup update the report
+    tracer.mark('Kernel ready')
+    with open(path) as fh:
+        events = json.load(fh)['traceEvents']
+    assert events[-1]['name'] == 'Kernel ready'
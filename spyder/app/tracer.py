@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""
+Startup tracer.
+
+Records the wall time, CPU time and number of imported modules of each
+startup phase and saves them as a Chrome trace, which can be opened in
+chrome://tracing or https://ui.perfetto.dev.
+"""
+
+# Standard library imports
+from contextlib import contextmanager
+import json
+import logging
+import os
+import sys
+import threading
+import time
+
+
+logger = logging.getLogger(__name__)
+
+# Id of the pseudo thread used to show the splash screen messages
+SPLASH_TID = 0
+
+
+class StartupTracer(object):
+    """Tracer of the phases of Spyder startup."""
+
+    def __init__(self):
+        self.events = []
+        self.path = None
+        self.finished = False
+        self._start_time = time.perf_counter()
+        self._splash_phase = None
+
+    @property
+    def enabled(self):
+        """Whether the tracer is recording events."""
+        return self.path is not None
+
+    def _get_timestamp(self, wall_time):
+        """Return the trace timestamp of `wall_time`, in microseconds."""
+        return (wall_time - self._start_time) * 1e6
+
+    def _add_event(self, event):
+        """Add an event and update the report if startup finished."""
+        event.setdefault('pid', os.getpid())
+        event.setdefault('tid', threading.get_ident())
+        self.events.append(event)
+
+        # Events can come after startup, e.g. when a kernel is ready
+        if self.finished:
+            self.save()
+
+    def start(self, path):
+        """Start recording events, to save them later in `path`."""
+        self.path = path
+        self.events = [
+            {'name': 'process_name', 'ph': 'M', 'pid': os.getpid(),
+             'args': {'name': 'Spyder'}},
+            {'name': 'thread_name', 'ph': 'M', 'pid': os.getpid(),
+             'tid': SPLASH_TID, 'args': {'name': 'Splash messages'}},
+        ]
+
+    @contextmanager
+    def phase(self, name, category='startup'):
+        """Record the time spent running the body of the with statement."""
+        if not self.enabled:
+            yield
+            return
+
+        start_wall = time.perf_counter()
+        start_cpu = time.process_time()
+        start_modules = len(sys.modules)
+        try:
+            yield
+        finally:
+            end_wall = time.perf_counter()
+            self._add_event({
+                'name': name,
+                'cat': category,
+                'ph': 'X',
+                'ts': self._get_timestamp(start_wall),
+                'dur': (end_wall - start_wall) * 1e6,
+                'args': {
+                    'cpu_ms': (time.process_time() - start_cpu) * 1e3,
+                    'imports': len(sys.modules) - start_modules,
+                },
+            })
+
+    def set_splash_phase(self, message):
+        """
+        Start the phase shown with `message` in the splash screen.
+
+        It lasts until the next message is shown.
+        """
+        if not self.enabled:
+            return
+
+        if self._splash_phase is not None:
+            name, start_wall, start_cpu, start_modules = self._splash_phase
+            end_wall = time.perf_counter()
+            self._add_event({
+                'name': name,
+                'cat': 'splash',
+                'ph': 'X',
+                'ts': self._get_timestamp(start_wall),
+                'dur': (end_wall - start_wall) * 1e6,
+                'tid': SPLASH_TID,
+                'args': {
+                    'cpu_ms': (time.process_time() - start_cpu) * 1e3,
+                    'imports': len(sys.modules) - start_modules,
+                },
+            })
+            self._splash_phase = None
+
+        if message:
+            self._splash_phase = (message, time.perf_counter(),
+                                  time.process_time(), len(sys.modules))
+
+    def mark(self, name, category='startup'):
+        """Record that `name` happened at this moment."""
+        if not self.enabled:
+            return
+
+        self._add_event({
+            'name': name,
+            'cat': category,
+            'ph': 'i',
+            's': 'g',
+            'ts': self._get_timestamp(time.perf_counter()),
+        })
+
+    def finish(self):
+        """Mark the end of startup and save the report."""
+        if not self.enabled or self.finished:
+            return
+
+        self.set_splash_phase('')
+        self.mark('Startup finished')
+        self.finished = True
+        self.save()
+
+    def save(self):
+        """Save the recorded events as a Chrome trace."""
+        report = {'traceEvents': self.events, 'displayTimeUnit': 'ms'}
+        try:
+            with open(self.path, 'w') as fh:
+                json.dump(report, fh, indent=1)
+        except (OSError, TypeError, ValueError) as error:
+            logger.error("Failed to save startup trace to {}: {}".format(
+                self.path, error))
+
+
+STARTUP_TRACER = StartupTracer()
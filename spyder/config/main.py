@@ -157,6 +157,8 @@
               'pdb_execute_events': True,
               'pdb_use_exclamation_mark': True,
               'pdb_stop_first_line': True,
+              'kernel_pool_size': 0,
+              'kernel_pool_min_available_memory': 20,
               }),
             ('variable_explorer',
              {
@@ -223,6 +225,7 @@
               'highlight_current_cell': True,
               'occurrence_highlighting': True,
               'occurrence_highlighting/timeout': 1500,
+              'large_file_mchars': 10,
               'always_remove_trailing_spaces': False,
               'add_newline': False,
               'always_remove_trailing_newlines': False,
@@ -278,6 +281,7 @@
               'name_filters': NAME_FILTERS,
               'show_all': True,
               'show_hscrollbar': True,
+              'hide_ignored_files': False,
               'max_recent_projects': 10,
               'visible_if_project_open': True
               }),
@@ -302,6 +306,10 @@
               'more_options': False,
               'case_sensitive': False,
               'max_results': 1000,
+              'project_index': False,
+              'search_pool': 'auto',
+              'search_workers': 0,
+              'use_ignore_files': True,
               }),
             ('breakpoints',
              {
@@ -261,6 +261,12 @@ def reset_to_defaults(self, section=None):
         config = self.get_active_conf(section)
         config.reset_to_defaults(section=section)
 
+    def flush(self):
+        """Write pending changes of all configurations to disk."""
+        self._user_config.flush()
+        for _, (_, plugin_config) in self._plugin_configs.items():
+            plugin_config.flush()
+
     # Shortcut configuration management
     # ------------------------------------------------------------------------
     def _get_shortcut_config(self, context, plugin_name=None):
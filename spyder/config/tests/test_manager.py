@@ -107,6 +107,7 @@ def test_external_plugin_config(qtbot):
     # Change an option in the console
     console = Console(None, configuration=manager)
     console.set_conf_option('max_line_count', 600)
+    manager.flush()
 
     # Read config filew directly
     user_path = manager.get_user_config_path()
@@ -345,6 +345,7 @@ def test_userconfig_set_invalid(self, defaults, value, tmpdir):
 
     def test_userconfig_set_with_string(self, userconfig):
         userconfig.set('section', 'option', 'new value')
+        userconfig.flush()
         with open(userconfig.get_config_fpath()) as inifile:
             ini_contents = inifile.read()
 
@@ -375,6 +376,52 @@ def test_userconfig_remove_option(userconfig):
         userconfig.get('section', 'option')
 
 
+def test_userconfig_save_later(userconfig, mocker):
+    """Test that several changes are written to disk at once."""
+    configpath = userconfig.get_config_fpath()
+    write_contents = mocker.spy(userconfig, '_write_contents')
+
+    userconfig.set('section', 'option', 'value 1')
+    userconfig.set('section', 'option', 'value 2')
+    userconfig.set('section', 'other option', [1, 2])
+    assert write_contents.call_count == 0
+    with open(configpath) as inifile:
+        assert 'value 2' not in inifile.read()
+
+    userconfig.flush()
+    assert write_contents.call_count == 1
+    with open(configpath) as inifile:
+        ini_contents = inifile.read()
+    assert 'value 2' in ini_contents
+    assert 'other option = [1, 2]' in ini_contents
+
+    # Nothing is written if there are no pending changes
+    userconfig.flush()
+    assert write_contents.call_count == 1
+
+
+def test_userconfig_load_pending_changes(userconfig):
+    """Test that pending changes are written before the file is loaded."""
+    userconfig.set('section', 'option', 'new value')
+    new_config = UserConfig(name='spyder-test',
+                            path=os.path.dirname(
+                                userconfig.get_config_fpath()),
+                            defaults={}, load=True, version='1.0.0',
+                            backup=False, raw_mode=True)
+    assert new_config.get('section', 'option') == 'new value'
+
+
+def test_userconfig_get_cached_value(userconfig):
+    """Test that values returned by get can't change the cached ones."""
+    userconfig.set('section', 'list option', [1, 2])
+    value = userconfig.get('section', 'list option')
+    value.append(3)
+    assert userconfig.get('section', 'list option') == [1, 2]
+
+    userconfig.set('section', 'list option', [4])
+    assert userconfig.get('section', 'list option') == [4]
+
+
 def test_userconfig_cleanup(userconfig):
     configpath = userconfig.get_config_fpath()
     assert os.path.isfile(configpath)
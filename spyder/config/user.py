@@ -14,13 +14,16 @@
 
 # Standard library imports
 import ast
+import atexit
 import copy
 import io
 import os
 import os.path as osp
 import re
 import shutil
+import threading
 import time
+import weakref
 
 # Local imports
 from spyder.config.base import get_conf_path, get_module_source_path
@@ -29,6 +32,30 @@
 from spyder.utils.programs import check_version
 
 
+# Seconds to wait after a change before writing the .ini file, so that
+# changes made in quick succession are saved together
+SAVE_DELAY = 1
+
+# Configurations with changes that are waiting to be written to disk
+_PENDING_SAVES = weakref.WeakValueDictionary()
+
+
+def _flush_pending_saves(fpath=None):
+    """
+    Write pending configuration changes to disk.
+
+    If `fpath` is given, only the changes of the configurations stored in
+    that file are written.
+    """
+    for config in list(_PENDING_SAVES.values()):
+        if (fpath is None or osp.normcase(config.get_config_fpath())
+                == osp.normcase(fpath)):
+            config.flush()
+
+
+atexit.register(_flush_pending_saves)
+
+
 # ============================================================================
 # Auxiliary classes
 # ============================================================================
@@ -102,16 +129,31 @@ def _set(self, section, option, value, verbose):
 
         super(DefaultsConfig, self).set(section, option, value)
 
-    def _save(self):
-        """Save config into the associated .ini file."""
+    def _get_contents(self):
+        """Return the contents of the .ini file of this config."""
+        configfile = io.StringIO()
+        if PY2:
+            self._write(configfile)
+        else:
+            self.write(configfile)
+        return configfile.getvalue()
+
+    def _write_contents(self, contents):
+        """Write `contents` to the associated .ini file."""
         fpath = self.get_config_fpath()
 
         def _write_file(fpath):
-            with io.open(fpath, 'w', encoding='utf-8') as configfile:
-                if PY2:
-                    self._write(configfile)
-                else:
-                    self.write(configfile)
+            # Write a temporary file first and replace the .ini file with
+            # it afterwards, so it's never left half-written
+            tmp_fpath = fpath + '.tmp'
+            with io.open(tmp_fpath, 'w', encoding='utf-8') as configfile:
+                configfile.write(contents)
+            if PY2:
+                if osp.isfile(fpath):
+                    os.remove(fpath)
+                os.rename(tmp_fpath, fpath)
+            else:
+                os.replace(tmp_fpath, fpath)
 
         # See spyder-ide/spyder#1086 and spyder-ide/spyder#1242 for background
         # on why this method contains all the exception handling.
@@ -131,6 +173,10 @@ def _write_file(fpath):
                       'the exception shown below')  # spyder: test-skip
                 print(e)  # spyder: test-skip
 
+    def _save(self):
+        """Save config into the associated .ini file."""
+        self._write_contents(self._get_contents())
+
     def get_config_fpath(self):
         """Return the ini file where this configuration is stored."""
         path = self._path
@@ -178,6 +224,9 @@ class UserConfig(DefaultsConfig):
     -----
     The 'get' and 'set' arguments number and type differ from the overriden
     methods. 'defaults' is an attribute and not a method.
+
+    Changes are written to the .ini file `SAVE_DELAY` seconds after they
+    are made, in a background thread. Use `flush` to write them right away.
     """
     DEFAULT_SECTION_NAME = 'main'
 
@@ -185,6 +234,16 @@ def __init__(self, name, path, defaults=None, load=True, version=None,
                  backup=False, raw_mode=False, remove_obsolete=False,
                  external_plugin=False):
         """UserConfig class, based on ConfigParser."""
+        # Lock to change or read the contents of the config from several
+        # threads, and lock to write them to disk one at a time
+        self._lock = threading.RLock()
+        self._save_lock = threading.Lock()
+        self._save_timer = None
+
+        # Cache of values converted to the type of their default, with the
+        # raw value and default type they were converted from
+        self._values = {}
+
         super(UserConfig, self).__init__(name=name, path=path)
 
         self._load = load
@@ -318,6 +377,14 @@ def _make_backup(self, version=None, old_version=None):
 
     def _load_from_ini(self, fpath):
         """Load config from the associated .ini file found at `fpath`."""
+        # Another config for the same file could have changes that were not
+        # written yet, e.g. the one of a project that was just closed
+        _flush_pending_saves(fpath)
+        with self._lock:
+            self._read_ini(fpath)
+
+    def _read_ini(self, fpath):
+        """Read the .ini file found at `fpath`."""
         try:
             if PY2:
                 # Python 2
@@ -379,6 +446,72 @@ def _remove_deprecated_options(self, old_version):
                     except cp.NoSectionError:
                         self.remove_section(section)
 
+    def _convert_value(self, value, default_value):
+        """Convert the raw `value` to the type of `default_value`."""
+        if isinstance(default_value, bool):
+            value = ast.literal_eval(value)
+        elif isinstance(default_value, float):
+            value = float(value)
+        elif isinstance(default_value, int):
+            value = int(value)
+        elif is_text_string(default_value):
+            if PY2:
+                try:
+                    value = value.decode('utf-8')
+                    try:
+                        # Some str config values expect to be eval after
+                        # decoding
+                        new_value = ast.literal_eval(value)
+                        if is_text_string(new_value):
+                            value = new_value
+                    except (SyntaxError, ValueError):
+                        pass
+                except (UnicodeEncodeError, UnicodeDecodeError):
+                    pass
+        else:
+            try:
+                # Lists, tuples, ...
+                value = ast.literal_eval(value)
+            except (SyntaxError, ValueError):
+                pass
+
+        return value
+
+    def _set(self, section, option, value, verbose):
+        """Set method."""
+        with self._lock:
+            super(UserConfig, self)._set(section, option, value, verbose)
+
+    def _get_contents(self):
+        """Return the contents of the .ini file of this config."""
+        with self._lock:
+            return super(UserConfig, self)._get_contents()
+
+    def _save(self):
+        """Save config into the associated .ini file right away."""
+        with self._save_lock:
+            with self._lock:
+                self._cancel_save()
+                contents = self._get_contents()
+            self._write_contents(contents)
+
+    def _save_later(self):
+        """Save config into the associated .ini file after `SAVE_DELAY`."""
+        with self._lock:
+            if self._save_timer is None:
+                self._save_timer = threading.Timer(SAVE_DELAY, self.flush)
+                self._save_timer.daemon = True
+                self._save_timer.start()
+                _PENDING_SAVES[id(self)] = self
+
+    def _cancel_save(self):
+        """Cancel a pending save of the .ini file."""
+        with self._lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            _PENDING_SAVES.pop(id(self), None)
+
     # --- Compatibility API
     # ------------------------------------------------------------------------
     def get_previous_config_fpath(self):
@@ -458,7 +591,7 @@ def reset_to_defaults(self, save=True, verbose=False, section=None):
                     value = options[option]
                     self._set(sec, option, value, verbose)
         if save:
-            self._save()
+            self._save_later()
 
     def set_as_defaults(self):
         """Set defaults from the current config."""
@@ -515,35 +648,24 @@ def get(self, section, option, default=NoDefault):
                 self.set(section, option, default)
                 return default
 
-        value = super(UserConfig, self).get(section, option, raw=self._raw)
-
+        raw_value = super(UserConfig, self).get(section, option,
+                                                raw=self._raw)
         default_value = self.get_default(section, option)
-        if isinstance(default_value, bool):
-            value = ast.literal_eval(value)
-        elif isinstance(default_value, float):
-            value = float(value)
-        elif isinstance(default_value, int):
-            value = int(value)
-        elif is_text_string(default_value):
-            if PY2:
-                try:
-                    value = value.decode('utf-8')
-                    try:
-                        # Some str config values expect to be eval after
-                        # decoding
-                        new_value = ast.literal_eval(value)
-                        if is_text_string(new_value):
-                            value = new_value
-                    except (SyntaxError, ValueError):
-                        pass
-                except (UnicodeEncodeError, UnicodeDecodeError):
-                    pass
+
+        # Only convert the raw value again if it or the type of its default
+        # changed since the last time it was read
+        key = (section, option)
+        cached = self._values.get(key)
+        if (cached is not None and cached[0] == raw_value
+                and cached[1] is type(default_value)):
+            value = cached[2]
         else:
-            try:
-                # Lists, tuples, ...
-                value = ast.literal_eval(value)
-            except (SyntaxError, ValueError):
-                pass
+            value = self._convert_value(raw_value, default_value)
+            self._values[key] = (raw_value, type(default_value), value)
+
+        # Don't let callers modify the cached value in place
+        if isinstance(value, (list, dict, set)):
+            value = copy.deepcopy(value)
 
         return value
 
@@ -590,20 +712,35 @@ def set(self, section, option, value, verbose=False, save=True):
 
         self._set(section, option, value, verbose)
         if save:
-            self._save()
+            self._save_later()
+
+    def add_section(self, section):
+        """Add `section` to the config."""
+        with self._lock:
+            super(UserConfig, self).add_section(section)
 
     def remove_section(self, section):
         """Remove `section` and all options within it."""
-        super(UserConfig, self).remove_section(section)
-        self._save()
+        with self._lock:
+            removed = super(UserConfig, self).remove_section(section)
+        self._save_later()
+        return removed
 
     def remove_option(self, section, option):
         """Remove `option` from `section`."""
-        super(UserConfig, self).remove_option(section, option)
-        self._save()
+        with self._lock:
+            removed = super(UserConfig, self).remove_option(section, option)
+        self._save_later()
+        return removed
+
+    def flush(self):
+        """Write changes that are waiting to be saved to the .ini file."""
+        if self._save_timer is not None:
+            self._save()
 
     def cleanup(self):
         """Remove .ini file associated to config."""
+        self._cancel_save()
         os.remove(self.get_config_fpath())
 
     def to_list(self):
@@ -614,6 +751,7 @@ def to_list(self):
                        ('section2', {'opt-2': othervalue, ...}), ...]
         """
         new_defaults = []
+        self.flush()
         self._load_from_ini(self.get_config_fpath())
         for section in self._sections:
             sec_data = {}
@@ -1000,10 +1138,15 @@ def remove_option(self, section, option):
         config = self._get_config(section, option)
         config.remove_option(section, option)
 
+    def flush(self):
+        """Write pending changes of all configurations to their files."""
+        for _, config in self._configs_map.items():
+            config.flush()
+
     def cleanup(self):
         """Remove .ini files associated to configurations."""
         for _, config in self._configs_map.items():
-            os.remove(config.get_config_fpath())
+            config.cleanup()
 
 
 class PluginConfig(UserConfig):
@@ -19,15 +19,11 @@
 # Qt imports
 from qtpy.QtCore import QObject, QThread, QMutex, QMutexLocker, Signal, Slot
 
-# Other imports
-from pygments.lexers import get_lexer_by_name
-from diff_match_patch import diff_match_patch
-
 # Local imports
 from spyder.plugins.completion.manager.api import CompletionItemKind
 from spyder.plugins.completion.manager.api import LSPRequestTypes
 from spyder.plugins.completion.fallback.utils import (
-    get_keywords, get_words, is_prefix_valid)
+    get_language_keywords, is_prefix_valid, WordIndex)
 
 
 FALLBACK_COMPLETION = "Fallback"
@@ -47,59 +43,49 @@ def __init__(self, parent):
         self.daemon = True
         self.mutex = QMutex()
         self.file_tokens = {}
-        self.diff_patch = diff_match_patch()
         self.thread = QThread()
         self.moveToThread(self.thread)
 
         self.thread.started.connect(self.started)
         self.sig_mailbox.connect(self.handle_msg)
 
-    def tokenize(self, text, offset, language, current_word):
+    def tokenize(self, text, offset, language, current_word, word_index):
         """
         Return all tokens in `text` and all keywords associated by
         Pygments to `language`.
+
+        The tokens are taken from `word_index`, the index of the words
+        in `text`.
         """
         valid = is_prefix_valid(text, offset, language)
         if not valid:
             return []
 
         # Get language keywords provided by Pygments
-        try:
-            lexer = get_lexer_by_name(language)
-            keywords = get_keywords(lexer)
-        except Exception:
-            keywords = []
+        keywords = get_language_keywords(language)
         keyword_set = set(keywords)
-        keywords = [{'kind': CompletionItemKind.KEYWORD,
-                     'insertText': keyword,
-                     'label': keyword,
-                     'sortText': keyword,
-                     'filterText': keyword,
-                     'documentation': '',
-                     'provider': FALLBACK_COMPLETION}
-                    for keyword in keywords]
 
         # Get file tokens
-        tokens = get_words(text, offset, language)
-        tokens = [{'kind': CompletionItemKind.TEXT,
-                   'insertText': token,
-                   'label': token,
-                   'sortText': token,
-                   'filterText': token,
-                   'documentation': '',
-                   'provider': FALLBACK_COMPLETION}
-                  for token in tokens]
-        for token in tokens:
-            if token['insertText'] not in keyword_set:
-                keywords.append(token)
+        tokens = [token for token in word_index.get_words(offset)
+                  if token not in keyword_set]
 
         # Filter matching results
         if current_word is not None:
             current_word = current_word.lower()
-            keywords = [k for k in keywords
-                        if current_word in k['insertText'].lower()]
-
-        return keywords
+            keywords = [k for k in keywords if current_word in k.lower()]
+            tokens = [t for t in tokens if current_word in t.lower()]
+
+        items = [(CompletionItemKind.KEYWORD, keyword)
+                 for keyword in keywords]
+        items += [(CompletionItemKind.TEXT, token) for token in tokens]
+        return [{'kind': kind,
+                 'insertText': label,
+                 'label': label,
+                 'sortText': label,
+                 'filterText': label,
+                 'documentation': '',
+                 'provider': FALLBACK_COMPLETION}
+                for kind, label in items]
 
     def stop(self):
         """Stop actor."""
@@ -127,6 +113,7 @@ def handle_msg(self, message):
                 'text': msg['text'],
                 'offset': msg['offset'],
                 'language': msg['language'],
+                'words': WordIndex(msg['text'], msg['language']),
             }
         elif msg_type == LSPRequestTypes.DOCUMENT_DID_CHANGE:
             if file not in self.file_tokens:
@@ -134,13 +121,13 @@ def handle_msg(self, message):
                     'text': '',
                     'offset': msg['offset'],
                     'language': msg['language'],
+                    'words': WordIndex('', msg['language']),
                 }
-            diff = msg['diff']
             text = self.file_tokens[file]
             text['offset'] = msg['offset']
-            text, _ = self.diff_patch.patch_apply(
-                diff, text['text'])
-            self.file_tokens[file]['text'] = text
+            text['text'] = msg['text']
+            # Only the lines that changed are tokenized again
+            text['words'].update(msg['text'])
         elif msg_type == LSPRequestTypes.DOCUMENT_DID_CLOSE:
             self.file_tokens.pop(file, {})
         elif msg_type == LSPRequestTypes.DOCUMENT_COMPLETION:
@@ -151,6 +138,7 @@ def handle_msg(self, message):
                     text_info['text'],
                     text_info['offset'],
                     text_info['language'],
-                    msg['current_word'])
+                    msg['current_word'],
+                    text_info['words'])
             tokens = {'params': tokens}
             self.sig_set_tokens.emit(_id, tokens)
@@ -10,7 +10,9 @@
 import pytest
 from diff_match_patch import diff_match_patch
 from spyder.plugins.completion.manager.api import LSPRequestTypes
-from spyder.plugins.completion.fallback.utils import get_words
+from spyder.plugins.completion.fallback.actor import FallbackActor
+from spyder.plugins.completion.fallback.utils import (
+    get_words, is_prefix_valid, WordIndex)
 
 
 DATA_PATH = osp.join(osp.dirname(osp.abspath(__file__)), "data")
@@ -91,6 +93,79 @@ def test_get_words():
     assert set(tokens) == {'foo', 'baz', 'car456'}
 
 
+@pytest.mark.parametrize('language', ['python', 'css'])
+def test_word_index(language):
+    source = 'foo bar-baz\n\ncar456 foo-bar\nbaz'
+    index = WordIndex(source, language)
+    assert set(index.get_words()) == set(get_words(source, None, language))
+
+    # Insert, replace and remove text in one or several lines
+    changes = [
+        source.replace('bar-baz', 'bar-baz qux'),
+        source.replace('\n\ncar', '\nnew line\n\ncar'),
+        source.replace('car456 foo', 'car'),
+        source.replace('baz\n\ncar', 'z'),
+        '',
+        source,
+    ]
+    for new_source in changes:
+        index.update(new_source)
+        assert set(index.get_words()) == set(get_words(new_source, None,
+                                                       language))
+        assert sum(index.counts.values()) == len(get_words(new_source, None,
+                                                           language))
+
+    # Only the word at the offset is left out
+    index.set_text('foo bar foo')
+    assert 'bar' not in index.get_words(5)
+    assert 'foo' in index.get_words(1)
+
+
+def test_did_change_updates_word_index(qtbot, monkeypatch):
+    """Test that only the lines that changed are tokenized again."""
+    actor = FallbackActor(None)
+    actor.handle_msg({
+        'type': LSPRequestTypes.DOCUMENT_DID_OPEN,
+        'id': None,
+        'file': 'test.py',
+        'msg': {'text': TEST_FILE, 'offset': 0, 'language': 'python'}})
+    words = actor.file_tokens['test.py']['words']
+    monkeypatch.setattr(words, 'set_text', None)
+    tokenized = []
+    tokenize_lines = words._tokenize_lines
+    monkeypatch.setattr(
+        words, '_tokenize_lines',
+        lambda lines: tokenized.extend(lines) or tokenize_lines(lines))
+
+    # Payload sent by CodeEditor.flush_document_changes
+    new_text = TEST_FILE_UPDATE.replace('args', 'kwargs')
+    change = {
+        'range': {'start': {'line': 5, 'character': 9},
+                  'end': {'line': 5, 'character': 9}},
+        'rangeLength': 0,
+        'text': 'kw',
+    }
+    actor.handle_msg({
+        'type': LSPRequestTypes.DOCUMENT_DID_CHANGE,
+        'id': None,
+        'file': 'test.py',
+        'msg': {'file': 'test.py', 'version': 2, 'text': new_text,
+                'changes': [change], 'offset': 4, 'selection_start': 4,
+                'selection_end': 4, 'language': 'python'}})
+    assert actor.file_tokens['test.py']['text'] == new_text
+    assert 'kwargs' in words.get_words()
+    assert 'func' in words.get_words()
+    assert len(tokenized) < len(new_text.splitlines())
+
+
+def test_is_prefix_valid():
+    source = 'foo bar123\nbaz car456 \n'
+    assert is_prefix_valid(source, 2, 'python')
+    assert is_prefix_valid(source, 14, 'python')
+    assert is_prefix_valid(source, 22, 'python')
+    assert not is_prefix_valid(source, 100, 'python')
+
+
 @pytest.mark.slow
 @pytest.mark.parametrize('file_fixture', language_list, indirect=True)
 def test_tokenize(qtbot_module, fallback_fixture, file_fixture):
@@ -147,11 +222,10 @@ def test_token_update(qtbot_module, fallback_fixture):
     initial_tokens = {token['insertText'] for token in initial_tokens}
     assert 'args' not in initial_tokens
 
-    diff = diff_match.patch_make(TEST_FILE, TEST_FILE_UPDATE)
     update_request = {
         'file': 'test.py',
-        'diff': diff,
-        'offset': len(diff),
+        'text': TEST_FILE_UPDATE,
+        'offset': len(TEST_FILE_UPDATE),
     }
     fallback.send_request(
         'python', LSPRequestTypes.DOCUMENT_DID_CHANGE, update_request)
@@ -9,12 +9,14 @@
 """
 
 # Standard imports
+from collections import Counter
 import importlib
 import os
 import os.path as osp
 import re
 
 # Third-party imports
+from diff_match_patch import diff_match_patch
 from pygments.lexer import words
 from pygments.lexers import (get_lexer_for_filename, get_lexer_by_name,
                              TextLexer)
@@ -46,6 +48,8 @@
     'xml': kebab_regex
 }
 
+DIFF_MATCH_PATCH = diff_match_patch()
+
 
 def find_lexer_for_filename(filename):
     """Get a Pygments Lexer given a filename.
@@ -98,6 +102,21 @@ def get_keywords(lexer):
     return keywords
 
 
+@memoize
+def get_language_keywords(language):
+    """
+    Get the keywords associated by Pygments to `language`.
+
+    The returned list is shared by all callers, so it must not be modified.
+    """
+    try:
+        lexer = get_lexer_by_name(language)
+        keywords = get_keywords(lexer)
+    except Exception:
+        keywords = []
+    return keywords
+
+
 def get_words(text, exclude_offset=None, language=''):
     """
     Extract all words from a source code file to be used in code completion.
@@ -134,11 +153,16 @@ def is_prefix_valid(text, offset, language):
     regex = LANGUAGE_REGEX.get(language.lower(), all_regex)
     prefix = ''
 
-    for match in regex.finditer(text):
+    # Words can't span several lines, so only the ones in the current line
+    # up to the first that ends after the offset need to be checked
+    line_start = text.rfind('\n', 0, offset) + 1
+    for match in regex.finditer(text, line_start):
         start, end = match.span()
         max_end = max(end, max_end)
         if offset >= start and offset <= end:
             prefix = match.group()
+        if end >= offset:
+            break
     if offset > max_end:
         if letter_regex.match(current_pos_text):
             prefix = current_pos_text
@@ -146,6 +170,91 @@ def is_prefix_valid(text, offset, language):
     return valid
 
 
+class WordIndex(object):
+    """
+    Index of the words in a text, updated incrementally when it changes.
+
+    Words can't span several lines, so the words of each line are stored
+    separately and only the lines that changed are tokenized again.
+    """
+
+    def __init__(self, text='', language=''):
+        self.regex = LANGUAGE_REGEX.get(language.lower(), all_regex)
+        self.text = ''
+        self.line_words = [[]]
+        self.counts = Counter()
+        self.set_text(text)
+
+    def _tokenize_lines(self, lines):
+        """Return the list of words of each line in `lines`."""
+        return [self.regex.findall(line) for line in lines]
+
+    def set_text(self, text):
+        """Index all the words in `text`."""
+        self.text = text
+        self.line_words = self._tokenize_lines(text.split('\n'))
+        self.counts = Counter()
+        for words in self.line_words:
+            self.counts.update(words)
+
+    def update(self, text):
+        """Update the index for the new `text` of the document."""
+        old_text = self.text
+
+        # Find the region that changed
+        start = DIFF_MATCH_PATCH.diff_commonPrefix(old_text, text)
+        end = DIFF_MATCH_PATCH.diff_commonSuffix(old_text[start:],
+                                                 text[start:])
+        old_end = len(old_text) - end
+        new_end = len(text) - end
+
+        # Tokenize again the lines that contain it
+        first_line = old_text.count('\n', 0, start)
+        last_line = first_line + old_text.count('\n', start, old_end)
+        line_start = text.rfind('\n', 0, start) + 1
+        line_end = text.find('\n', new_end)
+        if line_end == -1:
+            line_end = len(text)
+        new_line_words = self._tokenize_lines(
+            text[line_start:line_end].split('\n'))
+
+        for words in self.line_words[first_line:last_line + 1]:
+            for word in words:
+                count = self.counts[word] - 1
+                if count:
+                    self.counts[word] = count
+                else:
+                    del self.counts[word]
+        for words in new_line_words:
+            self.counts.update(words)
+
+        self.line_words[first_line:last_line + 1] = new_line_words
+        self.text = text
+
+    def get_words(self, exclude_offset=None):
+        """
+        Return the different words in the text.
+
+        The word at `exclude_offset` is left out, unless it appears more
+        than once.
+        """
+        words = list(self.counts)
+        if exclude_offset is None:
+            return words
+
+        line_start = self.text.rfind('\n', 0, exclude_offset) + 1
+        for match in self.regex.finditer(self.text, line_start):
+            start, end = match.span()
+            if start > exclude_offset:
+                break
+            if exclude_offset <= end:
+                if self.counts[match.group()] == 1:
+                    words.remove(match.group())
+                break
+
+        return words
+
+
 @memoize
 def get_parent_until(path):
     """
@@ -12,7 +12,7 @@
 # Local imports
 from spyder.plugins.completion.manager.api import (
     LSPRequestTypes, InsertTextFormat, CompletionItemKind,
-    ClientConstants)
+    ClientConstants, TextDocumentSyncKind)
 from spyder.plugins.completion.languageserver.providers.utils import (
     path_as_uri, process_uri, snake_to_camel)
 from spyder.plugins.completion.languageserver.decorators import (
@@ -46,14 +46,21 @@ def process_document_diagnostics(self, response, *args):
 
     @send_notification(method=LSPRequestTypes.DOCUMENT_DID_CHANGE)
     def document_changed(self, params):
+        # Range changes are only sent to servers that support them. None
+        # means the editor lost track of the changes.
+        changes = params.get('changes')
+        sync_options = self.server_capabilites.get('textDocumentSync', {})
+        incremental = (sync_options.get('change') ==
+                       TextDocumentSyncKind.INCREMENTAL)
+        if changes is None or not incremental:
+            changes = [{'text': params['text']}]
+
         params = {
             'textDocument': {
                 'uri': path_as_uri(params['file']),
                 'version': params['version']
             },
-            'contentChanges': [{
-                'text': params['text']
-            }]
+            'contentChanges': changes
         }
         return params
 
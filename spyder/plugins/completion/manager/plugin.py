@@ -17,6 +17,7 @@
 from qtpy.QtWidgets import QMessageBox
 
 # Local imports
+from spyder.app.tracer import STARTUP_TRACER
 from spyder.config.base import _
 from spyder.plugins.completion.languageserver.plugin import (
     LanguageServerPlugin)
@@ -369,7 +370,11 @@ def start_client(self, language):
         for client_name in self.clients:
             client_info = self.clients[client_name]
             if client_info['status'] == self.RUNNING:
-                client_started = client_info['plugin'].start_client(language)
+                with STARTUP_TRACER.phase(
+                        'Start {} client for {}'.format(client_name,
+                                                        language)):
+                    client_started = client_info['plugin'].start_client(
+                        language)
                 started |= client_started
                 language_clients[client_name] = client_started
         self.language_status[language] = language_clients
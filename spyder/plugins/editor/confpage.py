@@ -225,6 +225,26 @@ def enable_tabwidth_spin(index):
         autosave_layout.addWidget(autosave_spinbox)
         autosave_group.setLayout(autosave_layout)
 
+        # -- Large files
+        large_file_group = QGroupBox(_('Large files'))
+        large_file_label = QLabel(_("Files with more characters than this "
+                                    "are opened showing the syntax "
+                                    "highlighting of the visible lines only, "
+                                    "and without code completion, folding "
+                                    "or outline. Use 0 to disable this "
+                                    "mode."))
+        large_file_label.setWordWrap(True)
+        large_file_spinbox = self.create_spinbox(
+            _('Large file size: '),
+            _('million characters'),
+            'large_file_mchars',
+            min_=0, max_=1024)
+
+        large_file_layout = QVBoxLayout()
+        large_file_layout.addWidget(large_file_label)
+        large_file_layout.addWidget(large_file_spinbox)
+        large_file_group.setLayout(large_file_layout)
+
         # -- Docstring
         docstring_group = QGroupBox(_('Docstring type'))
 
@@ -313,8 +333,8 @@ def enable_tabwidth_spin(index):
         tabs.addTab(self.create_tab(sourcecode_widget), _("Source code"))
         tabs.addTab(self.create_tab(run_widget), _('Run code'))
         tabs.addTab(self.create_tab(template_btn, autosave_group,
-                                    docstring_group, annotations_group,
-                                    eol_group),
+                                    large_file_group, docstring_group,
+                                    annotations_group, eol_group),
                     _("Advanced settings"))
 
         vlayout = QVBoxLayout()
@@ -14,7 +14,6 @@
 # Third party imports
 from qtpy.QtGui import QTextCursor, QColor
 from qtpy.QtCore import Qt, QMutex, QMutexLocker
-from diff_match_patch import diff_match_patch
 
 try:
     from rtree import index
@@ -29,7 +28,12 @@
 
 
 MERGE_ALLOWED = {'int', 'name', 'whitespace'}
-VALID_UPDATES = {diff_match_patch.DIFF_DELETE, diff_match_patch.DIFF_INSERT}
+
+
+def count_changed_chars(changes):
+    """Return the number of characters removed and inserted by `changes`."""
+    return sum(change['rangeLength'] + len(change['text'])
+               for change in changes)
 
 
 def no_undo(f):
@@ -139,12 +143,7 @@ def _undo(self):
         if len(self.undo_stack) == 0:
             self.reset()
         if self.is_snippet_active:
-            num_pops = 0
-            patch = self.editor.patch
-            for diffs in patch:
-                for (op, data) in diffs.diffs:
-                    if op in VALID_UPDATES:
-                        num_pops += len(data)
+            num_pops = count_changed_chars(self.editor.text_changes)
             if len(self.undo_stack) > 0:
                 for _ in range(num_pops):
                     if len(self.undo_stack) == 0:
@@ -163,12 +162,7 @@ def _undo(self):
     @no_undo
     def _redo(self):
         if self.is_snippet_active:
-            num_pops = 0
-            patch = self.editor.patch
-            for diffs in patch:
-                for (op, data) in diffs.diffs:
-                    if op in VALID_UPDATES:
-                        num_pops += len(data)
+            num_pops = count_changed_chars(self.editor.text_changes)
             if len(self.redo_stack) > 0:
                 for _ in range(num_pops):
                     if len(self.redo_stack) == 0:
@@ -14,7 +14,7 @@
 
 # Third party imports
 from qtpy.QtCore import QSize, Qt, QTimer
-from qtpy.QtGui import QPainter, QColor, QCursor
+from qtpy.QtGui import QPainter, QColor, QCursor, QTextBlock
 from qtpy.QtWidgets import (QStyle, QStyleOptionSlider, QApplication)
 
 # Local imports
@@ -26,6 +26,78 @@
 REFRESH_RATE = 1000
 
 
+def get_flag_type(data):
+    """
+    Return the scroll flag type of the block user data `data`, or None.
+
+    Code analysis results take precedence over todos, and todos over
+    breakpoints.
+    """
+    if data.code_analysis:
+        for _, _, severity, _ in data.code_analysis:
+            if severity == DiagnosticSeverity.ERROR:
+                return 'error'
+        return 'warning'
+    elif data.todo:
+        return 'todo'
+    elif data.breakpoint:
+        return 'breakpoint'
+    return None
+
+
+class BlockFlagIndex(object):
+    """
+    Index of the blocks of an editor that have a scroll flag.
+
+    Producers of flags (code analysis, todos and breakpoints) call `add`
+    with the blocks they change, so the flags can be listed without
+    walking the whole document.
+    """
+
+    def __init__(self):
+        # Blocks follow the edits of the document, so their numbers are
+        # only computed when the flags are requested. The user data is kept
+        # to detect blocks that were removed.
+        self._blocks = {}
+
+    def __len__(self):
+        return len(self._blocks)
+
+    def add(self, block):
+        """Add `block` to the index if its user data has a flag."""
+        data = block.userData()
+        if data and get_flag_type(data) is not None:
+            self._blocks[id(data)] = (QTextBlock(block), data)
+
+    def clear(self):
+        """Remove all blocks from the index."""
+        self._blocks = {}
+
+    def get_flags(self):
+        """
+        Return a dict with the block numbers of each flag type.
+
+        Blocks that were removed from the document or that no longer have
+        a flag are dropped from the index.
+        """
+        flags = {
+            'error': [],
+            'warning': [],
+            'todo': [],
+            'breakpoint': [],
+        }
+        for key, (block, data) in list(self._blocks.items()):
+            flag_type = None
+            if block.isValid() and block.userData() is data:
+                flag_type = get_flag_type(data)
+
+            if flag_type is None:
+                del self._blocks[key]
+            else:
+                flags[flag_type].append(block.blockNumber())
+        return flags
+
+
 class ScrollFlagArea(Panel):
     """Source code editor's scroll flag area"""
     WIDTH = 24 if sys.platform == 'darwin' and is_dark_interface() else 12
@@ -108,43 +180,11 @@ def update_flags(self):
         """
         Update flags list.
 
-        This parses the entire file, which can take a lot of time for
-        large files. Save all the flags in lists for painting during
-        paint events.
+        The flags are taken from the editor's index of flagged blocks, so
+        only the blocks with a flag are visited. Save all the flags in lists
+        for painting during paint events.
         """
-        self._dict_flag_list = {
-            'error': [],
-            'warning': [],
-            'todo': [],
-            'breakpoint': [],
-        }
-
-        editor = self.editor
-        block = editor.document().firstBlock()
-        while block.isValid():
-            # Parse all lines in the file looking for something to flag.
-            data = block.userData()
-            if data:
-                if data.code_analysis:
-                    # Paint the errors and warnings
-                    for _, _, severity, _ in data.code_analysis:
-                        if severity == DiagnosticSeverity.ERROR:
-                            flag_type = 'error'
-                            break
-                    else:
-                        flag_type = 'warning'
-                elif data.todo:
-                    flag_type = 'todo'
-                elif data.breakpoint:
-                    flag_type = 'breakpoint'
-                else:
-                    flag_type = None
-
-                if flag_type is not None:
-                    self._dict_flag_list[flag_type].append(block.blockNumber())
-
-            block = block.next()
-
+        self._dict_flag_list = self.editor.flag_index.get_flags()
         self.update()
 
     def paintEvent(self, event):
@@ -205,16 +245,28 @@ def compute_flag_ypos(block):
         }
         dict_flag_lists.update(self._dict_flag_list)
 
+        # Bin the flags by their vertical position, so that each pixel row
+        # is painted once even with thousands of flags. Flag types that come
+        # later in the dict are drawn on top of the previous ones.
+        flag_buckets = {}
         for flag_type in dict_flag_lists:
-            painter.setBrush(self._facecolors[flag_type])
-            painter.setPen(self._edgecolors[flag_type])
             for block_number in dict_flag_lists[flag_type]:
                 # Find the block
                 block = editor.document().findBlockByNumber(block_number)
                 if not block.isValid():
                     continue
-                # paint if everything else is fine
-                rect_y = compute_flag_ypos(block)
+                flag_buckets[compute_flag_ypos(block)] = flag_type
+
+        rects_y = {}
+        for rect_y, flag_type in flag_buckets.items():
+            rects_y.setdefault(flag_type, []).append(rect_y)
+
+        for flag_type in dict_flag_lists:
+            if flag_type not in rects_y:
+                continue
+            painter.setBrush(self._facecolors[flag_type])
+            painter.setPen(self._edgecolors[flag_type])
+            for rect_y in rects_y[flag_type]:
                 painter.drawRect(rect_x, rect_y, rect_w, rect_h)
 
         # Paint the slider range
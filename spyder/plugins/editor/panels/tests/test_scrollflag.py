@@ -147,6 +147,55 @@ def test_flag_painting(editor_bot, qtbot):
         editor.setTextCursor(cursor)
 
 
+def test_flag_index(editor_bot):
+    """Test that the flags are taken from the editor's index of flagged
+    blocks and that they follow the edits of the document."""
+    editor = editor_bot
+    sfa = editor.scrollflagarea
+    editor.set_text(short_code)
+
+    editor.debugger.toogle_breakpoint(line_number=2)
+    editor.process_todo([[True, 3]])
+    editor._diagnostics = [
+        {'source': 'pycodestyle', 'range': {
+            'start': {'line': 3, 'character': 0},
+            'end': {'line': 3, 'character': 1}},
+         'code': 'E227', 'message': 'E227 warning', 'severity': 2},
+        {'source': 'pyflakes', 'range': {
+            'start': {'line': 4, 'character': 0},
+            'end': {'line': 4, 'character': 1}},
+         'message': 'syntax error', 'severity': 1}]
+    editor.set_errors()
+    assert len(editor.flag_index) == 4
+
+    sfa.update_flags()
+    assert sfa._dict_flag_list == {
+        'error': [4], 'warning': [3], 'todo': [2], 'breakpoint': [1]}
+
+    # Insert a line at the top of the file
+    cursor = editor.textCursor()
+    cursor.setPosition(0)
+    cursor.insertText('\n')
+    sfa.update_flags()
+    assert sfa._dict_flag_list == {
+        'error': [5], 'warning': [4], 'todo': [3], 'breakpoint': [2]}
+
+    # Removed flags are dropped from the index
+    editor.process_todo([])
+    editor.debugger.clear_breakpoints()
+    sfa.update_flags()
+    assert sfa._dict_flag_list == {
+        'error': [5], 'warning': [4], 'todo': [], 'breakpoint': []}
+    assert len(editor.flag_index) == 2
+
+    # Removed blocks too
+    editor.set_text(long_code)
+    sfa.update_flags()
+    assert sfa._dict_flag_list == {
+        'error': [], 'warning': [], 'todo': [], 'breakpoint': []}
+    assert len(editor.flag_index) == 0
+
+
 @pytest.mark.skipif(os.environ.get('CI', None) is not None,
                     reason="It fails on CIs")
 def test_range_indicator_visible_on_hover_only(editor_bot, qtbot):
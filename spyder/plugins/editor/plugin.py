@@ -50,6 +50,7 @@
                                                   clear_breakpoint)
 from spyder.plugins.editor.widgets.status import (CursorPositionStatus,
                                                   EncodingStatus, EOLStatus,
+                                                  LargeFileStatus,
                                                   ReadWriteStatus, VCSStatus)
 from spyder.api.plugins import SpyderPluginWidget
 from spyder.plugins.run.widgets import (ALWAYS_OPEN_FIRST_RUN_OPTION,
@@ -185,6 +186,7 @@ def __init__(self, parent, ignore_last_opened_files=False):
         self.encoding_status = EncodingStatus(self, statusbar)
         self.eol_status = EOLStatus(self, statusbar)
         self.readwrite_status = ReadWriteStatus(self, statusbar)
+        self.largefile_status = LargeFileStatus(self, statusbar)
 
         layout = QVBoxLayout()
         self.dock_toolbar = QToolBar(self)
@@ -1299,10 +1301,13 @@ def register_editorstack(self, editorstack):
             editorstack.reset_statusbar.connect(self.readwrite_status.hide)
             editorstack.reset_statusbar.connect(self.encoding_status.hide)
             editorstack.reset_statusbar.connect(self.cursorpos_status.hide)
+            editorstack.reset_statusbar.connect(self.largefile_status.hide)
             editorstack.readonly_changed.connect(
                                         self.readwrite_status.update_readonly)
             editorstack.encoding_changed.connect(
                                          self.encoding_status.update_encoding)
+            editorstack.large_file_changed.connect(
+                self.largefile_status.update_large_file)
             editorstack.sig_editor_cursor_position_changed.connect(
                                  self.cursorpos_status.update_cursor_position)
             editorstack.sig_editor_cursor_position_changed.connect(
@@ -1352,6 +1357,7 @@ def register_editorstack(self, editorstack):
             ('set_highlight_current_cell_enabled',  'highlight_current_cell'),
             ('set_occurrence_highlighting_enabled',  'occurrence_highlighting'),
             ('set_occurrence_highlighting_timeout',  'occurrence_highlighting/timeout'),
+            ('set_large_file_mchars',               'large_file_mchars'),
             ('set_checkeolchars_enabled',           'check_eol_chars'),
             ('set_tabbar_visible',                  'show_tab_bar'),
             ('set_classfunc_dropdown_visible',      'show_class_func_dropdown'),
@@ -2803,6 +2809,8 @@ def apply_plugin_settings(self, options):
             occurrence_o = self.get_option(occurrence_n)
             occurrence_timeout_n = 'occurrence_highlighting/timeout'
             occurrence_timeout_o = self.get_option(occurrence_timeout_n)
+            large_file_mchars_n = 'large_file_mchars'
+            large_file_mchars_o = self.get_option(large_file_mchars_n)
             focus_to_editor_n = 'focus_to_editor'
             focus_to_editor_o = self.get_option(focus_to_editor_n)
 
@@ -2820,6 +2828,9 @@ def apply_plugin_settings(self, options):
                 if occurrence_timeout_n in options:
                     editorstack.set_occurrence_highlighting_timeout(
                                                            occurrence_timeout_o)
+                if large_file_mchars_n in options:
+                    editorstack.set_large_file_mchars(
+                        large_file_mchars_o)
                 if focus_to_editor_n in options:
                     editorstack.set_focus_to_editor(focus_to_editor_o)
 
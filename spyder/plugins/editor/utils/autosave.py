@@ -352,7 +352,8 @@ def maybe_autosave(self, index):
         """
         Autosave a file if necessary.
 
-        If the file is newly created (and thus not named by the user), do
+        If the file is newly created (and thus not named by the user) or
+        is still being loaded (and thus can't have been edited), do
         nothing.  If the current contents are the same as the autosave file
         (if it exists) or the original file (if no autosave filee exists),
         then do nothing. If the current contents are the same as the file on
@@ -363,7 +364,7 @@ def maybe_autosave(self, index):
             index (int): index into self.stack.data
         """
         finfo = self.stack.data[index]
-        if finfo.newly_created:
+        if finfo.newly_created or finfo.editor.is_loading_text():
             return
         orig_filename = finfo.filename
         try:
@@ -401,6 +402,8 @@ def autosave(self, finfo):
         """
         autosave_filename = self.get_autosave_filename(finfo.filename)
         logger.debug('Autosaving %s to %s', finfo.filename, autosave_filename)
+        # Never write a partially loaded large file
+        finfo.editor.finish_loading_text()
         try:
             self.stack._write_to_file(finfo, autosave_filename)
             autosave_hash = self.stack.compute_hash(finfo)
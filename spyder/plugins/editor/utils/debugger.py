@@ -114,6 +114,7 @@ def toogle_breakpoint(self, line_number=None, condition=None,
             if len(text) == 0 or text.startswith(('#', '"', "'")):
                 data.breakpoint = False
         block.setUserData(data)
+        self.editor.flag_index.add(block)
         self.editor.sig_flags_changed.emit()
         self.editor.sig_breakpoints_changed.emit()
 
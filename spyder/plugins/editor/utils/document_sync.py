@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""
+Incremental synchronization of the editor text with language servers.
+
+Changes are taken from the contentsChange signal of QTextDocument and
+converted to the range based content changes of the Language Server
+Protocol, so only the edited text needs to be sent after each edit.
+"""
+
+# Standard library imports
+import re
+
+# Third party imports
+from qtpy.QtGui import QTextCursor
+
+
+# Characters outside the Basic Multilingual Plane take two positions in a
+# QTextDocument but one in Python strings, so positions can't be mapped
+# between both without scanning the whole text.
+ASTRAL_CHARS = re.compile('[\U00010000-\U0010ffff]')
+
+# Above this number of pending changes it's cheaper to send the whole text
+MAX_PENDING_CHANGES = 1000
+
+
+def to_plain_text(text):
+    """
+    Convert text taken from a QTextCursor selection to plain text.
+
+    This does the same conversions as QTextDocument.toPlainText.
+    """
+    return (text.replace(u'\u2029', u'\n')
+                .replace(u'\u2028', u'\n')
+                .replace(u'\xa0', u' '))
+
+
+def apply_text_changes(text, changes):
+    """
+    Apply a list of LSP content changes to `text`.
+
+    Changes are applied in order, each one relative to the text left by the
+    previous one. A change without range replaces the whole text.
+    """
+    for change in changes:
+        if 'range' not in change:
+            text = change['text']
+            continue
+        lines = text.split('\n')
+        start = change['range']['start']
+        end = change['range']['end']
+        start_offset = (sum(len(line) + 1 for line in lines[:start['line']])
+                        + start['character'])
+        end_offset = (sum(len(line) + 1 for line in lines[:end['line']])
+                      + end['character'])
+        text = text[:start_offset] + change['text'] + text[end_offset:]
+    return text
+
+
+class DocumentChangeTracker:
+    """
+    Record the changes of a QTextDocument as LSP content changes.
+
+    A copy of the text is kept up to date to compute the range of each
+    change, in the coordinates of the text before it.
+
+    Changes that can't be mapped to that copy (e.g. text with characters
+    outside the Basic Multilingual Plane) make the next synchronization
+    send the whole text instead.
+
+    Parameters
+    ----------
+    document: QTextDocument
+        Document to track. It's shared by cloned editors, which must share
+        its tracker too.
+    """
+
+    def __init__(self, document):
+        self.document = document
+        self.enabled = True
+        self._pending = []
+        self._recent = []
+        self._full_sync = False
+        self._set_text(document.toPlainText())
+        self.synced_text = self.text
+
+        # Qt only emits contentsChange for documents with a layout
+        document.documentLayout()
+        document.contentsChange.connect(self._on_contents_change)
+
+    # ---- Public API
+    # ------------------------------------------------------------------------
+    def set_enabled(self, state):
+        """
+        Enable or disable the tracker.
+
+        A disabled tracker doesn't keep a copy of the text, so it's used for
+        files that are too big to be synchronized.
+        """
+        self.enabled = state
+        if state:
+            self.reset()
+        else:
+            self._pending = []
+            self._recent = []
+            self.text = self.synced_text = ''
+
+    def reset(self):
+        """Forget all changes and take the current text as synchronized."""
+        self._pending = []
+        self._recent = []
+        self._full_sync = False
+        self._set_text(self.document.toPlainText())
+        self.synced_text = self.text
+
+    def has_pending_changes(self):
+        """Return True if there are changes not synchronized yet."""
+        return self.enabled and (self._full_sync or bool(self._pending))
+
+    def take_changes(self):
+        """
+        Return the changes since the last call and mark them as synchronized.
+
+        Returns
+        -------
+        list or None
+            List of LSP content changes, or None if the whole text must be
+            sent instead.
+        """
+        if self._full_sync:
+            self._set_text(self.document.toPlainText())
+            changes = None
+        else:
+            changes = self._pending
+
+        self._pending = []
+        self._full_sync = False
+        self.synced_text = self.text
+        return changes
+
+    def take_recent_changes(self):
+        """
+        Return the changes since the last call.
+
+        Unlike `take_changes`, this doesn't affect synchronization. It's used
+        to know what the last edit did.
+        """
+        changes = self._recent
+        self._recent = []
+        return changes
+
+    # ---- Private API
+    # ------------------------------------------------------------------------
+    def _set_text(self, text):
+        self.text = text
+        self._has_astral = ASTRAL_CHARS.search(text) is not None
+
+    def _on_contents_change(self, position, removed, added):
+        """Record a change reported by Qt."""
+        if not self.enabled or self._full_sync:
+            return
+        if self._has_astral:
+            self._full_sync = True
+            return
+
+        document = self.document
+        length = document.characterCount() - 1
+        text = self.text
+
+        # Changes that reach the end of the document can also count its
+        # final paragraph separator, which is not part of the text
+        removed = min(removed, len(text) - position)
+        added = min(added, length - position)
+        if added < 0 or removed < 0:
+            self._full_sync = True
+            return
+
+        if added:
+            cursor = QTextCursor(document)
+            cursor.setPosition(position)
+            cursor.setPosition(position + added, QTextCursor.KeepAnchor)
+            inserted = to_plain_text(cursor.selectedText())
+            if ASTRAL_CHARS.search(inserted):
+                self._full_sync = True
+                return
+        else:
+            inserted = ''
+
+        removed_text = text[position:position + removed]
+        if removed_text == inserted:
+            # Only formats changed
+            return
+
+        # Lines are counted in the text rather than taken from the blocks
+        # of the document, which can also contain line separators
+        start_line = text.count('\n', 0, position)
+        start_char = position - text.rfind('\n', 0, position) - 1
+        newlines = removed_text.count('\n')
+        if newlines:
+            end_char = len(removed_text) - removed_text.rfind('\n') - 1
+        else:
+            end_char = start_char + removed
+
+        self.text = text[:position] + inserted + text[position + removed:]
+        if len(self.text) != length:
+            self._full_sync = True
+            return
+
+        change = {
+            'range': {
+                'start': {'line': start_line, 'character': start_char},
+                'end': {'line': start_line + newlines,
+                        'character': end_char},
+            },
+            'rangeLength': removed,
+            'text': inserted,
+        }
+        self._recent.append(change)
+        self._pending.append(change)
+        if len(self._pending) > MAX_PENDING_CHANGES:
+            self._pending = []
+            self._full_sync = True
+        if len(self._recent) > MAX_PENDING_CHANGES:
+            self._recent = []
@@ -180,6 +180,7 @@ def test_autosave(mocker, have_hash):
     """Test that AutosaveForStack.maybe_autosave writes the contents to the
     autosave file and updates the file_hashes."""
     mock_editor = mocker.Mock()
+    mock_editor.is_loading_text.return_value = False
     mock_fileinfo = mocker.Mock(editor=mock_editor, filename='orig',
                                 newly_created=False)
     mock_document = mocker.Mock()
@@ -202,6 +203,23 @@ def test_autosave(mocker, have_hash):
         assert addon.file_hashes == {'autosave': 3}
 
 
+def test_autosave_loading_file(mocker):
+    """Test that AutosaveForStack.maybe_autosave doesn't write files still
+    being loaded in large file mode."""
+    mock_editor = mocker.Mock()
+    mock_editor.is_loading_text.return_value = True
+    mock_fileinfo = mocker.Mock(editor=mock_editor, filename='orig',
+                                newly_created=False)
+    mock_stack = mocker.Mock(data=[mock_fileinfo])
+    addon = AutosaveForStack(mock_stack)
+    addon.file_hashes = {'orig': 1}
+    mock_stack.compute_hash.return_value = 2
+
+    addon.maybe_autosave(0)
+
+    assert not mock_stack._write_to_file.called
+
+
 @pytest.mark.parametrize('latin', [True, False])
 def test_save_autosave_mapping_with_nonempty_mapping(mocker, tmpdir, latin):
     """Test that save_autosave_mapping() writes the current autosave mapping
@@ -289,6 +307,7 @@ def test_autosave_file_renamed(mocker, tmpdir, have_hash):
     mocker.patch('spyder.plugins.editor.utils.autosave.get_conf_path',
                  return_value=str(tmpdir))
     mock_editor = mocker.Mock()
+    mock_editor.is_loading_text.return_value = False
     mock_fileinfo = mocker.Mock(editor=mock_editor, filename='new_foo.py',
                                 newly_created=False)
     mock_document = mocker.Mock()
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+#
+"""Tests for document_sync.py"""
+
+# Third party imports
+import pytest
+from qtpy.QtGui import QTextCursor
+
+# Local imports
+from spyder.plugins.completion.manager.api import LSPRequestTypes
+from spyder.plugins.editor.utils.document_sync import apply_text_changes
+from spyder.plugins.editor.widgets.tests.conftest import codeeditor_factory
+
+
+TEXT = 'import os\n\ndef spam(x):\n    return x\n'
+
+
+@pytest.fixture
+def editor(qtbot):
+    editor = codeeditor_factory()
+    qtbot.addWidget(editor)
+    editor.set_text(TEXT)
+    editor.document_sync.reset()
+    return editor
+
+
+def check_sync(editor):
+    """Check that the tracked changes turn the synced text into the text."""
+    tracker = editor.document_sync
+    previous_text = tracker.synced_text
+    changes = tracker.take_changes()
+    assert changes is not None
+    assert apply_text_changes(previous_text, changes) == editor.toPlainText()
+    assert tracker.synced_text == editor.toPlainText()
+    return changes
+
+
+def test_tracker_changes(editor):
+    """Test that edits are recorded as LSP content changes."""
+    cursor = QTextCursor(editor.document())
+    cursor.setPosition(len('import os'))
+    cursor.insertText(', sys')
+    assert check_sync(editor) == [{
+        'range': {'start': {'line': 0, 'character': 9},
+                  'end': {'line': 0, 'character': 9}},
+        'rangeLength': 0,
+        'text': ', sys',
+    }]
+
+    # Removal across lines
+    cursor.setPosition(3)
+    cursor.setPosition(len('import os, sys\n\nd'), QTextCursor.KeepAnchor)
+    cursor.removeSelectedText()
+    assert check_sync(editor)[0]['range'] == {
+        'start': {'line': 0, 'character': 3},
+        'end': {'line': 2, 'character': 1}}
+
+    # Several edits, including the end of the document, in one batch
+    cursor.movePosition(QTextCursor.End)
+    cursor.insertText('\nprint(spam(1))')
+    cursor.movePosition(QTextCursor.Start)
+    cursor.insertText('# Comment\n')
+    editor.undo()
+    cursor.movePosition(QTextCursor.End)
+    cursor.movePosition(QTextCursor.StartOfLine, QTextCursor.KeepAnchor)
+    cursor.insertText('eggs = 1 ham = 2')
+    assert len(check_sync(editor)) == 4
+
+    editor.set_text('x = 1\n')
+    check_sync(editor)
+    assert check_sync(editor) == []
+
+
+def test_tracker_full_sync(editor):
+    """Test that the whole text is sent for text Qt and Python count apart."""
+    tracker = editor.document_sync
+    cursor = QTextCursor(editor.document())
+    cursor.insertText('# \U0001f40d\n')
+    assert tracker.has_pending_changes()
+    assert tracker.take_changes() is None
+    assert tracker.synced_text == editor.toPlainText()
+
+    cursor.movePosition(QTextCursor.Start)
+    cursor.movePosition(QTextCursor.Down, QTextCursor.KeepAnchor)
+    cursor.removeSelectedText()
+    assert tracker.take_changes() is None
+    cursor.insertText('x')
+    check_sync(editor)
+
+    # Disabled trackers don't record anything
+    tracker.set_enabled(False)
+    cursor.insertText('y')
+    assert not tracker.has_pending_changes()
+
+
+def test_editor_batches_changes(editor, qtbot):
+    """Test that didChange requests are sent in batches and in order."""
+    requests = []
+    editor.sig_perform_completion_request.connect(
+        lambda language, method, params: requests.append((method, params)))
+    editor.completions_available = True
+    editor.document_symbols_enabled = True
+
+    editor.moveCursor(QTextCursor.End)
+    qtbot.keyClicks(editor, 'abc')
+    assert requests == []
+    qtbot.waitUntil(lambda: len(requests) > 0)
+    method, params = requests[0]
+    assert method == LSPRequestTypes.DOCUMENT_DID_CHANGE
+    assert [change['text'] for change in params['changes']] == list('abc')
+    assert params['text'] == editor.toPlainText()
+
+    # Other requests send the pending changes first
+    requests.clear()
+    qtbot.keyClicks(editor, 'd')
+    editor.request_symbols()
+    assert [method for method, __ in requests] == [
+        LSPRequestTypes.DOCUMENT_DID_CHANGE, LSPRequestTypes.DOCUMENT_SYMBOL]
+    assert not editor.document_change_timer.isActive()
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+#
+"""Tests for workers.py"""
+
+# Standard library imports
+import threading
+
+# Third party imports
+import pytest
+
+# Local imports
+from spyder.plugins.editor.utils.workers import WorkerPool
+
+
+class Owner(object):
+    pass
+
+
+@pytest.fixture
+def workerpool(qtbot):
+    pool = WorkerPool()
+    yield pool
+    pool.cancel()
+
+
+def test_workerpool_submit(workerpool, qtbot):
+    """Test that results are passed to the callback in the main thread."""
+    results = []
+    workerpool.submit(Owner(), 'todo', sum, ([1, 2, 3],),
+                      lambda res: results.append(
+                          (res, threading.current_thread())))
+    qtbot.waitUntil(lambda: not workerpool.is_busy())
+    assert results == [(6, threading.main_thread())]
+
+
+def test_workerpool_coalesce(workerpool, qtbot):
+    """
+    Test that only the last job submitted while another one is running is
+    run, and that the results of the superseded running job are discarded.
+    """
+    owner = Owner()
+    started = threading.Event()
+    event = threading.Event()
+    calls = []
+    results = []
+
+    def job(value):
+        calls.append(value)
+        if value == 0:
+            started.set()
+            event.wait(5)
+        return value
+
+    workerpool.submit(owner, 'todo', job, (0,), results.append)
+    assert started.wait(5)
+    for value in range(1, 4):
+        workerpool.submit(owner, 'todo', job, (value,), results.append)
+
+    # Jobs of other owners or types are not coalesced
+    other = Owner()
+    workerpool.submit(other, 'todo', job, (10,), results.append)
+    workerpool.submit(owner, 'cells', job, (20,), results.append)
+    qtbot.waitUntil(lambda: sorted(results) == [10, 20])
+
+    event.set()
+    qtbot.waitUntil(lambda: not workerpool.is_busy())
+    assert sorted(calls) == [0, 3, 10, 20]
+    assert sorted(results) == [3, 10, 20]
+
+
+def test_workerpool_cancel(workerpool, qtbot):
+    """Test that cancelling the jobs of an owner discards their results."""
+    owner = Owner()
+    other = Owner()
+    event = threading.Event()
+    results = []
+
+    def job(value):
+        event.wait(5)
+        return value
+
+    workerpool.submit(owner, 'todo', job, (1,), results.append)
+    workerpool.submit(owner, 'todo', job, (2,), results.append)
+    workerpool.submit(other, 'todo', job, (3,), results.append)
+    workerpool.cancel(owner)
+    assert not workerpool.is_busy(owner)
+    assert workerpool.is_busy(other)
+
+    event.set()
+    qtbot.waitUntil(lambda: not workerpool.is_busy())
+    assert results == [3]
+
+
+if __name__ == "__main__":
+    pytest.main()
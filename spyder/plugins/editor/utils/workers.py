@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""
+Pool of workers for the background jobs of the Editor.
+
+All editor stacks share the same pool of threads. Jobs are identified by
+the object they belong to (e.g. a file) and their type, so that at most one
+job of each kind runs per file: submitting a new job while another one is
+running replaces any job still waiting for it and discards the results of
+the running one, which is outdated.
+"""
+
+# Standard library imports
+import concurrent.futures
+import logging
+import os
+import threading
+
+# Third party imports
+from qtpy.QtCore import QObject, Signal
+
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of jobs that run at the same time
+MAX_WORKERS = max(2, min(4, os.cpu_count() or 1))
+
+_EXECUTOR = None
+_EXECUTOR_LOCK = threading.Lock()
+
+
+def get_executor():
+    """Return the pool of threads shared by all the editor stacks."""
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None:
+            _EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+                max_workers=MAX_WORKERS, thread_name_prefix='spyder-editor')
+        return _EXECUTOR
+
+
+class WorkerJob(object):
+    """Job run by a worker pool."""
+
+    def __init__(self, key, func, args, callback):
+        self.key = key
+        self.func = func
+        self.args = args
+        self.callback = callback
+        self.results = None
+        self.cancelled = False
+        self.future = None
+
+    def cancel(self):
+        """
+        Cancel the job.
+
+        A job that didn't start is skipped by its worker and the results of
+        a running one are discarded when it finishes, because it can't be
+        stopped.
+        """
+        self.cancelled = True
+
+    def run(self):
+        """Run the job in a worker thread."""
+        if self.cancelled:
+            return
+        try:
+            self.results = self.func(*self.args)
+        except Exception as e:
+            logger.error(e, exc_info=True)
+
+
+class WorkerPool(QObject):
+    """Run and coalesce the background jobs of an editor stack."""
+
+    # Emitted from worker threads, so it's received in the main thread
+    sig_job_finished = Signal(object)
+
+    def __init__(self, parent=None, executor=None):
+        super(WorkerPool, self).__init__(parent)
+        self._executor = executor
+        self._running = {}
+        self._pending = {}
+        self.sig_job_finished.connect(self._job_finished)
+
+    @property
+    def executor(self):
+        """Pool of threads where jobs are run."""
+        if self._executor is None:
+            self._executor = get_executor()
+        return self._executor
+
+    # ---- Public API
+    # ------------------------------------------------------------------------
+    def submit(self, owner, job_type, func, args, callback):
+        """
+        Run `func(*args)` in a worker thread.
+
+        Parameters
+        ----------
+        owner: object
+            Object the job belongs to, e.g. a file.
+        job_type: str
+            Kind of the job. Only the last job submitted of each type is run
+            for `owner` when several are submitted in a row.
+        func: callable
+            Function to run in a worker thread.
+        args: tuple
+            Arguments of `func`.
+        callback: callable
+            Called in the main thread with the results of `func`, unless
+            the job is cancelled, superseded or fails.
+
+        Returns
+        -------
+        WorkerJob
+            The submitted job.
+        """
+        key = (id(owner), job_type)
+        job = WorkerJob(key, func, args, callback)
+
+        previous = self._pending.pop(key, None)
+        if previous is not None:
+            previous.cancel()
+
+        running = self._running.get(key)
+        if running is None:
+            self._start(job)
+        else:
+            # Wait for the running job, whose results are outdated now
+            running.cancel()
+            self._pending[key] = job
+        return job
+
+    def cancel(self, owner=None):
+        """Cancel the jobs of `owner`, or all the jobs if it's None."""
+        for jobs in (self._pending, self._running):
+            for key, job in list(jobs.items()):
+                if owner is None or key[0] == id(owner):
+                    job.cancel()
+                    jobs.pop(key)
+
+    def is_busy(self, owner=None):
+        """Whether there are jobs of `owner` (or of any owner) left."""
+        keys = list(self._pending) + list(self._running)
+        if owner is None:
+            return bool(keys)
+        return any(key[0] == id(owner) for key in keys)
+
+    # ---- Private API
+    # ------------------------------------------------------------------------
+    def _start(self, job):
+        """Send `job` to the pool of threads."""
+        self._running[job.key] = job
+        try:
+            job.future = self.executor.submit(self._run, job)
+        except RuntimeError:
+            # The pool was shut down when exiting
+            self._running.pop(job.key)
+
+    def _run(self, job):
+        """Run `job` and notify the main thread."""
+        job.run()
+        try:
+            self.sig_job_finished.emit(job)
+        except RuntimeError:
+            # The pool was deleted while the job was running
+            pass
+
+    def _job_finished(self, job):
+        """Handle the end of `job` in the main thread."""
+        if self._running.get(job.key) is job:
+            self._running.pop(job.key)
+            pending = self._pending.pop(job.key, None)
+            if pending is not None:
+                self._start(pending)
+
+        if not job.cancelled and job.results is not None:
+            job.callback(job.results)
@@ -71,8 +71,10 @@
                                           FoldingPanel, IndentationGuide,
                                           LineNumberArea, PanelsManager,
                                           ScrollFlagArea)
+from spyder.plugins.editor.panels.scrollflag import BlockFlagIndex
 from spyder.plugins.editor.utils.editor import (TextHelper, BlockUserData)
 from spyder.plugins.editor.utils.debugger import DebuggerManager
+from spyder.plugins.editor.utils.document_sync import DocumentChangeTracker
 # from spyder.plugins.editor.utils.folding import IndentFoldDetector, FoldScope
 from spyder.plugins.editor.utils.kill_ring import QtKillRing
 from spyder.plugins.editor.utils.languages import ALL_LANGUAGES, CELL_LANGUAGES
@@ -105,6 +107,21 @@
 # the up/down arrow keys.
 UPDATE_DECORATIONS_TIMEOUT = 500  # miliseconds
 
+# Files with more characters than this are opened in large file mode by
+# default
+LARGE_FILE_MCHARS = 10  # millions of characters
+
+# Number of characters added to the document at a time when loading
+# large files
+LARGE_FILE_CHUNK_SIZE = 1024 ** 2
+
+# Timeout to highlight the visible lines of large files after scrolling
+LARGE_FILE_HIGHLIGHT_TIMEOUT = 50  # miliseconds
+
+# Time to gather text changes before sending them to the completion
+# providers. Pending changes are also sent before any other request.
+DOCUMENT_CHANGE_TIMEOUT = 200  # miliseconds
+
 # %% This line is for cell execution testing
 def is_letter_or_number(char):
     """Returns whether the specified unicode character is a letter or a number.
@@ -290,6 +307,9 @@ class CodeEditor(TextEditBaseWidget):
     #: Signal emitted when a new text is set on the widget
     new_text_set = Signal()
 
+    #: Signal emitted when all the text of a large file has been loaded
+    sig_large_file_loaded = Signal()
+
     # -- LSP signals
     #: Signal emitted when an LSP request is sent to the LSP manager
     sig_perform_completion_request = Signal(str, str, dict)
@@ -537,10 +557,38 @@ def __init__(self, parent=None):
         self.verticalScrollBar().valueChanged.connect(
             lambda value: self.update_decorations_timer.start())
 
+        # Large file mode
+        self.large_file = False
+        self.large_file_mchars = LARGE_FILE_MCHARS
+        self._large_file_text = None
+        self._large_file_offset = 0
+        self._large_file_read_only = False
+        self.large_file_timer = QTimer(self)
+        self.large_file_timer.setSingleShot(True)
+        self.large_file_timer.setInterval(0)
+        self.large_file_timer.timeout.connect(self._load_large_file_chunk)
+        self.viewport_highlight_timer = QTimer(self)
+        self.viewport_highlight_timer.setSingleShot(True)
+        self.viewport_highlight_timer.setInterval(
+            LARGE_FILE_HIGHLIGHT_TIMEOUT)
+        self.viewport_highlight_timer.timeout.connect(
+            self.highlight_viewport)
+        self.updateRequest.connect(self._start_viewport_highlight_timer)
+
+        # Text changes sent to the completion providers
+        self.document_change_timer = QTimer(self)
+        self.document_change_timer.setSingleShot(True)
+        self.document_change_timer.setInterval(DOCUMENT_CHANGE_TIMEOUT)
+        self.document_change_timer.timeout.connect(
+            self.flush_document_changes)
+
         # Mark found results
         self.textChanged.connect(self.__text_has_changed)
         self.found_results = []
 
+        # Blocks with flags to show in the scroll flag area
+        self.flag_index = BlockFlagIndex()
+
         # Docstring
         self.writer_docstring = DocstringWriterExtension(self)
 
@@ -638,9 +686,9 @@ def __init__(self, parent=None):
 
         # Text diffs across versions
         self.differ = diff_match_patch()
-        self.previous_text = ''
+        self.document_sync = DocumentChangeTracker(self.document())
         self.word_tokens = []
-        self.patch = []
+        self.text_changes = []
         self.text_diff = ([], '')
         self.leading_whitespaces = {}
 
@@ -808,14 +856,21 @@ def get_document_id(self):
     def set_as_clone(self, editor):
         """Set as clone editor"""
         self.setDocument(editor.document())
+        self.document_sync = editor.document_sync
         self.document_id = editor.get_document_id()
         self.highlighter = editor.highlighter
+        self.flag_index = editor.flag_index
         self.eol_chars = editor.eol_chars
         self._apply_highlighter_color_scheme()
+        if editor.large_file:
+            self.set_large_file_mode()
+            self.viewport_highlight_timer.start()
 
     # ---- Widget setup and options
     def toggle_wrap_mode(self, enable):
         """Enable/disable wrap mode"""
+        # Wrapping lines requires to lay out the whole document
+        enable = enable and not self.large_file
         self.set_wrap_mode('word' if enable else None)
 
     def toggle_line_numbers(self, linenumbers=True, markers=False):
@@ -873,7 +928,8 @@ def setup_editor(self,
                      remove_trailing_spaces=False,
                      remove_trailing_newlines=False,
                      add_newline=False,
-                     format_on_save=False):
+                     format_on_save=False,
+                     large_file_mchars=LARGE_FILE_MCHARS):
         """
         Set-up configuration for the CodeEditor instance.
 
@@ -956,9 +1012,13 @@ def setup_editor(self,
             Default False.
         format_on_save: Autoformat file automatically when saving.
             Default False.
+        large_file_mchars: Number of characters, in millions, above which
+            files are opened in large file mode. Zero disables it.
+            Default 10.
         """
 
         self.set_close_parentheses_enabled(close_parentheses)
+        self.set_large_file_mchars(large_file_mchars)
         self.set_close_quotes_enabled(close_quotes)
         self.set_add_colons_enabled(add_colons)
         self.set_auto_unindent_enabled(auto_unindent)
@@ -1007,7 +1067,7 @@ def setup_editor(self,
             self.setFont(font) # this is required for line numbers area
             # Needed to show indent guides for splited editor panels
             # See spyder-ide/spyder#10900
-            self.patch = cloned_from.patch
+            self.text_changes = cloned_from.text_changes
             self.is_cloned = True
         self.toggle_line_numbers(linenumbers, markers)
 
@@ -1086,6 +1146,11 @@ def handle_response(self, method, params):
 
     def emit_request(self, method, params, requires_response):
         """Send request to LSP manager."""
+        # Requests must see the text the user sees, so pending changes are
+        # sent first
+        if (method != LSPRequestTypes.DOCUMENT_DID_CHANGE
+                and self.document_sync.has_pending_changes()):
+            self.flush_document_changes()
         params['requires_response'] = requires_response
         params['response_instance'] = self
         self.sig_perform_completion_request.emit(
@@ -1180,6 +1245,10 @@ def stop_completion_services(self):
     @request(method=LSPRequestTypes.DOCUMENT_DID_OPEN, requires_response=False)
     def document_did_open(self):
         """Send textDocument/didOpen request to the server."""
+        if self.large_file:
+            return
+        self.document_change_timer.stop()
+        self.document_sync.reset()
         cursor = self.textCursor()
         params = {
             'file': self.filename,
@@ -1197,7 +1266,7 @@ def document_did_open(self):
     @request(method=LSPRequestTypes.DOCUMENT_SYMBOL)
     def request_symbols(self):
         """Request document symbols."""
-        if not self.document_symbols_enabled:
+        if not self.document_symbols_enabled or self.large_file:
             return
         if self.oe_proxy is not None:
             self.oe_proxy.emit_request_in_progress()
@@ -1221,20 +1290,43 @@ def process_symbols(self, params):
             self.log_lsp_handle_errors("Error when processing symbols")
 
     # ------------- LSP: Linting ---------------------------------------
-    @request(
-        method=LSPRequestTypes.DOCUMENT_DID_CHANGE, requires_response=False)
+    @property
+    def previous_text(self):
+        """Text last sent to the completion providers."""
+        return self.document_sync.synced_text
+
     def document_did_change(self, text=None):
-        """Send textDocument/didChange request to the server."""
+        """
+        Notify a change of the text.
+
+        Changes are gathered and sent to the server by
+        `flush_document_changes` after `DOCUMENT_CHANGE_TIMEOUT`.
+        """
+        if self.large_file:
+            return
         self.text_version += 1
-        text = self.toPlainText()
-        self.patch = self.differ.patch_make(self.previous_text, text)
-        self.previous_text = text
+        self.text_changes = self.document_sync.take_recent_changes()
+        self.document_change_timer.start()
+
+    @request(
+        method=LSPRequestTypes.DOCUMENT_DID_CHANGE, requires_response=False)
+    def flush_document_changes(self):
+        """
+        Send textDocument/didChange request to the server.
+
+        Only the changes since the last request are sent, unless the whole
+        text is needed to synchronize the server again.
+        """
+        self.document_change_timer.stop()
+        if self.large_file or not self.document_sync.has_pending_changes():
+            return
+        changes = self.document_sync.take_changes()
         cursor = self.textCursor()
         params = {
             'file': self.filename,
             'version': self.text_version,
-            'text': text,
-            'diff': self.patch,
+            'text': self.document_sync.synced_text,
+            'changes': changes,
             'offset': cursor.position(),
             'selection_start': cursor.selectionStart(),
             'selection_end': cursor.selectionEnd(),
@@ -1746,7 +1838,8 @@ def cleanup_folding(self):
     @request(method=LSPRequestTypes.DOCUMENT_FOLDING_RANGE)
     def request_folding(self):
         """Request folding."""
-        if not self.folding_supported or not self.code_folding:
+        if (not self.folding_supported or not self.code_folding
+                or self.large_file):
             return
         params = {'file': self.filename}
         return params
@@ -1773,7 +1866,7 @@ def handle_folding_range(self, response):
             folding_panel.update_folding(extended_ranges)
 
             # Update indent guides, which depend on folding
-            if self.indent_guides._enabled and len(self.patch) > 0:
+            if self.indent_guides._enabled and len(self.text_changes) > 0:
                 line, column = self.get_cursor_line_column()
                 self.update_whitespace_count(line, column)
         except RuntimeError:
@@ -1792,6 +1885,8 @@ def handle_folding_range(self, response):
              requires_response=False)
     def notify_save(self):
         """Send save request."""
+        if self.large_file:
+            return
         params = {'file': self.filename}
         if self.save_include_text:
             params['text'] = self.toPlainText()
@@ -1801,7 +1896,7 @@ def notify_save(self):
              requires_response=False)
     def notify_close(self):
         """Send close request."""
-        if self.completions_available:
+        if self.completions_available and not self.large_file:
             params = {
                 'file': self.filename,
                 'codeeditor': self
@@ -1867,12 +1962,14 @@ def toggle_format_on_save(self, state):
         self.format_on_save = state
 
     def toggle_code_folding(self, state):
+        state = state and not self.large_file
         self.code_folding = state
         self.set_folding_panel(state)
         if not state and self.indent_guides._enabled:
             self.code_folding = True
 
     def toggle_identation_guides(self, state):
+        state = state and not self.large_file
         if state and not self.code_folding:
             self.code_folding = True
         self.indent_guides.set_enabled(state)
@@ -1923,6 +2020,7 @@ def set_auto_unindent_enabled(self, enable):
 
     def set_occurrence_highlighting(self, enable):
         """Enable/disable occurrence highlighting"""
+        enable = enable and not self.large_file
         self.occurrence_highlighting = enable
         if not enable:
             self.__clear_occurrences()
@@ -1993,6 +2091,9 @@ def set_language(self, language, filename=None):
         self.completion_widget.set_language(self.language)
 
     def _set_highlighter(self, sh_class):
+        if self.large_file and issubclass(sh_class, sh.PygmentsSH):
+            # Pygments lexers need the whole text to highlight a single line
+            sh_class = sh.TextSH
         self.highlighter_class = sh_class
         if self.highlighter is not None:
             # Removing old highlighter
@@ -2003,7 +2104,11 @@ def _set_highlighter(self, sh_class):
                                                   self.font(),
                                                   self.color_scheme)
         self.highlighter._cell_list = []
+        self.highlighter._sorted_cell_list = None
         self.highlighter.sig_new_cell.connect(self.add_to_cell_list)
+        if self.large_file:
+            # Only visible lines are highlighted, see highlight_viewport
+            self.highlighter.set_highlighted_range((0, -1))
         self._apply_highlighter_color_scheme()
 
         self.highlighter.editor = self
@@ -2013,11 +2118,25 @@ def add_to_cell_list(self, oedata):
         if self.highlighter is None:
             return
         self.highlighter._cell_list.append(oedata)
+        self.highlighter._sorted_cell_list = None
+
+    def invalidate_cell_list(self):
+        """Compute the sorted cell list again the next time it's needed."""
+        if self.highlighter is not None:
+            self.highlighter._sorted_cell_list = None
 
     def get_cell_list(self):
-        """Get all cells."""
+        """
+        Get all cells.
+
+        The list is sorted by block number and kept until the document
+        changes, so it must not be modified.
+        """
         if self.highlighter is None:
             return []
+        if self.highlighter._sorted_cell_list is not None:
+            return self.highlighter._sorted_cell_list
+
         # Filter out old cells
         def good(oedata):
             return oedata.is_valid() and oedata.def_type == oedata.CELL
@@ -2025,9 +2144,10 @@ def good(oedata):
         self.highlighter._cell_list = [
             oedata for oedata in self.highlighter._cell_list if good(oedata)]
 
-        return sorted(
+        self.highlighter._sorted_cell_list = sorted(
             {oedata.get_block_number(): oedata
              for oedata in self.highlighter._cell_list}.items())
+        return self.highlighter._sorted_cell_list
 
     def is_json(self):
         return (isinstance(self.highlighter, sh.PygmentsSH) and
@@ -2367,6 +2487,7 @@ def clear_found_results(self):
     def __text_has_changed(self):
         """Text has changed, eventually clear found results highlighting"""
         self.last_change_position = self.textCursor().position()
+        self.invalidate_cell_list()
         if self.found_results:
             self.clear_found_results()
 
@@ -2516,6 +2637,7 @@ def resizeEvent(self, event):
         """Reimplemented Qt method to handle p resizing"""
         TextEditBaseWidget.resizeEvent(self, event)
         self.panels.resize()
+        self._start_viewport_highlight_timer()
 
     def showEvent(self, event):
         """Overrides showEvent to update the viewport margins."""
@@ -2585,6 +2707,12 @@ def set_color_scheme(self, color_scheme):
 
     def set_text(self, text):
         """Set the text of the editor"""
+        if self.is_large_text(text):
+            self.set_large_file_mode()
+        if self.large_file:
+            self.set_text_progressively(text)
+            return
+
         self.setPlainText(text)
         self.set_eol_chars(text)
         self.document_did_change(text)
@@ -2593,6 +2721,152 @@ def set_text(self, text):
                 and not running_under_pytest()):
             self.highlighter.make_charlist()
 
+    # --- Large file mode
+    def set_large_file_mchars(self, threshold):
+        """
+        Set the number of characters (in millions) above which files are
+        opened in large file mode. Zero disables the large file mode.
+        """
+        self.large_file_mchars = threshold
+
+    def is_large_text(self, text):
+        """Return True if `text` must be shown in large file mode."""
+        if self.is_cloned or not self.large_file_mchars:
+            return False
+        return len(text) > self.large_file_mchars * 10 ** 6
+
+    def set_large_file_mode(self):
+        """
+        Switch to large file mode.
+
+        In this mode only the visible lines are highlighted and the features
+        that need to process the whole text (completions, folding, outline,
+        indent guides, occurrences and the scroll flag area) are disabled.
+        """
+        if self.large_file:
+            return
+        logger.debug("Using large file mode for {}".format(self.filename))
+        self.large_file = True
+
+        # Clones share the highlighter and document sync of their editor,
+        # which already are in large file mode
+        if not self.is_cloned:
+            if self.highlighter is not None:
+                self._set_highlighter(self.highlighter_class)
+            self.document_sync.set_enabled(False)
+
+        self.indent_guides.set_enabled(False)
+        self.toggle_code_folding(False)
+        self.scrollflagarea.set_enabled(False)
+        self.set_occurrence_highlighting(False)
+        self.toggle_wrap_mode(False)
+        self.leading_whitespaces = {}
+
+    def set_text_progressively(self, text):
+        """
+        Set the text of the editor in chunks.
+
+        The first chunk is shown right away and the rest are appended in
+        the event loop, so the editor stays responsive while huge files are
+        loaded. The editor is read only until loading ends.
+        """
+        if self._large_file_text is None:
+            self._large_file_read_only = self.isReadOnly()
+        self.document().setUndoRedoEnabled(False)
+        self.setReadOnly(True)
+        self._large_file_text = text
+        self._large_file_offset = 0
+        self.set_eol_chars(text)
+
+        self.setPlainText(self._next_large_file_chunk())
+        self.highlight_viewport()
+        self._load_large_file_chunk()
+
+    def is_loading_text(self):
+        """Return True if the text of a large file is still being
+        loaded."""
+        return self._large_file_text is not None
+
+    def finish_loading_text(self):
+        """Load the remaining text of a large file at once."""
+        while self.is_loading_text():
+            self._load_large_file_chunk(schedule=False)
+
+    def highlight_viewport(self):
+        """Highlight the lines around the visible ones in large files."""
+        if not self.large_file or self.highlighter is None:
+            return
+        first, last = self.get_buffer_block_numbers()
+        self.highlighter.set_highlighted_range((first, last))
+
+        # Formats mark the document as modified while loading, because its
+        # undo stack is disabled
+        document = self.document()
+        loading = self.is_loading_text()
+        if loading:
+            document.blockSignals(True)
+        try:
+            block = document.findBlockByNumber(first)
+            while block.isValid() and block.blockNumber() <= last:
+                self.highlighter.rehighlightBlock(block)
+                block = block.next()
+        finally:
+            if loading:
+                document.setModified(False)
+                document.blockSignals(False)
+
+    def _start_viewport_highlight_timer(self, rect=None, dy=None):
+        """Highlight the visible lines after scrolling or resizing."""
+        if self.large_file and dy != 0:
+            self.viewport_highlight_timer.start()
+
+    def _next_large_file_chunk(self):
+        """Return the next chunk of text to load, ending at a line."""
+        text = self._large_file_text
+        start = self._large_file_offset
+        end = start + LARGE_FILE_CHUNK_SIZE
+        if end < len(text):
+            newline = text.find('\n', end)
+            end = len(text) if newline == -1 else newline + 1
+        else:
+            end = len(text)
+        self._large_file_offset = end
+        return text[start:end]
+
+    def _load_large_file_chunk(self, schedule=True):
+        """Append the next chunk of text of a large file."""
+        if self._large_file_text is None:
+            return
+
+        if self._large_file_offset < len(self._large_file_text):
+            # Block signals to not update breakpoints, bookmarks and panels,
+            # which go through the whole document, for every chunk, and to
+            # not mark the file as modified while it's loaded
+            document = self.document()
+            cursor = QTextCursor(document)
+            cursor.movePosition(QTextCursor.End)
+            self.blockSignals(True)
+            document.blockSignals(True)
+            try:
+                cursor.insertText(self._next_large_file_chunk())
+                document.setModified(False)
+            finally:
+                document.blockSignals(False)
+                self.blockSignals(False)
+
+        if self._large_file_offset < len(self._large_file_text):
+            if schedule:
+                self.large_file_timer.start()
+            return
+
+        self.large_file_timer.stop()
+        self._large_file_text = None
+        self.document().setUndoRedoEnabled(True)
+        self.document().setModified(False)
+        self.setReadOnly(self._large_file_read_only)
+        self.blockCountChanged.emit(self.blockCount())
+        self.sig_large_file_loaded.emit()
+
     def set_text_from_file(self, filename, language=None):
         """Set the text of the editor from file *fname*"""
         self.filename = filename
@@ -2775,6 +3049,7 @@ def _process_code_analysis(self, underline):
             else:
                 data.code_analysis.append((source, code, severity, message))
                 block.setUserData(data)
+                self.flag_index.add(block)
 
     def set_errors(self):
         """Set errors and warnings in the line number area."""
@@ -3005,9 +3280,8 @@ def go_to_previous_warning(self):
 
     def cell_list(self):
         """Get the outline explorer data for all cells."""
-        for oedata in self.outlineexplorer_data_list():
-            if oedata.def_type == OED.CELL:
-                yield oedata
+        for __, oedata in self.get_cell_list():
+            yield oedata
 
     def get_cell_code(self, cell):
         """
@@ -3016,18 +3290,21 @@ def get_cell_code(self, cell):
         If the cell doesn't exist, raises an exception
         """
         selected_block = None
+        cell_list = self.get_cell_list()
         if is_string(cell):
-            for oedata in self.cell_list():
-                if oedata.def_name == cell:
+            for __, oedata in cell_list:
+                # Unique names are the cell name, possibly followed by a
+                # number, so only compute them for cells that can match
+                if not cell.startswith(oedata.get_base_name()):
+                    continue
+                if oedata.get_cell_name(cell_list) == cell:
                     selected_block = oedata.block
                     break
         else:
             if cell == 0:
                 selected_block = self.document().firstBlock()
-            else:
-                cell_list = list(self.cell_list())
-                if cell <= len(cell_list):
-                    selected_block = cell_list[cell - 1].block
+            elif cell <= len(cell_list):
+                selected_block = cell_list[cell - 1][1].block
 
         if not selected_block:
             raise RuntimeError("Cell {} not found.".format(repr(cell)))
@@ -3038,7 +3315,7 @@ def get_cell_code(self, cell):
 
     def get_cell_count(self):
         """Get number of cells in document."""
-        return 1 + len(list(self.cell_list()))
+        return 1 + len(self.get_cell_list())
 
 
     #------Tasks management
@@ -3077,6 +3354,7 @@ def process_todo(self, todo_results):
                 data = BlockUserData(self)
             data.todo = message
             block.setUserData(data)
+            self.flag_index.add(block)
         self.sig_flags_changed.emit()
 
 
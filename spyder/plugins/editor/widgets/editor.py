@@ -24,7 +24,7 @@
 import qdarkstyle
 from qtpy.compat import getsavefilename
 from qtpy.QtCore import (QByteArray, QFileInfo, QObject, QPoint, QSize, Qt,
-                         QThread, QTimer, Signal, Slot, QCoreApplication)
+                         QTimer, Signal, Slot, QCoreApplication)
 from qtpy.QtGui import QFont
 from qtpy.QtWidgets import (QAction, QApplication, QFileDialog, QHBoxLayout,
                             QLabel, QMainWindow, QMessageBox, QMenu,
@@ -50,12 +50,14 @@
 from spyder.widgets.findreplace import FindReplace
 from spyder.plugins.editor.utils.autosave import AutosaveForStack
 from spyder.plugins.editor.utils.switcher import EditorSwitcherManager
+from spyder.plugins.editor.utils.workers import WorkerPool
 from spyder.plugins.editor.widgets import codeeditor
 from spyder.plugins.editor.widgets.base import TextEditBaseWidget  # analysis:ignore
 from spyder.plugins.editor.widgets.codeeditor import Printer       # analysis:ignore
 from spyder.plugins.editor.widgets.codeeditor import get_file_language
 from spyder.plugins.editor.widgets.status import (CursorPositionStatus,
                                                   EncodingStatus, EOLStatus,
+                                                  LargeFileStatus,
                                                   ReadWriteStatus, VCSStatus)
 from spyder.plugins.editor.utils.findtasks import find_tasks
 from spyder.widgets.tabs import BaseTabs
@@ -68,101 +70,6 @@
 logger = logging.getLogger(__name__)
 
 
-class AnalysisThread(QThread):
-    """Analysis thread"""
-
-    def __init__(self, parent, checker, source_code):
-
-        super(AnalysisThread, self).__init__(parent)
-        self.checker = checker
-        self.results = None
-        self.source_code = source_code
-
-    def run(self):
-        """Run analysis"""
-        try:
-            self.results = self.checker(self.source_code)
-        except Exception as e:
-            logger.error(e, exc_info=True)
-
-
-class ThreadManager(QObject):
-    """Analysis thread manager"""
-    def __init__(self, parent, max_simultaneous_threads=2):
-        super(ThreadManager, self).__init__(parent)
-        self.max_simultaneous_threads = max_simultaneous_threads
-        self.started_threads = {}
-        self.pending_threads = []
-        self.end_callbacks = {}
-
-    def close_threads(self, parent):
-        """Close threads associated to parent_id"""
-        logger.debug("Call ThreadManager's 'close_threads'")
-        if parent is None:
-            # Closing all threads
-            self.pending_threads = []
-            threadlist = []
-            for threads in list(self.started_threads.values()):
-                threadlist += threads
-        else:
-            parent_id = id(parent)
-            self.pending_threads = [(_th, _id) for (_th, _id)
-                                    in self.pending_threads
-                                    if _id != parent_id]
-            threadlist = self.started_threads.get(parent_id, [])
-        for thread in threadlist:
-            logger.debug("Waiting for thread %r to finish" % thread)
-            while thread.isRunning():
-                # We can't terminate thread safely, so we simply wait...
-                QApplication.processEvents()
-
-    def close_all_threads(self):
-        """Close all threads"""
-        logger.debug("Call ThreadManager's 'close_all_threads'")
-        self.close_threads(None)
-
-    def add_thread(self, checker, end_callback, source_code, parent):
-        """Add thread to queue"""
-        parent_id = id(parent)
-        thread = AnalysisThread(self, checker, source_code)
-        self.end_callbacks[id(thread)] = end_callback
-        self.pending_threads.append((thread, parent_id))
-        logger.debug("Added thread %r to queue" % thread)
-        QTimer.singleShot(50, self.update_queue)
-
-    def update_queue(self):
-        """Update queue"""
-        started = 0
-        for parent_id, threadlist in list(self.started_threads.items()):
-            still_running = []
-            for thread in threadlist:
-                if thread.isFinished():
-                    end_callback = self.end_callbacks.pop(id(thread))
-                    if thread.results is not None:
-                        #  The thread was executed successfully
-                        end_callback(thread.results)
-                    thread.setParent(None)
-                    thread = None
-                else:
-                    still_running.append(thread)
-                    started += 1
-            threadlist = None
-            if still_running:
-                self.started_threads[parent_id] = still_running
-            else:
-                self.started_threads.pop(parent_id)
-        logger.debug("Updating queue:")
-        logger.debug("    started: %d" % started)
-        logger.debug("    pending: %d" % len(self.pending_threads))
-        if self.pending_threads and started < self.max_simultaneous_threads:
-            thread, parent_id = self.pending_threads.pop(0)
-            thread.finished.connect(self.update_queue)
-            threadlist = self.started_threads.get(parent_id, [])
-            self.started_threads[parent_id] = threadlist+[thread]
-            logger.debug("===>starting: %r" % thread)
-            thread.start()
-
-
 class FileInfo(QObject):
     """File properties"""
     todo_results_changed = Signal()
@@ -174,9 +81,9 @@ class FileInfo(QObject):
     sig_show_object_info = Signal(int)
     sig_show_completion_object_info = Signal(str, str)
 
-    def __init__(self, filename, encoding, editor, new, threadmanager):
+    def __init__(self, filename, encoding, editor, new, workerpool):
         QObject.__init__(self)
-        self.threadmanager = threadmanager
+        self.workerpool = workerpool
         self._filename = filename
         self.newly_created = new
         self.default = False      # Default untitled file
@@ -217,9 +124,9 @@ def get_source_code(self):
     def run_todo_finder(self):
         """Run TODO finder"""
         if self.editor.is_python():
-            self.threadmanager.add_thread(find_tasks,
-                                          self.todo_finished,
-                                          self.get_source_code(), self)
+            self.workerpool.submit(self, 'todo', find_tasks,
+                                   (self.get_source_code(),),
+                                   self.todo_finished)
 
     def todo_finished(self, results):
         """Code analysis thread has finished"""
@@ -413,6 +320,7 @@ class EditorStack(QWidget):
     reset_statusbar = Signal()
     readonly_changed = Signal(bool)
     encoding_changed = Signal(str)
+    large_file_changed = Signal(bool)
     sig_editor_cursor_position_changed = Signal(int, int)
     sig_refresh_eol_chars = Signal(str)
     sig_refresh_formatting = Signal(bool)
@@ -489,7 +397,7 @@ def __init__(self, parent, actions):
 
         self.setAttribute(Qt.WA_DeleteOnClose)
 
-        self.threadmanager = ThreadManager(self)
+        self.workerpool = WorkerPool(self)
         self.new_window = False
         self.horsplit_action = None
         self.versplit_action = None
@@ -598,6 +506,7 @@ def __init__(self, parent, actions):
         self.highlight_current_cell_enabled = False
         self.occurrence_highlighting_enabled = True
         self.occurrence_highlighting_timeout = 1500
+        self.large_file_mchars = codeeditor.LARGE_FILE_MCHARS
         self.checkeolchars_enabled = True
         self.always_remove_trailing_spaces = False
         self.add_newline = False
@@ -985,7 +894,7 @@ def close_split(self):
 
     def closeEvent(self, event):
         """Overrides QWidget closeEvent()."""
-        self.threadmanager.close_all_threads()
+        self.workerpool.cancel()
         self.analysis_timer.timeout.disconnect(self.analyze_script)
 
         # Remove editor references from the outline explorer settings
@@ -1377,6 +1286,13 @@ def set_occurrence_highlighting_timeout(self, timeout):
             for finfo in self.data:
                 finfo.editor.set_occurrence_timeout(timeout)
 
+    def set_large_file_mchars(self, threshold):
+        # CONF.get(self.CONF_SECTION, 'large_file_mchars')
+        self.large_file_mchars = threshold
+        if self.data:
+            for finfo in self.data:
+                finfo.editor.set_large_file_mchars(threshold)
+
     def set_underline_errors_enabled(self, state):
         self.underline_errors_enabled = state
         if self.data:
@@ -1813,7 +1729,7 @@ def close_file(self, index=None, force=False):
                  and can_close_file)
         if is_ok:
             finfo = self.data[index]
-            self.threadmanager.close_threads(finfo)
+            self.workerpool.cancel(finfo)
             # Removing editor reference from outline explorer settings:
             if self.outlineexplorer is not None:
                 self.outlineexplorer.remove_editor(finfo.editor.oe_proxy)
@@ -2065,6 +1981,8 @@ def save(self, index=None, force=False, save_new_files=True):
         if not (finfo.editor.document().isModified() or
                 finfo.newly_created) and not force:
             return True
+        # Never write a partially loaded large file
+        finfo.editor.finish_loading_text()
         if not osp.isfile(finfo.filename) and not force:
             # File has not been saved yet
             if save_new_files:
@@ -2317,7 +2235,7 @@ def analyze_script(self, index=None):
             index = self.get_stack_index()
         if self.data and len(self.data) > index:
             finfo = self.data[index]
-            if self.todolist_enabled:
+            if self.todolist_enabled and not finfo.editor.large_file:
                 finfo.run_todo_finder()
         self.is_analysis_done = True
 
@@ -2445,6 +2363,7 @@ def __refresh_statusbar(self, index):
         if self.data and len(self.data) > index:
             finfo = self.data[index]
             self.encoding_changed.emit(finfo.encoding)
+            self.large_file_changed.emit(finfo.editor.large_file)
             # Refresh cursor position status:
             line, index = finfo.editor.get_cursor_line_column()
             self.sig_editor_cursor_position_changed.emit(line, index)
@@ -2651,7 +2570,7 @@ def create_new_editor(self, fname, enc, txt, set_current, new=False,
             lambda fname, line, column: self.sig_go_to_definition.emit(
                 fname, line, column))
 
-        finfo = FileInfo(fname, enc, editor, new, self.threadmanager)
+        finfo = FileInfo(fname, enc, editor, new, self.workerpool)
 
         self.add_to_data(finfo, set_current, add_where)
         finfo.sig_send_to_help.connect(self.send_to_help)
@@ -2713,7 +2632,8 @@ def create_new_editor(self, fname, enc, txt, set_current, new=False,
             remove_trailing_spaces=self.always_remove_trailing_spaces,
             remove_trailing_newlines=self.remove_trailing_newlines,
             add_newline=self.add_newline,
-            format_on_save=self.format_on_save
+            format_on_save=self.format_on_save,
+            large_file_mchars=self.large_file_mchars
         )
         if cloned_from is None:
             editor.set_text(txt)
@@ -2932,10 +2852,12 @@ def run_selection(self):
 
     def run_cell(self, debug=False):
         """Run current cell."""
-        text, block = self.get_current_editor().get_cell_as_executable_code()
-        finfo = self.get_current_finfo()
         editor = self.get_current_editor()
-        name = cell_name(block)
+        # Cells can end in the text of large files still being loaded
+        editor.finish_loading_text()
+        text, block = editor.get_cell_as_executable_code()
+        finfo = self.get_current_finfo()
+        name = cell_name(block, editor.get_cell_list())
         filename = finfo.filename
 
         self._run_cell_text(text, editor, (filename, name), debug)
@@ -2978,6 +2900,7 @@ def re_run_last_cell(self):
         if index is None:
             return
         editor = self.data[index].editor
+        editor.finish_loading_text()
 
         try:
             text = editor.get_cell_code(cell_name)
@@ -3324,6 +3247,7 @@ def __init__(self, parent, plugin, menu_actions, outline_explorer_options):
         self.encoding_status = EncodingStatus(self, statusbar)
         self.eol_status = EOLStatus(self, statusbar)
         self.readwrite_status = ReadWriteStatus(self, statusbar)
+        self.largefile_status = LargeFileStatus(self, statusbar)
 
         self.editorstacks = []
 
@@ -3375,10 +3299,13 @@ def register_editorstack(self, editorstack):
         editorstack.reset_statusbar.connect(self.readwrite_status.hide)
         editorstack.reset_statusbar.connect(self.encoding_status.hide)
         editorstack.reset_statusbar.connect(self.cursorpos_status.hide)
+        editorstack.reset_statusbar.connect(self.largefile_status.hide)
         editorstack.readonly_changed.connect(
                                         self.readwrite_status.update_readonly)
         editorstack.encoding_changed.connect(
                                          self.encoding_status.update_encoding)
+        editorstack.large_file_changed.connect(
+            self.largefile_status.update_large_file)
         editorstack.sig_editor_cursor_position_changed.connect(
                      self.cursorpos_status.update_cursor_position)
         editorstack.sig_refresh_eol_chars.connect(self.eol_status.update_eol)
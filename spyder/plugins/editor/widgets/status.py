@@ -71,6 +71,25 @@ def get_tooltip(self):
         return _("Cursor position")
 
 
+class LargeFileStatus(StatusBarWidget):
+    """Status bar widget shown when the current file is in large file
+    mode."""
+
+    def __init__(self, parent, statusbar):
+        super(LargeFileStatus, self).__init__(parent, statusbar)
+        self.hide()
+
+    def update_large_file(self, large_file):
+        """Show or hide the large file mode indicator."""
+        self.set_value(_("Large file") if large_file else '')
+        self.setVisible(large_file)
+
+    def get_tooltip(self):
+        """Return localized tool tip for widget."""
+        return _("Only the visible lines are highlighted, and completions, "
+                 "folding and the outline are disabled for this file")
+
+
 class VCSStatus(StatusBarWidget):
     """Status bar widget for system vcs."""
 
@@ -142,7 +161,7 @@ def test():
     statusbar = win.statusBar()
     status_widgets = []
     for status_class in (ReadWriteStatus, EOLStatus, EncodingStatus,
-                         CursorPositionStatus):
+                         CursorPositionStatus, LargeFileStatus):
         status_widget = status_class(win, statusbar)
         status_widgets.append(status_widget)
     win.show()
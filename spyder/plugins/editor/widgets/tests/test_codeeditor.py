@@ -264,5 +264,53 @@ def test_undo_return(editorbot):
     assert editor.toPlainText() == text
 
 
+def test_cell_code_and_count(editorbot):
+    """Test getting cells by name and index, and updating them on changes."""
+    qtbot, widget = editorbot
+    text = ('# %% First\n'
+            'a = 1\n'
+            '# %% First\n'
+            'b = 2\n'
+            '# %%\n'
+            'c = 3\n')
+    widget.set_text(text)
+    assert widget.get_cell_count() == 4
+    assert [oedata.def_name for oedata in widget.cell_list()] == [
+        'First, #1', 'First, #2', 'Unnamed Cell']
+
+    assert 'a = 1' in widget.get_cell_code('First, #1')
+    assert 'b = 2' in widget.get_cell_code('First, #2')
+    assert 'c = 3' in widget.get_cell_code('Unnamed Cell')
+    assert 'b = 2' in widget.get_cell_code(2)
+    with pytest.raises(RuntimeError):
+        widget.get_cell_code('Second')
+
+    # Add a cell at the beginning
+    cursor = widget.textCursor()
+    cursor.movePosition(QTextCursor.Start)
+    cursor.insertText('# %% Second\nd = 4\n')
+    assert widget.get_cell_count() == 5
+    assert 'd = 4' in widget.get_cell_code('Second')
+    assert 'c = 3' in widget.get_cell_code(4)
+
+
+def test_cell_list_highlighter_changes(editorbot):
+    """Test that cells removed by the highlighter are not listed anymore."""
+    qtbot, widget = editorbot
+    widget.set_text('# %% First\na = 1\n# %% Second\nb = 2\n')
+    assert widget.get_cell_count() == 3
+
+    # Change the text without the editor noticing, as when blocks are
+    # highlighted later in the large file mode
+    widget.blockSignals(True)
+    cursor = widget.textCursor()
+    cursor.movePosition(QTextCursor.Start)
+    cursor.movePosition(QTextCursor.Down, n=2)
+    cursor.movePosition(QTextCursor.EndOfBlock, QTextCursor.KeepAnchor)
+    cursor.insertText('c = 3')
+    widget.blockSignals(False)
+    assert widget.get_cell_count() == 2
+
+
 if __name__ == '__main__':
     pytest.main(['test_codeeditor.py'])
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+#
+
+"""Tests for the large file mode of the editor."""
+
+# Third party imports
+import pytest
+from qtpy.QtGui import QFont
+
+# Local imports
+from spyder.plugins.editor.widgets import codeeditor
+from spyder.plugins.editor.widgets.tests.conftest import codeeditor_factory
+
+
+# --- Fixtures
+# -----------------------------------------------------------------------------
+@pytest.fixture
+def large_file_editor(qtbot, monkeypatch):
+    """Editor in large file mode for texts of more than 10000 characters."""
+    monkeypatch.setattr(codeeditor, 'LARGE_FILE_CHUNK_SIZE', 1000)
+    editor = codeeditor_factory()
+    editor.set_large_file_mchars(0.01)
+    qtbot.addWidget(editor)
+    editor.show()
+    return editor
+
+
+def get_text(lines):
+    return ''.join('x = {}  # Comment\n'.format(i) for i in range(lines))
+
+
+# --- Tests
+# -----------------------------------------------------------------------------
+def test_large_file_mode(large_file_editor, qtbot):
+    """Test that large files are loaded progressively."""
+    editor = large_file_editor
+    text = get_text(2000)
+
+    with qtbot.waitSignal(editor.sig_large_file_loaded):
+        editor.set_text(text)
+        assert editor.is_loading_text()
+        assert editor.isReadOnly()
+        assert not editor.document().isModified()
+        assert len(editor.toPlainText()) < len(text)
+
+    assert editor.large_file
+    assert not editor.is_loading_text()
+    assert editor.toPlainText() == text
+    assert not editor.isReadOnly()
+    assert not editor.document().isModified()
+    assert not editor.document().isUndoAvailable()
+    assert not editor.code_folding
+    assert not editor.scrollflagarea.enabled
+
+
+def test_large_file_unmodified_while_loading(large_file_editor, qtbot):
+    """Test that files aren't marked as modified while they are loaded."""
+    editor = large_file_editor
+    modified = []
+    editor.document().modificationChanged.connect(modified.append)
+
+    editor.set_text(get_text(2000))
+    while editor.is_loading_text():
+        editor.go_to_line(editor.blockCount())
+        editor.highlight_viewport()
+        assert not editor.document().isModified()
+        editor._load_large_file_chunk(schedule=False)
+
+    assert not editor.document().isModified()
+    assert not modified or not modified[-1]
+
+
+def test_large_file_viewport_highlighting(large_file_editor, qtbot):
+    """Test that only the lines around the visible ones are highlighted."""
+    editor = large_file_editor
+    editor.set_text(get_text(2000))
+    editor.finish_loading_text()
+    document = editor.document()
+
+    __, last = editor.get_buffer_block_numbers()
+    assert document.firstBlock().layout().formats()
+    assert not document.findBlockByNumber(last + 1).layout().formats()
+
+    editor.go_to_line(1500)
+    block = document.findBlockByNumber(1499)
+    qtbot.waitUntil(lambda: len(block.layout().formats()) > 0)
+
+
+def test_large_file_clone(large_file_editor, qtbot):
+    """Test that clones of a large file editor use the large file mode."""
+    editor = large_file_editor
+    editor.set_text(get_text(2000))
+    editor.finish_loading_text()
+
+    clone = codeeditor.CodeEditor(parent=None)
+    clone.setup_editor(language='Python', color_scheme='spyder/dark',
+                       font=QFont("Monospace", 10), folding=True,
+                       scrollflagarea=True, wrap=True,
+                       occurrence_highlighting=True, cloned_from=editor)
+    qtbot.addWidget(clone)
+    clone.show()
+
+    assert clone.large_file
+    assert clone.highlighter is editor.highlighter
+    assert not clone.code_folding
+    assert not clone.scrollflagarea.enabled
+    assert not clone.occurrence_highlighting
+    assert clone.wordWrapMode() == editor.wordWrapMode()
+
+    clone.go_to_line(1500)
+    block = clone.document().findBlockByNumber(1499)
+    qtbot.waitUntil(lambda: len(block.layout().formats()) > 0)
+
+
+def test_small_file_mode(large_file_editor):
+    """Test that files below the threshold are loaded as usual."""
+    editor = large_file_editor
+    text = get_text(10)
+    editor.set_text(text)
+    assert not editor.large_file
+    assert not editor.is_loading_text()
+    assert editor.toPlainText() == text
+
+    # Zero disables the large file mode
+    editor.set_large_file_mchars(0)
+    assert not editor.is_large_text(get_text(2000))
+
+
+if __name__ == "__main__":
+    pytest.main()
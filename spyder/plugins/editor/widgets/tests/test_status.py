@@ -17,6 +17,7 @@
 # Local imports
 from spyder.plugins.editor.widgets.status import (CursorPositionStatus,
                                                   EncodingStatus, EOLStatus,
+                                                  LargeFileStatus,
                                                   ReadWriteStatus, VCSStatus)
 
 
@@ -36,11 +37,11 @@ def test_status_bar(status_bar, qtbot):
     win, statusbar = status_bar
     swidgets = []
     for klass in (ReadWriteStatus, EOLStatus, EncodingStatus,
-                  CursorPositionStatus, VCSStatus):
+                  CursorPositionStatus, VCSStatus, LargeFileStatus):
         swidget = klass(win, statusbar)
         swidgets.append(swidget)
     assert win
-    assert len(swidgets) == 5
+    assert len(swidgets) == 6
 
 
 if __name__ == "__main__":
@@ -45,6 +45,7 @@
                                     create_plugin_layout, create_toolbutton,
                                     file_uri, MENU_SEPARATOR,
                                     QInputDialogMultiline)
+from spyder.utils.traversal import FileWalker
 
 try:
     from nbconvert import PythonExporter as nbexporter
@@ -1420,12 +1421,20 @@ def __init__(self, parent):
         super(ProxyModel, self).__init__(parent)
         self.root_path = None
         self.path_list = []
+        self.walker = None
         self.setDynamicSortFilter(True)
 
     def setup_filter(self, root_path, path_list):
         """Setup proxy model filter parameters"""
         self.root_path = osp.normpath(to_text_string(root_path))
         self.path_list = [osp.normpath(to_text_string(p)) for p in path_list]
+        if self.walker is not None:
+            self.walker.clear_cache()
+        self.invalidateFilter()
+
+    def set_hide_ignored(self, hide_ignored):
+        """Hide or show the files ignored by version control"""
+        self.walker = FileWalker() if hide_ignored else None
         self.invalidateFilter()
 
     def sort(self, column, order=Qt.AscendingOrder):
@@ -1437,14 +1446,22 @@ def filterAcceptsRow(self, row, parent_index):
         if self.root_path is None:
             return True
         index = self.sourceModel().index(row, 0, parent_index)
-        path = osp.normcase(osp.normpath(
-            to_text_string(self.sourceModel().filePath(index))))
+        filepath = osp.normpath(
+            to_text_string(self.sourceModel().filePath(index)))
+        path = osp.normcase(filepath)
         if osp.normcase(self.root_path).startswith(path):
             # This is necessary because parent folders need to be scanned
             return True
         else:
             for p in [osp.normcase(p) for p in self.path_list]:
-                if path == p or path.startswith(p+os.sep):
+                if path == p:
+                    return True
+                elif path.startswith(p+os.sep):
+                    # Rows of ignored folders are rejected too, so their
+                    # contents are never shown (nor scanned by the view)
+                    if self.walker is not None:
+                        is_dir = self.sourceModel().isDir(index)
+                        return not self.walker.is_ignored(filepath, is_dir)
                     return True
             else:
                 return False
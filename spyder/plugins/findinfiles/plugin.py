@@ -68,6 +68,10 @@ def register(self):
         if projects:
             projects.sig_project_loaded.connect(self.set_project_path)
             projects.sig_project_closed.connect(self.unset_project_path)
+            projects.sig_file_created.connect(self.update_project_index)
+            projects.sig_file_deleted.connect(self.update_project_index)
+            projects.sig_file_modified.connect(self.update_project_index)
+            projects.sig_file_moved.connect(self.move_in_project_index)
 
         if working_directory:
             working_directory.sig_current_directory_changed.connect(
@@ -98,6 +102,7 @@ def register(self):
     def on_close(self, cancelable=False):
         self.get_widget()._update_options()
         self.get_widget()._stop_and_reset_thread(ignore_results=True)
+        self.get_widget()._close_project_index()
         return True
 
     # --- Public API
@@ -148,6 +153,34 @@ def unset_project_path(self):
         """
         self.get_widget().disable_project_search()
 
+    def update_project_index(self, path, is_dir):
+        """
+        Update the project index after a file or folder changed.
+
+        Parameters
+        ----------
+        path: str
+            Path of the file or folder.
+        is_dir: bool
+            Whether the path is a folder.
+        """
+        self.get_widget().update_project_index([path])
+
+    def move_in_project_index(self, src_path, dest_path, is_dir):
+        """
+        Update the project index after a file or folder was moved.
+
+        Parameters
+        ----------
+        src_path: str
+            Original path of the file or folder.
+        dest_path: str
+            New path of the file or folder.
+        is_dir: bool
+            Whether the path is a folder.
+        """
+        self.get_widget().update_project_index([src_path, dest_path])
+
     def find(self):
         """
         Search text in multiple files.
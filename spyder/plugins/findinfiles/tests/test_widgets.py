@@ -290,6 +290,39 @@ def test_exclude_regexp_error(findinfiles, qtbot):
     assert findinfiles.REGEX_ERROR in tooltip
 
 
+@pytest.mark.parametrize('findinfiles',
+                         [{'project_index': True}],
+                         indirect=True)
+def test_project_index_search(findinfiles, qtbot, tmpdir):
+    """Test that searches in a project use its trigram index."""
+    data = osp.join(LOCATION, "data")
+    for fname in os.listdir(data):
+        with open(osp.join(data, fname), 'rb') as f:
+            tmpdir.join(fname).write_binary(f.read())
+
+    findinfiles.set_project_path(str(tmpdir))
+    index = findinfiles.project_index
+    qtbot.waitUntil(lambda: index.ready)
+    assert tmpdir.join('.spyproject', 'findinfiles', 'trigrams.idx').check()
+
+    # Add a file the index doesn't know about yet
+    tmpdir.join('eggs.txt').write('spam\n')
+    findinfiles.update_project_index([str(tmpdir.join('eggs.txt'))])
+
+    findinfiles.path_selection_combo.setCurrentIndex(PROJECT)
+    findinfiles.set_search_text("spam")
+    with qtbot.waitSignal(findinfiles.sig_finished):
+        findinfiles.find()
+
+    matches = process_search_results(findinfiles.result_browser.data)
+    expected = expected_results()
+    expected['eggs.txt'] = [(1, 0)]
+    assert matches == expected
+
+    findinfiles.disable_project_search()
+    assert findinfiles.project_index is None
+
+
 # ---- Tests for SearchInComboBox
 
 def test_add_external_paths(searchin_combobox, mocker):
@@ -11,7 +11,6 @@
 # Standard library imports
 import fnmatch
 import math
-import os
 import os.path as osp
 import re
 import traceback
@@ -31,8 +30,13 @@
 from spyder.api.widgets import PluginMainWidget
 from spyder.config.gui import get_font, is_dark_interface
 from spyder.config.main import EXCLUDE_PATTERNS  # This could be more general?
-from spyder.utils.encoding import is_text_file, to_unicode_from_fs
+from spyder.utils.encoding import to_unicode_from_fs
 from spyder.utils.misc import regexp_error_msg
+from spyder.utils.textindex import TrigramIndex
+from spyder.utils.textsearch import (AUTO_POOL, PERMISSION_ERROR,
+                                     SearchEngine, search_in_file)
+from spyder.utils.traversal import FileWalker
+from spyder.utils.workers import WorkerManager
 from spyder.widgets.comboboxes import PatternComboBox
 # TODO: Use SpyderWidgetMixin on OneColumnTree
 from spyder.widgets.onecolumntree import OneColumnTree
@@ -70,6 +74,8 @@ class FindInFilesWidgetActions:
 
     # Toggles
     ToggleCase = 'toggle_case_action'
+    ToggleProjectIndex = 'toggle_project_index_action'
+    ToggleUseIgnoreFiles = 'toggle_use_ignore_files_action'
     ToggleExcludeCase = 'toggle_exclude_case_action'
     ToggleExcludeRegex = 'togle_use_regex_on_exlude_action'
     ToggleMoreOptions = 'toggle_more_options_action'
@@ -116,12 +122,18 @@ class SearchThread(QThread):
     power = 0       # 0**1 = 1
     max_power = 9   # 2**9 = 512
 
-    def __init__(self, parent, search_text, text_color=None):
+    def __init__(self, parent, search_text, text_color=None, workers=None,
+                 pool=AUTO_POOL, index=None, use_ignore_files=True):
         super().__init__(parent)
         self.mutex = QMutex()
         self.stopped = None
         self.search_text = search_text
         self.text_color = text_color
+        self.workers = workers
+        self.pool = pool
+        self.index = index
+        self.use_ignore_files = use_ignore_files
+        self.engine = None
         self.pathlist = None
         self.total_matches = None
         self.error_flag = None
@@ -150,6 +162,8 @@ def initialize(self, path, is_file, exclude,
         self.stopped = False
         self.completed = False
         self.case_sensitive = case_sensitive
+        self.engine = SearchEngine(texts, text_re, case_sensitive,
+                                   workers=self.workers, pool=self.pool)
 
     def run(self):
         try:
@@ -170,115 +184,77 @@ def run(self):
     def stop(self):
         with QMutexLocker(self.mutex):
             self.stopped = True
+        if self.engine is not None:
+            self.engine.stop()
+
+    def is_stopped(self):
+        with QMutexLocker(self.mutex):
+            return self.stopped
+
+    def iter_files_in_path(self, path):
+        """Yield the text files under `path` that are not excluded."""
+        walker = FileWalker(use_ignore_files=self.use_ignore_files,
+                            exclude=self.exclude, check_text=True)
+        return walker.walk(path, should_stop=self.is_stopped)
 
     def find_files_in_path(self, path):
         if self.pathlist is None:
             self.pathlist = []
         self.pathlist.append(path)
-        for path, dirs, files in os.walk(path):
-            with QMutexLocker(self.mutex):
-                if self.stopped:
+        self.error_flag = False
+        fnames = self.iter_files_in_path(path)
+        if self.index is not None:
+            # Skip files that the project index knows can't match
+            self.index.flush()
+            accept = self.index.get_filter(self.texts, self.text_re)
+            if accept is not None:
+                fnames = filter(accept, fnames)
+
+        try:
+            results = self.engine.search(fnames, check_text=False)
+            for fname, matches, error in results:
+                if self.is_stopped():
                     return False
-            try:
-                for d in dirs[:]:
-                    with QMutexLocker(self.mutex):
-                        if self.stopped:
-                            return False
-                    dirname = os.path.join(path, d)
-                    if (self.exclude and
-                            re.search(self.exclude, dirname + os.sep)):
-                        dirs.remove(d)
-                    elif d == '.git' or d == '.hg':
-                        dirs.remove(d)
-                for f in files:
-                    with QMutexLocker(self.mutex):
-                        if self.stopped:
-                            return False
-                    filename = os.path.join(path, f)
-                    if self.exclude and re.search(self.exclude, filename):
-                        continue
-                    if is_text_file(filename):
-                        self.find_string_in_file(filename)
-            except re.error:
-                self.error_flag = _("invalid regular expression")
-                return False
+                self.handle_file_results(fname, matches, error)
+        except re.error:
+            self.error_flag = _("invalid regular expression")
+            return False
+
+        if self.is_stopped():
+            return False
 
         # Process any pending results
         if self.partial_results:
             self.process_results()
 
+        self.completed = True
         return True
 
     def find_string_in_file(self, fname):
         self.error_flag = False
+        matches, error = search_in_file(fname, self.texts, self.text_re,
+                                        self.case_sensitive)
+        self.handle_file_results(fname, matches, error)
+
+        # Process any pending results
+        if self.partial_results and not self.is_stopped():
+            self.process_results()
+
+        self.completed = True
+
+    def handle_file_results(self, fname, matches, error):
+        """Add the matches found in `fname` to the pending results."""
         self.sig_current_file.emit(fname)
-        try:
-            for lineno, line in enumerate(open(fname, 'rb')):
-                for text, enc in self.texts:
-                    with QMutexLocker(self.mutex):
-                        if self.stopped:
-                            return False
-                    line_search = line
-                    if not self.case_sensitive:
-                        line_search = line_search.lower()
-                    if self.text_re:
-                        found = re.search(text, line_search)
-                        if found is not None:
-                            break
-                    else:
-                        found = line_search.find(text)
-                        if found > -1:
-                            break
-                try:
-                    line_dec = line.decode(enc)
-                except UnicodeDecodeError:
-                    line_dec = line
-
-                if not self.case_sensitive:
-                    line = line.lower()
-
-                if self.text_re:
-                    for match in re.finditer(text, line):
-                        with QMutexLocker(self.mutex):
-                            if self.stopped:
-                                return False
-                        self.total_matches += 1
-                        self.partial_results.append((osp.abspath(fname),
-                                                     lineno + 1,
-                                                     match.start(),
-                                                     match.end(),
-                                                     line_dec))
-                        if len(self.partial_results) > (2**self.power):
-                            self.process_results()
-                            if self.power < self.max_power:
-                                self.power += 1
-                else:
-                    found = line.find(text)
-                    while found > -1:
-                        with QMutexLocker(self.mutex):
-                            if self.stopped:
-                                return False
-                        self.total_matches += 1
-                        self.partial_results.append((osp.abspath(fname),
-                                                     lineno + 1,
-                                                     found,
-                                                     found + len(text),
-                                                     line_dec))
-                        if len(self.partial_results) > (2**self.power):
-                            self.process_results()
-                            if self.power < self.max_power:
-                                self.power += 1
-
-                        for text, enc in self.texts:
-                            found = line.find(text, found + 1)
-                            if found > -1:
-                                break
-
-        except IOError as xxx_todo_changeme:
-            (_errno, _strerror) = xxx_todo_changeme.args
+        if error == PERMISSION_ERROR:
             self.error_flag = _("permission denied errors were encountered")
 
-        self.completed = True
+        for match in matches:
+            self.total_matches += 1
+            self.partial_results.append(match)
+            if len(self.partial_results) > (2**self.power):
+                self.process_results()
+                if self.power < self.max_power:
+                    self.power += 1
 
     def process_results(self):
         """
@@ -808,13 +784,17 @@ class FindInFilesWidget(PluginMainWidget):
         'exclude_regexp': False,
         'path_history': [],
         'max_results': 1000,
+        'project_index': False,
         'hist_limit': MAX_PATH_HISTORY,
         'more_options': False,
         'search_in_index': None,
         'search_text': '',
         'search_text_regexp': False,
+        'search_pool': AUTO_POOL,
+        'search_workers': 0,
         'supported_encodings': ("utf-8", "iso-8859-1", "cp1252"),
         'text_color': MAIN_TEXT_COLOR,
+        'use_ignore_files': True,
     }
     ENABLE_SPINNER = True
     REGEX_INVALID = "background-color:rgb(255, 80, 80);"
@@ -855,8 +835,10 @@ def __init__(self, name=None, plugin=None, parent=None,
         self.text_color = self.get_option('text_color')
         self.supported_encodings = self.get_option('supported_encodings')
         self.search_thread = None
+        self.project_index = None
         self.running = False
         self.more_options_action = None
+        self._worker_manager = WorkerManager(max_threads=1)
         self.extras_toolbar = None
 
         search_text = self.get_option('search_text')
@@ -985,6 +967,21 @@ def setup(self, options=DEFAULT_OPTIONS):
             tip=_('Set maximum number of results'),
             triggered=lambda x=None: self.set_max_results(),
         )
+        self.project_index_action = self.create_action(
+            FindInFilesWidgetActions.ToggleProjectIndex,
+            text=_('Index project files'),
+            tip=_('Keep an index of the project files to speed up '
+                  'searches in large projects'),
+            toggled=lambda val: self.set_option('project_index', val),
+            initial=self.get_option('project_index'),
+        )
+        self.use_ignore_files_action = self.create_action(
+            FindInFilesWidgetActions.ToggleUseIgnoreFiles,
+            text=_('Skip files ignored by version control'),
+            tip=_('Skip the files listed in .gitignore and .hgignore files'),
+            toggled=lambda val: self.set_option('use_ignore_files', val),
+            initial=self.get_option('use_ignore_files'),
+        )
 
         # Toolbar
         toolbar = self.get_main_toolbar()
@@ -1019,10 +1016,12 @@ def setup(self, options=DEFAULT_OPTIONS):
             )
 
         menu = self.get_options_menu()
-        self.add_item_to_menu(
-            self.set_max_results_action,
-            menu=menu,
-        )
+        for item in [self.set_max_results_action, self.project_index_action,
+                     self.use_ignore_files_action]:
+            self.add_item_to_menu(
+                item,
+                menu=menu,
+            )
 
     def update_actions(self):
         stop_text = _('Stop')
@@ -1073,6 +1072,9 @@ def on_option_update(self, option, value):
         elif option == 'max_results':
             self.result_browser.set_max_results(value)
 
+        elif option == 'project_index':
+            self._setup_project_index(self.project_path)
+
     # --- Private API
     # ------------------------------------------------------------------------
     def _update_size(self, size, old_size):
@@ -1184,6 +1186,31 @@ def _handle_search_complete(self, completed):
         self.stop_spinner()
         self.update_actions()
 
+    def _setup_project_index(self, path):
+        """Load or build the index of the files in project `path`."""
+        self._close_project_index()
+        if path is None or not self.get_option('project_index'):
+            return
+
+        self.project_index = TrigramIndex(path)
+        worker = self._worker_manager.create_python_worker(
+            self._update_project_index, self.project_index)
+        worker.start()
+
+    def _update_project_index(self, index):
+        """Bring `index` up to date with the files on disk and save it."""
+        index.load()
+        index.refresh()
+        index.save()
+
+    def _close_project_index(self):
+        """Save and discard the current project index."""
+        if self.project_index is not None:
+            if self.project_index.ready:
+                self.project_index.flush()
+                self.project_index.save()
+            self.project_index = None
+
     def _stop_and_reset_thread(self, ignore_results=False):
         """Stop current search thread and clean-up."""
         if self.search_thread is not None:
@@ -1239,10 +1266,26 @@ def set_project_path(self, path):
             Project path string.
         """
         self.path_selection_combo.set_project_path(path)
+        self._setup_project_index(path)
 
     def disable_project_search(self):
         """Disable project search path in combobox."""
         self.path_selection_combo.set_project_path(None)
+        self._close_project_index()
+
+    def update_project_index(self, paths):
+        """
+        Update the project index after files were changed.
+
+        Parameters
+        ----------
+        paths: list
+            Paths of the files or folders that were created, modified,
+            moved or deleted.
+        """
+        if self.project_index is not None:
+            for path in paths:
+                self.project_index.mark_dirty(path)
 
     def set_file_path(self, path):
         """
@@ -1305,10 +1348,23 @@ def start(self):
         # Update and set options
         self._update_options()
 
+        # Only use the project index once it's up to date
+        index = self.project_index
+        if index is not None and not index.ready:
+            index = None
+
         # Start
         self.running = True
         self.start_spinner()
-        self.search_thread = SearchThread(self, search_text, self.text_color)
+        self.search_thread = SearchThread(
+            self,
+            search_text,
+            self.text_color,
+            workers=self.get_option('search_workers'),
+            pool=self.get_option('search_pool'),
+            index=index,
+            use_ignore_files=self.get_option('use_ignore_files'),
+        )
         self.search_thread.sig_finished.connect(self._handle_search_complete)
         self.search_thread.sig_file_match.connect(
             self.result_browser.append_file_result
@@ -31,6 +31,10 @@ class KernelComm(CommBase, QObject):
     communications with a console.
     """
 
+    # Values received from the kernel are only displayed, so they are not
+    # copied out of the read-only buffers. Editors copy them if needed.
+    _writable_buffers = False
+
     _sig_got_reply = Signal()
     _sig_comm_port_changed = Signal()
     sig_exception_occurred = Signal(dict)
@@ -39,11 +43,22 @@ def __init__(self):
         super(KernelComm, self).__init__()
         self.comm_port = None
         self.kernel_client = None
+        self._call_error_handlers = {}
 
         # Register handlers
         self.register_call_handler('_async_error', self._async_error)
         self.register_call_handler('_set_comm_port', self._set_comm_port)
 
+    def register_call_error_handler(self, call_name, handler):
+        """
+        Register a handler for the errors of the calls named call_name.
+
+        Only the errors of non-blocking calls are passed to handler, which
+        gets their CommsErrorWrapper. It must return True if the error was
+        handled, so that it's not shown in the console.
+        """
+        self._call_error_handlers[call_name] = handler
+
     def _set_comm_port(self, port):
         """Set comm port."""
         if port is None:
@@ -241,6 +256,9 @@ def _async_error(self, error_wrapper):
         """
         Handle an error that was raised on the other side and sent back.
         """
+        handler = self._call_error_handlers.get(error_wrapper.call_name)
+        if handler is not None and handler(error_wrapper):
+            return
         for line in error_wrapper.format_error():
             self.sig_exception_occurred.emit(
                 dict(text=line, is_traceback=True)
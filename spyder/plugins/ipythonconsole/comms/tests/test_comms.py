@@ -13,10 +13,12 @@
 import os
 
 # Test imports
+import numpy as np
 import pytest
 
 
 # Local imports
+from spyder_kernels.comms.commbase import CommError, CommsErrorWrapper
 from spyder_kernels.utils.test_utils import get_kernel
 from spyder_kernels.comms.frontendcomm import FrontendComm
 from spyder.plugins.ipythonconsole.comms.kernelcomm import KernelComm
@@ -91,6 +93,24 @@ def on_close(self, callback):
         self.close_callback = callback
 
 
+def spy_read_only_send(comm):
+    """
+    Make the buffers sent by comm read only, like the frames received by
+    zmq, and return the list of the buffers sent.
+    """
+    sent_buffers = []
+    send = comm.send
+
+    def spy_send(msg_dict, buffers=None):
+        sent_buffers.append(buffers)
+        if buffers is not None:
+            buffers = [memoryview(bytes(buf)) for buf in buffers]
+        send(msg_dict, buffers=buffers)
+
+    comm.send = spy_send
+    return sent_buffers
+
+
 @pytest.fixture
 def comms(kernel):
     """Get the comms"""
@@ -112,6 +132,9 @@ class DummyKernelClient():
         comm_channel = 0
         shell_channel = 0
 
+        def is_alive(self):
+            return True
+
     kernel_comm.kernel_client = DummyKernelClient()
 
     kernel_comm._register_comm(commA)
@@ -181,5 +204,70 @@ def handler(a, b):
     assert res == 'ab'
 
 
+@pytest.mark.skipif(os.name == 'nt', reason="Hangs on Windows")
+def test_out_of_band_buffers(comms):
+    """Test that big arrays are sent out of the pickle stream."""
+    kernel_comm, frontend_comm = comms
+    comm = kernel_comm._comms[1]['comm']
+    assert kernel_comm._comms[1]['out_of_band']
+
+    sent_buffers = spy_read_only_send(comm)
+
+    data = {'small': np.arange(10), 'big': np.arange(10 ** 6)}
+    kernel_comm.register_call_handler('get_data', lambda: data)
+    res = frontend_comm.remote_call(blocking=True).get_data()
+
+    assert len(sent_buffers[0]) == 2
+    assert np.array_equal(res['small'], data['small'])
+    assert np.array_equal(res['big'], data['big'])
+    # Values set in the kernel namespace have to be modifiable
+    assert res['big'].flags.writeable
+
+
+@pytest.mark.skipif(os.name == 'nt', reason="Hangs on Windows")
+def test_out_of_band_buffers_frontend(comms):
+    """Test that big arrays received by the frontend are not copied."""
+    kernel_comm, frontend_comm = comms
+    sent_buffers = spy_read_only_send(frontend_comm._comms[1]['comm'])
+
+    data = np.arange(10 ** 6)
+    frontend_comm.register_call_handler('get_data', lambda: data)
+    replies = []
+    kernel_comm.remote_call(callback=replies.append).get_data()
+    res = replies[0]
+
+    assert len(sent_buffers[0]) == 2
+    assert np.array_equal(res, data)
+    assert not res.flags.writeable
+
+
+@pytest.mark.skipif(os.name == 'nt', reason="Hangs on Windows")
+def test_call_error_handler(comms):
+    """Test that the errors of calls are passed to their error handler."""
+    kernel_comm, frontend_comm = comms
+    try:
+        frontend_comm._remote_callback('missing_call', [], {})
+    except CommError:
+        # The wrapper takes the error being handled
+        error_wrapper = CommsErrorWrapper('missing_call', 0)
+    else:
+        pytest.fail("Calling an unknown function must fail")
+
+    errors = []
+    exceptions = []
+    kernel_comm.sig_exception_occurred.connect(exceptions.append)
+    kernel_comm.register_call_error_handler(
+        'missing_call', lambda error: errors.append(error) or True)
+    kernel_comm._async_error(error_wrapper)
+    assert errors == [error_wrapper]
+    assert exceptions == []
+
+    # Errors that are not handled are shown in the console
+    kernel_comm.register_call_error_handler(
+        'missing_call', lambda error: False)
+    kernel_comm._async_error(error_wrapper)
+    assert len(exceptions) > 0
+
+
 if __name__ == "__main__":
     pytest.main()
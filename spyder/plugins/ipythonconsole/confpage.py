@@ -420,6 +420,28 @@ def setup_page(self):
         windows_layout.addWidget(hide_cmd_windows)
         windows_group.setLayout(windows_layout)
 
+        # Kernel pool
+        kernel_pool_group = QGroupBox(_("Kernel pool"))
+        kernel_pool_label = QLabel(_("Kernels can be started in advance "
+                                     "so that new consoles are ready right "
+                                     "away. Idle kernels are shut down when "
+                                     "the available memory goes below the "
+                                     "given percentage. Use 0 kernels to "
+                                     "disable this feature."))
+        kernel_pool_label.setWordWrap(True)
+        kernel_pool_spin = self.create_spinbox(
+            _("Idle kernels:"), "",
+            'kernel_pool_size', min_=0, max_=5, step=1)
+        kernel_pool_memory_spin = self.create_spinbox(
+            _("Minimum available memory:"), "%",
+            'kernel_pool_min_available_memory', min_=0, max_=90, step=5)
+
+        kernel_pool_layout = QVBoxLayout()
+        kernel_pool_layout.addWidget(kernel_pool_label)
+        kernel_pool_layout.addWidget(kernel_pool_spin)
+        kernel_pool_layout.addWidget(kernel_pool_memory_spin)
+        kernel_pool_group.setLayout(kernel_pool_layout)
+
         # --- Tabs organization ---
         tabs = QTabWidget()
         tabs.addTab(self.create_tab(interface_group, comp_group,
@@ -432,7 +454,7 @@ def setup_page(self):
                     _("Debugger"))
         tabs.addTab(self.create_tab(jedi_group, greedy_group, autocall_group,
                                     sympy_group, prompts_group,
-                                    windows_group),
+                                    kernel_pool_group, windows_group),
                     _("Advanced settings"))
 
         vlayout = QVBoxLayout()
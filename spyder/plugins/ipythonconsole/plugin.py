@@ -14,6 +14,7 @@
 # pylint: disable=R0201
 
 # Standard library imports
+import codecs
 import os
 import os.path as osp
 import sys
@@ -34,11 +35,14 @@
 
 # Local imports
 from spyder.api.plugins import SpyderPluginWidget
+from spyder.app.tracer import STARTUP_TRACER
 from spyder.config.base import (_, get_conf_path, get_home_dir,
                                 running_under_pytest)
 from spyder.config.gui import get_font, is_dark_interface
 from spyder.config.manager import CONF
 from spyder.plugins.ipythonconsole.confpage import IPythonConsoleConfigPage
+from spyder.plugins.ipythonconsole.utils.kernelpool import (
+    KernelPool, PooledKernel, get_kernel_spec_key)
 from spyder.plugins.ipythonconsole.utils.kernelspec import SpyderKernelSpec
 from spyder.plugins.ipythonconsole.utils.manager import SpyderKernelManager
 from spyder.plugins.ipythonconsole.utils.ssh import openssh_tunnel
@@ -50,7 +54,8 @@
 from spyder.utils import encoding
 from spyder.utils import icon_manager as ima
 from spyder.utils import programs, sourcecode
-from spyder.utils.misc import get_error_match, remove_backslashes
+from spyder.utils.misc import (get_error_match, getcwd_or_home,
+                               remove_backslashes)
 from spyder.utils.programs import get_temp_dir
 from spyder.utils.qthelpers import MENU_SEPARATOR, add_actions, create_action
 from spyder.widgets.browser import WebView
@@ -180,6 +185,13 @@ def __init__(self, parent, testing=False, test_dir=None,
         self.test_dir = test_dir
         self.test_no_stderr = test_no_stderr
 
+        # Kernels started in advance for new consoles
+        self.kernel_pool = KernelPool(
+            self, self._start_pooled_kernel,
+            size=self.get_option('kernel_pool_size'),
+            min_available_memory=self.get_option(
+                'kernel_pool_min_available_memory'))
+
         # Create temp dir on testing to save kernel errors
         if self.test_dir is not None:
             if not osp.isdir(osp.join(test_dir)):
@@ -413,6 +425,16 @@ def apply_plugin_settings(self, options):
         restart_needed = False
         restart_options = []
 
+        # Kernel pool options
+        kernel_pool_size_n = 'kernel_pool_size'
+        if kernel_pool_size_n in options:
+            self.kernel_pool.set_size(self.get_option(kernel_pool_size_n))
+        min_available_memory_n = 'kernel_pool_min_available_memory'
+        if min_available_memory_n in options:
+            self.kernel_pool.min_available_memory = self.get_option(
+                min_available_memory_n)
+            self.kernel_pool.evict_if_low_memory()
+
         # Startup options (needs a restart)
         run_lines_n = 'startup/run_lines'
         use_run_file_n = 'startup/use_run_file'
@@ -517,6 +539,7 @@ def get_focus_widget(self):
     def closing_plugin(self, cancelable=False):
         """Perform actions before parent main window is closed"""
         self.mainwindow_close = True
+        self.kernel_pool.shutdown()
         for client in self.clients:
             client.shutdown()
             client.remove_stderr_file()
@@ -933,7 +956,16 @@ def create_new_client(self, give_focus=True, filename='', is_cython=False,
         self.master_clients += 1
         client_id = dict(int_id=to_text_string(self.master_clients),
                          str_id='A')
-        cf = self._new_connection_file()
+
+        # Use a kernel from the pool for regular consoles if there's one
+        pooled_kernel = None
+        if not (is_cython or is_pylab or is_sympy):
+            pooled_kernel = self._take_pooled_kernel()
+        if pooled_kernel is not None:
+            cf = pooled_kernel.connection_file
+        else:
+            cf = self._new_connection_file()
+
         show_elapsed_time = self.get_option('show_elapsed_time')
         reset_warning = self.get_option('show_reset_namespace_warning')
         ask_before_restart = self.get_option('ask_before_restart')
@@ -990,7 +1022,8 @@ def create_new_client(self, give_focus=True, filename='', is_cython=False,
                 return
 
         self.connect_client_to_kernel(client, is_cython=is_cython,
-                                      is_pylab=is_pylab, is_sympy=is_sympy)
+                                      is_pylab=is_pylab, is_sympy=is_sympy,
+                                      pooled_kernel=pooled_kernel)
         if client.shellwidget.kernel_manager is None:
             return
         self.register_client(client)
@@ -1019,16 +1052,26 @@ def create_client_for_kernel(self):
                                            password)
 
     def connect_client_to_kernel(self, client, is_cython=False,
-                                 is_pylab=False, is_sympy=False):
+                                 is_pylab=False, is_sympy=False,
+                                 pooled_kernel=None):
         """Connect a client to its kernel"""
         connection_file = client.connection_file
-        stderr_handle = None if self.test_no_stderr else client.stderr_handle
-        km, kc = self.create_kernel_manager_and_kernel_client(
-                     connection_file,
-                     stderr_handle,
-                     is_cython=is_cython,
-                     is_pylab=is_pylab,
-                     is_sympy=is_sympy)
+        if pooled_kernel is not None:
+            # The kernel is already running and writing to the stderr file
+            # of the client, which closes it.
+            km = pooled_kernel.kernel_manager
+            kc = pooled_kernel.kernel_client
+            client.kernel_stderr_handle = pooled_kernel.stderr_handle
+        else:
+            stderr_handle = (None if self.test_no_stderr
+                             else client.stderr_handle)
+            with STARTUP_TRACER.phase('Start kernel'):
+                km, kc = self.create_kernel_manager_and_kernel_client(
+                             connection_file,
+                             stderr_handle,
+                             is_cython=is_cython,
+                             is_pylab=is_pylab,
+                             is_sympy=is_sympy)
 
         # An error occurred if this is True
         if is_string(km) and kc is None:
@@ -1049,6 +1092,10 @@ def connect_client_to_kernel(self, client, is_cython=False,
         shellwidget.set_kernel_client_and_manager(kc, km)
         shellwidget.sig_exception_occurred.connect(
             self.main.console.handle_exception)
+        if pooled_kernel is not None:
+            # Pooled kernels were started in the working directory of
+            # Spyder at that time, instead of the current one
+            shellwidget.set_cwd(getcwd_or_home())
 
     @Slot(object, object)
     def edit_file(self, filename, line):
@@ -1712,6 +1759,43 @@ def _new_connection_file(self):
             cf = cf if not os.path.exists(cf) else ''
         return cf
 
+    def _take_pooled_kernel(self):
+        """Take an idle kernel from the pool for a new console."""
+        if not self.kernel_pool.enabled:
+            return None
+        key = get_kernel_spec_key(self.create_kernel_spec())
+        return self.kernel_pool.take(key)
+
+    def _start_pooled_kernel(self):
+        """Start a kernel to keep in the pool of idle kernels."""
+        connection_file = self._new_connection_file()
+        if connection_file is None:
+            return None
+
+        # Save the kernel stderr in the file that its client will read
+        stderr_handle = None
+        if not self.test_no_stderr:
+            kernel_id = osp.basename(connection_file).split('.json')[0]
+            stderr_dir = self.test_dir
+            try:
+                if stderr_dir is None:
+                    stderr_dir = get_temp_dir()
+                stderr_handle = codecs.open(
+                    osp.join(stderr_dir, kernel_id + '.stderr'), 'w',
+                    encoding='utf-8')
+            except Exception:
+                stderr_handle = None
+
+        km, kc = self.create_kernel_manager_and_kernel_client(
+            connection_file, stderr_handle)
+        if is_string(km) and kc is None:
+            if stderr_handle is not None:
+                stderr_handle.close()
+            return None
+
+        return PooledKernel(get_kernel_spec_key(km._kernel_spec),
+                            connection_file, km, kc, stderr_handle)
+
     def process_started(self, client):
         self.sig_shellwidget_process_started.emit(client.shellwidget)
 
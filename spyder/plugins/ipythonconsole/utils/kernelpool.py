@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""
+Pool of idle kernels for new consoles.
+
+Kernels take several seconds to be ready, mostly to import the scientific
+libraries and to set up Matplotlib. The pool starts kernels in advance with
+the kernel spec that new consoles use, so that a console can be connected
+right away to one of them. Idle kernels are shut down when the system runs
+low on memory.
+"""
+
+# Standard library imports
+import logging
+import os
+
+# Third party imports
+import psutil
+from qtpy.QtCore import QObject, QTimer
+
+
+logger = logging.getLogger(__name__)
+
+# Time to wait before starting a kernel for the pool, in ms, so that it
+# doesn't compete with the kernel of the console that was just created.
+FILL_DELAY = 3000
+
+# Interval to check the available memory, in ms
+MEMORY_CHECK_INTERVAL = 10000
+
+
+def get_kernel_spec_key(kernel_spec):
+    """Return a key identifying the kernels started with `kernel_spec`."""
+    return (tuple(kernel_spec.argv), tuple(sorted(kernel_spec.env.items())))
+
+
+def get_available_memory():
+    """Return the percentage of the system memory that is available."""
+    memory = psutil.virtual_memory()
+    return 100 * memory.available / memory.total
+
+
+class PooledKernel(object):
+    """Idle kernel kept in a pool."""
+
+    def __init__(self, key, connection_file, kernel_manager, kernel_client,
+                 stderr_handle=None):
+        self.key = key
+        self.connection_file = connection_file
+        self.kernel_manager = kernel_manager
+        self.kernel_client = kernel_client
+        self.stderr_handle = stderr_handle
+
+    def is_alive(self):
+        """Whether the kernel process is still running."""
+        try:
+            return self.kernel_manager.is_alive()
+        except Exception:
+            return False
+
+    def shutdown(self):
+        """Shut down the kernel and remove its files."""
+        try:
+            self.kernel_manager.shutdown_kernel(now=True)
+        except Exception:
+            logger.debug("Error shutting down pooled kernel %s",
+                         self.connection_file, exc_info=True)
+
+        if self.stderr_handle is not None:
+            stderr_file = self.stderr_handle.name
+            try:
+                self.stderr_handle.close()
+                os.remove(stderr_file)
+            except (IOError, OSError):
+                pass
+
+
+class KernelPool(QObject):
+    """
+    Pool of idle kernels.
+
+    Parameters
+    ----------
+    parent: QObject
+        Parent of the pool.
+    start_kernel: callable
+        Called without arguments to start a kernel for the pool. It must
+        return a PooledKernel, or None if the kernel couldn't be started.
+    size: int, optional
+        Number of idle kernels to keep. 0 disables the pool.
+    min_available_memory: int, optional
+        Percentage of the system memory that must remain available. Idle
+        kernels are shut down below it.
+    """
+
+    def __init__(self, parent, start_kernel, size=0, min_available_memory=20):
+        super(KernelPool, self).__init__(parent)
+        self._start_kernel = start_kernel
+        self.size = size
+        self.min_available_memory = min_available_memory
+        self.key = None
+        self.kernels = []
+
+        self._fill_timer = QTimer(self)
+        self._fill_timer.setSingleShot(True)
+        self._fill_timer.setInterval(FILL_DELAY)
+        self._fill_timer.timeout.connect(self._fill)
+
+        self._memory_timer = QTimer(self)
+        self._memory_timer.setInterval(MEMORY_CHECK_INTERVAL)
+        self._memory_timer.timeout.connect(self.evict_if_low_memory)
+
+    # ---- Public API
+    # ------------------------------------------------------------------------
+    @property
+    def enabled(self):
+        """Whether the pool keeps idle kernels."""
+        return self.size > 0
+
+    def take(self, key):
+        """
+        Return an idle kernel started with `key`, or None if there isn't any.
+
+        The pool is filled again afterwards with kernels for `key`.
+        """
+        if not self.enabled:
+            return None
+
+        if key != self.key:
+            self.fill(key)
+
+        kernel = None
+        while self.kernels:
+            candidate = self.kernels.pop(0)
+            if candidate.is_alive():
+                kernel = candidate
+                break
+            candidate.shutdown()
+
+        self.fill(key)
+        return kernel
+
+    def fill(self, key):
+        """Keep idle kernels started with `key` from now on."""
+        if self.key != key:
+            self.key = key
+            # Kernels started with a different kernel spec can't be used
+            self._shutdown_kernels(
+                [kernel for kernel in self.kernels if kernel.key != key])
+
+        if self.enabled:
+            self._memory_timer.start()
+            if len(self.kernels) < self.size:
+                self._fill_timer.start()
+
+    def set_size(self, size):
+        """Set the number of idle kernels to keep."""
+        self.size = size
+        if len(self.kernels) > size:
+            self._shutdown_kernels(self.kernels[size:])
+        if not self.enabled:
+            self._fill_timer.stop()
+            self._memory_timer.stop()
+        elif self.key is not None:
+            self.fill(self.key)
+
+    def is_memory_low(self):
+        """Whether the system memory available is below the minimum."""
+        try:
+            return get_available_memory() < self.min_available_memory
+        except Exception:
+            return False
+
+    def evict_if_low_memory(self):
+        """Shut down idle kernels while the system is low on memory."""
+        while self.kernels and self.is_memory_low():
+            logger.debug("Low memory, shutting down a pooled kernel")
+            self._shutdown_kernels(self.kernels[-1:])
+
+    def shutdown(self):
+        """Shut down all idle kernels and stop filling the pool."""
+        self._fill_timer.stop()
+        self._memory_timer.stop()
+        self._shutdown_kernels(self.kernels)
+
+    # ---- Private API
+    # ------------------------------------------------------------------------
+    def _shutdown_kernels(self, kernels):
+        """Shut down `kernels` and remove them from the pool."""
+        for kernel in list(kernels):
+            self.kernels.remove(kernel)
+            kernel.shutdown()
+
+    def _fill(self):
+        """Start a kernel for the pool, one at a time."""
+        if (not self.enabled or self.key is None
+                or len(self.kernels) >= self.size or self.is_memory_low()):
+            return
+
+        kernel = self._start_kernel()
+        if kernel is None:
+            # Don't retry until a kernel is taken from the pool
+            return
+        if kernel.key != self.key:
+            # The kernel spec changed since the pool was filled, so the
+            # kernels started before can't be used anymore
+            self.fill(kernel.key)
+
+        self.kernels.append(kernel)
+        if len(self.kernels) < self.size:
+            self._fill_timer.start()
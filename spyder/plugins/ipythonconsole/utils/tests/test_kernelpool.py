@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+#
+
+"""
+Tests for the pool of idle kernels
+"""
+
+import pytest
+
+from spyder.plugins.ipythonconsole.utils import kernelpool
+from spyder.plugins.ipythonconsole.utils.kernelpool import (KernelPool,
+                                                            PooledKernel)
+
+
+class FakeKernelManager(object):
+    """Kernel manager that doesn't start any process."""
+
+    def __init__(self):
+        self.alive = True
+
+    def is_alive(self):
+        return self.alive
+
+    def shutdown_kernel(self, now=False):
+        self.alive = False
+
+
+@pytest.fixture
+def kernel_pool(qtbot, monkeypatch):
+    monkeypatch.setattr(kernelpool, 'FILL_DELAY', 0)
+    monkeypatch.setattr(kernelpool, 'get_available_memory', lambda: 50)
+    started = []
+
+    def start_kernel():
+        kernel = PooledKernel(start_kernel.key,
+                              'kernel-{}.json'.format(len(started)),
+                              FakeKernelManager(), None)
+        started.append(kernel)
+        return kernel
+
+    start_kernel.key = 'spec'
+    pool = KernelPool(None, start_kernel, size=2)
+    pool.started = started
+    pool.start_kernel = start_kernel
+    yield pool
+    pool.shutdown()
+
+
+def test_kernel_pool_take(kernel_pool, qtbot):
+    """Test that the pool is filled and that its kernels are handed out."""
+    assert kernel_pool.take('spec') is None
+    qtbot.waitUntil(lambda: len(kernel_pool.kernels) == 2)
+
+    kernel = kernel_pool.take('spec')
+    assert kernel is kernel_pool.started[0]
+    assert kernel.is_alive()
+    qtbot.waitUntil(lambda: len(kernel_pool.started) == 3)
+    assert kernel_pool.kernels == kernel_pool.started[1:]
+
+    # Dead kernels are not handed out
+    kernel_pool.started[1].kernel_manager.alive = False
+    assert kernel_pool.take('spec') is kernel_pool.started[2]
+
+
+def test_kernel_pool_key_changed(kernel_pool, qtbot):
+    """Test that kernels started with another kernel spec are shut down."""
+    kernel_pool.fill('spec')
+    qtbot.waitUntil(lambda: len(kernel_pool.kernels) == 2)
+    old_kernels = list(kernel_pool.kernels)
+
+    kernel_pool.start_kernel.key = 'new spec'
+    assert kernel_pool.take('new spec') is None
+    assert not any(kernel.is_alive() for kernel in old_kernels)
+    qtbot.waitUntil(lambda: len(kernel_pool.kernels) == 2)
+    assert all(kernel.key == 'new spec' for kernel in kernel_pool.kernels)
+
+
+def test_kernel_pool_size_and_memory(kernel_pool, qtbot, monkeypatch):
+    """Test that idle kernels are shut down when the pool is made smaller
+    and when the system is low on memory."""
+    kernel_pool.fill('spec')
+    qtbot.waitUntil(lambda: len(kernel_pool.kernels) == 2)
+
+    kernel_pool.set_size(1)
+    assert kernel_pool.kernels == kernel_pool.started[:1]
+    assert not kernel_pool.started[1].is_alive()
+
+    monkeypatch.setattr(kernelpool, 'get_available_memory', lambda: 10)
+    kernel_pool.evict_if_low_memory()
+    assert kernel_pool.kernels == []
+    assert not kernel_pool.started[0].is_alive()
+
+    # No kernels are started while memory is low
+    kernel_pool._fill()
+    assert len(kernel_pool.started) == 2
+
+    kernel_pool.set_size(0)
+    assert kernel_pool.take('spec') is None
+
+
+if __name__ == "__main__":
+    pytest.main()
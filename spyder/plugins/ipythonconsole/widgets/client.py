@@ -31,6 +31,7 @@
                             QToolButton, QVBoxLayout, QWidget)
 
 # Local imports
+from spyder.app.tracer import STARTUP_TRACER
 from spyder.config.base import (_, get_image_path, get_module_source_path,
                                 running_under_pytest)
 from spyder.config.manager import CONF
@@ -122,6 +123,9 @@ def __init__(self, plugin, id_,
         self.history = []
         self.allow_rename = True
         self.stderr_dir = None
+        # Handle of stderr_file that the kernel was started with, if it
+        # must be closed with the client
+        self.kernel_stderr_handle = None
         self.is_error_shown = False
         self.restart_thread = None
 
@@ -235,6 +239,8 @@ def remove_stderr_file(self):
             # Defer closing the stderr_handle until the client
             # is closed because jupyter_client needs it open
             # while it tries to restart the kernel
+            if self.kernel_stderr_handle is not None:
+                self.kernel_stderr_handle.close()
             self.stderr_handle.close()
             os.remove(self.stderr_file)
         except Exception:
@@ -332,6 +338,8 @@ def _before_prompt_is_ready(self):
 
     def _when_prompt_is_ready(self):
         """Configuration after the prompt is shown."""
+        STARTUP_TRACER.mark('Kernel ready')
+
         # To hide the loading page
         self._hide_loading_page()
 
@@ -49,20 +49,41 @@ class NamepaceBrowserWidget(RichJupyterWidget):
     # To save values and messages returned by the kernel
     _kernel_is_starting = True
 
+    # Id of the last namespace view got from the kernel, to only ask for
+    # its changes. It's None when the whole view is needed.
+    _namespace_view_id = None
+
+    # Whether the kernel can send the changes of the namespace view.
+    # Older kernels only send whole views.
+    _namespace_view_changes = True
+
     # --- Public API --------------------------------------------------
     def set_namespacebrowser(self, namespacebrowser):
         """Set namespace browser widget"""
         self.namespacebrowser = namespacebrowser
 
-    def refresh_namespacebrowser(self, interrupt=True):
-        """Refresh namespace browser"""
+    def refresh_namespacebrowser(self, interrupt=True, full=False):
+        """
+        Refresh namespace browser
+
+        Only the changes of the namespace view are asked for, unless `full`
+        is True or the kernel can't send them.
+        """
         if self.kernel_client is None:
             return
         if self.namespacebrowser:
-            self.call_kernel(
-                interrupt=interrupt,
-                callback=self.set_namespace_view
-            ).get_namespace_view()
+            if full:
+                self._namespace_view_id = None
+            if self._namespace_view_changes:
+                self.call_kernel(
+                    interrupt=interrupt,
+                    callback=self.set_namespace_view_changes
+                ).get_namespace_view_changes(self._namespace_view_id)
+            else:
+                self.call_kernel(
+                    interrupt=interrupt,
+                    callback=self.set_namespace_view
+                ).get_namespace_view()
             self.call_kernel(
                 interrupt=interrupt,
                 callback=self.set_var_properties
@@ -70,9 +91,33 @@ def refresh_namespacebrowser(self, interrupt=True):
 
     def set_namespace_view(self, view):
         """Set the current namespace view."""
+        # The next refresh can't be based on the last view of the kernel
+        self._namespace_view_id = None
         if self.namespacebrowser is not None:
             self.namespacebrowser.process_remote_view(view)
 
+    def set_namespace_view_changes(self, changes):
+        """Apply the changes of the namespace view."""
+        if changes is None:
+            return
+        self._namespace_view_id = changes['view_id']
+        if self.namespacebrowser is not None:
+            self.namespacebrowser.process_remote_view_changes(changes)
+
+    def handle_namespace_view_changes_error(self, error_wrapper):
+        """
+        Ask for whole namespace views if the kernel can't send their changes.
+
+        Return True if the error was handled.
+        """
+        if not isinstance(error_wrapper.error, CommError):
+            return False
+        logger.debug("Kernel can't send namespace view changes: %s",
+                     error_wrapper.error)
+        self._namespace_view_changes = False
+        self.refresh_namespacebrowser(interrupt=False)
+        return True
+
     def set_var_properties(self, properties):
         """Set var properties."""
         if self.namespacebrowser is not None:
@@ -84,6 +129,7 @@ def set_namespace_view_settings(self):
             return
         if self.namespacebrowser:
             settings = self.namespacebrowser.get_view_settings()
+            self._namespace_view_id = None
             self.call_kernel().set_namespace_view_settings(settings)
 
     def get_value(self, name):
@@ -114,6 +160,43 @@ def get_value(self, name):
         except Exception:
             raise ValueError(msg % reason_other)
 
+    def open_data_view(self, name):
+        """
+        Ask kernel to open a view of a variable, to browse it without
+        retrieving its value.
+
+        Return a RemoteDataView, or None if the variable can't be viewed.
+        """
+        try:
+            reply = self.call_kernel(
+                blocking=True,
+                timeout=CALL_KERNEL_TIMEOUT).open_data_view(name)
+        except Exception:
+            # Kernels without data views are handled like unsupported
+            # values, i.e. by getting their value instead.
+            logger.debug("Data view of %s not opened", name, exc_info=True)
+            return None
+        if reply is None:
+            return None
+        view_id, info = reply
+        view = RemoteDataView(self, view_id, info)
+        self._data_views[view_id] = view
+        return view
+
+    def handle_data_view_error(self, error_wrapper):
+        """
+        Let the open data views request again the blocks they are waiting
+        for, because one of them failed.
+
+        Return True if the error was handled.
+        """
+        logger.debug("Block of a data view not received: %s",
+                     error_wrapper.error)
+        for view in list(self._data_views.values()):
+            if view.error_callback is not None:
+                view.error_callback()
+        return True
+
     def set_value(self, name, value):
         """Set value for a variable"""
         self.call_kernel(
@@ -235,3 +318,65 @@ def _handle_status(self, msg):
             self.ipyclient.t0 = time.monotonic()
         else:
             super(NamepaceBrowserWidget, self)._handle_status(msg)
+
+
+class RemoteDataView(object):
+    """
+    View of a DataFrame, Series or Index kept in the kernel.
+
+    This is used by the DataFrame editor to only request the parts of the
+    data it displays. See spyder_kernels.utils.dataview for details.
+
+    Windows and headers are requested without blocking if a callback is
+    given, which gets them when they are received. error_callback is
+    called instead if any of those requests fails.
+    """
+
+    def __init__(self, shellwidget, view_id, info):
+        self.shellwidget = shellwidget
+        self.view_id = view_id
+        self.type_name = info['type_name']
+        self.is_series = info['is_series']
+        self.shape = tuple(info['shape'])
+        self.header_shape = tuple(info['header_shape'])
+        self.names = info['names']
+        self.closed = False
+        self.error_callback = None
+
+    def _call_kernel(self, callback=None):
+        if callback is not None:
+            # The kernel replies once it's idle
+            return self.shellwidget.call_kernel(callback=callback)
+        return self.shellwidget.call_kernel(
+            blocking=True,
+            display_error=True,
+            timeout=CALL_KERNEL_TIMEOUT)
+
+    def get_window(self, start_row, stop_row, start_col, stop_col,
+                   callback=None):
+        """Get the DataFrame of the given rows and columns."""
+        return self._call_kernel(callback).get_data_view_window(
+            self.view_id, start_row, stop_row, start_col, stop_col)
+
+    def get_header(self, axis, start, stop, callback=None):
+        """Get the labels of columns (axis 0) or rows (axis 1)."""
+        return self._call_kernel(callback).get_data_view_header(
+            self.view_id, axis, start, stop)
+
+    def get_minmax(self):
+        """Get the maximum and minimum of each column."""
+        return self._call_kernel().get_data_view_minmax(self.view_id)
+
+    def sort(self, column, ascending=True):
+        """Sort rows by column, or by the index if column is negative."""
+        self._call_kernel().sort_data_view(self.view_id, column, ascending)
+
+    def close(self):
+        """Release the view in the kernel."""
+        if self.closed:
+            return
+        self.closed = True
+        self.error_callback = None
+        self.shellwidget._data_views.pop(self.view_id, None)
+        if self.shellwidget.kernel_client is not None:
+            self.shellwidget.call_kernel().close_data_view(self.view_id)
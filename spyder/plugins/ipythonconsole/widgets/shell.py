@@ -9,6 +9,7 @@
 """
 
 # Standard library imports
+import hashlib
 import os
 import os.path as osp
 import uuid
@@ -105,15 +106,26 @@ def __init__(self, ipyclient, additional_options, interpreter_versions,
             'cell_count': self.handle_cell_count,
             'current_filename': self.handle_current_filename,
             'get_file_code': self.handle_get_file_code,
+            'get_file_code_version': self.handle_get_file_code_version,
             'set_debug_state': self.set_debug_state,
             'update_syspath': self.update_syspath,
             'do_where': self.do_where,
             'pdb_input': self.pdb_input,
             'request_interrupt_eventloop': self.request_interrupt_eventloop,
+            'refresh_namespacebrowser': self.refresh_namespacebrowser,
         }
         for request_id in handlers:
             self.spyder_kernel_comm.register_call_handler(
                 request_id, handlers[request_id])
+        self.spyder_kernel_comm.register_call_error_handler(
+            'get_namespace_view_changes',
+            self.handle_namespace_view_changes_error)
+
+        # Open views of data kept in the kernel, by id
+        self._data_views = {}
+        for call_name in ['get_data_view_window', 'get_data_view_header']:
+            self.spyder_kernel_comm.register_call_error_handler(
+                call_name, self.handle_data_view_error)
 
         self._execute_queue = []
         self.executed.connect(self.pop_execute_queue)
@@ -204,6 +216,7 @@ def set_kernel_client_and_manager(self, kernel_client, kernel_manager):
         self.kernel_manager = kernel_manager
         self.kernel_client = kernel_client
         self.spyder_kernel_comm.open_comm(kernel_client)
+        self._namespace_view_changes = True
 
         # Redefine the complete method to work while debugging.
         self._redefine_complete_for_dbg(self.kernel_client)
@@ -717,8 +730,28 @@ def handle_get_file_code(self, filename, save_all=True):
             text, _enc = encoding.read(filename)
             return text
 
+        # Run the whole text of large files still being loaded
+        editor.finish_loading_text()
         return editor.toPlainText()
 
+    def handle_get_file_code_version(self, filename, version=None,
+                                     save_all=True):
+        """
+        Return the version of the file code and the code itself.
+
+        The version is the SHA-1 hash of the code of files open in the
+        editor and None for other files. The code is None if its version is
+        `version`, i.e. the one the kernel already has.
+        """
+        file_code = self.handle_get_file_code(filename, save_all=save_all)
+        if self.get_editor(filename) is None:
+            return None, file_code
+
+        new_version = hashlib.sha1(file_code.encode('utf-8')).hexdigest()
+        if new_version == version:
+            return new_version, None
+        return new_version, file_code
+
     def handle_run_cell(self, cell_name, filename):
         """
         Get cell code from cell name and file name.
@@ -733,6 +766,7 @@ def handle_run_cell(self, cell_name, filename):
         editorstack.last_cell_call = (filename, cell_name)
 
         # The file is open, load code from editor
+        editor.finish_loading_text()
         return editor.get_cell_code(cell_name)
 
     def handle_cell_count(self, filename):
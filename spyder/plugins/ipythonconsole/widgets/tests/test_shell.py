@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# Copyright © Spyder Project Contributors
+#
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+# -----------------------------------------------------------------------------
+
+"""Tests for the requests of the kernel handled by the shell widget."""
+
+# Standard library imports
+try:
+    from unittest.mock import Mock
+except ImportError:
+    from mock import Mock  # Python 2
+
+# Third party imports
+import pytest
+
+# Local imports
+from spyder.plugins.ipythonconsole.widgets.shell import ShellWidget
+
+
+@pytest.fixture
+def shell():
+    """Mock of a shell widget with a file open in the editor."""
+    shell = Mock()
+    shell.handle_get_file_code.return_value = u'x = 1\n# é\n'
+    shell.get_editor.return_value = Mock()
+    return shell
+
+
+def test_get_file_code_version(shell):
+    """Test that the code is only sent when its version changes."""
+    version, code = ShellWidget.handle_get_file_code_version(
+        shell, 'test.py')
+    assert code == u'x = 1\n# é\n'
+    assert len(version) == 40
+
+    # Same code
+    assert ShellWidget.handle_get_file_code_version(
+        shell, 'test.py', version) == (version, None)
+
+    # Changed code
+    shell.handle_get_file_code.return_value = u'x = 2\n'
+    new_version, code = ShellWidget.handle_get_file_code_version(
+        shell, 'test.py', version)
+    assert new_version != version
+    assert code == u'x = 2\n'
+
+
+def test_get_file_code_version_not_in_editor(shell):
+    """Test that files not open in the editor have no version."""
+    shell.get_editor.return_value = None
+    assert ShellWidget.handle_get_file_code_version(
+        shell, 'test.py', 'version') == (None, u'x = 1\n# é\n')
+
+
+def test_get_file_code_large_file(shell):
+    """Test that large files are loaded completely before being run."""
+    editor = shell.get_editor.return_value
+    editor.toPlainText.return_value = u'x = 1\n'
+    assert ShellWidget.handle_get_file_code(
+        shell, 'test.py', save_all=False) == u'x = 1\n'
+    editor.finish_loading_text.assert_called_once_with()
+
+
+def test_data_view_requests(shell):
+    """Test that data views request blocks again after an error."""
+    shell._data_views = {}
+    info = {'type_name': 'DataFrame', 'is_series': False, 'shape': (1, 1),
+            'header_shape': (1, 1), 'names': [[None], [None]]}
+    shell.call_kernel.return_value.open_data_view.return_value = ('id', info)
+    view = ShellWidget.open_data_view(shell, 'df')
+    assert shell._data_views == {'id': view}
+
+    # Blocks requested with a callback don't block
+    callback = Mock()
+    view.get_window(0, 1, 0, 1, callback=callback)
+    shell.call_kernel.assert_called_with(callback=callback)
+
+    view.error_callback = Mock()
+    assert ShellWidget.handle_data_view_error(shell, Mock())
+    view.error_callback.assert_called_once_with()
+
+    view.close()
+    assert shell._data_views == {}
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -22,6 +22,7 @@ def handle_go_to(name, line, text):
 
 outlineexplorer.edit_goto.connect(handle_go_to)
 """
+import bisect
 import re
 
 from qtpy.QtCore import Signal, QObject
@@ -39,8 +40,8 @@ def document_cells(block, forward=True, cell_list=None):
     forward : bool, optional
         Whether to iterate forward or backward from the current block.
     cell_list: list of tuple containing (block_number, oedata)
-        This is the list of all cells in a file to avoid having to parse
-        the file every time.
+        This is the list of all cells in a file, sorted by block number,
+        to avoid having to parse the file every time.
     """
     if not block.isValid():
         # Not a valid block
@@ -55,16 +56,17 @@ def document_cells(block, forward=True, cell_list=None):
         return
 
     if cell_list is not None:
-        cell_list = sorted(cell_list)
+        # Tuples with only the block number sort before the cells in the
+        # same block, so the cells around block can be found by bisection
         block_line = block.blockNumber()
         if forward:
-            for cell_line, oedata in cell_list:
-                if cell_line >= block_line:
-                    yield oedata
+            index = bisect.bisect_left(cell_list, (block_line,))
+            indexes = range(index, len(cell_list))
         else:
-            for cell_line, oedata in cell_list[::-1]:
-                if cell_line <= block_line:
-                    yield oedata
+            index = bisect.bisect_left(cell_list, (block_line + 1,))
+            indexes = range(index - 1, -1, -1)
+        for index in indexes:
+            yield cell_list[index][1]
         return
 
     # If the cell_list was not provided, search the cells
@@ -90,15 +92,16 @@ def is_cell_header(block):
             and data.oedata.def_type == OutlineExplorerData.CELL)
 
 
-def cell_index(block):
+def cell_index(block, cell_list=None):
     """Get the cell index of the given block."""
-    index = len(list(document_cells(block, forward=False)))
+    index = len(list(document_cells(block, forward=False,
+                                    cell_list=cell_list)))
     if is_cell_header(block):
         return index + 1
     return index
 
 
-def cell_name(block):
+def cell_name(block, cell_list=None):
     """
     Get the cell name the block is in.
 
@@ -108,15 +111,16 @@ def cell_name(block):
         header = block.userData().oedata
     else:
         try:
-            header = next(document_cells(block, forward=False))
+            header = next(document_cells(block, forward=False,
+                                         cell_list=cell_list))
         except StopIteration:
             # This cell has no header, so it is the first cell.
             return 0
     if header.has_name():
-        return header.def_name
+        return header.get_cell_name(cell_list)
     else:
         # No name, return the index
-        return cell_index(block)
+        return cell_index(block, cell_list)
 
 
 class OutlineExplorerProxy(QObject):
@@ -234,19 +238,22 @@ def def_name(self):
         if self.def_type != self.CELL:
             return self._def_name
 
-        def get_name(oedata):
-            name = oedata._def_name
-            if not name:
-                name = _('Unnamed Cell')
-            return name
+        return self.get_cell_name()
 
-        self_name = get_name(self)
+    def get_cell_name(self, cell_list=None):
+        """
+        Get the unique name of this cell.
+
+        `cell_list` is the sorted list of all cells in the document, as
+        in `document_cells`.
+        """
+        self_name = self.get_base_name()
 
         existing_numbers = []
 
         def check_match(oedata):
             # Look for "string"
-            other_name = get_name(oedata)
+            other_name = oedata.get_base_name()
             pattern = '^' + re.escape(self_name) + r'(?:, #(\d+))?$'
             match = re.match(pattern, other_name)
             if match:
@@ -259,13 +266,15 @@ def check_match(oedata):
 
         # Count cells
         N_prev = 0
-        for oedata in document_cells(self.block, forward=False):
+        for oedata in document_cells(self.block, forward=False,
+                                     cell_list=cell_list):
             if check_match(oedata):
                 N_prev += 1
         N_fix_previous = len(existing_numbers)
 
         N_next = 0
-        for oedata in document_cells(self.block, forward=True):
+        for oedata in document_cells(self.block, forward=True,
+                                     cell_list=cell_list):
             if check_match(oedata):
                 N_next += 1
 
@@ -304,6 +313,13 @@ def update(self, other):
             return True
         return False
 
+    def get_base_name(self):
+        """Get the name written in the cell header, or the default one."""
+        name = self._def_name
+        if not name:
+            name = _('Unnamed Cell')
+        return name
+
     def is_valid(self):
         """Check if the oedata has a valid block attached."""
         block = self.block
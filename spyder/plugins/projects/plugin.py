@@ -77,6 +77,59 @@ class Projects(SpyderPluginWidget):
     sig_project_closed = Signal(object)
     sig_pythonpath_changed = Signal()
 
+    sig_file_created = Signal(str, bool)
+    """
+    This signal is emitted when a file or folder is created in the current
+    project.
+
+    Parameters
+    ----------
+    path: str
+        Path of the created file or folder.
+    is_dir: bool
+        Whether the path is a folder.
+    """
+
+    sig_file_moved = Signal(str, str, bool)
+    """
+    This signal is emitted when a file or folder is moved in the current
+    project.
+
+    Parameters
+    ----------
+    src_path: str
+        Original path of the file or folder.
+    dest_path: str
+        New path of the file or folder.
+    is_dir: bool
+        Whether the path is a folder.
+    """
+
+    sig_file_deleted = Signal(str, bool)
+    """
+    This signal is emitted when a file or folder is deleted in the current
+    project.
+
+    Parameters
+    ----------
+    path: str
+        Path of the deleted file or folder.
+    is_dir: bool
+        Whether the path is a folder.
+    """
+
+    sig_file_modified = Signal(str, bool)
+    """
+    This signal is emitted when a file is modified in the current project.
+
+    Parameters
+    ----------
+    path: str
+        Path of the modified file or folder.
+    is_dir: bool
+        Whether the path is a folder.
+    """
+
     def __init__(self, parent=None):
         """Initialization."""
         SpyderPluginWidget.__init__(self, parent)
@@ -87,6 +140,7 @@ def __init__(self, parent=None):
             show_hscrollbar=self.get_option('show_hscrollbar'),
             options_button=self.options_button,
             single_click_to_open=CONF.get('explorer', 'single_click_to_open'),
+            hide_ignored_files=self.get_option('hide_ignored_files'),
         )
 
         layout = QVBoxLayout()
@@ -102,6 +156,13 @@ def __init__(self, parent=None):
         self.watcher.connect_signals(self)
         self._project_types = OrderedDict()
 
+        # Let other plugins know about filesystem changes in the project
+        event_handler = self.watcher.event_handler
+        event_handler.sig_file_created.connect(self.sig_file_created)
+        event_handler.sig_file_moved.connect(self.sig_file_moved)
+        event_handler.sig_file_deleted.connect(self.sig_file_deleted)
+        event_handler.sig_file_modified.connect(self.sig_file_modified)
+
     #------ SpyderPluginWidget API ---------------------------------------------
     def get_plugin_title(self):
         """Return widget title"""
@@ -160,6 +221,7 @@ def register_plugin(self):
 
         self.add_dockwidget()
         self.explorer.sig_open_file.connect(self.main.open_file)
+        self.explorer.sig_option_changed.connect(self.set_hide_ignored_files)
         self.register_widget_shortcuts(treewidget)
 
         treewidget.sig_delete_project.connect(self.delete_project)
@@ -238,6 +300,11 @@ def set_single_click_to_open(self, option, value):
         if option == 'single_click_to_open':
             self.explorer.treewidget.set_single_click_to_open(value)
 
+    def set_hide_ignored_files(self, option, value):
+        """Save the option to hide files ignored by version control."""
+        if option == 'hide_ignored_files':
+            self.set_option(option, value)
+
     def closing_plugin(self, cancelable=False):
         """Perform actions before parent main window is closed"""
         self.save_config()
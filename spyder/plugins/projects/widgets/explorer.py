@@ -32,11 +32,14 @@ class ExplorerTreeWidget(FilteredDirView):
 
     sig_delete_project = Signal()
 
-    def __init__(self, parent, show_hscrollbar=True):
+    def __init__(self, parent, show_hscrollbar=True,
+                 hide_ignored_files=False):
         FilteredDirView.__init__(self, parent)
         self.last_folder = None
         self.setSelectionMode(FilteredDirView.ExtendedSelection)
         self.show_hscrollbar = show_hscrollbar
+        self.hide_ignored_files = hide_ignored_files
+        self.proxymodel.set_hide_ignored(hide_ignored_files)
 
         # Enable drag & drop events
         self.setDragEnabled(True)
@@ -53,7 +56,13 @@ def setup_common_actions(self):
         hscrollbar_action.setChecked(self.show_hscrollbar)
         self.toggle_hscrollbar(self.show_hscrollbar)
 
-        return actions + [hscrollbar_action]
+        # Toggle files ignored by version control
+        hide_ignored_action = create_action(
+            self, _("Hide files ignored by version control"),
+            toggled=self.toggle_hide_ignored_files)
+        hide_ignored_action.setChecked(self.hide_ignored_files)
+
+        return actions + [hscrollbar_action, hide_ignored_action]
 
     #------Public API----------------------------------------------------------
     @Slot(bool)
@@ -68,6 +77,14 @@ def toggle_hscrollbar(self, checked):
         except:  # support for qtpy<1.2.0
             self.header().setResizeMode(QHeaderView.ResizeToContents)
 
+    @Slot(bool)
+    def toggle_hide_ignored_files(self, checked):
+        """Toggle files ignored by version control"""
+        self.parent_widget.sig_option_changed.emit('hide_ignored_files',
+                                                   checked)
+        self.hide_ignored_files = checked
+        self.proxymodel.set_hide_ignored(checked)
+
     #---- Internal drag & drop
     def dragMoveEvent(self, event):
         """Reimplement Qt method"""
@@ -173,13 +190,17 @@ class ProjectExplorerWidget(QWidget):
     sig_open_file = Signal(str)
 
     def __init__(self, parent, name_filters=[], show_hscrollbar=True,
-                 options_button=None, single_click_to_open=False):
+                 options_button=None, single_click_to_open=False,
+                 hide_ignored_files=False):
         QWidget.__init__(self, parent)
 
         self.name_filters = name_filters
         self.show_hscrollbar = show_hscrollbar
+        self.hide_ignored_files = hide_ignored_files
 
-        self.treewidget = ExplorerTreeWidget(self, self.show_hscrollbar)
+        self.treewidget = ExplorerTreeWidget(
+            self, self.show_hscrollbar,
+            hide_ignored_files=self.hide_ignored_files)
         self.treewidget.setup(
             name_filters=self.name_filters,
             single_click_to_open=False,
@@ -64,5 +64,33 @@ def test_project_explorer(project_explorer, qtbot):
     assert project
 
 
+@pytest.mark.change_directory
+def test_hide_ignored_files(project_explorer, qtbot):
+    """Test hiding files ignored by version control."""
+    project = project_explorer
+    project_dir = project.directory
+    os.mkdir(osp.join(project_dir, '.git'))
+    os.mkdir(osp.join(project_dir, 'build'))
+    for fname in ['.gitignore', 'script.py', 'error.log']:
+        open(osp.join(project_dir, fname), 'w').close()
+    with open(osp.join(project_dir, '.gitignore'), 'w') as f:
+        f.write('*.log\nbuild/\n')
+
+    treewidget = project.explorer.treewidget
+
+    def visible(name):
+        index = treewidget.fsmodel.index(osp.join(project_dir, name))
+        return treewidget.proxymodel.mapFromSource(index).isValid()
+
+    treewidget.toggle_hide_ignored_files(True)
+    assert visible('script.py')
+    assert not visible('error.log')
+    assert not visible('build')
+
+    treewidget.toggle_hide_ignored_files(False)
+    assert visible('error.log')
+    assert visible('build')
+
+
 if __name__ == "__main__":
     pytest.main()
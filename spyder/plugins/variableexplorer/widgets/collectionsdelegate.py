@@ -62,6 +62,15 @@ def set_value(self, index, value):
         if index.isValid():
             index.model().set_value(index, value)
 
+    def open_data_view(self, index):
+        """
+        Open a view of the variable associated to a TableModel index, to
+        browse it without getting its value.
+
+        Only remote variables can have views, so this returns None.
+        """
+        return None
+
     def show_warning(self, index):
         """
         Decide if showing a warning when the user is trying to view
@@ -102,6 +111,12 @@ def createEditor(self, parent, option, index, object_explorer=False):
         if index.column() < 3:
             return None
         if self.show_warning(index):
+            # Big data frames are browsed without getting their value
+            if DataFrame is not FakeObject and not object_explorer:
+                view = self.open_data_view(index)
+                if view is not None:
+                    self.create_data_view_editor(parent, index, view)
+                    return None
             answer = QMessageBox.warning(
                 self.parent(), _("Warning"),
                 _("Opening this variable can be slow\n\n"
@@ -173,6 +188,9 @@ def createEditor(self, parent, option, index, object_explorer=False):
         # ArrayEditor for a Numpy array
         elif (isinstance(value, (ndarray, MaskedArray)) and
                 ndarray is not FakeObject and not object_explorer):
+            # Arrays received from the kernel can be read only
+            if not readonly and not value.flags.writeable:
+                value = value.copy()
             editor = ArrayEditor(parent=parent)
             if not editor.setup_and_check(value, title=key, readonly=readonly):
                 return
@@ -276,6 +294,16 @@ def createEditor(self, parent, option, index, object_explorer=False):
                                             key=key, readonly=readonly))
             return None
 
+    def create_data_view_editor(self, parent, index, view):
+        """Create a read-only DataFrameEditor for a view of a variable."""
+        key = index.model().get_key(index)
+        editor = DataFrameEditor(parent=parent)
+        editor.setup_and_check(view, title=key)
+        editor.dataModel.set_format(index.model().dataframe_format)
+        editor.sig_option_changed.connect(self.change_option)
+        self.create_dialog(editor, dict(model=index.model(), editor=editor,
+                                        key=key, readonly=True, view=view))
+
     def create_dialog(self, editor, data):
         self._editors[id(editor)] = data
         editor.accepted.connect(
@@ -314,17 +342,26 @@ def editor_accepted(self, editor_id):
             self._editors.pop(editor_id)
         except KeyError:
             pass
+        self.close_data_view(data)
         self.free_memory()
 
     def editor_rejected(self, editor_id):
         # This is needed to avoid the problem reported on
         # spyder-ide/spyder#8557.
         try:
-            self._editors.pop(editor_id)
+            data = self._editors.pop(editor_id)
         except KeyError:
             pass
+        else:
+            self.close_data_view(data)
         self.free_memory()
 
+    def close_data_view(self, data):
+        """Close the view shown by an editor, if any."""
+        view = data.get('view')
+        if view is not None:
+            view.close()
+
     def free_memory(self):
         """Free memory after closing an editor."""
         try:
@@ -494,6 +531,9 @@ def createEditor(self, parent, option, index):
         # ArrayEditor for a Numpy array
         elif (isinstance(value, (ndarray, MaskedArray)) and
                 ndarray is not FakeObject):
+            # Arrays received from the kernel can be read only
+            if not readonly and not value.flags.writeable:
+                value = value.copy()
             editor = ArrayEditor(parent=parent)
             if not editor.setup_and_check(value, title=key, readonly=readonly):
                 return
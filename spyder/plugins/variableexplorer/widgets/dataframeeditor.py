@@ -33,6 +33,10 @@
 """
 
 # Standard library imports
+from collections import OrderedDict
+from functools import partial
+import logging
+import time
 
 # Third party imports
 from qtpy.compat import from_qvariant, to_qvariant
@@ -64,6 +68,9 @@
 from spyder.plugins.variableexplorer.widgets.arrayeditor import get_idx_rect
 from spyder.plugins.variableexplorer.widgets.basedialog import BaseDialog
 
+
+logger = logging.getLogger(__name__)
+
 # Supported Numbers and complex numbers
 REAL_NUMBER_TYPES = (float, int, np.int64, np.int32)
 COMPLEX_NUMBER_TYPES = (complex, np.complex64, np.complex128)
@@ -80,6 +87,17 @@
 ROWS_TO_LOAD = 500
 COLS_TO_LOAD = 40
 
+# Number of cells formatted and colored at once for display
+DISPLAY_BLOCK_ROWS = 100
+DISPLAY_BLOCK_COLS = 20
+
+# Number of blocks of cells and labels kept by the caches of the models
+MAX_CACHED_BLOCKS = 16
+
+# Seconds after which blocks requested to the kernel are requested again
+# if they were not received
+BLOCK_REQUEST_TIMEOUT = 30
+
 # Background colours
 BACKGROUND_NUMBER_MINHUE = 0.66 # hue for largest number
 BACKGROUND_NUMBER_HUERANGE = 0.33 # (hue for smallest) minus (hue for largest)
@@ -110,6 +128,19 @@ def global_max(col_vals, index):
     return max(max_col), min(min_col)
 
 
+def get_cell_value(df, row, column):
+    """Return the value of a DataFrame cell."""
+    # To increase the performance iat is used but that requires error
+    # handling, so fallback uses iloc
+    try:
+        value = df.iat[row, column]
+    except OutOfBoundsDatetime:
+        value = df.iloc[:, column].astype(str).iat[row]
+    except:
+        value = df.iloc[row, column]
+    return value
+
+
 class DataFrameModel(QAbstractTableModel):
     """ DataFrame Table Model.
 
@@ -124,16 +155,25 @@ def __init__(self, dataFrame, format=DEFAULT_FORMAT, parent=None):
         QAbstractTableModel.__init__(self)
         self.dialog = parent
         self.df = dataFrame
+        # Frames received from the kernel can be read only, so they are
+        # copied the first time a cell can't be set (see `_set_cell`)
+        self._df_copied = False
         self.df_columns_list = None
         self.df_index_list = None
         self._format = format
         self.complex_intran = None
         self.display_error_idxs = []
 
-        self.total_rows = self.df.shape[0]
-        self.total_cols = self.df.shape[1]
+        # Blocks of display strings and background colors of the cells
+        self._texts = OrderedDict()
+        self._colors = OrderedDict()
+
+        self.total_rows = self.shape[0]
+        self.total_cols = self.shape[1]
         size = self.total_rows * self.total_cols
 
+        # Column statistics of large frames are computed when background
+        # colors are enabled
         self.max_min_col = None
         if size < LARGE_SIZE:
             self.max_min_col_update()
@@ -229,7 +269,7 @@ def name(self, axis, level):
         if ax.name:
             return ax.name
 
-    def max_min_col_update(self):
+    def max_min_col_update(self, column=None):
         """
         Determines the maximum and minimum number in each column.
 
@@ -241,25 +281,40 @@ def max_min_col_update(self):
         is set to None. If the dtype is complex, then compute the maximum and
         minimum of the absolute values. If vmax equals vmin, then vmin is
         decreased by one.
+
+        The columns of each kind are reduced all at once. If column is
+        given, only its entry is updated.
         """
         if self.df.shape[0] == 0: # If no rows to compute max/min then return
             return
-        self.max_min_col = []
-        for dummy, col in self.df.iteritems():
-            if col.dtype in REAL_NUMBER_TYPES + COMPLEX_NUMBER_TYPES:
-                if col.dtype in REAL_NUMBER_TYPES:
-                    vmax = col.max(skipna=True)
-                    vmin = col.min(skipna=True)
-                else:
-                    vmax = col.abs().max(skipna=True)
-                    vmin = col.abs().min(skipna=True)
+        if column is None or self.max_min_col is None:
+            self.max_min_col = [None] * self.df.shape[1]
+            columns = range(self.df.shape[1])
+        else:
+            self.max_min_col[column] = None
+            columns = [column]
+
+        dtypes = self.df.dtypes
+        real = [i for i in columns if dtypes.iat[i] in REAL_NUMBER_TYPES]
+        complex_ = [i for i in columns
+                    if dtypes.iat[i] in COMPLEX_NUMBER_TYPES]
+        for positions in (real, complex_):
+            if not positions:
+                continue
+            if len(positions) == self.df.shape[1]:
+                values = self.df
+            else:
+                values = self.df.iloc[:, positions]
+            if positions is complex_:
+                values = values.abs()
+            vmaxs = values.max(skipna=True).tolist()
+            vmins = values.min(skipna=True).tolist()
+            for i, vmax, vmin in zip(positions, vmaxs, vmins):
                 if vmax != vmin:
-                    max_min = [vmax, vmin]
+                    self.max_min_col[i] = [vmax, vmin]
                 else:
-                    max_min = [vmax, vmin - 1]
-            else:
-                max_min = None
-            self.max_min_col.append(max_min)
+                    self.max_min_col[i] = [vmax, vmin - 1]
+        self._colors.clear()
 
     def get_format(self):
         """Return current format"""
@@ -269,10 +324,15 @@ def get_format(self):
     def set_format(self, format):
         """Change display format"""
         self._format = format
+        self._texts.clear()
         self.reset()
 
     def bgcolor(self, state):
         """Toggle backgroundcolor"""
+        if state > 0 and self.max_min_col is None:
+            self.max_min_col_update()
+            if self.max_min_col is None:
+                return
         self.bgcolor_enabled = state > 0
         self.reset()
 
@@ -283,79 +343,123 @@ def colum_avg(self, state):
             self.return_max = lambda col_vals, index: col_vals[index]
         else:
             self.return_max = global_max
+        self._colors.clear()
         self.reset()
 
+    def _get_cached(self, cache, row, column, compute_block):
+        """
+        Return the item of a cell from a cache of blocks of cells.
+
+        compute_block is called with the first row and column of a block
+        to get it as a list of rows when it's not cached.
+        """
+        key = (row - row % DISPLAY_BLOCK_ROWS,
+               column - column % DISPLAY_BLOCK_COLS)
+        try:
+            block = cache.pop(key)
+        except KeyError:
+            block = compute_block(*key)
+            if len(cache) >= MAX_CACHED_BLOCKS:
+                cache.popitem(last=False)
+        cache[key] = block
+        return block[row - key[0]][column - key[1]]
+
+    def _block_cells(self, start_row, start_column):
+        """Return the ranges of rows and columns of a block."""
+        rows = range(start_row,
+                     min(start_row + DISPLAY_BLOCK_ROWS, self.total_rows))
+        columns = range(start_column,
+                        min(start_column + DISPLAY_BLOCK_COLS,
+                            self.total_cols))
+        return rows, columns
+
+    def _get_color_block(self, start_row, start_column):
+        """Compute the background colors of a block of cells."""
+        rows, columns = self._block_cells(start_row, start_column)
+        string_color = QColor(BACKGROUND_NONNUMBER_COLOR)
+        string_color.setAlphaF(BACKGROUND_STRING_ALPHA)
+        misc_color = QColor(BACKGROUND_NONNUMBER_COLOR)
+        misc_color.setAlphaF(BACKGROUND_MISC_ALPHA)
+
+        block_columns = []
+        for column in columns:
+            values = [self.get_value(row, column) for row in rows]
+            colors = [string_color if is_text_string(value) else misc_color
+                      for value in values]
+            if self.max_min_col[column] is not None:
+                # Hues of all numbers are computed at once
+                numbers = np.array(values)
+                if numbers.dtype.kind == 'c':
+                    numbers = np.abs(numbers)
+                numbers = numbers.astype(float)
+                vmax, vmin = self.return_max(self.max_min_col, column)
+                if vmax - vmin == 0:
+                    vmax_vmin_diff = 1.0
+                else:
+                    vmax_vmin_diff = vmax - vmin
+                hues = (BACKGROUND_NUMBER_MINHUE +
+                        BACKGROUND_NUMBER_HUERANGE *
+                        (vmax - numbers) / (vmax_vmin_diff))
+                hues = np.minimum(np.abs(hues), 1)
+                for i in np.flatnonzero(~np.isnan(numbers)):
+                    colors[i] = QColor.fromHsvF(
+                        float(hues[i]), BACKGROUND_NUMBER_SATURATION,
+                        BACKGROUND_NUMBER_VALUE, BACKGROUND_NUMBER_ALPHA)
+            block_columns.append(colors)
+        return [list(row) for row in zip(*block_columns)]
+
     def get_bgcolor(self, index):
         """Background color depending on value."""
-        column = index.column()
         if not self.bgcolor_enabled:
             return
-        value = self.get_value(index.row(), column)
-        if self.max_min_col[column] is None or isna(value):
-            color = QColor(BACKGROUND_NONNUMBER_COLOR)
-            if is_text_string(value):
-                color.setAlphaF(BACKGROUND_STRING_ALPHA)
-            else:
-                color.setAlphaF(BACKGROUND_MISC_ALPHA)
-        else:
-            if isinstance(value, COMPLEX_NUMBER_TYPES):
-                color_func = abs
-            else:
-                color_func = float
-            vmax, vmin = self.return_max(self.max_min_col, column)
-            if vmax - vmin == 0:
-                vmax_vmin_diff = 1.0
-            else:
-                vmax_vmin_diff = vmax - vmin
-            hue = (BACKGROUND_NUMBER_MINHUE + BACKGROUND_NUMBER_HUERANGE *
-                   (vmax - color_func(value)) / (vmax_vmin_diff))
-            hue = float(abs(hue))
-            if hue > 1:
-                hue = 1
-            color = QColor.fromHsvF(hue, BACKGROUND_NUMBER_SATURATION,
-                                    BACKGROUND_NUMBER_VALUE,
-                                    BACKGROUND_NUMBER_ALPHA)
-        return color
+        return self._get_cached(self._colors, index.row(), index.column(),
+                                self._get_color_block)
 
     def get_value(self, row, column):
         """Return the value of the DataFrame."""
-        # To increase the performance iat is used but that requires error
-        # handling, so fallback uses iloc
-        try:
-            value = self.df.iat[row, column]
-        except OutOfBoundsDatetime:
-            value = self.df.iloc[:, column].astype(str).iat[row]
-        except:
-            value = self.df.iloc[row, column]
-        return value
+        return get_cell_value(self.df, row, column)
+
+    def get_slice(self, rows, columns):
+        """Return the DataFrame of the given row and column slices."""
+        return self.df.iloc[rows, columns]
+
+    def get_text(self, row, column):
+        """Return the text to display for a value of the DataFrame."""
+        value = self.get_value(row, column)
+        if isinstance(value, float):
+            try:
+                return self._format % value
+            except (ValueError, TypeError):
+                # may happen if format = '%d' and value = NaN;
+                # see spyder-ide/spyder#4139.
+                return DEFAULT_FORMAT % value
+        elif is_type_text_string(value):
+            # Don't perform any conversion on strings
+            # because it leads to differences between
+            # the data present in the dataframe and
+            # what is shown by Spyder
+            return value
+        else:
+            try:
+                return to_text_string(value)
+            except Exception:
+                self.display_error_idxs.append(self.createIndex(row, column))
+                return u'Display Error!'
+
+    def _get_text_block(self, start_row, start_column):
+        """Compute the display strings of a block of cells."""
+        rows, columns = self._block_cells(start_row, start_column)
+        return [[self.get_text(row, column) for column in columns]
+                for row in rows]
 
     def data(self, index, role=Qt.DisplayRole):
         """Cell content"""
         if not index.isValid():
             return to_qvariant()
         if role == Qt.DisplayRole or role == Qt.EditRole:
-            column = index.column()
-            row = index.row()
-            value = self.get_value(row, column)
-            if isinstance(value, float):
-                try:
-                    return to_qvariant(self._format % value)
-                except (ValueError, TypeError):
-                    # may happen if format = '%d' and value = NaN;
-                    # see spyder-ide/spyder#4139.
-                    return to_qvariant(DEFAULT_FORMAT % value)
-            elif is_type_text_string(value):
-                # Don't perform any conversion on strings
-                # because it leads to differences between
-                # the data present in the dataframe and
-                # what is shown by Spyder
-                return value
-            else:
-                try:
-                    return to_qvariant(to_text_string(value))
-                except Exception:
-                    self.display_error_idxs.append(index)
-                    return u'Display Error!'
+            return to_qvariant(self._get_cached(self._texts, index.row(),
+                                                index.column(),
+                                                self._get_text_block))
         elif role == Qt.BackgroundColorRole:
             return to_qvariant(self.get_bgcolor(index))
         elif role == Qt.FontRole:
@@ -410,6 +514,8 @@ def sort(self, column, order=Qt.AscendingOrder):
                                  "TypeError error: %s" % str(e))
             return False
 
+        self._texts.clear()
+        self._colors.clear()
         self.reset()
         return True
 
@@ -431,9 +537,9 @@ def setData(self, index, value, role=Qt.EditRole, change_type=None):
                 val = from_qvariant(value, str)
                 if change_type is bool:
                     val = bool_false_check(val)
-                self.df.iloc[row, column] = change_type(val)
+                self._set_cell(row, column, change_type(val))
             except ValueError:
-                self.df.iloc[row, column] = change_type('0')
+                self._set_cell(row, column, change_type('0'))
         else:
             val = from_qvariant(value, str)
             current_value = self.get_value(row, column)
@@ -443,7 +549,8 @@ def setData(self, index, value, role=Qt.EditRole, change_type=None):
             if (isinstance(current_value, supported_types) or
                     is_text_string(current_value)):
                 try:
-                    self.df.iloc[row, column] = current_value.__class__(val)
+                    self._set_cell(row, column,
+                                   current_value.__class__(val))
                 except (ValueError, OverflowError) as e:
                     QMessageBox.critical(self.dialog, "Error",
                                          str(type(e).__name__) + ": " + str(e))
@@ -453,10 +560,24 @@ def setData(self, index, value, role=Qt.EditRole, change_type=None):
                                      "Editing dtype {0!s} not yet supported."
                                      .format(type(current_value).__name__))
                 return False
-        self.max_min_col_update()
+        if self.max_min_col is not None:
+            self.max_min_col_update(column)
+        self._texts.pop((row - row % DISPLAY_BLOCK_ROWS,
+                         column - column % DISPLAY_BLOCK_COLS), None)
         self.dataChanged.emit(index, index)
         return True
 
+    def _set_cell(self, row, column, value):
+        """Set the value of a cell, copying read-only frames if needed."""
+        try:
+            self.df.iloc[row, column] = value
+        except ValueError:
+            if self._df_copied:
+                raise
+            self.df = self.df.copy()
+            self._df_copied = True
+            self.df.iloc[row, column] = value
+
     def get_data(self):
         """Return data"""
         return self.df
@@ -498,7 +619,7 @@ def columnCount(self, index=QModelIndex()):
         # See spyder-ide/spyder#8910.
         try:
             # This is done to implement series
-            if len(self.df.shape) == 1:
+            if len(self.shape) == 1:
                 return 2
             elif self.total_cols <= self.cols_loaded:
                 return self.total_cols
@@ -512,6 +633,196 @@ def reset(self):
         self.endResetModel()
 
 
+class RemoteDataFrameModel(DataFrameModel):
+    """
+    DataFrame Table Model for a view of a DataFrame kept in the kernel.
+
+    Only the blocks of cells and labels being displayed are requested to
+    the kernel, and just the last MAX_CACHED_BLOCKS of them are kept.
+    Blocks are requested without waiting for them, so cells and labels are
+    empty until their block is received. The data can't be edited.
+
+    Signals
+    -------
+    sig_blocks_received(): Raised after a block is received.
+    """
+    sig_blocks_received = Signal()
+
+    def __init__(self, view, format=DEFAULT_FORMAT, parent=None):
+        self.view = view
+        self._blocks = OrderedDict()
+        self._headers = OrderedDict()
+
+        # Maps the keys of the blocks waiting for the kernel to the time
+        # they were requested
+        self._requested = {}
+
+        # Replies to requests made before the cache was cleared are dropped
+        self._generation = 0
+
+        # Whether a block was missing while computing the items of cells
+        self._missing = False
+
+        DataFrameModel.__init__(self, None, format=format, parent=parent)
+        self.view.error_callback = self._forget_requests
+
+    def _fetch(self, cache, key, method, *args):
+        """
+        Return a block received from the kernel, or None if it's not
+        received yet, in which case it's requested.
+        """
+        try:
+            block = cache.pop(key)
+        except KeyError:
+            requested = self._requested.get((id(cache), key))
+            if (requested is None or
+                    time.monotonic() - requested > BLOCK_REQUEST_TIMEOUT):
+                self._requested[(id(cache), key)] = time.monotonic()
+                method(*args, callback=partial(
+                    self._receive_block, self._generation, cache, key))
+            self._missing = True
+            return None
+        cache[key] = block
+        return block
+
+    def _receive_block(self, generation, cache, key, block):
+        """Cache a block received from the kernel and show it."""
+        if (generation != self._generation or
+                self._requested.pop((id(cache), key), None) is None):
+            return
+        if len(cache) >= MAX_CACHED_BLOCKS:
+            cache.popitem(last=False)
+        cache[key] = block
+        self.sig_blocks_received.emit()
+
+    def _forget_requests(self):
+        """
+        Forget the blocks waiting for the kernel after one of them failed,
+        so they are requested again the next time they are displayed.
+        """
+        self._requested.clear()
+
+    def _get_cached(self, cache, row, column, compute_block):
+        """
+        Return the item of a cell from a cache of blocks of cells.
+
+        Blocks of items computed while some cells were not received are
+        not cached.
+        """
+        self._missing = False
+        item = DataFrameModel._get_cached(self, cache, row, column,
+                                          compute_block)
+        if self._missing:
+            cache.pop((row - row % DISPLAY_BLOCK_ROWS,
+                       column - column % DISPLAY_BLOCK_COLS))
+        return item
+
+    def clear_cache(self):
+        """Forget all the blocks received from the kernel."""
+        self._blocks.clear()
+        self._headers.clear()
+        self._requested.clear()
+        self._generation += 1
+        self._texts.clear()
+        self._colors.clear()
+
+    @property
+    def shape(self):
+        """Return the shape of the dataframe."""
+        return self.view.shape
+
+    @property
+    def header_shape(self):
+        """Return the levels for the columns and rows of the dataframe."""
+        return self.view.header_shape
+
+    def header(self, axis, x, level=0):
+        """
+        Return the values of the labels for the header of columns or rows.
+
+        The value corresponds to the header of column or row x in the
+        given level.
+        """
+        size = COLS_TO_LOAD if axis == 0 else ROWS_TO_LOAD
+        start = x - x % size
+        labels = self._fetch(self._headers, (axis, start),
+                             self.view.get_header, axis, start, start + size)
+        if labels is None:
+            return ''
+        label = labels[x - start]
+        if self.header_shape[axis] > 1:
+            return label[level]
+        return label
+
+    def name(self, axis, level):
+        """Return the labels of the levels if any."""
+        names = self.view.names[axis]
+        if len(names) > 1:
+            return names[level]
+        if names[0]:
+            return names[0]
+
+    def max_min_col_update(self, column=None):
+        """
+        Determines the maximum and minimum number in each column.
+
+        They are computed by the kernel.
+        """
+        try:
+            self.max_min_col = self.view.get_minmax()
+        except Exception:
+            logger.debug("Statistics of %s not fetched", self.view.type_name,
+                         exc_info=True)
+        self._colors.clear()
+
+    def get_value(self, row, column):
+        """Return the value of the DataFrame."""
+        start_row = row - row % ROWS_TO_LOAD
+        start_col = column - column % COLS_TO_LOAD
+        block = self._fetch(self._blocks, (start_row, start_col),
+                            self.view.get_window, start_row,
+                            start_row + ROWS_TO_LOAD, start_col,
+                            start_col + COLS_TO_LOAD)
+        if block is None:
+            return ''
+        return get_cell_value(block, row - start_row, column - start_col)
+
+    def get_slice(self, rows, columns):
+        """Return the DataFrame of the given row and column slices."""
+        return self.view.get_window(rows.start, rows.stop, columns.start,
+                                    columns.stop)
+
+    def recalculate_index(self):
+        """Recalcuate index information."""
+        self.clear_cache()
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        """Overriding sort method"""
+        ascending = order == Qt.AscendingOrder
+        try:
+            self.view.sort(column, ascending)
+        except Exception as e:
+            QMessageBox.critical(self.dialog, "Error",
+                                 "%s: %s" % (type(e).__name__,
+                                             to_text_string(e)))
+            return False
+        self.clear_cache()
+        self.reset()
+        return True
+
+    def flags(self, index):
+        """Set flags"""
+        return QAbstractTableModel.flags(self, index)
+
+    def setData(self, index, value, role=Qt.EditRole, change_type=None):
+        """Cell content change"""
+        return False
+
+    def get_data(self):
+        """Return data"""
+        return None
+
+
 class DataFrameView(QTableView):
     """
     Data Frame view class.
@@ -638,9 +949,8 @@ def copy(self):
         # Copy index and header too (equal True).
         # See spyder-ide/spyder#11096
         index = header = True
-        df = self.model().df
-        obj = df.iloc[slice(row_min, row_max + 1),
-                      slice(col_min, col_max + 1)]
+        obj = self.model().get_slice(slice(row_min, row_max + 1),
+                                     slice(col_min, col_max + 1))
         output = io.StringIO()
         try:
             obj.to_csv(output, sep='\t', index=index, header=header)
@@ -914,7 +1224,8 @@ def setup_and_check(self, data, title=''):
         """
         Setup DataFrameEditor:
         return False if data is not supported, True otherwise.
-        Supported types for data are DataFrame, Series and Index.
+        Supported types for data are DataFrame, Series and Index, and
+        views of them kept in the kernel, which are shown read-only.
         """
         self._selection_rec = False
         self._model = None
@@ -924,11 +1235,19 @@ def setup_and_check(self, data, title=''):
         self.layout.setContentsMargins(0, 0, 0, 0)
         self.setLayout(self.layout)
         self.setWindowIcon(ima.icon('arredit'))
+        if isinstance(data, (DataFrame, Series, Index)):
+            view = None
+            type_name = data.__class__.__name__
+        else:
+            view = data
+            type_name = view.type_name
         if title:
-            title = to_text_string(title) + " - %s" % data.__class__.__name__
+            title = to_text_string(title) + " - %s" % type_name
         else:
-            title = _("%s editor") % data.__class__.__name__
-        if isinstance(data, Series):
+            title = _("%s editor") % type_name
+        if view is not None:
+            self.is_series = view.is_series
+        elif isinstance(data, Series):
             self.is_series = True
             data = data.to_frame()
         elif isinstance(data, Index):
@@ -949,7 +1268,11 @@ def setup_and_check(self, data, title=''):
         self.create_table_index()
 
         # Create the model and view of the data
-        self.dataModel = DataFrameModel(data, parent=self)
+        if view is None:
+            self.dataModel = DataFrameModel(data, parent=self)
+        else:
+            self.dataModel = RemoteDataFrameModel(view, parent=self)
+            self.dataModel.sig_blocks_received.connect(self._update_tables)
         self.dataModel.dataChanged.connect(self.save_and_close_enable)
         self.create_data_table()
 
@@ -980,11 +1303,10 @@ def setup_and_check(self, data, title=''):
         btn_layout.addWidget(btn)
         btn.clicked.connect(self.resize_to_contents)
 
-        bgcolor = QCheckBox(_('Background color'))
-        bgcolor.setChecked(self.dataModel.bgcolor_enabled)
-        bgcolor.setEnabled(self.dataModel.bgcolor_enabled)
-        bgcolor.stateChanged.connect(self.change_bgcolor_enable)
-        btn_layout.addWidget(bgcolor)
+        self.bgcolor = QCheckBox(_('Background color'))
+        self.bgcolor.setChecked(self.dataModel.bgcolor_enabled)
+        self.bgcolor.stateChanged.connect(self.change_bgcolor_enable)
+        btn_layout.addWidget(self.bgcolor)
 
         self.bgcolor_global = QCheckBox(_('Column min/max'))
         self.bgcolor_global.setChecked(self.dataModel.colum_avg_enabled)
@@ -1013,6 +1335,16 @@ def setup_and_check(self, data, title=''):
 
         return True
 
+    def _update_tables(self):
+        """Repaint the tables after receiving data from the kernel."""
+        for table in (self.dataTable, self.table_header, self.table_index,
+                      self.table_level):
+            table.viewport().update()
+
+        # Visible columns were sized before their data was received
+        self._autosized_cols = set()
+        self._resizeVisibleColumnsToContents()
+
     @Slot(QModelIndex, QModelIndex)
     def save_and_close_enable(self, top_left, bottom_right):
         """Handle the data change event to enable the save and close button."""
@@ -1285,7 +1617,13 @@ def change_bgcolor_enable(self, state):
         This is implementet so column min/max is only active when bgcolor is
         """
         self.dataModel.bgcolor(state)
-        self.bgcolor_global.setEnabled(not self.is_series and state > 0)
+        # Colors stay disabled if column statistics couldn't be computed
+        enabled = self.dataModel.bgcolor_enabled
+        if self.bgcolor.isChecked() != enabled:
+            self.bgcolor.blockSignals(True)
+            self.bgcolor.setChecked(enabled)
+            self.bgcolor.blockSignals(False)
+        self.bgcolor_global.setEnabled(not self.is_series and enabled)
 
     def change_format(self):
         """
@@ -382,7 +382,7 @@ def show_finder(self, set_visible=False):
     def refresh_table(self):
         """Refresh variable table"""
         if self.is_visible and self.isVisible():
-            self.shellwidget.refresh_namespacebrowser()
+            self.shellwidget.refresh_namespacebrowser(full=True)
             try:
                 self.editor.resizeRowToContents()
             except TypeError:
@@ -397,6 +397,31 @@ def process_remote_view(self, remote_view):
         if remote_view is not None:
             self.set_data(remote_view)
 
+    def process_remote_view_changes(self, changes):
+        """
+        Process the changes of the remote view since the last one
+
+        See get_namespace_view_changes in the kernel for their format.
+        """
+        self.finder.text_finder.load_all = False
+
+        changed = changes['changed']
+        removed = changes['removed']
+        if changes['full']:
+            self.set_data(changed)
+            return
+
+        data = self.editor.source_model.get_data()
+        if removed or any(key not in data for key in changed):
+            data = {key: value for key, value in data.items()
+                    if key not in removed}
+            data.update(changed)
+            self.set_data(data)
+        elif changed:
+            # Only values changed, so there's no need to reset the table
+            self.editor.source_model.update_data(changed)
+            self.editor.adjust_columns()
+
     def set_var_properties(self, properties):
         """Set properties of variables"""
         if properties is not None:
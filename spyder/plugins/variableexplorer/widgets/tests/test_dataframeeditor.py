@@ -24,6 +24,7 @@
 # Third party imports
 from pandas import (DataFrame, date_range, read_csv, concat, Index, RangeIndex,
                     MultiIndex, CategoricalIndex, Series)
+from pandas.testing import assert_frame_equal
 from qtpy.QtGui import QColor
 from qtpy.QtCore import Qt, QTimer
 import numpy
@@ -35,7 +36,8 @@
 from spyder.utils.test import close_message_box
 from spyder.plugins.variableexplorer.widgets import dataframeeditor
 from spyder.plugins.variableexplorer.widgets.dataframeeditor import (
-    DataFrameEditor, DataFrameModel)
+    DataFrameEditor, DataFrameModel, RemoteDataFrameModel)
+from spyder_kernels.utils.dataview import DataView
 
 
 # =============================================================================
@@ -351,6 +353,66 @@ def test_dataframemodel_get_bgcolor_with_missings():
             'Wrong bg color for missing of type ' + column
 
 
+def test_dataframemodel_bgcolor_large(monkeypatch):
+    """
+    Test that column statistics of large frames are computed when
+    background colors are enabled.
+    """
+    monkeypatch.setattr(dataframeeditor, 'LARGE_SIZE', 10)
+    df = DataFrame({'a': numpy.arange(10.0), 'b': ['x'] * 10,
+                    'c': numpy.arange(10) * 1j})
+    dfm = DataFrameModel(df)
+    assert not dfm.bgcolor_enabled
+    assert dfm.max_min_col is None
+
+    dfm.bgcolor(2)
+    assert dfm.bgcolor_enabled
+    assert dfm.max_min_col == [[9.0, 0.0], None, [9.0, 0.0]]
+    h0 = dataframeeditor.BACKGROUND_NUMBER_MINHUE
+    dh = dataframeeditor.BACKGROUND_NUMBER_HUERANGE
+    s = dataframeeditor.BACKGROUND_NUMBER_SATURATION
+    v = dataframeeditor.BACKGROUND_NUMBER_VALUE
+    a = dataframeeditor.BACKGROUND_NUMBER_ALPHA
+    assert colorclose(bgcolor(dfm, 0, 0), (h0 + dh, s, v, a))
+    assert colorclose(bgcolor(dfm, 9, 2), (h0, s, v, a))
+
+
+def test_dataframemodel_set_data_updates_caches():
+    """Test that edits update the statistics and texts of their cells."""
+    df = DataFrame([[1.0, 2.0], [3.0, 4.0]])
+    dfm = DataFrameModel(df)
+    assert data(dfm, 0, 0) == '1'
+    assert dfm.max_min_col == [[3.0, 1.0], [4.0, 2.0]]
+
+    assert dfm.setData(dfm.createIndex(0, 0), '5')
+    assert data(dfm, 0, 0) == '5'
+    assert dfm.max_min_col == [[5.0, 3.0], [4.0, 2.0]]
+    h0 = dataframeeditor.BACKGROUND_NUMBER_MINHUE
+    assert colorclose(bgcolor(dfm, 0, 0), (h0, 0.7, 1.0, 0.6))
+
+    dfm.set_format('%.2f')
+    assert data(dfm, 1, 1) == '4.00'
+
+
+def test_dataframemodel_set_data_read_only():
+    """Test that frames received from the kernel in read-only buffers are
+    copied to be edited."""
+    values = numpy.array([[1.0, 2.0], [3.0, 4.0]])
+    values.flags.writeable = False
+    df = DataFrame(values, copy=False)
+    dfm = DataFrameModel(df)
+
+    assert dfm.setData(dfm.createIndex(0, 0), '5')
+    assert data(dfm, 0, 0) == '5'
+    assert dfm.get_data() is not df
+    assert values[0, 0] == 1.0
+
+    # The copy is only made once
+    edited = dfm.get_data()
+    assert dfm.setData(dfm.createIndex(1, 1), '6')
+    assert dfm.get_data() is edited
+
+
 def test_dataframemodel_with_format_percent_d_and_nan():
     """
     Test DataFrameModel with format `%d` and dataframe containing NaN
@@ -750,5 +812,120 @@ def test_no_convert_strings_to_unicode():
     assert data(dfm, 0, 0) != u'файла'
 
 
+def make_remote_view(df):
+    """
+    Return a stand-in for RemoteDataView that calls a view of `df` directly.
+
+    The replies to the requests made with a callback are kept until
+    `send_replies` is called, like if the kernel was busy.
+    """
+    kernel_view = DataView(df)
+    info = kernel_view.get_info()
+    view = Mock(type_name=info['type_name'], is_series=info['is_series'],
+                shape=info['shape'], header_shape=info['header_shape'],
+                names=info['names'], wraps=kernel_view)
+    view.replies = []
+
+    def request(method):
+        def call(*args, **kwargs):
+            value = method(*args)
+            callback = kwargs.get('callback')
+            if callback is None:
+                return value
+            view.replies.append(lambda: callback(value))
+        return call
+
+    def send_replies():
+        while view.replies:
+            view.replies.pop(0)()
+
+    view.get_window.side_effect = request(kernel_view.get_window)
+    view.get_header.side_effect = request(kernel_view.get_header)
+    view.send_replies = send_replies
+    return view
+
+
+def test_remote_dataframemodel(qtbot, monkeypatch):
+    """
+    Test that views of data frames kept in the kernel are browsed by
+    requesting blocks of them, and sorted without changing the data frame.
+    """
+    monkeypatch.setattr(dataframeeditor, 'LARGE_SIZE', 100)
+    monkeypatch.setattr(dataframeeditor, 'ROWS_TO_LOAD', 10)
+    monkeypatch.setattr(dataframeeditor, 'COLS_TO_LOAD', 2)
+    monkeypatch.setattr(dataframeeditor, 'DISPLAY_BLOCK_ROWS', 5)
+    monkeypatch.setattr(dataframeeditor, 'DISPLAY_BLOCK_COLS', 1)
+    monkeypatch.setattr(dataframeeditor, 'MAX_CACHED_BLOCKS', 2)
+    df = DataFrame({'a': numpy.arange(100.0)[::-1], 'b': ['x'] * 100,
+                    'c': numpy.arange(100)})
+    original = df.copy()
+    view = make_remote_view(df)
+
+    editor = DataFrameEditor(None)
+    qtbot.addWidget(editor)
+    editor.setup_and_check(view, title='df')
+    view.send_replies()
+    dfm = editor.model()
+    assert isinstance(dfm, RemoteDataFrameModel)
+    assert editor.windowTitle() == 'df - DataFrame'
+    assert not dfm.flags(dfm.createIndex(0, 0)) & Qt.ItemIsEditable
+
+    # Cells and labels are empty until their block is received
+    assert data(dfm, 15, 2) == ''
+    assert dfm.header(0, 2) == ''
+    assert dfm.header(1, 15) == ''
+    with qtbot.waitSignal(dfm.sig_blocks_received):
+        view.send_replies()
+    assert data(dfm, 0, 0) == '99'
+    assert data(dfm, 15, 2) == '15'
+    assert dfm.header(0, 2) == 'c'
+    assert dfm.header(1, 15) == 15
+
+    # Blocks are cached and only requested once
+    calls = view.get_window.call_count
+    assert data(dfm, 1, 1) == 'x'
+    assert view.get_window.call_count == calls
+    data(dfm, 50, 0)
+    data(dfm, 51, 0)
+    assert view.get_window.call_count == calls + 1
+
+    # Blocks are requested again after a request fails
+    view.replies = []
+    view.error_callback()
+    data(dfm, 50, 0)
+    assert view.get_window.call_count == calls + 2
+    view.send_replies()
+    assert data(dfm, 50, 0) == '49'
+
+    # Sorting is done in the kernel and blocks of the previous order
+    # are dropped
+    data(dfm, 70, 0)
+    assert dfm.sort(0)
+    view.send_replies()
+    assert data(dfm, 70, 0) == ''
+    view.send_replies()
+    assert data(dfm, 0, 0) == '0'
+    assert data(dfm, 70, 0) == '70'
+    assert dfm.header(1, 0) == ''
+    view.send_replies()
+    assert dfm.header(1, 0) == 99
+    assert_frame_equal(df, original)
+
+    # Column statistics are only requested to color cells
+    assert not view.get_minmax.called
+    editor.change_bgcolor_enable(2)
+    assert view.get_minmax.called
+    assert bgcolor(dfm, 0, 0) is not None
+    assert editor.bgcolor.isChecked()
+
+    # Colors stay disabled if the statistics can't be requested
+    editor.bgcolor.setChecked(False)
+    dfm.max_min_col = None
+    view.get_minmax.side_effect = RuntimeError
+    editor.bgcolor.setChecked(True)
+    assert not dfm.bgcolor_enabled
+    assert not editor.bgcolor.isChecked()
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -221,5 +221,39 @@ def test_filtering_with_large_rows(qtbot):
     assert model.rowCount() == 1
 
 
+def test_process_remote_view_changes(qtbot):
+    """
+    Test that the changes of the namespace view are applied to the table.
+    """
+    browser = NamespaceBrowser(None)
+    qtbot.addWidget(browser)
+    browser.set_shellwidget(Mock())
+    browser.setup(exclude_private=True, exclude_uppercase=True,
+                  exclude_capitalized=True, exclude_unsupported=False,
+                  exclude_callables_and_modules=True,
+                  minmax=False)
+    model = browser.editor.model
+
+    def entry(view):
+        return {'type': 'int', 'size': 1, 'color': '#0000ff', 'view': view}
+
+    browser.process_remote_view_changes(
+        {'full': True, 'changed': {'a': entry('1'), 'b': entry('2')},
+         'removed': []})
+    assert model.rowCount() == 2
+
+    # Changed values don't reset the table
+    with qtbot.assertNotEmitted(browser.editor.source_model.modelReset):
+        browser.process_remote_view_changes(
+            {'full': False, 'changed': {'b': entry('3')}, 'removed': []})
+    assert data(model, 1, 3) == '3'
+
+    # Added and removed variables
+    browser.process_remote_view_changes(
+        {'full': False, 'changed': {'c': entry('4')}, 'removed': ['a']})
+    assert [data(model, row, 0) for row in range(model.rowCount())] == [
+        'b', 'c']
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -235,6 +235,241 @@ def get_search_scores(query, choices, ignore_case=True, template='{}',
     return results
 
 
+def get_char_mask(text):
+    """
+    Return a bitmask with one bit set for each character found in `text`.
+
+    Characters share bits modulo 64, so the mask can only be used to discard
+    choices that can't contain a query, not to confirm they do.
+    """
+    mask = 0
+    for char in set(text):
+        mask |= 1 << (ord(char) & 63)
+    return mask
+
+
+def enrich_text(text, spans, template='{}'):
+    """
+    Apply `template` to the parts of `text` given by `spans`.
+
+    Parameters
+    ----------
+    text : str
+        Text to enrich.
+    spans : list of tuples
+        Sorted and non overlapping (start, end) ranges of `text`.
+    template : str, optional
+        Template string to surround the spans with ('{}' by default).
+    """
+    parts = []
+    pos = 0
+    for start, end in spans:
+        parts.append(text[pos:start])
+        parts.append(template.format(text[start:end]))
+        pos = end
+    parts.append(text[pos:])
+    return u''.join(parts)
+
+
+class FuzzyMatcher(object):
+    """
+    Score a list of choices against successive queries.
+
+    This gives the same scores as `get_search_score`, but the lowercase
+    version and a character bitmask of each choice are computed only once,
+    when the choice is added. Choices whose bitmask lacks any character of
+    the query are discarded without being scored. Besides, when a query
+    extends the previous one, only the choices that matched the previous
+    query are considered, as no other choice can match it.
+
+    Parameters
+    ----------
+    choices : list of str, optional
+        Initial list of choices.
+    ignore_case : bool, optional
+        Optional value perform a case insensitive search (True by default).
+    """
+
+    _SEP = u'-'
+    _LET = u'x'
+
+    def __init__(self, choices=(), ignore_case=True):
+        self.ignore_case = ignore_case
+        self.clear()
+        for choice in choices:
+            self.add_choice(choice)
+
+    def __len__(self):
+        return len(self._choices)
+
+    def clear(self):
+        """Remove all choices."""
+        self._choices = []
+        self._lower = []
+        self._words = []
+        self._patterns = []
+        self._masks = []
+        self._reset_cache()
+
+    def add_choice(self, choice):
+        """Add `choice` to the list of choices."""
+        choice = to_text_string(choice, encoding='utf-8')
+        if self.ignore_case:
+            lower = choice.lower()
+            if len(lower) != len(choice):
+                # A few unicode characters change their length when
+                # lowercased, so keep them as they are to be able to map
+                # positions back to the choice.
+                lower = u''.join(char.lower() if len(char.lower()) == 1
+                                 else char for char in choice)
+        else:
+            lower = choice
+        pattern = u''.join(char if char in (u' ', self._SEP) else self._LET
+                           for char in choice)
+
+        self._choices.append(choice)
+        self._lower.append(lower)
+        self._words.append(set(lower.split(u' ')))
+        self._patterns.append(pattern)
+        self._masks.append(get_char_mask(lower))
+        self._reset_cache()
+
+    def get_matches(self, query):
+        """
+        Return the choices matching `query`, ranked by their score.
+
+        Parameters
+        ----------
+        query : str
+            String with letters to search in each choice (in order of
+            appearance). Spaces are ignored.
+
+        Returns
+        -------
+        results : list of tuples
+            List of (score, index, spans) tuples sorted by score, where
+            `index` is the position of the choice in the list of choices and
+            `spans` the (start, end) ranges of the choice to highlight.
+            Lower scores mean a better match.
+        """
+        query = to_text_string(query, encoding='utf-8').replace(u' ', u'')
+        if not query:
+            return []
+        if self.ignore_case:
+            query = query.lower()
+
+        if self._last_query and query.startswith(self._last_query):
+            candidates = self._last_candidates
+        else:
+            candidates = range(len(self._choices))
+
+        query_mask = get_char_mask(query)
+        masks = self._masks
+        candidates = [i for i in candidates
+                      if masks[i] & query_mask == query_mask]
+
+        results = []
+        for i in candidates:
+            match = self._score(i, query)
+            if match is not None:
+                results.append((match[0], i, match[1]))
+
+        self._last_query = query
+        self._last_candidates = [i for __, i, __ in results]
+
+        results.sort()
+        return results
+
+    def get_scores(self, query, template='{}', valid_only=False,
+                   sort=False):
+        """
+        Search for query inside the choices and return a list of tuples.
+
+        The result is the same `get_search_scores` would return for the
+        current choices.
+        """
+        query = to_text_string(query, encoding='utf-8').replace(u' ', u'')
+        if not query:
+            return [(choice, choice, NO_SCORE) for choice in self._choices]
+
+        matches = self.get_matches(query)
+        if valid_only:
+            if not sort:
+                matches = sorted(matches, key=lambda match: match[1])
+            return [(self._choices[i],
+                     enrich_text(self._choices[i], spans, template), score)
+                    for score, i, spans in matches]
+
+        results = [(choice, choice, NOT_FOUND_SCORE)
+                   for choice in self._choices]
+        for score, i, spans in matches:
+            choice = self._choices[i]
+            results[i] = (choice, enrich_text(choice, spans, template),
+                          score)
+        if sort:
+            results = sorted(results, key=lambda row: row[-1])
+        return results
+
+    def _reset_cache(self):
+        self._last_query = u''
+        self._last_candidates = []
+
+    def _score(self, i, query):
+        """
+        Return the (score, spans) of the choice at `i`, or None.
+
+        This follows the precedence explained in `get_search_score`.
+        """
+        lower = self._lower[i]
+        pattern = self._patterns[i]
+        sep = self._SEP
+        length = len(query)
+
+        pos = lower.find(query)
+        if pos == -1:
+            # Find the query letters one by one, leftmost first
+            positions = []
+            index = -1
+            for char in query:
+                index = lower.find(char, index + 1)
+                if index == -1:
+                    return None
+                positions.append(index)
+
+        if pos != -1:
+            if query in self._words[i]:
+                score = pos + 1
+            else:
+                score = pos + 100
+            spans = [(pos, pos + length)]
+            pattern = pattern[:pos] + sep * length + pattern[pos + length:]
+        else:
+            score = positions[0]
+            spans = [(index, index + 1) for index in positions]
+            parts = []
+            start = 0
+            for index in positions:
+                parts.append(pattern[start:index])
+                parts.append(sep)
+                start = index + 1
+            parts.append(pattern[start:])
+            pattern = u''.join(parts)
+
+        for size in range(1, length + 1):
+            score += (length - pattern.count(sep * size)) * 100000
+
+        gaps = [gap for gap in pattern.split(sep) if gap]
+        if not pattern.startswith(sep):
+            gaps = gaps[1:]
+        if not pattern.endswith(sep):
+            gaps = gaps[:-1]
+        for gap in gaps:
+            score += gap.count(u' ') * 10000
+            score += gap.count(self._LET) * 100
+
+        return score, spans
+
+
 def test():
     template = '<b>{0}</b>'
     names = ['close pane', 'debug continue', 'debug exit', 'debug step into',
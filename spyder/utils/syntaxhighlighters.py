@@ -11,6 +11,7 @@
 
 # Standard library imports
 from __future__ import print_function
+from bisect import bisect_left
 import keyword
 import os
 import re
@@ -20,7 +21,7 @@
 from pygments.lexer import RegexLexer, bygroups
 from pygments.lexers import get_lexer_by_name
 from pygments.token import (Text, Other, Keyword, Name, String, Number,
-                            Comment, Generic, Token)
+                            Comment, Generic, Token, Error, _TokenType)
 from qtpy.QtCore import Qt, QTimer, Signal
 from qtpy.QtGui import (QColor, QCursor, QFont, QSyntaxHighlighter,
                         QTextCharFormat, QTextOption)
@@ -79,6 +80,12 @@
 # Mapping for file extensions that use Pygments highlighting but should use
 # different lexers than Pygments' autodetection suggests.  Keys are file
 # extensions or tuples of extensions, values are Pygments lexer names.
+# Multiple of the number of blocks that the table of lexer states of a
+# Pygments highlighter can reach before the states no longer used by any
+# block are dropped. Small documents can use at least MIN_LEXER_STATES.
+LEXER_STATES_PER_BLOCK = 4
+MIN_LEXER_STATES = 1024
+
 CUSTOM_EXTENSION_LEXER = {
     '.ipynb': 'json',
     '.nt': 'bat',
@@ -195,6 +202,10 @@ def __init__(self, parent, font=None, color_scheme='Spyder'):
         self.editor = None
         self.patterns = DEFAULT_COMPILED_PATTERNS
 
+        # Range of block numbers to highlight, or None to highlight all
+        # of them. This is used by the large file mode of the editor.
+        self._highlighted_range = None
+
     def get_background_color(self):
         return QColor(self.background_color)
 
@@ -288,6 +299,26 @@ def update_patterns(self, patterns):
 
         self.patterns = create_patterns(all_patterns, compile=True)
 
+    def set_highlighted_range(self, block_range):
+        """
+        Restrict highlighting to a range of blocks.
+
+        Parameters
+        ----------
+        block_range: tuple or None
+            (first, last) block numbers to highlight. Blocks outside this
+            range are left unformatted. If None, all blocks are highlighted.
+        """
+        self._highlighted_range = block_range
+
+    def is_block_skipped(self):
+        """Return True if the current block is outside the range to
+        highlight."""
+        if self._highlighted_range is None:
+            return False
+        first, last = self._highlighted_range
+        return not first <= self.currentBlock().blockNumber() <= last
+
     def highlightBlock(self, text):
         """
         Highlights a block of text. Please do not override, this method.
@@ -296,6 +327,8 @@ def highlightBlock(self, text):
 
         :param text: text to highlight.
         """
+        if self.is_block_skipped():
+            return
         self.highlight_block(text)
 
     def highlight_block(self, text):
@@ -661,6 +694,11 @@ def highlight_block(self, text):
             update = data.oedata.update(oedata)
 
         if data and not update:
+            if (data.oedata is not None and
+                    data.oedata.def_type == OutlineExplorerData.CELL):
+                # The sorted cell list of the editor has a cell that is
+                # not valid anymore
+                self._sorted_cell_list = None
             data.oedata = oedata
             self.outline_explorer_data_update_timer.start(500)
 
@@ -1145,6 +1183,8 @@ class MarkdownSH(BaseSH):
     CODE = 1
 
     def highlightBlock(self, text):
+        if self.is_block_skipped():
+            return
         text = to_text_string(text)
         previous_state = self.previousBlockState()
 
@@ -1227,8 +1267,93 @@ def setup_formats(self, font=None):
 # highlighter based on PygmentsSH would be 2 to 3 times slower than the
 # current native PythonSH syntax highlighter.
 
+def is_resumable_lexer(lexer):
+    """
+    Return True if `lexer` can resume lexing from any of its states.
+
+    That's the case of lexers built only from regular expression rules,
+    whose complete state is their stack of states.
+    """
+    return (isinstance(lexer, RegexLexer) and
+            type(lexer).get_tokens_unprocessed is
+            RegexLexer.get_tokens_unprocessed)
+
+
+def iter_lexer_matches(lexer, text, pos, stack):
+    """
+    Lex `text` from `pos` with `lexer` in state `stack`.
+
+    This follows `RegexLexer.get_tokens_unprocessed` but yields one
+    (end, tokens, stack) tuple per matched rule, where `end` is the position
+    after the match, `tokens` the list of (position, token type, value)
+    tuples it produced and `stack` the state stack after it. The stack is
+    updated in place, so it must be copied to be kept.
+    """
+    tokendefs = lexer._tokens
+    statestack = list(stack)
+    statetokens = tokendefs[statestack[-1]]
+    length = len(text)
+    while pos < length:
+        for rexmatch, action, new_state in statetokens:
+            m = rexmatch(text, pos)
+            if m:
+                if action is None:
+                    tokens = []
+                elif type(action) is _TokenType:
+                    tokens = [(pos, action, m.group())]
+                else:
+                    tokens = list(action(lexer, m))
+                pos = m.end()
+                if new_state is not None:
+                    if isinstance(new_state, tuple):
+                        for state in new_state:
+                            if state == '#pop':
+                                if len(statestack) > 1:
+                                    statestack.pop()
+                            elif state == '#push':
+                                statestack.append(statestack[-1])
+                            else:
+                                statestack.append(state)
+                    elif isinstance(new_state, int):
+                        if abs(new_state) >= len(statestack):
+                            del statestack[1:]
+                        else:
+                            del statestack[new_state:]
+                    elif new_state == '#push':
+                        statestack.append(statestack[-1])
+                    statetokens = tokendefs[statestack[-1]]
+                yield pos, tokens, statestack
+                break
+        else:
+            # No rule matched, so skip a character. At the end of lines the
+            # lexer goes back to its initial state.
+            if text[pos] == '\n':
+                statestack[:] = ['root']
+                statetokens = tokendefs['root']
+                tokens = [(pos, Text, '\n')]
+            else:
+                tokens = [(pos, Error, text[pos])]
+            pos += 1
+            yield pos, tokens, statestack
+
+
 class PygmentsSH(BaseSH):
-    """Generic Pygments syntax highlighter."""
+    """
+    Generic Pygments syntax highlighter.
+
+    Lexers made only of regular expression rules are resumed at the
+    beginning of each block with the state they had at the end of the
+    previous one. That state is stored in the block, so Qt only highlights
+    again the blocks after a change until their state is the same as before.
+    Rules that match text of several blocks are run again from their start
+    when one of the blocks after the first one is edited. Blocks before an
+    edit are not highlighted again, so a rule that only matches once text
+    is added to a later block is only shown after its first block changes.
+
+    Other lexers go over the complete text in a worker thread and the
+    formats they find are stored per block as run-length ranges, so only
+    the blocks whose formats changed are highlighted again.
+    """
     # Store the language name and a ref to the lexer
     _lang_name = None
     _lexer = None
@@ -1251,89 +1376,313 @@ def __init__(self, parent, font=None, color_scheme=None):
         if self._lang_name is not None:
             self._lexer = get_lexer_by_name(self._lang_name)
 
+        # Format names of the token types found so far
+        self._token_formats = {}
+
+        # Lexer states at the end of each block. Block states are indexes
+        # in this list, which is compacted when it grows too much (see
+        # _compact_states).
+        self._states = []
+        self._state_ids = {}
+
+        # Document revision and number of the last highlighted block, to
+        # know if the state of the previous block is up to date
+        self._last_highlighted = None
+
+        # Copy of the document text used to resume the lexer. Lexer rules
+        # can span several blocks, so they need the text that follows the
+        # block being highlighted.
+        self._text = None
+        self._text_length = 0
+        self._astral_positions = []
+
+        # Formats found by the worker for each block, as flat tuples of
+        # (start, length, format index) ranges
+        self._format_names = []
+        self._block_formats = []
+
+        self._incremental = is_resumable_lexer(self._lexer)
+
         BaseSH.__init__(self, parent, font, color_scheme)
 
         # This worker runs in a thread to avoid blocking when doing full file
         # parsing
         self._worker_manager = WorkerManager()
 
-        # Store the format for all the tokens after Pygments parsing
-        self._charlist = []
-
-        # Flag variable to avoid unnecessary highlights if the worker has not
-        # yet finished processing
-        self._allow_highlight = True
-
     def make_charlist(self):
-        """Parses the complete text and stores format for each character."""
+        """
+        Parse the complete text and highlight the blocks that changed.
+
+        This is only needed for lexers that can't be resumed, because the
+        rest are run by Qt as the text changes.
+        """
+        if self._incremental:
+            return
 
         def worker_output(worker, output, error):
             """Worker finished callback."""
-            self._charlist = output
             if error is None and output:
-                self._allow_highlight = True
-                self.rehighlight()
-            self._allow_highlight = False
+                self._set_block_formats(*output)
 
         text = to_text_string(self.document().toPlainText())
-        tokens = self._lexer.get_tokens(text)
 
         # Before starting a new worker process make sure to end previous
         # incarnations
         self._worker_manager.terminate_all()
 
         worker = self._worker_manager.create_python_worker(
-            self._make_charlist,
-            tokens,
-            self._tokmap,
-            self.formats,
+            self._make_block_formats,
+            self._lexer,
+            text,
         )
         worker.sig_finished.connect(worker_output)
         worker.start()
 
-    def _make_charlist(self, tokens, tokmap, formats):
+    def _get_format_name(self, typ):
+        """Get the Spyder format name for the given Pygments token type."""
+        name = self._token_formats.get(typ)
+        if name is None:
+            name = 'normal'
+            # Exact matches first
+            if typ in self._tokmap:
+                name = self._tokmap[typ]
+            else:
+                # Partial (parent-> child) matches
+                for key, val in self._tokmap.items():
+                    if typ in key:  # Checks if typ is a subtype of key.
+                        name = val
+                        break
+            self._token_formats[typ] = name
+        return name
+
+    def _make_block_formats(self, lexer, text):
         """
-        Parses the complete text and stores format for each character.
-
-        Uses the attached lexer to parse into a list of tokens and Pygments
-        token types.  Then breaks tokens into individual letters, each with a
-        Spyder token type attached.  Stores this list as self._charlist.
+        Lex the complete text and return the formats of each block.
 
-        It's attached to the contentsChange signal of the parent QTextDocument
-        so that the charlist is updated whenever the document changes.
+        Returns a tuple with the list of format names and a list with a flat
+        tuple of (start, length, format index) ranges for each block, where
+        adjacent tokens with the same format are merged.
         """
+        names = []
+        name_ids = {}
+        blocks = []
+        ranges = []
+        block_start = 0
+        for pos, typ, value in lexer.get_tokens_unprocessed(text + '\n'):
+            name = self._get_format_name(typ)
+            fid = name_ids.get(name)
+            if fid is None:
+                fid = name_ids[name] = len(names)
+                names.append(name)
+
+            for i, part in enumerate(value.split('\n')):
+                if i > 0:
+                    blocks.append(tuple(ranges))
+                    ranges = []
+                    block_start = pos
+                if part:
+                    start = pos - block_start
+                    if (ranges and ranges[-1] == fid and
+                            ranges[-3] + ranges[-2] == start):
+                        ranges[-2] += len(part)
+                    else:
+                        ranges.extend([start, len(part), fid])
+                pos += len(part) + 1
+
+        if ranges:
+            blocks.append(tuple(ranges))
+        return names, blocks
+
+    def _set_block_formats(self, names, blocks):
+        """Store the formats found by the worker and apply the new ones."""
+        old_blocks = self._block_formats if names == self._format_names else []
+        self._format_names = names
+        self._block_formats = blocks
+
+        changed = [number for number, ranges in enumerate(blocks)
+                   if number >= len(old_blocks) or
+                   old_blocks[number] != ranges]
+        if len(changed) > len(blocks) // 2:
+            self.rehighlight()
+        else:
+            document = self.document()
+            for number in changed:
+                self.rehighlightBlock(document.findBlockByNumber(number))
+
+    def _get_state_id(self, stack, pending, restart):
+        """Return the block state that stands for a lexer state."""
+        state = (stack, pending, restart)
+        state_id = self._state_ids.get(state)
+        if state_id is None:
+            if len(self._states) >= max(
+                    MIN_LEXER_STATES,
+                    LEXER_STATES_PER_BLOCK * self.document().blockCount()):
+                self._compact_states()
+            state_id = self._state_ids[state] = len(self._states)
+            self._states.append(state)
+        return state_id
+
+    def _compact_states(self):
+        """
+        Drop the lexer states that are no longer used by any block.
 
-        def _get_fmt(typ):
-            """Get the Spyder format code for the given Pygments token type."""
-            # Exact matches first
-            if typ in tokmap:
-                return tokmap[typ]
-            # Partial (parent-> child) matches
-            for key, val in tokmap.items():
-                if typ in key: # Checks if typ is a subtype of key.
-                    return val
-
-            return 'normal'
+        Edits leave behind the states that blocks had before, so this is
+        needed to bound the memory used by the table. The states of blocks
+        are changed to their index in the new table.
+        """
+        states = []
+        state_ids = {}
+        block = self.document().firstBlock()
+        while block.isValid():
+            old_id = block.userState()
+            if 0 <= old_id < len(self._states):
+                state = self._states[old_id]
+                new_id = state_ids.get(state)
+                if new_id is None:
+                    new_id = state_ids[state] = len(states)
+                    states.append(state)
+                block.setUserState(new_id)
+            block = block.next()
+        self._states = states
+        self._state_ids = state_ids
 
-        charlist = []
-        for typ, token in tokens:
-            fmt = formats[_get_fmt(typ)]
-            for letter in token:
-                charlist.append((fmt, letter))
+    def _get_block_offset(self, block, text):
+        """
+        Return the position of `block` in the text copy, updating it if
+        the document changed.
+        """
+        document = self.document()
+        position = block.position()
+        for update in (False, True):
+            if update or self._text is None:
+                plain_text = to_text_string(document.toPlainText())
+                self._text = plain_text + '\n'
+                self._text_length = qstring_length(plain_text)
+                self._astral_positions = []
+                if self._text_length != len(plain_text):
+                    # Characters outside the BMP take two positions in Qt
+                    self._astral_positions = [
+                        index + i for i, index in enumerate(
+                            index for index, char in enumerate(plain_text)
+                            if ord(char) > 0xFFFF)]
+
+            offset = position - bisect_left(self._astral_positions, position)
+            if (self._text_length == document.characterCount() - 1 and
+                    self._text[offset:offset + len(text)] == text):
+                break
+        return offset
+
+    def _highlight_block_incremental(self, text):
+        """Resume the lexer at the current block and apply its formats."""
+        block = self.currentBlock()
+        start = self._get_block_offset(block, text)
+        end = start + len(text) + 1
+        previous_state = self.previousBlockState()
+        if previous_state < 0:
+            stack, pending, restart = ('root',), (), None
+        else:
+            stack, pending, restart = self._states[previous_state]
+
+        # `pending` has the ranges left by a rule that matched text of this
+        # block too. They are only valid if the previous block was
+        # highlighted after the last change of this one, so the rule is
+        # run again from its start otherwise. `restart` has the stack before
+        # the rule and how far before this block it started.
+        revision = self.document().revision()
+        if pending and self._last_highlighted != (revision,
+                                                  block.blockNumber() - 1):
+            stack, distance = restart
+            pos = start - distance
+            pending = []
+        else:
+            pos = start
+            pending = list(pending)
+        self._last_highlighted = (revision, block.blockNumber())
+
+        # Start and stack of the rule that matched the last ranges
+        match_start = start - restart[1] if pending else pos
+        match_stack = restart[0] if pending else stack
+
+        ranges = []
+
+        # Ranges of a rule that started in a previous block
+        while pending and pos < end:
+            length, name = pending[0]
+            size = min(length, end - pos)
+            ranges.append((pos - start, size, name))
+            pos += size
+            if size == length:
+                pending.pop(0)
+            else:
+                pending[0] = (length - size, name)
+
+        if pos < end:
+            match_start = pos
+            match_stack = stack
+            for match_end, tokens, statestack in iter_lexer_matches(
+                    self._lexer, self._text, pos, stack):
+                cursor = end
+                for token_pos, typ, value in tokens:
+                    name = self._get_format_name(typ)
+                    token_end = token_pos + len(value)
+                    if token_pos < end and token_end > start:
+                        token_start = max(token_pos, start)
+                        ranges.append((token_start - start,
+                                       min(token_end, end) - token_start,
+                                       name))
+                    if token_end > end:
+                        token_start = max(token_pos, end)
+                        if token_start > cursor:
+                            pending.append((token_start - cursor, None))
+                        pending.append((token_end - token_start, name))
+                        cursor = token_end
+                if match_end >= end:
+                    if match_end > cursor:
+                        pending.append((match_end - cursor, None))
+                    stack = tuple(statestack)
+                    break
+                match_start = match_end
+                match_stack = tuple(statestack)
+
+        restart = (match_stack, end - match_start) if pending else None
+        self.setCurrentBlockState(
+            self._get_state_id(stack, tuple(pending), restart))
+        self._apply_ranges(text, ranges)
+
+    def _apply_ranges(self, text, ranges):
+        """Apply a list of (start, length, format name) ranges to a block."""
+        convert = qstring_length(text) != len(text)
+        for start, length, name in ranges:
+            # Ranges can include the line break at the end of the block
+            length = min(length, len(text) - start)
+            if name is None or length <= 0:
+                continue
+            if convert:
+                qt_start = qstring_length(text[:start])
+                length = qstring_length(text[start:start + length])
+                start = qt_start
+            self.setFormat(start, length, self.formats[name])
 
-        return charlist
+    def rehighlight(self):
+        """Highlight all blocks again, starting with an empty state table."""
+        self._states = []
+        self._state_ids = {}
+        BaseSH.rehighlight(self)
 
     def highlightBlock(self, text):
         """ Actually highlight the block"""
-        # Note that an undefined blockstate is equal to -1, so the first block
-        # will have the correct behaviour of starting at 0.
-        if self._allow_highlight:
-            start = self.previousBlockState() + 1
-            end = start + qstring_length(text)
-            for i, (fmt, letter) in enumerate(self._charlist[start:end]):
-                self.setFormat(i, 1, fmt)
-            self.setCurrentBlockState(end)
-            self.highlight_extras(text)
+        if self._incremental:
+            self._highlight_block_incremental(text)
+        else:
+            number = self.currentBlock().blockNumber()
+            if number < len(self._block_formats):
+                ranges = self._block_formats[number]
+                names = self._format_names
+                self._apply_ranges(
+                    text, [(ranges[i], ranges[i + 1], names[ranges[i + 2]])
+                           for i in range(0, len(ranges), 3)])
+            self.setCurrentBlockState(self.NORMAL)
+        self.highlight_extras(text)
 
 
 class PythonLoggingLexer(RegexLexer):
@@ -15,7 +15,7 @@
 import pytest
 
 # Local imports
-from spyder.utils.stringmatching import get_search_scores
+from spyder.utils.stringmatching import FuzzyMatcher, get_search_scores
 
 TEST_FILE = os.path.join(os.path.dirname(__file__), 'data/example.py')
 
@@ -216,5 +216,44 @@ def test_stringmatching_order_filter():
                                      'use previous <b>lay</b>out', 400113)]
 
 
+@pytest.mark.parametrize('queries', [['l', 'la', 'lay'], ['d', 'de', 'des'],
+                                     ['cls', 'c', 'co'], ['re-r', 'S O']])
+def test_fuzzy_matcher(queries):
+    """Test that the matcher gives the same results as get_search_scores."""
+    template = '<b>{0}</b>'
+    names = ['close pane', 'debug continue', 'debug step into',
+             'layout preferences', 'lock unlock panes', 'Save current layout',
+             'switch to find_in_files', 'use next layout', 'clear line',
+             'close all', 'debug with winpdb', 'delete', 'go to line',
+             're-run last script', 'show/hide outline', 'start of line', '']
+    matcher = FuzzyMatcher(names)
+    assert len(matcher) == len(names)
+
+    for query in queries:
+        for valid_only, sort in [(False, False), (True, True)]:
+            assert matcher.get_scores(
+                query, template=template, valid_only=valid_only,
+                sort=sort) == get_search_scores(
+                    query, names, template=template, valid_only=valid_only,
+                    sort=sort)
+
+
+def test_fuzzy_matcher_matches():
+    """Test the ranked matches and their highlight spans."""
+    matcher = FuzzyMatcher(['save current layout', 'layout preferences',
+                            'close pane'])
+    assert matcher.get_matches('lay') == [(400100, 1, [(0, 3)]),
+                                          (400113, 0, [(13, 16)])]
+    assert matcher.get_matches('layz') == []
+    assert matcher.get_matches('cp') == [(210400, 2, [(0, 1), (6, 7)])]
+
+    # Choices added after a search are taken into account
+    matcher.get_matches('lay')
+    matcher.add_choice('layers')
+    assert [m[1] for m in matcher.get_matches('laye')] == [3, 1]
+    matcher.clear()
+    assert matcher.get_matches('lay') == []
+
+
 if __name__ == "__main__":
     pytest.main()
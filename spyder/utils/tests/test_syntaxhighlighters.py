@@ -7,9 +7,11 @@
 
 import pytest
 from qtpy.QtWidgets import QApplication
-from qtpy.QtGui import QTextDocument
+from qtpy.QtGui import QTextCursor, QTextDocument
 
-from spyder.utils.syntaxhighlighters import HtmlSH, PythonSH, MarkdownSH
+from spyder.utils import syntaxhighlighters
+from spyder.utils.syntaxhighlighters import (HtmlSH, PythonSH, MarkdownSH,
+                                             guess_pygments_highlighter)
 from spyder.py3compat import PY3
 
 def compare_formats(actualFormats, expectedFormats, sh):
@@ -96,6 +98,112 @@ def test_Markdown_basic():
     compare_formats(doc.firstBlock().layout().additionalFormats(), res, sh)
 
 
+def get_block_colors(doc):
+    """Return the foreground color of each character of each block."""
+    colors = []
+    block = doc.firstBlock()
+    while block.isValid():
+        line = [None] * len(block.text())
+        for fmt_range in block.layout().formats():
+            for i in range(fmt_range.start,
+                           fmt_range.start + fmt_range.length):
+                line[i] = fmt_range.format.foreground().color().name()
+        colors.append(line)
+        block = block.next()
+    return colors
+
+
+def get_lexer_colors(doc, sh):
+    """Return the colors found by lexing the whole document at once."""
+    text = doc.toPlainText()
+    colors = [[None] * len(line) for line in text.split('\n')]
+    row, column = 0, 0
+    for __, typ, value in sh._lexer.get_tokens_unprocessed(text + '\n'):
+        color = sh.formats[sh._get_format_name(typ)].foreground().color()
+        for char in value:
+            if char == '\n':
+                row, column = row + 1, 0
+            else:
+                colors[row][column] = color.name()
+                column += 1
+    return colors[:doc.blockCount()]
+
+
+@pytest.mark.parametrize('filename,txt', [
+    ('test.js', 'var a = 1; /* multi\nline\ncomment */ var s = "str";\n'
+                '// comment\nfunction f() {\n  return `tpl\n${a}\n`;\n}\n'),
+    ('test.xml', '<a>\n<!-- multi\nline -->\n<b x="1"/>\n</a>'),
+    ('test.json', '{\n  "a": [1, 2,\n  "x"],\n  "b": true\n}\n'),
+])
+def test_pygments_highlighter(qtbot, filename, txt):
+    """
+    Test that Pygments highlighters give the same formats as lexing the
+    whole text, also after editing it.
+    """
+    doc = QTextDocument(txt)
+    doc.documentLayout()
+    sh = guess_pygments_highlighter(filename)(doc, color_scheme='Spyder')
+    assert sh._incremental == (filename != 'test.json')
+
+    def check_formats():
+        sh.make_charlist()
+        qtbot.waitUntil(lambda: get_block_colors(doc) ==
+                        get_lexer_colors(doc, sh))
+
+    check_formats()
+
+    # Open a comment and a string that change the following blocks
+    cursor = QTextCursor(doc)
+    cursor.insertText('/* "\n')
+    check_formats()
+
+    # Close them again
+    cursor.setPosition(0)
+    cursor.movePosition(QTextCursor.NextBlock, QTextCursor.KeepAnchor)
+    cursor.removeSelectedText()
+    check_formats()
+
+    # Edit every block, which can be inside rules that started before it
+    for number in range(doc.blockCount()):
+        cursor = QTextCursor(doc.findBlockByNumber(number))
+        cursor.insertText('x ')
+        check_formats()
+        cursor.movePosition(QTextCursor.EndOfBlock)
+        cursor.insertText(' x')
+        check_formats()
+
+
+def test_pygments_highlighter_states(qtbot, monkeypatch):
+    """
+    Test that the lexer states left behind by edits are dropped and that
+    full rehighlights start with an empty table.
+    """
+    monkeypatch.setattr(syntaxhighlighters, 'MIN_LEXER_STATES', 0)
+    doc = QTextDocument('var a = 1;\n/* multi\nline */\n' * 5)
+    doc.documentLayout()
+    sh = guess_pygments_highlighter('test.js')(doc, color_scheme='Spyder')
+    assert sh._incremental
+
+    def check_formats():
+        qtbot.waitUntil(lambda: get_block_colors(doc) ==
+                        get_lexer_colors(doc, sh))
+
+    check_formats()
+
+    # Nested template strings give a new state on every edit
+    cursor = QTextCursor(doc)
+    for i in range(100):
+        cursor.setPosition(0)
+        cursor.insertText('`${')
+        assert len(sh._states) <= (
+            syntaxhighlighters.LEXER_STATES_PER_BLOCK * doc.blockCount() + 1)
+    check_formats()
+
+    sh.rehighlight()
+    assert len(sh._states) <= doc.blockCount()
+    check_formats()
+
+
 @pytest.mark.parametrize('line', ['# --- First variant',
                                   '#------ 2nd variant',
                                   '### 3rd variant'])
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+#
+
+"""
+Tests for textindex.py
+"""
+
+# Standard library imports
+import os
+import os.path as osp
+import pickle
+import re
+
+# Test library imports
+import pytest
+
+# Local imports
+from spyder.utils.textindex import TrigramIndex, get_literals
+
+
+@pytest.fixture
+def project(tmpdir):
+    """Create a project with some files."""
+    tmpdir.join('spam.py').write('spam = "Spam"\n')
+    tmpdir.join('ham.txt').write('ham and eggs\n')
+    tmpdir.mkdir('sub').join('eggs.txt').write('eggs, sausage and spam\n')
+    tmpdir.mkdir('.spyproject')
+    return tmpdir
+
+
+UNPICKLED = []
+
+
+def unpickle_hook():
+    UNPICKLED.append(True)
+
+
+class Exploit(object):
+    """Object that calls `unpickle_hook` when it's unpickled."""
+
+    def __reduce__(self):
+        return (unpickle_hook, ())
+
+
+def accepted(index, text, text_re=False):
+    """Return the basenames of the project files that may contain `text`."""
+    accept = index.get_filter([(text, 'utf-8')], text_re)
+    if accept is None:
+        return None
+    fnames = []
+    for dirpath, dirs, files in os.walk(index.root_path):
+        dirs[:] = [d for d in dirs if d != '.spyproject']
+        fnames += [f for f in files if accept(osp.join(dirpath, f))]
+    return sorted(fnames)
+
+
+@pytest.mark.parametrize('pattern,expected', [
+    (b'spam', [b'spam']),
+    (b'spam.*eggs', [b'spam', b'eggs']),
+    (b'sp(a)m', [b'sp', b'm']),
+    (b'spam|eggs', None),
+    (b'.*', None),
+])
+def test_get_literals(pattern, expected):
+    """Test extracting the mandatory literals of a regular expression."""
+    assert get_literals(re.compile(pattern), True) == expected
+
+
+def test_index_filter(project):
+    """Test that the index narrows the files to scan."""
+    index = TrigramIndex(str(project))
+    assert accepted(index, b'spam') is None
+
+    index.refresh()
+    assert index.ready
+    assert len(index) == 3
+    assert accepted(index, b'spam') == ['eggs.txt', 'spam.py']
+    assert accepted(index, b'SPAM') == ['eggs.txt', 'spam.py']
+    assert accepted(index, b'eggs') == ['eggs.txt', 'ham.txt']
+    assert accepted(index, b'foobar') == []
+    assert accepted(index, b'sau.*age', text_re=True) == ['eggs.txt']
+
+    # Searches that can't be narrowed
+    assert accepted(index, b'sp') is None
+    assert accepted(index, b'spam|ham', text_re=True) is None
+
+
+def test_index_update(project):
+    """Test that the index is updated incrementally."""
+    index = TrigramIndex(str(project))
+    index.refresh()
+
+    project.join('ham.txt').write('ham and more spam\n')
+    index.mark_dirty(str(project.join('ham.txt')))
+    project.join('sub', 'eggs.txt').remove()
+    index.mark_dirty(str(project.join('sub', 'eggs.txt')))
+    project.join('new.txt').write('spam\n')
+    index.mark_dirty(str(project.join('new.txt')))
+
+    # Files unknown to the index are always scanned
+    assert accepted(index, b'foobar') == ['new.txt']
+
+    index.flush()
+    assert accepted(index, b'spam') == ['ham.txt', 'new.txt', 'spam.py']
+    assert accepted(index, b'foobar') == []
+
+
+def test_index_save_load(project):
+    """Test that the index is saved in the project folder and reloaded."""
+    index = TrigramIndex(str(project))
+    index.refresh()
+    index.remove_file(str(project.join('sub')))
+    index.save()
+    assert project.join('.spyproject', 'findinfiles', 'trigrams.idx').check()
+
+    # Files in the project config folder are never indexed
+    index.refresh()
+    assert len(index) == 3
+
+    new_index = TrigramIndex(str(project))
+    assert new_index.load()
+    assert not new_index.ready
+    new_index.refresh()
+    assert accepted(new_index, b'spam') == ['eggs.txt', 'spam.py']
+
+
+def test_index_load_invalid(project):
+    """Test that invalid or untrusted index files are ignored."""
+    index = TrigramIndex(str(project))
+    index.refresh()
+    index.save()
+    index_file = project.join('.spyproject', 'findinfiles', 'trigrams.idx')
+    data = index_file.read_binary()
+
+    # A pickle shipped with the project must never be loaded
+    index_file.write_binary(pickle.dumps(Exploit()))
+    assert not TrigramIndex(str(project)).load()
+    assert UNPICKLED == []
+
+    for invalid in [b'', data[:-1], data + b'\0\0\0\0',
+                    data.replace(b'spam.py', b'spam.p\xff')]:
+        index_file.write_binary(invalid)
+        assert not TrigramIndex(str(project)).load()
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+#
+
+"""
+Tests for textsearch.py
+"""
+
+# Standard library imports
+import os
+import os.path as osp
+import re
+
+# Test library imports
+import pytest
+
+# Local imports
+from spyder.utils.textsearch import (AUTO_POOL, PROCESS_POOL, THREAD_POOL,
+                                     SearchEngine, search_in_file)
+
+
+@pytest.fixture
+def search_dir(tmpdir):
+    """Create a directory with some files to search in."""
+    for i in range(50):
+        tmpdir.join('file{:02d}.txt'.format(i)).write(
+            'spam eggs\nham\nspam spam {}\n'.format(i))
+    tmpdir.join('binary.dat').write_binary(b'\x00\x01spam\x00' * 100)
+    return tmpdir
+
+
+def test_search_in_file(tmpdir):
+    """Test that matches are found with their line and column."""
+    fname = tmpdir.join('spam.txt')
+    fname.write('spam ham\nHam\nham ham\n')
+    texts = [(b'ham', 'utf-8')]
+
+    matches, error = search_in_file(str(fname), texts, False, True)
+    assert error is None
+    assert [m[1:4] for m in matches] == [(1, 5, 8), (3, 0, 3), (3, 4, 7)]
+    assert matches[0][4] == 'spam ham\n'
+
+    matches, error = search_in_file(str(fname), texts, False, False)
+    assert [m[1:4] for m in matches] == [(1, 5, 8), (2, 0, 3), (3, 0, 3),
+                                         (3, 4, 7)]
+
+    texts = [(re.compile(b'h.m'), 'utf-8')]
+    matches, error = search_in_file(str(fname), texts, True, True)
+    assert [m[1:4] for m in matches] == [(1, 5, 8), (3, 0, 3), (3, 4, 7)]
+
+
+@pytest.mark.parametrize('case_sensitive', [True, False])
+def test_search_in_file_lines(tmpdir, case_sensitive):
+    """Test that matches are confined to lines and numbered correctly."""
+    fname = tmpdir.join('eggs.txt')
+    fname.write_binary(b'\n'.join([b'x' * 10] * 1000 + [b'spam', b'ham']))
+    texts = [(re.compile(b'm\\s+h'), 'utf-8')]
+    assert search_in_file(str(fname), texts, True, case_sensitive) == (
+        [], None)
+
+    texts = [(re.compile(b'^ham$'), 'utf-8')]
+    matches, __ = search_in_file(str(fname), texts, True, case_sensitive)
+    assert [m[1:] for m in matches] == [(1002, 0, 3, 'ham')]
+
+    fname = tmpdir.join('empty.txt')
+    fname.write('')
+    assert search_in_file(str(fname), texts, True, case_sensitive) == (
+        [], None)
+
+
+def test_search_in_file_line_constructs(tmpdir):
+    """
+    Test that string anchors still match at the start of every line and that
+    patterns with global inline flags can be searched in several encodings.
+    """
+    fname = tmpdir.join('spam.txt')
+    fname.write('eggs\nham spam\nspam\n')
+
+    texts = [(re.compile(b'\\Aspam'), 'utf-8')]
+    matches, __ = search_in_file(str(fname), texts, True, True)
+    assert [m[1:4] for m in matches] == [(3, 0, 4)]
+
+    texts = [(re.compile(b'(?i)SPAM'), 'utf-8'),
+             (re.compile(b'(?i)SPAM'), 'latin-1')]
+    matches, __ = search_in_file(str(fname), texts, True, True)
+    assert [m[1:4] for m in matches] == [(2, 4, 8), (3, 0, 4)]
+
+
+def test_search_in_file_error(tmpdir):
+    """Test that unreadable files are reported."""
+    fname = str(tmpdir.join('missing.txt'))
+    matches, error = search_in_file(fname, [(b'ham', 'utf-8')], False, True)
+    assert matches == []
+    assert error is not None
+
+
+@pytest.mark.parametrize('workers,pool', [(1, THREAD_POOL), (3, THREAD_POOL),
+                                          (2, PROCESS_POOL)])
+def test_search_engine_order(search_dir, workers, pool):
+    """Test that results are returned in the order files were given."""
+    fnames = sorted(str(search_dir.join(f)) for f in os.listdir(search_dir))
+    engine = SearchEngine([(b'spam', 'utf-8')], False, True, workers=workers,
+                          pool=pool, chunksize=4, max_pending=2)
+    results = list(engine.search(iter(fnames)))
+
+    assert [r[0] for r in results] == fnames
+    for fname, matches, error in results:
+        assert error is None
+        if osp.basename(fname) == 'binary.dat':
+            assert matches == []
+        else:
+            assert [m[1:3] for m in matches] == [(1, 0), (3, 0), (3, 5)]
+
+
+def test_search_engine_auto_pool(search_dir):
+    """Test that an automatic pool moves to processes for big trees."""
+    fnames = sorted(str(search_dir.join(f)) for f in os.listdir(search_dir))
+    engine = SearchEngine([(b'spam', 'utf-8')], False, True, workers=2,
+                          pool=AUTO_POOL, chunksize=4, max_pending=2,
+                          process_min_files=20)
+    pools = []
+    for __ in engine.search(iter(fnames)):
+        pools.append(engine._executor_pool)
+
+    assert len(pools) == len(fnames)
+    assert pools[0] == THREAD_POOL
+    assert pools[-1] == PROCESS_POOL
+
+    # Small trees are only scanned with threads
+    engine = SearchEngine([(b'spam', 'utf-8')], False, True, workers=2,
+                          pool=AUTO_POOL, chunksize=4, max_pending=2)
+    pools = {engine._executor_pool for __ in engine.search(iter(fnames))}
+    assert pools == {THREAD_POOL}
+
+
+def test_search_engine_stop(search_dir):
+    """Test that stopping the engine cancels the remaining work."""
+    fnames = sorted(str(search_dir.join(f)) for f in os.listdir(search_dir))
+    engine = SearchEngine([(b'spam', 'utf-8')], False, True, workers=2,
+                          pool=THREAD_POOL, chunksize=1, max_pending=2)
+    results = []
+    for result in engine.search(iter(fnames)):
+        results.append(result)
+        if len(results) == 3:
+            engine.stop()
+
+    assert engine.stopped
+    assert len(results) < len(fnames)
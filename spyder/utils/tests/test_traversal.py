@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+#
+
+"""
+Tests for traversal.py
+"""
+
+# Standard library imports
+import os.path as osp
+import re
+
+# Test library imports
+import pytest
+
+# Local imports
+from spyder.utils import traversal
+from spyder.utils.traversal import FileWalker, IgnoreRules
+
+
+@pytest.fixture
+def repo(tmpdir):
+    """Create a repository with some ignore files."""
+    tmpdir.mkdir('.git').join('HEAD').write('ref: refs/heads/master\n')
+    tmpdir.join('.gitignore').write(
+        '# Comment\n'
+        '*.log\n'
+        '!keep.log\n'
+        'build/\n'
+        '/top.txt\n'
+        'docs/**/*.tmp\n')
+    tmpdir.join('spam.py').write('spam\n')
+    tmpdir.join('error.log').write('error\n')
+    tmpdir.join('keep.log').write('keep\n')
+    tmpdir.join('top.txt').write('top\n')
+    tmpdir.mkdir('build').join('out.py').write('out\n')
+    sub = tmpdir.mkdir('sub')
+    sub.join('top.txt').write('top\n')
+    sub.join('build').write('not a folder\n')
+    sub.join('.gitignore').write('*.py\n')
+    sub.join('eggs.py').write('eggs\n')
+    sub.join('eggs.txt').write('eggs\n')
+    docs = tmpdir.mkdir('docs')
+    docs.join('a.tmp').write('tmp\n')
+    docs.mkdir('deep').mkdir('deeper').join('b.tmp').write('tmp\n')
+    tmpdir.mkdir('node_modules').join('mod.js').write('mod\n')
+    return tmpdir
+
+
+def walk(root, **kwargs):
+    """Return the paths found by the walker relative to `root`."""
+    root = str(root)
+    return sorted(osp.relpath(path, root).replace(osp.sep, '/')
+                  for path in FileWalker(**kwargs).walk(root))
+
+
+def test_walk_gitignore(repo):
+    """Test that ignored files and folders are pruned."""
+    assert walk(repo) == ['.gitignore', 'keep.log', 'node_modules/mod.js',
+                          'spam.py', 'sub/.gitignore', 'sub/build',
+                          'sub/eggs.txt', 'sub/top.txt']
+
+    # `**` also matches no folders at all
+    assert 'docs/a.tmp' in walk(repo, use_ignore_files=False)
+
+
+def test_walk_no_ignore_files(repo):
+    """Test walking without honoring ignore files."""
+    files = walk(repo, use_ignore_files=False)
+    assert 'error.log' in files
+    assert 'build/out.py' in files
+    assert not any(f.startswith('.git/') for f in files)
+
+
+def test_walk_exclude(repo):
+    """Test that the exclude expression prunes folders and files."""
+    exclude = re.compile(r'node_modules' + re.escape(osp.sep) + r'|\.txt$')
+    assert walk(repo, exclude=exclude) == ['.gitignore', 'keep.log',
+                                           'spam.py', 'sub/.gitignore',
+                                           'sub/build']
+
+
+def test_walk_subfolder(repo):
+    """Test that rules of parent folders apply when walking a subfolder."""
+    repo.join('sub', 'debug.log').write('debug\n')
+    assert walk(repo.join('sub')) == ['.gitignore', 'build', 'eggs.txt',
+                                      'top.txt']
+
+
+def test_walk_outside_repository(tmpdir):
+    """Test that ignore files above a repository are not inherited."""
+    tmpdir.join('.gitignore').write('*.py\n')
+    project = tmpdir.mkdir('project')
+    project.mkdir('.git')
+    project.join('spam.py').write('spam\n')
+    assert walk(project) == ['spam.py']
+
+
+def test_walk_git_info_exclude(repo):
+    """Test that the repository exclude file is honored."""
+    repo.join('.git').mkdir('info').join('exclude').write('spam.py\n')
+    assert 'spam.py' not in walk(repo)
+
+
+def test_is_ignored(repo):
+    """Test checking single paths."""
+    walker = FileWalker()
+    root = str(repo)
+    assert walker.is_ignored(osp.join(root, 'error.log'))
+    assert not walker.is_ignored(osp.join(root, 'keep.log'))
+    assert walker.is_ignored(osp.join(root, 'build'))
+    assert not walker.is_ignored(osp.join(root, 'sub', 'build'))
+    assert walker.is_ignored(osp.join(root, '.git'))
+
+    # Files in ignored folders are only ignored when checking parents
+    fname = osp.join(root, 'build', 'out.py')
+    assert not walker.is_ignored(fname)
+    assert walker.is_ignored(fname, root=root)
+
+
+def test_hgignore(tmpdir):
+    """Test reading Mercurial ignore files."""
+    tmpdir.mkdir('.hg')
+    tmpdir.join('.hgignore').write(
+        'syntax: glob\n'
+        '*.pyc\n'
+        'syntax: regexp\n'
+        '^dist/\n'
+        're:\\.bak$  # Backups\n')
+    rules = IgnoreRules.from_hgignore(str(tmpdir.join('.hgignore')))
+    root = str(tmpdir)
+    assert rules.match(osp.join(root, 'sub', 'spam.pyc'), False)
+    assert rules.match(osp.join(root, 'dist', 'spam.py'), False)
+    assert rules.match(osp.join(root, 'spam.py.bak'), False)
+    assert rules.match(osp.join(root, 'spam.py'), False) is None
+
+
+def test_hgignore_repository_root(tmpdir):
+    """Test that only the .hgignore file of the repository root is read."""
+    tmpdir.mkdir('.hg')
+    tmpdir.join('.hgignore').write('syntax: glob\n*.pyc\n')
+    sub = tmpdir.mkdir('sub')
+    sub.join('.hgignore').write('syntax: glob\n*.txt\n')
+    sub.join('spam.pyc').write('')
+    sub.join('spam.txt').write('spam\n')
+
+    assert walk(tmpdir) == ['.hgignore', 'sub/.hgignore', 'sub/spam.txt']
+
+
+def test_is_text_file_cached(tmpdir, mocker):
+    """Test that text file verdicts are cached until the file changes."""
+    fname = tmpdir.join('spam.txt')
+    fname.write('spam\n')
+    spy = mocker.spy(traversal, 'is_text_file')
+
+    assert traversal.is_text_file_cached(str(fname))
+    assert traversal.is_text_file_cached(str(fname))
+    assert spy.call_count == 1
+
+    fname.write_binary(b'\x00\x01\x02' * 100)
+    assert not traversal.is_text_file_cached(str(fname))
+    assert spy.call_count == 2
@@ -0,0 +1,516 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""
+Persistent trigram index used by Find in Files to narrow the files to scan.
+
+The index maps every lowercase three byte sequence found in a file to the
+files that contain it. A literal search (or a regular expression with
+literal parts) can only match files that contain all the trigrams of its
+literal parts, so every other file can be skipped without reading it.
+
+The index is conservative: files it doesn't know about, or that were too
+big to be indexed, are always reported as candidates.
+
+The index is saved inside the project, so it can come from an untrusted
+source. It's stored as a JSON header followed by the raw postings arrays,
+which can't run any code when they are loaded, and an index that can't be
+decoded is simply ignored.
+"""
+
+# Standard library imports
+from array import array
+import json
+import logging
+import os
+import os.path as osp
+import struct
+import sys
+import threading
+
+try:
+    from re import _parser as sre_parse
+    from re import _constants as sre_constants
+except ImportError:
+    import sre_parse
+    import sre_constants
+
+# Third-party imports
+from atomicwrites import atomic_write
+
+# Local imports
+from spyder.config.base import get_project_config_folder
+from spyder.utils.encoding import is_text_file
+from spyder.utils.traversal import GITIGNORE, HGIGNORE, FileWalker
+
+
+logger = logging.getLogger(__name__)
+
+# Bump this when the on-disk format changes
+INDEX_VERSION = 2
+
+# Header of index files: magic, version, size of the postings items and
+# size of the JSON part
+INDEX_MAGIC = b'SPYTRIGR'
+INDEX_HEADER = struct.Struct('<8sIIQ')
+
+# Files bigger than this are not indexed and always scanned
+MAX_INDEXED_SIZE = 4 * 1024 ** 2
+
+# Maximum number of trigrams intersected when querying the index
+MAX_QUERY_TRIGRAMS = 8
+
+# Folders that are never indexed
+SKIPPED_DIRS = {'.git', '.hg', '.svn', get_project_config_folder()}
+
+# Kind of index entries
+INDEXED = 0
+UNINDEXED = 1
+BINARY = 2
+
+
+def get_index_path(root_path):
+    """Return the path where the index of `root_path` is stored."""
+    return osp.join(root_path, get_project_config_folder(), 'findinfiles',
+                    'trigrams.idx')
+
+
+def get_trigrams(data):
+    """Return the set of lowercase trigrams of `data` (bytes)."""
+    data = data.lower()
+    return {data[i:i + 3] for i in range(len(data) - 2)}
+
+
+def get_literals(text, text_re):
+    """
+    Return the literal parts that any match of `text` must contain.
+
+    Parameters
+    ----------
+    text: bytes or compiled regular expression
+        Search text.
+    text_re: bool
+        Whether `text` is a regular expression.
+
+    Returns
+    -------
+    list or None
+        List of bytes, or None if no literal part could be extracted.
+    """
+    if not text_re:
+        return [text]
+
+    pattern = getattr(text, 'pattern', text)
+    if not isinstance(pattern, bytes):
+        return None
+
+    try:
+        items = list(sre_parse.parse(pattern))
+    except (sre_constants.error, RecursionError):
+        return None
+
+    # Only consecutive top level literals are mandatory. Any other
+    # construct (groups, repeats, classes, anchors...) ends the current run,
+    # while alternatives make every literal optional.
+    literals = []
+    run = bytearray()
+    for op, av in items:
+        if op == sre_constants.BRANCH:
+            return None
+        elif op == sre_constants.LITERAL:
+            run.append(av)
+        else:
+            if run:
+                literals.append(bytes(run))
+            run = bytearray()
+    if run:
+        literals.append(bytes(run))
+
+    return literals or None
+
+
+class TrigramIndex:
+    """
+    Trigram index of the text files found under `root_path`.
+
+    All public methods are thread safe, so the index can be updated from the
+    GUI thread while a search thread queries it.
+    """
+
+    def __init__(self, root_path, index_path=None,
+                 max_file_size=MAX_INDEXED_SIZE):
+        self.root_path = osp.normpath(root_path)
+        self.index_path = index_path or get_index_path(self.root_path)
+        self.max_file_size = max_file_size
+
+        self._walker = FileWalker(skip_dirs=SKIPPED_DIRS)
+        self._lock = threading.RLock()
+        self._dirty = set()
+        self._ready = False
+        self._clear()
+
+    # ---- Public API
+    # ------------------------------------------------------------------------
+    @property
+    def ready(self):
+        """Whether the index is up to date and can be queried."""
+        return self._ready
+
+    def __len__(self):
+        with self._lock:
+            return len(self._files)
+
+    def __contains__(self, fname):
+        with self._lock:
+            return self._relpath(fname) in self._files
+
+    def load(self):
+        """
+        Load the index from disk.
+
+        Returns True if a valid index was found, False otherwise. The index
+        can't be queried until `refresh` is called.
+        """
+        try:
+            with open(self.index_path, 'rb') as f:
+                entries, postings = self._decode(f.read())
+        except OSError as error:
+            logger.debug("Trigram index not loaded: %s", error)
+            return False
+        except (ValueError, TypeError, KeyError, IndexError, struct.error,
+                UnicodeError, RecursionError) as error:
+            logger.debug("Invalid trigram index %s: %s", self.index_path,
+                         error)
+            return False
+
+        with self._lock:
+            self._entries = entries
+            self._postings = postings
+            self._files = {entry[0]: fid
+                           for fid, entry in enumerate(self._entries)
+                           if entry is not None}
+            self._dead = len(self._entries) - len(self._files)
+        return True
+
+    def save(self):
+        """Save the index to disk."""
+        with self._lock:
+            if self._dead > len(self._files):
+                self._compact()
+            data = self._encode()
+        try:
+            os.makedirs(osp.dirname(self.index_path), exist_ok=True)
+            with atomic_write(self.index_path, mode='wb',
+                              overwrite=True) as f:
+                f.write(data)
+        except OSError as error:
+            logger.debug("Trigram index not saved: %s", error)
+
+    def refresh(self):
+        """
+        Bring the index up to date with the files on disk.
+
+        Only files whose size or modification time changed are read again.
+        """
+        seen = set()
+        for fname in self._walk(self.root_path):
+            seen.add(self._relpath(fname))
+            self.update_file(fname)
+
+        with self._lock:
+            for relpath in list(self._files):
+                if relpath not in seen:
+                    self._remove(relpath)
+            self._ready = True
+
+    def clear(self):
+        """Remove all files from the index."""
+        with self._lock:
+            self._clear()
+            self._ready = False
+
+    def update_file(self, fname):
+        """Index `fname` again if it changed since it was last indexed."""
+        relpath = self._relpath(fname)
+        if relpath is None:
+            return
+
+        try:
+            stat = os.stat(fname)
+        except OSError:
+            self.remove_file(fname)
+            return
+
+        with self._lock:
+            fid = self._files.get(relpath)
+            if fid is not None:
+                entry = self._entries[fid]
+                if entry[1:3] == (stat.st_mtime_ns, stat.st_size):
+                    return
+
+        trigrams = None
+        if stat.st_size > self.max_file_size:
+            kind = UNINDEXED
+        elif not is_text_file(fname):
+            kind = BINARY
+        else:
+            try:
+                with open(fname, 'rb') as f:
+                    trigrams = get_trigrams(f.read())
+                kind = INDEXED
+            except OSError:
+                kind = UNINDEXED
+
+        with self._lock:
+            self._remove(relpath)
+            fid = len(self._entries)
+            self._entries.append(
+                (relpath, stat.st_mtime_ns, stat.st_size, kind))
+            self._files[relpath] = fid
+            if trigrams:
+                for trigram in trigrams:
+                    postings = self._postings.get(trigram)
+                    if postings is None:
+                        self._postings[trigram] = array('I', [fid])
+                    else:
+                        postings.append(fid)
+
+    def remove_file(self, fname):
+        """Remove `fname`, or all files under it if it's a folder."""
+        relpath = self._relpath(fname)
+        if relpath is None:
+            return
+
+        prefix = relpath + os.sep
+        with self._lock:
+            self._remove(relpath)
+            for other in list(self._files):
+                if other.startswith(prefix):
+                    self._remove(other)
+
+    def mark_dirty(self, fname):
+        """
+        Mark `fname` as changed.
+
+        Changes are applied the next time `flush` is called, so that bursts
+        of filesystem events don't block the caller. Files ignored by
+        version control are not indexed.
+        """
+        if self._relpath(fname) is not None:
+            with self._lock:
+                self._dirty.add(fname)
+
+    def flush(self):
+        """Apply all pending changes."""
+        with self._lock:
+            dirty = self._dirty
+            self._dirty = set()
+
+        if any(osp.basename(fname) in (GITIGNORE, HGIGNORE)
+               for fname in dirty):
+            self._walker.clear_cache()
+
+        for fname in sorted(dirty):
+            if self._walker.is_ignored(fname, root=self.root_path):
+                self.remove_file(fname)
+            elif osp.isfile(fname):
+                self.update_file(fname)
+            elif osp.isdir(fname):
+                for child in self._walk(fname):
+                    self.update_file(child)
+            else:
+                self.remove_file(fname)
+
+    def get_filter(self, texts, text_re):
+        """
+        Return a function telling if a file may contain any of `texts`.
+
+        Parameters
+        ----------
+        texts: list
+            List of (text, encoding) tuples, as used by the search thread.
+        text_re: bool
+            Whether `texts` are regular expressions.
+
+        Returns
+        -------
+        callable or None
+            None if the index can't narrow down the search.
+        """
+        if not self._ready:
+            return None
+
+        fids = set()
+        for text, __ in texts:
+            literals = get_literals(text, text_re)
+            if literals is None:
+                return None
+
+            trigrams = set()
+            for literal in literals:
+                trigrams |= get_trigrams(literal)
+            if not trigrams:
+                return None
+
+            fids |= self._query(trigrams)
+
+        with self._lock:
+            files = dict(self._files)
+            unindexed = {fid for fid in files.values()
+                         if self._entries[fid][3] == UNINDEXED}
+        fids |= unindexed
+
+        def accept(fname):
+            relpath = self._relpath(fname)
+            if relpath is None:
+                return True
+            fid = files.get(relpath)
+            return fid is None or fid in fids
+
+        return accept
+
+    # ---- Private API
+    # ------------------------------------------------------------------------
+    def _clear(self):
+        self._files = {}       # relative path -> file id
+        self._entries = []     # file id -> (relpath, mtime, size, kind)
+        self._postings = {}    # trigram -> array of file ids
+        self._dead = 0         # number of removed entries still in postings
+
+    def _relpath(self, fname):
+        """
+        Return the path of `fname` relative to the root path.
+
+        Returns None for files outside the root path or in skipped folders.
+        """
+        relpath = osp.relpath(osp.normpath(fname), self.root_path)
+        parts = relpath.split(os.sep)
+        if parts[0] == os.pardir or SKIPPED_DIRS.intersection(parts):
+            return None
+        return relpath
+
+    def _walk(self, path):
+        """Yield all files under `path` that can be indexed."""
+        self._walker.clear_cache()
+        return self._walker.walk(path)
+
+    def _remove(self, relpath):
+        """
+        Remove `relpath` from the index.
+
+        Its postings are kept around until the index is compacted, but they
+        are ignored because the file id is no longer alive.
+        """
+        fid = self._files.pop(relpath, None)
+        if fid is not None:
+            self._entries[fid] = None
+            self._dead += 1
+
+    def _query(self, trigrams):
+        """Return the ids of the files containing all `trigrams`."""
+        with self._lock:
+            postings = []
+            for trigram in trigrams:
+                fids = self._postings.get(trigram)
+                if fids is None:
+                    return set()
+                postings.append(fids)
+
+            postings.sort(key=len)
+            result = set(postings[0])
+            for fids in postings[1:MAX_QUERY_TRIGRAMS]:
+                result.intersection_update(fids)
+                if not result:
+                    break
+
+            return {fid for fid in result if self._entries[fid] is not None}
+
+    def _encode(self):
+        """Return the index as bytes."""
+        trigrams = []
+        chunks = []
+        for trigram, fids in self._postings.items():
+            trigrams.append([trigram.decode('latin-1'), len(fids)])
+            if sys.byteorder != 'little':
+                fids = array('I', fids)
+                fids.byteswap()
+            chunks.append(fids.tobytes())
+
+        header = json.dumps({'entries': self._entries,
+                             'trigrams': trigrams}).encode('utf-8')
+        return b''.join([INDEX_HEADER.pack(INDEX_MAGIC, INDEX_VERSION,
+                                           array('I').itemsize,
+                                           len(header)),
+                         header] + chunks)
+
+    def _decode(self, data):
+        """
+        Return the entries and postings encoded in `data`.
+
+        Raises ValueError, or any other decoding error, if `data` is not a
+        valid index.
+        """
+        magic, version, itemsize, size = INDEX_HEADER.unpack_from(data)
+        if (magic != INDEX_MAGIC or version != INDEX_VERSION
+                or itemsize != array('I').itemsize):
+            raise ValueError("Unsupported index format")
+
+        offset = INDEX_HEADER.size
+        header = json.loads(data[offset:offset + size].decode('utf-8'))
+        offset += size
+
+        entries = []
+        for entry in header['entries']:
+            if entry is not None:
+                relpath, mtime, fsize, kind = entry
+                if (not isinstance(relpath, str)
+                        or not all(isinstance(value, int)
+                                   for value in (mtime, fsize, kind))
+                        or kind not in (INDEXED, UNINDEXED, BINARY)):
+                    raise ValueError("Invalid index entry")
+                entry = (relpath, mtime, fsize, kind)
+            entries.append(entry)
+
+        postings = {}
+        for trigram, count in header['trigrams']:
+            if not isinstance(trigram, str) or not isinstance(count, int):
+                raise ValueError("Invalid postings")
+            end = offset + count * itemsize
+            if count <= 0 or end > len(data):
+                raise ValueError("Invalid postings")
+            fids = array('I')
+            fids.frombytes(data[offset:end])
+            if sys.byteorder != 'little':
+                fids.byteswap()
+            if max(fids) >= len(entries):
+                raise ValueError("Invalid postings")
+            postings[trigram.encode('latin-1')] = fids
+            offset = end
+
+        if offset != len(data):
+            raise ValueError("Invalid postings")
+        return entries, postings
+
+    def _compact(self):
+        """Drop the postings of removed files and renumber the rest."""
+        mapping = {}
+        entries = []
+        for fid, entry in enumerate(self._entries):
+            if entry is not None:
+                mapping[fid] = len(entries)
+                entries.append(entry)
+
+        postings = {}
+        for trigram, fids in self._postings.items():
+            new_fids = array('I', [mapping[fid] for fid in fids
+                                   if fid in mapping])
+            if new_fids:
+                postings[trigram] = new_fids
+
+        self._entries = entries
+        self._postings = postings
+        self._files = {entry[0]: fid for fid, entry in enumerate(entries)}
+        self._dead = 0
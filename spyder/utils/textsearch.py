@@ -0,0 +1,441 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""
+Text search engine used by Find in Files.
+
+Files are scanned by a pool of workers. Threads only overlap the reads of
+files, because matching a regular expression holds the GIL, so a pool of
+processes is needed to scan in parallel. That pool must be created for
+each search from the GUI process, which costs more than scanning a small
+tree, so by default a search starts with threads and moves to processes
+once it has gone through enough files. This module must not import Qt so
+that it can be loaded cheaply by those worker processes.
+"""
+
+# Standard library imports
+from collections import deque
+import concurrent.futures
+import logging
+import mmap
+import os
+import os.path as osp
+import re
+import threading
+
+# Local imports
+from spyder.utils.encoding import is_text_file
+
+
+logger = logging.getLogger(__name__)
+
+# Kind of pool used to scan files
+AUTO_POOL = 'auto'
+PROCESS_POOL = 'process'
+THREAD_POOL = 'thread'
+
+# Number of files after which an automatic pool moves to processes
+PROCESS_POOL_MIN_FILES = 1000
+
+# Error codes returned by workers
+PERMISSION_ERROR = 'permission'
+
+# Number of files sent to a worker at once
+CHUNK_SIZE = 16
+
+# Seconds to wait for a chunk before checking if the search was stopped
+POLL_INTERVAL = 0.05
+
+# Constructs whose meaning changes when a pattern is run over a whole file
+# instead of a single line (string anchors), or that can't be joined with
+# other patterns (global inline flags)
+STRING_ANCHORS_RE = re.compile(br'\\[AZ]')
+GLOBAL_FLAGS_RE = re.compile(br'\(\?[aiLmsux]+\)')
+
+
+def get_default_workers():
+    """Return the number of workers to use when none is given."""
+    return max(1, (os.cpu_count() or 1) - 1)
+
+
+def get_candidate_pattern(texts, text_re, case_sensitive=True):
+    """
+    Return a single pattern that finds every line matching any of `texts`.
+
+    The pattern is run over the whole file buffer, so lines without matches
+    are skipped in one pass of the regular expression engine.
+
+    Returns None if the lines of the file must be scanned one by one
+    instead, because `texts` use constructs that would behave differently
+    over the whole buffer.
+    """
+    if text_re:
+        patterns = [text.pattern for text, __ in texts]
+        if any(STRING_ANCHORS_RE.search(pattern) for pattern in patterns):
+            return None
+        if (len(patterns) > 1
+                and any(GLOBAL_FLAGS_RE.search(pattern)
+                        for pattern in patterns)):
+            return None
+    else:
+        patterns = [re.escape(text) for text, __ in texts]
+
+    flags = re.MULTILINE
+    if not case_sensitive:
+        # `texts` are lowercase already, but the buffer is not
+        flags |= re.IGNORECASE
+
+    try:
+        return re.compile(b'|'.join(patterns), flags)
+    except re.error:
+        return None
+
+
+def search_in_line(line, texts, text_re, case_sensitive):
+    """
+    Search for `texts` in `line`.
+
+    Returns
+    -------
+    tuple
+        (matches, encoding) where `matches` is a list of (start, end)
+        tuples and `encoding` is the one of the first matching text.
+    """
+    matches = []
+    if not case_sensitive:
+        line = line.lower()
+
+    for text, enc in texts:
+        if text_re:
+            found = re.search(text, line)
+            if found is not None:
+                break
+        else:
+            found = line.find(text)
+            if found > -1:
+                break
+    else:
+        return matches, None
+
+    encoding = enc
+    if text_re:
+        for match in re.finditer(text, line):
+            matches.append((match.start(), match.end()))
+    else:
+        while found > -1:
+            matches.append((found, found + len(text)))
+            for text, enc in texts:
+                found = line.find(text, found + 1)
+                if found > -1:
+                    break
+
+    return matches, encoding
+
+
+def search_in_file(fname, texts, text_re, case_sensitive, check_text=False):
+    """
+    Search for `texts` in file `fname`.
+
+    The file is memory-mapped and a single pattern is run over the whole
+    buffer to find the lines with matches. Only those lines are decoded
+    and searched again to get the position of every match, and line
+    numbers are computed from the number of newlines before them. If no
+    such pattern can be built, every line is searched.
+
+    Parameters
+    ----------
+    fname: str
+        Path to the file to scan.
+    texts: list
+        List of (text, encoding) tuples. `text` is a bytes string or a
+        compiled bytes regular expression if `text_re` is True.
+    text_re: bool
+        Whether `texts` are regular expressions.
+    case_sensitive: bool
+        Whether the search is case sensitive. If not, `texts` are expected
+        to be lowercase already.
+    check_text: bool, optional
+        If True, skip files that are not text files. Default is False.
+
+    Returns
+    -------
+    tuple
+        (matches, error) where `matches` is a list of
+        (filename, lineno, start, end, line) tuples and `error` is None or
+        one of the error codes of this module.
+    """
+    matches = []
+    if check_text and not is_text_file(fname):
+        return matches, None
+
+    abs_fname = osp.abspath(fname)
+    pattern = get_candidate_pattern(texts, text_re, case_sensitive)
+    try:
+        with open(fname, 'rb') as f:
+            try:
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty file
+                return matches, None
+            except OSError:
+                # Files that can't be mapped, e.g. in some virtual
+                # filesystems
+                buffer = f.read()
+
+            try:
+                size = len(buffer)
+                lineno = 1
+                pos = 0
+                counted = 0
+                while pos < size:
+                    if pattern is None:
+                        hit_start = pos
+                    else:
+                        hit = pattern.search(buffer, pos)
+                        if hit is None:
+                            break
+                        hit_start = hit.start()
+
+                    # `pos` is always at the beginning of a line
+                    start = buffer.rfind(b'\n', pos, hit_start)
+                    start = pos if start == -1 else start + 1
+                    end = buffer.find(b'\n', hit_start)
+                    end = size if end == -1 else end + 1
+
+                    # Memory maps can't count, so a slice of them is copied,
+                    # which is still faster than iterating over lines.
+                    if isinstance(buffer, bytes):
+                        lineno += buffer.count(b'\n', counted, start)
+                    else:
+                        lineno += buffer[counted:start].count(b'\n')
+                    counted = start
+
+                    line = buffer[start:end]
+                    line_matches, enc = search_in_line(
+                        line, texts, text_re, case_sensitive)
+                    if line_matches:
+                        try:
+                            line_dec = line.decode(enc)
+                        except UnicodeDecodeError:
+                            line_dec = line
+
+                        for match_start, match_end in line_matches:
+                            matches.append((abs_fname, lineno, match_start,
+                                            match_end, line_dec))
+                    pos = end
+            finally:
+                if isinstance(buffer, mmap.mmap):
+                    buffer.close()
+    except IOError:
+        return matches, PERMISSION_ERROR
+
+    return matches, None
+
+
+def search_in_files(fnames, texts, text_re, case_sensitive, check_text):
+    """
+    Search for `texts` in a chunk of files.
+
+    Returns a list with the result of `search_in_file` for each file.
+    """
+    return [(fname,) + search_in_file(fname, texts, text_re, case_sensitive,
+                                      check_text=check_text)
+            for fname in fnames]
+
+
+class SearchEngine:
+    """
+    Scan files for matches using a pool of workers.
+
+    Files are sent to the pool in chunks and their results are yielded in
+    the same order the files were given, so the output is deterministic no
+    matter how the work is scheduled. At most `max_pending` chunks are in
+    flight at any time, which bounds the memory used by queued results.
+
+    `pool` is one of `THREAD_POOL`, `PROCESS_POOL` or `AUTO_POOL`. The
+    last one scans with threads until `process_min_files` files were sent
+    and with processes after that. If `workers` is 1 or less, files are
+    scanned in the calling thread.
+    """
+
+    def __init__(self, texts, text_re, case_sensitive, workers=None,
+                 pool=AUTO_POOL, chunksize=CHUNK_SIZE, max_pending=None,
+                 process_min_files=PROCESS_POOL_MIN_FILES):
+        if workers is None or workers <= 0:
+            workers = get_default_workers()
+
+        self.texts = texts
+        self.text_re = text_re
+        self.case_sensitive = case_sensitive
+        self.workers = workers
+        self.pool = pool
+        self.chunksize = chunksize
+        self.max_pending = max_pending or 4 * workers
+        self.process_min_files = process_min_files
+
+        self._executor = None
+        self._executor_pool = None
+        self._submitted = 0
+        self._pending = deque()
+        self._lock = threading.Lock()
+        self._stopped = False
+
+    # ---- Public API
+    # ------------------------------------------------------------------------
+    @property
+    def stopped(self):
+        """Whether the search was stopped."""
+        return self._stopped
+
+    def search(self, fnames, check_text=True):
+        """
+        Search in `fnames`.
+
+        Parameters
+        ----------
+        fnames: iterable
+            Paths of the files to scan. It can be a lazy iterator, which
+            is consumed while results are produced.
+        check_text: bool, optional
+            If True, skip files that are not text files. Default is True.
+
+        Yields
+        ------
+        tuple
+            (filename, matches, error) for each scanned file, see
+            `search_in_file`.
+        """
+        if self.workers <= 1:
+            for fname in fnames:
+                if self._stopped:
+                    return
+                yield (fname,) + search_in_file(
+                    fname, self.texts, self.text_re, self.case_sensitive,
+                    check_text=check_text)
+            return
+
+        self._start()
+        try:
+            chunk = []
+            for fname in fnames:
+                if self._stopped:
+                    return
+                chunk.append(fname)
+                if len(chunk) < self.chunksize:
+                    continue
+
+                self._submit(chunk, check_text)
+                chunk = []
+                while len(self._pending) >= self.max_pending:
+                    for result in self._pop():
+                        yield result
+
+            if chunk:
+                self._submit(chunk, check_text)
+
+            while self._pending:
+                for result in self._pop():
+                    yield result
+        finally:
+            self._shutdown()
+
+    def stop(self):
+        """
+        Stop the search.
+
+        Pending chunks are cancelled right away. This can be called from a
+        different thread than the one consuming `search`.
+        """
+        self._stopped = True
+        with self._lock:
+            for future in self._pending:
+                future.cancel()
+        self._shutdown()
+
+    # ---- Private API
+    # ------------------------------------------------------------------------
+    def _start(self):
+        """Create the pool of workers."""
+        with self._lock:
+            if self._executor is not None:
+                return
+
+            pool = THREAD_POOL if self.pool == AUTO_POOL else self.pool
+            self._create_executor(pool)
+
+    def _create_executor(self, pool):
+        """Create the pool of workers of kind `pool`."""
+        self._executor_pool = pool
+        if pool == PROCESS_POOL:
+            try:
+                self._executor = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=self.workers)
+                return
+            except (OSError, NotImplementedError, ImportError) as error:
+                # Some platforms and sandboxes don't allow to spawn
+                # processes, so use threads in that case.
+                logger.debug("Process pool not available, using a "
+                             "thread pool instead: %s", error)
+
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.workers)
+
+    def _use_processes(self):
+        """
+        Move an automatic pool to processes.
+
+        Chunks already sent to the threads keep running there and their
+        results are still returned in order.
+        """
+        executor = self._executor
+        self._create_executor(PROCESS_POOL)
+        executor.shutdown(wait=False)
+
+    def _shutdown(self):
+        """Shutdown the pool without waiting for running chunks."""
+        with self._lock:
+            executor = self._executor
+            self._executor = None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def _submit(self, chunk, check_text):
+        """Send a chunk of files to the pool."""
+        with self._lock:
+            if self._stopped or self._executor is None:
+                return
+            try:
+                future = self._executor.submit(
+                    search_in_files, chunk, self.texts, self.text_re,
+                    self.case_sensitive, check_text)
+            except RuntimeError:
+                # The pool was shutdown by `stop`
+                return
+            self._pending.append(future)
+
+            self._submitted += len(chunk)
+            if (self.pool == AUTO_POOL
+                    and self._executor_pool == THREAD_POOL
+                    and self._submitted >= self.process_min_files):
+                self._use_processes()
+
+    def _pop(self):
+        """Wait for the oldest chunk and return its results."""
+        with self._lock:
+            future = self._pending.popleft()
+
+        while not self._stopped:
+            done, __ = concurrent.futures.wait([future],
+                                               timeout=POLL_INTERVAL)
+            if done:
+                break
+        else:
+            return []
+
+        try:
+            return future.result()
+        except concurrent.futures.CancelledError:
+            return []
@@ -0,0 +1,445 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""
+Directory traversal that honors version control ignore files.
+
+This is shared by Find in Files, its project index and the Project explorer
+so that large ignored trees (e.g. node_modules, build output or virtual
+environments) are pruned before reading anything inside them.
+"""
+
+# Standard library imports
+import logging
+import os
+import os.path as osp
+import re
+import threading
+
+# Local imports
+from spyder.utils.encoding import is_text_file
+
+
+logger = logging.getLogger(__name__)
+
+# Folders of version control systems, never traversed
+VCS_DIRS = ('.git', '.hg')
+
+# Ignore files read in every folder
+GITIGNORE = '.gitignore'
+HGIGNORE = '.hgignore'
+
+# Maximum number of verdicts kept by `is_text_file_cached`
+TEXT_FILE_CACHE_SIZE = 100000
+
+_text_file_cache = {}
+_text_file_cache_lock = threading.Lock()
+
+
+def is_text_file_cached(fname, stat=None):
+    """
+    Test if `fname` is a text file, caching the result.
+
+    Verdicts are cached by inode and modification time, so a file is only
+    read again after it changes.
+
+    Parameters
+    ----------
+    fname: str
+        Path to the file.
+    stat: os.stat_result, optional
+        Result of stat on `fname`, if already known.
+    """
+    try:
+        if stat is None:
+            stat = os.stat(fname)
+    except OSError:
+        return False
+
+    key = (stat.st_dev, stat.st_ino, stat.st_mtime_ns, stat.st_size)
+    result = _text_file_cache.get(key)
+    if result is None:
+        result = is_text_file(fname)
+        with _text_file_cache_lock:
+            if len(_text_file_cache) >= TEXT_FILE_CACHE_SIZE:
+                _text_file_cache.clear()
+            _text_file_cache[key] = result
+    return result
+
+
+def translate_glob(pattern, anchored):
+    """
+    Translate a gitignore style glob into a regular expression.
+
+    The expression matches paths relative to the ignore file folder, with
+    '/' as separator. If `anchored` is False, the pattern can match at any
+    depth.
+    """
+    i = 0
+    n = len(pattern)
+    res = ''
+    while i < n:
+        c = pattern[i]
+        if pattern.startswith('**/', i) and (i == 0 or pattern[i - 1] == '/'):
+            res += '(?:.*/)?'
+            i += 3
+            continue
+        elif pattern.startswith('**', i) and i + 2 == n and (
+                i == 0 or pattern[i - 1] == '/'):
+            res += '.*'
+            i += 2
+            continue
+
+        i += 1
+        if c == '*':
+            res += '[^/]*'
+        elif c == '?':
+            res += '[^/]'
+        elif c == '\\' and i < n:
+            res += re.escape(pattern[i])
+            i += 1
+        elif c == '[':
+            j = pattern.find(']', i + 1)
+            if j == -1:
+                res += '\\['
+            else:
+                stuff = pattern[i:j].replace('\\', '\\\\')
+                if stuff.startswith('!'):
+                    stuff = '^' + stuff[1:]
+                res += '[' + stuff + ']'
+                i = j + 1
+        else:
+            res += re.escape(c)
+
+    if not anchored:
+        res = '(?:.*/)?' + res
+    return '(?s:' + res + r')\Z'
+
+
+class IgnoreRules:
+    """
+    Rules read from an ignore file.
+
+    Parameters
+    ----------
+    base_path: str
+        Folder the rules are relative to.
+    rules: list
+        List of (regex, negated, dir_only) tuples.
+    """
+
+    def __init__(self, base_path, rules):
+        self.base_path = osp.normpath(base_path)
+        self.rules = rules
+        self._prefix = osp.join(self.base_path, '')
+
+    @classmethod
+    def from_gitignore(cls, fname, base_path=None):
+        """
+        Read the rules of a .gitignore file.
+
+        Rules are relative to the folder of `fname` unless `base_path` is
+        given.
+        """
+        rules = []
+        for line in cls._read_lines(fname):
+            if not line.strip() or line.startswith('#'):
+                continue
+
+            # Trailing spaces are ignored unless escaped
+            if not line.endswith('\\ '):
+                line = line.rstrip(' ')
+
+            negated = line.startswith('!')
+            if negated or line.startswith('\\!') or line.startswith('\\#'):
+                line = line[1:]
+
+            dir_only = line.endswith('/')
+            line = line.rstrip('/')
+            if not line:
+                continue
+
+            anchored = '/' in line
+            line = line.lstrip('/')
+            try:
+                regex = re.compile(translate_glob(line, anchored))
+            except re.error:
+                continue
+            rules.append((regex, negated, dir_only))
+
+        return cls(base_path or osp.dirname(fname), rules)
+
+    @classmethod
+    def from_hgignore(cls, fname):
+        """Read the rules of a .hgignore file."""
+        rules = []
+        syntax = 'regexp'
+        for line in cls._read_lines(fname):
+            line = line.split('#', 1)[0].strip()
+            if not line:
+                continue
+
+            if line.startswith('syntax:'):
+                syntax = line[len('syntax:'):].strip()
+                continue
+
+            line_syntax = syntax
+            for prefix, prefix_syntax in [('re:', 'regexp'),
+                                          ('glob:', 'glob')]:
+                if line.startswith(prefix):
+                    line_syntax = prefix_syntax
+                    line = line[len(prefix):]
+
+            try:
+                if line_syntax == 'glob':
+                    regex = re.compile(translate_glob(line, False))
+                else:
+                    # Mercurial regexps are unanchored and also match the
+                    # folders containing the files
+                    regex = re.compile('(?:{})'.format(line))
+                    regex = _SearchRegex(regex)
+            except re.error:
+                continue
+            rules.append((regex, False, False))
+
+        return cls(osp.dirname(fname), rules)
+
+    def match(self, path, is_dir):
+        """
+        Return if `path` is ignored by these rules.
+
+        Returns None if no rule matches `path`.
+        """
+        if not path.startswith(self._prefix):
+            return None
+
+        relpath = path[len(self._prefix):]
+        if os.sep != '/':
+            relpath = relpath.replace(os.sep, '/')
+
+        result = None
+        for regex, negated, dir_only in self.rules:
+            if dir_only and not is_dir:
+                continue
+            if regex.match(relpath):
+                result = not negated
+        return result
+
+    @staticmethod
+    def _read_lines(fname):
+        try:
+            with open(fname, 'r', encoding='utf-8', errors='replace') as f:
+                return f.read().splitlines()
+        except OSError:
+            return []
+
+
+class _SearchRegex:
+    """Adapter to use `re.search` for unanchored Mercurial regexps."""
+
+    def __init__(self, regex):
+        self.regex = regex
+
+    def match(self, relpath):
+        return self.regex.search(relpath)
+
+
+class FileWalker:
+    """
+    Walk directory trees pruning the paths ignored by version control.
+
+    Parameters
+    ----------
+    use_ignore_files: bool, optional
+        Honor .gitignore and .hgignore files. Default is True.
+    exclude: compiled regular expression, optional
+        Paths matching this expression are skipped. Folders are tested with
+        a trailing separator. Default is None.
+    skip_dirs: iterable, optional
+        Names of folders that are never traversed. Default is `VCS_DIRS`.
+    check_text: bool, optional
+        Only yield text files. Default is False.
+    """
+
+    def __init__(self, use_ignore_files=True, exclude=None,
+                 skip_dirs=VCS_DIRS, check_text=False):
+        self.use_ignore_files = use_ignore_files
+        self.exclude = exclude
+        self.skip_dirs = set(skip_dirs)
+        self.check_text = check_text
+        self._rules_cache = {}
+        self._repository_cache = {}
+
+    # ---- Public API
+    # ------------------------------------------------------------------------
+    def walk(self, root, should_stop=None):
+        """
+        Yield the paths of all files under `root` that are not skipped.
+
+        Folders are traversed top-down and in alphabetical order.
+
+        Parameters
+        ----------
+        root: str
+            Folder to traverse.
+        should_stop: callable, optional
+            Called before reading each folder. Traversal ends if it returns
+            True.
+        """
+        root = osp.normpath(root)
+        stack = [(root, self._get_rules(root))]
+        while stack:
+            if should_stop is not None and should_stop():
+                return
+
+            path, rules = stack.pop()
+            try:
+                with os.scandir(path) as it:
+                    entries = sorted(it, key=lambda entry: entry.name)
+            except OSError:
+                continue
+
+            if self.use_ignore_files and path != root:
+                rules = rules + self._read_rules(path, entries)
+
+            dirs = []
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    continue
+
+                if is_dir:
+                    if (entry.name in self.skip_dirs or entry.is_symlink()
+                            or self._is_skipped(entry.path, True, rules)):
+                        continue
+                    dirs.append(entry.path)
+                else:
+                    if self._is_skipped(entry.path, False, rules):
+                        continue
+                    if self.check_text and not is_text_file_cached(
+                            entry.path):
+                        continue
+                    yield entry.path
+
+            for dirname in reversed(dirs):
+                stack.append((dirname, rules))
+
+    def is_ignored(self, path, is_dir=None, root=None):
+        """
+        Return True if `path` is ignored by version control.
+
+        Parameters
+        ----------
+        path: str
+            Path to check.
+        is_dir: bool, optional
+            Whether `path` is a folder. It's computed if not given.
+        root: str, optional
+            If given, `path` is also ignored when any of its parent folders
+            below `root` is. Otherwise only the rules of `path` itself are
+            checked.
+        """
+        path = osp.normpath(path)
+        if root is not None:
+            prefix = osp.join(osp.normpath(root), '')
+            parent = osp.dirname(path)
+            while parent.startswith(prefix):
+                if self.is_ignored(parent, is_dir=True):
+                    return True
+                parent = osp.dirname(parent)
+
+        if osp.basename(path) in self.skip_dirs:
+            return True
+        if is_dir is None:
+            is_dir = osp.isdir(path)
+        rules = self._get_rules(osp.dirname(path))
+        return self._is_ignored(path, is_dir, rules)
+
+    def clear_cache(self):
+        """Forget the ignore files read so far."""
+        self._rules_cache = {}
+        self._repository_cache = {}
+
+    # ---- Private API
+    # ------------------------------------------------------------------------
+    def _is_skipped(self, path, is_dir, rules):
+        if self.exclude is not None:
+            if is_dir:
+                if self.exclude.search(path + os.sep):
+                    return True
+            elif self.exclude.search(path):
+                return True
+        return self._is_ignored(path, is_dir, rules)
+
+    def _is_ignored(self, path, is_dir, rules):
+        ignored = False
+        for rule in rules:
+            result = rule.match(path, is_dir)
+            if result is not None:
+                ignored = result
+        return ignored
+
+    def _read_rules(self, path, entries=None):
+        """Return the rules of the ignore files found in `path`."""
+        if entries is None:
+            try:
+                names = set(os.listdir(path))
+            except OSError:
+                return []
+        else:
+            names = {entry.name for entry in entries}
+
+        rules = []
+        # Mercurial only reads the .hgignore file of the repository root
+        if HGIGNORE in names and '.hg' in names:
+            rules.append(IgnoreRules.from_hgignore(osp.join(path, HGIGNORE)))
+        if GITIGNORE in names:
+            rules.append(
+                IgnoreRules.from_gitignore(osp.join(path, GITIGNORE)))
+        if '.git' in names:
+            exclude = osp.join(path, '.git', 'info', 'exclude')
+            if osp.isfile(exclude):
+                rules.append(
+                    IgnoreRules.from_gitignore(exclude, base_path=path))
+        return rules
+
+    def _get_rules(self, path):
+        """
+        Return the rules that apply to the files in `path`.
+
+        These come from the ignore files of `path` and its parent folders,
+        up to the root of the repository containing it.
+        """
+        if not self.use_ignore_files:
+            return []
+
+        path = osp.normpath(path)
+        rules = self._rules_cache.get(path)
+        if rules is not None:
+            return rules
+
+        rules = self._read_rules(path)
+        parent = osp.dirname(path)
+        if (parent != path and not self._is_repository_root(path)
+                and self._in_repository(parent)):
+            rules = self._get_rules(parent) + rules
+
+        self._rules_cache[path] = rules
+        return rules
+
+    def _is_repository_root(self, path):
+        return any(osp.isdir(osp.join(path, d)) for d in VCS_DIRS)
+
+    def _in_repository(self, path):
+        """Return True if `path` is inside a repository."""
+        result = self._repository_cache.get(path)
+        if result is None:
+            parent = osp.dirname(path)
+            result = self._is_repository_root(path) or (
+                parent != path and self._in_repository(parent))
+            self._repository_cache[path] = result
+        return result
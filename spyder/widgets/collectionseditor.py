@@ -217,6 +217,31 @@ def set_data(self, data, coll_filter=None):
             self.update_search_letters()
         self.reset()
 
+    def update_data(self, changed):
+        """
+        Update the values of some keys of the model data.
+
+        This avoids resetting the model when no keys are added or removed.
+
+        Parameters
+        ----------
+        changed: dict
+            New values of keys that are already in the model.
+        """
+        rows = {key: row for row, key in enumerate(self.keys)}
+        for key, value in changed.items():
+            self._data[key] = value
+            row = rows[key]
+            if row < len(self.sizes):
+                if self.remote:
+                    self.sizes[row] = value['size']
+                    self.types[row] = value['type']
+                else:
+                    self.sizes[row] = get_size(value)
+                    self.types[row] = get_human_readable_type(value)
+            self.dataChanged.emit(self.index(row, 0),
+                                  self.index(row, self.columnCount() - 1))
+
     def set_size_and_type(self, start=None, stop=None):
         data = self._data
 
@@ -1429,6 +1454,12 @@ def get_value(self, index):
             name = source_index.model().keys[source_index.row()]
             return self.parent().get_value(name)
 
+    def open_data_view(self, index):
+        if index.isValid():
+            source_index = index.model().mapToSource(index)
+            name = source_index.model().keys[source_index.row()]
+            return self.parent().open_data_view(name)
+
     def set_value(self, index, value):
         if index.isValid():
             source_index = index.model().mapToSource(index)
@@ -1488,6 +1519,10 @@ def get_value(self, name):
         value = self.shellwidget.get_value(name)
         return value
 
+    def open_data_view(self, name):
+        """Open a view of a variable kept in the kernel"""
+        return self.shellwidget.open_data_view(name)
+
     def new_value(self, name, value):
         """Create new value in data"""
         try:
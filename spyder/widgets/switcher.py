@@ -26,7 +26,7 @@
 from spyder.config.utils import is_ubuntu
 from spyder.py3compat import TEXT_TYPES, to_text_string
 from spyder.utils import icon_manager as ima
-from spyder.utils.stringmatching import get_search_scores
+from spyder.utils.stringmatching import FuzzyMatcher
 from spyder.widgets.helperwidgets import HTMLDelegate
 
 # Style dict constants
@@ -556,6 +556,7 @@ def __init__(self, parent, help_text=None, item_styles=ITEM_STYLES,
         self._mode_on = ''
         self._item_styles = item_styles
         self._item_separator_styles = item_separator_styles
+        self._matcher = FuzzyMatcher()
 
         # Widgets
         self.edit = QLineEdit(self)
@@ -604,6 +605,7 @@ def _add_item(self, item, last_item=True):
         """Perform common actions when adding items."""
         item.set_width(self._ITEM_WIDTH)
         self.model.appendRow(item)
+        self._matcher.add_choice(self._get_item_title(item))
         if last_item:
             # Only set the current row to the first item when the added item is
             # the last one in order to prevent performance issues when
@@ -619,6 +621,7 @@ def clear(self):
         self.model.beginResetModel()
         self.model.clear()
         self.model.endResetModel()
+        self._matcher.clear()
         self.setMinimumHeight(self._MIN_HEIGHT)
 
     def set_placeholder_text(self, text):
@@ -695,25 +698,27 @@ def setup(self):
                 return
 
         # Filter by text
-        titles = []
-        for row in range(self.model.rowCount()):
-            item = self.model.item(row)
-            if isinstance(item, SwitcherItem):
-                title = item.get_title()
-            else:
-                title = ''
-            titles.append(title)
+        if len(self._matcher) != self.model.rowCount():
+            # Items were added to the model directly
+            self._matcher.clear()
+            for row in range(self.model.rowCount()):
+                self._matcher.add_choice(
+                    self._get_item_title(self.model.item(row)))
 
         search_text = clean_string(search_text)
-        scores = get_search_scores(to_text_string(search_text),
-                                   titles, template=u"<b>{0}</b>")
+        scores = self._matcher.get_scores(to_text_string(search_text),
+                                          template=u"<b>{0}</b>")
 
+        # Only update the items whose result changed, because every update
+        # renders the item again
         for idx, (title, rich_title, score_value) in enumerate(scores):
             item = self.model.item(idx)
             if not self._is_separator(item) and not item.is_action_item():
                 rich_title = rich_title.replace(" ", "&nbsp;")
-                item.set_rich_title(rich_title)
-            item.set_score(score_value)
+                if rich_title != item.get_rich_title():
+                    item.set_rich_title(rich_title)
+            if score_value != item.get_score():
+                item.set_score(score_value)
         self.proxy.set_filter_by_score(True)
 
         self.setup_sections()
@@ -831,6 +836,12 @@ def set_search_text(self, string):
         self.edit.setText(string)
 
     # --- Helper methods: List widget
+    def _get_item_title(self, item):
+        """Return the title of item to match against the search text."""
+        if isinstance(item, SwitcherItem):
+            return item.get_title()
+        return ''
+
     def _is_separator(self, item):
         """Check if item is an separator item (SwitcherSeparatorItem)."""
         return isinstance(item, SwitcherSeparatorItem)
@@ -33,6 +33,7 @@
 from spyder.widgets.collectionseditor import (
     RemoteCollectionsEditorTableView, CollectionsEditorTableView,
     CollectionsModel, CollectionsEditor, LARGE_NROWS, ROWS_TO_LOAD, natsort)
+from spyder.plugins.variableexplorer.widgets import collectionsdelegate
 from spyder.plugins.variableexplorer.widgets.namespacebrowser import (
     NamespacesBrowserFinder)
 from spyder.plugins.variableexplorer.widgets.tests.test_dataframeeditor import \
@@ -278,6 +279,55 @@ def test_accept_sig_option_changed_from_dataframeeditor(qtbot, monkeypatch):
     dataframe_editor.sig_option_changed.emit('dataframe_format', '%5f')
     assert editor.source_model.dataframe_format == '%5f'
 
+
+def test_edit_read_only_array(qtbot, monkeypatch):
+    """
+    Test that read-only arrays, as received from the kernel, are copied
+    to be edited.
+    """
+    MockArrayEditor = Mock()
+    mockArrayEditor_instance = MockArrayEditor()
+    monkeypatch.setattr(collectionsdelegate, 'ArrayEditor', MockArrayEditor)
+    arr = numpy.arange(10)
+    arr.flags.writeable = False
+    editor = CollectionsEditorTableView(None, {'arr': arr})
+    qtbot.addWidget(editor)
+    editor.delegate.createEditor(None, None, editor.model.index(0, 3))
+    value = mockArrayEditor_instance.setup_and_check.call_args[0][0]
+    assert value is not arr
+    assert value.flags.writeable
+    assert numpy.array_equal(value, arr)
+
+
+def test_open_remote_dataframe_view(qtbot, monkeypatch):
+    """
+    Test that big remote data frames are opened as views kept in the
+    kernel instead of getting their value.
+    """
+    MockDataFrameEditor = Mock()
+    mockDataFrameEditor_instance = MockDataFrameEditor()
+    monkeypatch.setattr('spyder.plugins.variableexplorer.widgets.collectionsdelegate.DataFrameEditor',
+                        MockDataFrameEditor)
+    data = {'df': {'type': 'DataFrame', 'size': (10000000, 2),
+                   'color': '#00ff00', 'view': 'Column names: 0, 1'}}
+    editor = RemoteCollectionsEditorTableView(None, data)
+    qtbot.addWidget(editor)
+    view = Mock()
+    editor.open_data_view = Mock(return_value=view)
+    editor.get_value = Mock()
+
+    editor.delegate.createEditor(None, None, editor.model.index(0, 3))
+    editor.open_data_view.assert_called_once_with('df')
+    assert not editor.get_value.called
+    mockDataFrameEditor_instance.setup_and_check.assert_called_once_with(
+        view, title='df')
+
+    # The view is released when the editor is closed
+    editor_id = next(iter(editor.delegate._editors))
+    assert editor.delegate._editors[editor_id]['readonly']
+    editor.delegate.editor_rejected(editor_id)
+    view.close.assert_called_once_with()
+
 def test_collectionsmodel_with_two_ints():
     coll = {'x': 1, 'y': 2}
     cm = CollectionsModel(MockParent(), coll)